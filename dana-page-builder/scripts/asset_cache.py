@@ -0,0 +1,102 @@
+"""
+Encoded Asset Cache for DANA&PETA Page Builder
+Per-run LRU cache of base64 data URLs keyed by file path + mtime + size
+"""
+
+import base64
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Tuple
+
+# Image MIME types by suffix
+MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
+CacheKey = Tuple[str, int, int]
+
+
+class EncodedAssetCache:
+    """LRU cache of encoded data URLs bounded by total encoded size"""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize the cache
+
+        Args:
+            max_bytes: Upper bound on the summed length of cached data URLs
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(file_path: Path) -> CacheKey:
+        """Cache key: resolved path + mtime + size (a rewritten file gets a new key)"""
+        stat = file_path.stat()
+        return (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def get_data_url(self, file_path: Path) -> str:
+        """
+        Return the base64 data URL for a file, encoding it on first use
+
+        Args:
+            file_path: Existing image file
+
+        Returns:
+            data:{mime};base64,... string
+        """
+        key = self._key(file_path)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        with open(file_path, 'rb') as f:
+            base64_data = base64.b64encode(f.read()).decode('utf-8')
+
+        mime_type = MIME_TYPES.get(file_path.suffix.lower(), 'image/jpeg')
+        data_url = f"data:{mime_type};base64,{base64_data}"
+
+        with self._lock:
+            self.misses += 1
+            self._store(key, data_url)
+
+        return data_url
+
+    def _store(self, key: CacheKey, data_url: str) -> None:
+        """Insert an entry and evict least recently used ones over the cap"""
+        size = len(data_url)
+        if size > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= len(previous)
+
+        self._entries[key] = data_url
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= len(evicted)
+
+    def stats(self) -> str:
+        """One-line summary for logs"""
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0.0
+        return (
+            f"{self.hits} hits / {self.misses} misses ({hit_rate:.0f}% hit rate), "
+            f"{len(self._entries)} entries, {self.current_bytes / 1024 / 1024:.1f} MB"
+        )
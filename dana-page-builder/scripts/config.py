@@ -14,7 +14,12 @@ SHEET_ID = "1m1f784rij74eSpuHOEOqbAzQu97ZenfLa3QuO-Egjxk"  # DANA&PETA Products
 
 # Unified Template System: Single "템플릿" tab
 SHEET_NAME = "템플릿"  # Unified template tab
-SHEET_RANGE = "A2:KP100"  # 302 columns (A~KP), up to 100 products
+SHEET_RANGE = "A2:KP100"  # Fixed preview range (quick_test.py)
+SHEET_FIRST_ROW = 2  # First product row (row 1 is the header)
+SHEET_LAST_COLUMN = "KP"  # 302 columns (A~KP)
+SHEET_ROW_BLOCK_SIZE = 200  # Rows fetched per grid request (loader streams blocks until the sheet ends)
+SHEET_GRID_FIELDS = "sheets(data(rowData(values(hyperlink,formattedValue))))"  # Only fields the loader reads
+SNAPSHOT_GRID_FIELDS = "sheets(data(rowData(values(hyperlink,formattedValue,textFormatRuns))))"  # Snapshot capture also keeps text formatting
 
 # Unified Template Column Definitions (템플릿 tab - 302 columns)
 TEMPLATE_COLUMNS = {
@@ -333,14 +338,17 @@ SCOPES = [
 # Output Directories
 OUTPUT_DIR = PROJECT_ROOT / "output"
 ASSETS_DIR = OUTPUT_DIR / "assets" / "images"
+THUMBNAILS_DIR = OUTPUT_DIR / "assets" / "thumbs"  # WebP thumbnails for the index page
 EXPORTS_DIR = PROJECT_ROOT / "exports"
 STANDALONE_EXPORTS_DIR = EXPORTS_DIR / "standalone"
 IMAGES_EXPORTS_DIR = EXPORTS_DIR / "images"
 
 # Data Files
 DATA_DIR = PROJECT_ROOT / "data"
-PRODUCTS_DATA_PATH = DATA_DIR / "products.json"
+PRODUCTS_DATA_PATH = DATA_DIR / "products.json"  # Legacy export, imported into the store once
+PRODUCTS_DB_PATH = DATA_DIR / "products.db"  # Product store (SQLite, one row per product)
 TEMPLATE_PATH = DATA_DIR / "templates" / "dana_product_template.json"
+SNAPSHOTS_DIR = PROJECT_ROOT / "snapshots"  # Offline snapshot bundles (rows + images, see snapshot_bundle.py)
 
 # Logging Configuration
 LOG_FILE = PROJECT_ROOT / "dana_page_generation.log"
@@ -356,6 +364,34 @@ COLOR_EXTRACTION_CROP_PERCENT = 0.3  # Center crop 30%
 COLOR_EXTRACTION_BRIGHTNESS_THRESHOLD = 240  # Filter out bright pixels
 COLOR_EXTRACTION_KMEANS_CLUSTERS = 3  # Number of K-means clusters
 COLOR_EXTRACTION_KMEANS_ITERATIONS = 10  # Max iterations
+ENCODED_ASSET_CACHE_MAX_BYTES = 256 * 1024 * 1024  # LRU cap for base64 data URLs shared across page variants (split across --workers processes)
+THUMBNAIL_MAX_SIZE = (300, 400)  # Index card thumbnail bounding box (px)
+THUMBNAIL_QUALITY = 70  # WebP quality for thumbnails
+
+# Index Page Settings
+INDEX_CHUNK_SIZE = 60  # Cards rendered per chunk (later chunks are appended while scrolling)
+
+# Image Download Settings
+IMAGE_DOWNLOAD_WORKERS = 8  # Concurrent Drive downloads (one Drive client per worker)
+IMAGE_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # Bytes per streamed chunk (8MB)
+IMAGE_MANIFEST_PATH = ASSETS_DIR / ".manifest.json"  # Drive version of every cached image
+DRIVE_METADATA_BATCH_SIZE = 100  # files().get calls per batch request (Drive limit: 100)
+DRIVE_METADATA_FIELDS = "id,md5Checksum,modifiedTime,size"
+
+# Google API Rate Limiting (see rate_limiter.py)
+SHEETS_REQUESTS_PER_MINUTE = float(os.getenv("SHEETS_REQUESTS_PER_MINUTE") or 60)  # Sheets read quota per user
+DRIVE_REQUESTS_PER_MINUTE = float(os.getenv("DRIVE_REQUESTS_PER_MINUTE") or 1200)  # Drive calls (batch sub-requests count individually)
+RATE_LIMIT_BURST_SECONDS = 10  # Bucket capacity in seconds of traffic
+RATE_LIMIT_STATE_DIR = PROJECT_ROOT / ".cache" / "ratelimit"  # Token buckets shared by every process in this folder
+API_MAX_RETRIES = 6  # Retries per call on 429/5xx/connection errors
+API_BACKOFF_BASE = 1.0  # First retry delay in seconds (doubles per attempt, honours Retry-After)
+API_BACKOFF_MAX = 60.0
+API_CONCURRENCY_INITIAL = 4  # AIMD in-flight limit: +1/limit per success, halved on 429/5xx
+API_CONCURRENCY_MAX = 16
+
+# Output Retention Settings (editable server)
+OUTPUT_QUOTA_MB = int(os.getenv("OUTPUT_QUOTA_MB") or 0)  # Cap on dated output folders; 0 disables quota-driven eviction
+OUTPUT_RETENTION_INTERVAL = float(os.getenv("OUTPUT_RETENTION_INTERVAL") or 3600)  # Seconds between retention runs
 
 # Date format for output folders
 DATE_FORMAT = "%Y-%m-%d"
@@ -0,0 +1,1265 @@
+/*
+ * DANA&PETA editable page runtime
+ *
+ * Shared editor script referenced by every editable page. Per-product values
+ * come from window.DANA_EDITOR, which the page declares before loading this file:
+ *   window.DANA_EDITOR = { productCode, imageList, sizeImagesData, defaultSizeImage }
+ *   (sizeImagesData: illustration name -> size library URL, see size_library.py)
+ */
+
+// Product code for localStorage / exports
+const productCode = window.DANA_EDITOR.productCode;
+
+// Image list for editing
+const imageList = window.DANA_EDITOR.imageList;
+
+// Size images data for product info
+const sizeImagesData = window.DANA_EDITOR.sizeImagesData;
+let currentSizeImage = window.DANA_EDITOR.defaultSizeImage;
+
+// Crop settings storage
+const cropSettings = {
+    productCode: productCode,
+    images: {}
+};
+
+// Initialize crop settings for all images
+imageList.forEach(img => {
+    cropSettings.images[img.id] = { x: 100, y: 100, scale: 100 };
+});
+
+// Current selected image
+let currentImageId = imageList.length > 0 ? imageList[0].id : null;
+
+// Page zoom level (30-100%, default 60%)
+let pageZoom = 60;
+
+// Drag state
+let isDragging = false;
+let startX, startY, startObjX, startObjY;
+
+// Upload button elements
+let uploadBtn;
+let fileInput;
+
+// Initialize
+function init() {
+    // Populate image dropdown
+    const select = document.getElementById('image-select');
+    imageList.forEach(img => {
+        const option = document.createElement('option');
+        option.value = img.id;
+        option.textContent = img.label;
+        select.appendChild(option);
+    });
+
+    // Populate size image dropdown
+    const sizeImageSelect = document.getElementById('size-image-select');
+    if (sizeImageSelect && Object.keys(sizeImagesData).length > 0) {
+        Object.keys(sizeImagesData).sort().forEach(imageName => {
+            const option = document.createElement('option');
+            option.value = imageName;
+            option.textContent = imageName;
+            if (imageName === currentSizeImage) {
+                option.selected = true;
+            }
+            sizeImageSelect.appendChild(option);
+        });
+    }
+
+    // Load settings from localStorage
+    loadSettings();
+
+    // Apply initial settings
+    applyAllCropSettings();
+    applyPageZoom();  // Apply page zoom after loading settings
+
+    // Setup event listeners
+    setupEventListeners();
+
+    // Populate size illustration options
+    populateSizeIllustrationOptions();
+
+    // Select first image
+    if (currentImageId) {
+        selectImage(currentImageId);
+    }
+}
+
+// Setup all event listeners
+function setupEventListeners() {
+    // Dropdown change
+    document.getElementById('image-select').addEventListener('change', (e) => {
+        selectImage(e.target.value);
+    });
+
+    // Size image dropdown change
+    const sizeImageSelect = document.getElementById('size-image-select');
+    if (sizeImageSelect) {
+        sizeImageSelect.addEventListener('change', (e) => {
+            changeSizeImage(e.target.value);
+        });
+    }
+
+    // Page zoom slider
+    document.getElementById('page-zoom').addEventListener('input', (e) => {
+        pageZoom = parseInt(e.target.value);
+        document.getElementById('page-zoom-value').textContent = pageZoom + '%';
+        applyPageZoom();
+        autoSave();
+    });
+
+    // Image position/scale sliders
+    document.getElementById('position-x').addEventListener('input', (e) => {
+        const value = parseInt(e.target.value);
+        cropSettings.images[currentImageId].x = value;
+        document.getElementById('x-value').textContent = value + '%';
+        applyCurrentCrop();
+        autoSave();
+    });
+
+    document.getElementById('position-y').addEventListener('input', (e) => {
+        const value = parseInt(e.target.value);
+        cropSettings.images[currentImageId].y = value;
+        document.getElementById('y-value').textContent = value + '%';
+        applyCurrentCrop();
+        autoSave();
+    });
+
+    document.getElementById('scale').addEventListener('input', (e) => {
+        const value = parseInt(e.target.value);
+        cropSettings.images[currentImageId].scale = value;
+        document.getElementById('scale-value').textContent = value + '%';
+        applyCurrentCrop();
+        autoSave();
+    });
+
+    // Image frame interactions
+    document.querySelectorAll('.image-frame').forEach(frame => {
+        const id = frame.getAttribute('data-id');
+        if (!id) return;
+
+        // Click to select
+        frame.addEventListener('click', (e) => {
+            if (!isDragging) {
+                selectImage(id);
+                document.getElementById('image-select').value = id;
+            }
+        });
+
+        // Drag to move
+        frame.addEventListener('mousedown', (e) => {
+            e.preventDefault();
+            if (!cropSettings.images[id]) return;
+
+            selectImage(id);
+            document.getElementById('image-select').value = id;
+
+            isDragging = true;
+            startX = e.clientX;
+            startY = e.clientY;
+            startObjX = cropSettings.images[id].x;
+            startObjY = cropSettings.images[id].y;
+            frame.classList.add('dragging');
+        });
+
+        // Wheel to zoom
+        frame.addEventListener('wheel', (e) => {
+            e.preventDefault();
+            if (!cropSettings.images[id]) return;
+
+            selectImage(id);
+            document.getElementById('image-select').value = id;
+
+            const delta = e.deltaY > 0 ? -5 : 5;
+            const newScale = Math.max(100, Math.min(500,
+                cropSettings.images[id].scale + delta
+            ));
+
+            cropSettings.images[id].scale = newScale;
+            applyCurrentCrop();
+            updateSliders();
+            autoSave();
+        }, { passive: false });
+    });
+
+    // Global mouse move/up for drag
+    document.addEventListener('mousemove', (e) => {
+        if (!isDragging) return;
+
+        const frame = document.querySelector(`[data-id="${currentImageId}"]`);
+        if (!frame || !cropSettings.images[currentImageId]) return;
+
+        const dx = (e.clientX - startX) / frame.offsetWidth * 100;
+        const dy = (e.clientY - startY) / frame.offsetHeight * 100;
+
+        const scale = cropSettings.images[currentImageId].scale / 100;
+        const maxRange = (scale - 1) * 50;
+        const minX = -maxRange;
+        const maxX = 100 + maxRange;
+        const minY = -maxRange;
+        const maxY = 100 + maxRange;
+
+        const newX = Math.max(minX, Math.min(maxX, startObjX + dx));
+        const newY = Math.max(minY, Math.min(maxY, startObjY + dy));
+
+        cropSettings.images[currentImageId].x = newX;
+        cropSettings.images[currentImageId].y = newY;
+
+        applyCurrentCrop();
+        updateSliders();
+    });
+
+    document.addEventListener('mouseup', () => {
+        if (isDragging) {
+            isDragging = false;
+            document.querySelectorAll('.image-frame').forEach(f => {
+                f.classList.remove('dragging');
+            });
+            autoSave();
+        }
+    });
+
+    // Keyboard shortcuts
+    document.addEventListener('keydown', (e) => {
+        if (!currentImageId || !cropSettings.images[currentImageId]) return;
+
+        const step = e.shiftKey ? 10 : 1;
+        let changed = false;
+
+        const scale = cropSettings.images[currentImageId].scale / 100;
+        const maxRange = (scale - 1) * 50;
+        const minX = -maxRange;
+        const maxX = 100 + maxRange;
+        const minY = -maxRange;
+        const maxY = 100 + maxRange;
+
+        switch(e.key) {
+            case 'ArrowLeft':
+                e.preventDefault();
+                cropSettings.images[currentImageId].x = Math.max(minX,
+                    cropSettings.images[currentImageId].x - step
+                );
+                changed = true;
+                break;
+            case 'ArrowRight':
+                e.preventDefault();
+                cropSettings.images[currentImageId].x = Math.min(maxX,
+                    cropSettings.images[currentImageId].x + step
+                );
+                changed = true;
+                break;
+            case 'ArrowUp':
+                e.preventDefault();
+                cropSettings.images[currentImageId].y = Math.max(minY,
+                    cropSettings.images[currentImageId].y - step
+                );
+                changed = true;
+                break;
+            case 'ArrowDown':
+                e.preventDefault();
+                cropSettings.images[currentImageId].y = Math.min(maxY,
+                    cropSettings.images[currentImageId].y + step
+                );
+                changed = true;
+                break;
+            case '+':
+            case '=':
+                e.preventDefault();
+                cropSettings.images[currentImageId].scale = Math.min(500,
+                    cropSettings.images[currentImageId].scale + 5
+                );
+                changed = true;
+                break;
+            case '-':
+            case '_':
+                e.preventDefault();
+                cropSettings.images[currentImageId].scale = Math.max(100,
+                    cropSettings.images[currentImageId].scale - 5
+                );
+                changed = true;
+                break;
+        }
+
+        if (changed) {
+            applyCurrentCrop();
+            updateSliders();
+            autoSave();
+        }
+    });
+
+    // Size table cell keydown handler (브라우저 줌 단축키 충돌 방지)
+    // 전역 document 레벨에서 캡처 단계로 처리하여 브라우저 줌 완전 차단
+    document.addEventListener('keydown', (e) => {
+        // 현재 포커스된 요소가 사이즈표 셀인지 확인
+        const activeElement = document.activeElement;
+        const isSizeTableCell = activeElement &&
+            (activeElement.tagName === 'TD' || activeElement.tagName === 'TH') &&
+            activeElement.closest('.size-table');
+
+        // 사이즈표 셀에서 -, =, + 키 입력 시
+        if (isSizeTableCell && (e.key === '-' || e.key === '=' || e.key === '+')) {
+            e.preventDefault();  // 브라우저 기본 동작(줌) 완전 차단
+            e.stopPropagation(); // 이벤트 전파 중지
+
+            // Cmd/Ctrl 없이 단독으로 눌렸을 때만 문자 삽입
+            if (!e.metaKey && !e.ctrlKey) {
+                document.execCommand('insertText', false, e.key);
+            }
+            // Cmd/Ctrl과 함께 눌렸을 때는 아무것도 하지 않음 (줌 차단됨)
+        }
+    }, true);  // ⭐ capture: true - 캡처 단계에서 먼저 처리
+
+    // Fabric properties cell click handler (음영 처리)
+    document.querySelectorAll('.fabric-prop-cell.editable').forEach(cell => {
+        cell.addEventListener('click', (e) => {
+            // Grid 구조: 4열(header + 3 cells) × 5행(비침, 신축성, 안감, 두께감, 계절감)
+            // 같은 행의 셀들만 selected 클래스 제거
+            const allCells = Array.from(document.querySelectorAll('.fabric-prop-cell.editable'));
+            const clickedIndex = allCells.indexOf(cell);
+            const currentRow = Math.floor(clickedIndex / 4);  // 4열 grid
+
+            // 같은 row에 속한 셀들만 selected 제거
+            allCells.forEach((elem, index) => {
+                const elemRow = Math.floor(index / 4);
+                if (elemRow === currentRow) {
+                    elem.classList.remove('selected');
+                }
+            });
+
+            // 클릭한 셀에 selected 클래스 추가
+            cell.classList.add('selected');
+            autoSave();  // 변경사항 저장
+        });
+    });
+
+    // Upload button handler
+    uploadBtn = document.getElementById('upload-trigger-btn');
+    fileInput = document.getElementById('file-input-global');
+
+    uploadBtn.addEventListener('click', () => {
+        if (!currentImageId) {
+            alert('⚠️ 먼저 교체할 이미지를 선택해주세요.');
+            return;
+        }
+        fileInput.click();
+    });
+
+    fileInput.addEventListener('change', (e) => {
+        const file = e.target.files[0];
+        if (!file || !currentImageId) return;
+
+        console.log('📤 Uploading image for:', currentImageId);
+
+        const reader = new FileReader();
+        reader.onload = (event) => {
+            const base64 = event.target.result;
+
+            const frame = document.querySelector(`[data-id="${currentImageId}"]`);
+            if (frame) {
+                const img = frame.querySelector('.editable-image');
+                if (img) {
+                    img.src = base64;
+                    console.log('✅ Image replaced:', currentImageId);
+                    autoSave();
+                }
+            }
+
+            e.target.value = '';
+        };
+        reader.readAsDataURL(file);
+    });
+
+    // Color picker handlers
+    document.querySelectorAll('.hex-picker').forEach(picker => {
+        const updateColor = (e) => {
+            const newHex = e.target.value;
+            const colorIndex = parseInt(e.target.getAttribute('data-color-index'));
+
+            const swatch = e.target.closest('.color-swatch');
+            if (swatch) {
+                swatch.style.backgroundColor = newHex;
+            }
+
+            console.log(`Color ${colorIndex} updated to ${newHex}`);
+        };
+
+        picker.addEventListener('change', updateColor);
+        picker.addEventListener('input', updateColor);
+    });
+
+    // Note: Size table form event handlers moved to inline onclick
+}
+
+// Select image
+function selectImage(imageId) {
+    currentImageId = imageId;
+
+    document.querySelectorAll('.image-frame').forEach(frame => {
+        frame.classList.remove('selected');
+    });
+
+    const selectedFrame = document.querySelector(`[data-id="${imageId}"]`);
+    if (selectedFrame) {
+        selectedFrame.classList.add('selected');
+        selectedFrame.scrollIntoView({ behavior: 'smooth', block: 'center' });
+    }
+
+    updateSliders();
+}
+
+// Load settings from localStorage
+function loadSettings() {
+    const saved = localStorage.getItem(`cropSettings_${productCode}_dana`);
+    if (saved) {
+        try {
+            const settings = JSON.parse(saved);
+
+            // Load page zoom if available
+            if (settings.pageZoom && typeof settings.pageZoom === 'number' &&
+                settings.pageZoom >= 30 && settings.pageZoom <= 100) {
+                pageZoom = settings.pageZoom;
+                const zoomSlider = document.getElementById('page-zoom');
+                const zoomValue = document.getElementById('page-zoom-value');
+                if (zoomSlider) zoomSlider.value = pageZoom;
+                if (zoomValue) zoomValue.textContent = pageZoom + '%';
+            }
+
+            // Load size image selection if available
+            if (settings.sizeImage && typeof settings.sizeImage === 'string' &&
+                sizeImagesData[settings.sizeImage]) {
+                currentSizeImage = settings.sizeImage;
+                const sizeImageSelect = document.getElementById('size-image-select');
+                if (sizeImageSelect) sizeImageSelect.value = currentSizeImage;
+
+                // Apply the saved size image
+                const productInfoImage = document.getElementById('product-info-image');
+                if (productInfoImage) {
+                    productInfoImage.src = sizeImagesData[currentSizeImage];
+                }
+            }
+
+            // Validate and load only valid settings for existing images
+            if (settings.images && typeof settings.images === 'object') {
+                imageList.forEach(img => {
+                    // Skip loading settings for hero, shot, fabric, and first gallery images
+                    // These images always use default values (x:100, y:100, scale:100)
+                    const isFirstGalleryImage = img.type === 'gallery' && img.id.endsWith('_1');
+                    if (img.type === 'hero' || img.type === 'shot' || img.type === 'fabric' || isFirstGalleryImage) {
+                        return;  // Keep default values
+                    }
+
+                    const savedImgSettings = settings.images[img.id];
+                    if (savedImgSettings &&
+                        typeof savedImgSettings.x === 'number' &&
+                        typeof savedImgSettings.y === 'number' &&
+                        typeof savedImgSettings.scale === 'number' &&
+                        savedImgSettings.scale >= 100 && savedImgSettings.scale <= 500) {
+                        // Valid saved settings found, use them
+                        cropSettings.images[img.id] = {
+                            x: savedImgSettings.x,
+                            y: savedImgSettings.y,
+                            scale: savedImgSettings.scale
+                        };
+                    }
+                    // If invalid or missing, keep the default (100, 100, 100)
+                });
+            }
+        } catch (e) {
+            console.warn('Failed to load crop settings from localStorage:', e);
+            // Keep default settings on error
+        }
+    }
+}
+
+function computeTransform(frame, settings) {
+    if (!frame || !settings) {
+        return { translateX: 0, translateY: 0, scale: 1 };
+    }
+
+    const rect = frame.getBoundingClientRect();
+    const frameWidth = frame.offsetWidth || rect.width || 0;
+    const frameHeight = frame.offsetHeight || rect.height || 0;
+
+    const scale = (typeof settings.scale === 'number' ? settings.scale : 100) / 100;
+    const offsetXPercent = (typeof settings.x === 'number' ? settings.x : 100) - 100;
+    const offsetYPercent = (typeof settings.y === 'number' ? settings.y : 100) - 100;
+
+    const translateX = frameWidth * (offsetXPercent / 100);
+    const translateY = frameHeight * (offsetYPercent / 100);
+
+    return { translateX, translateY, scale };
+}
+
+function applyTransform(frame, img, settings) {
+    const { translateX, translateY, scale } = computeTransform(frame, settings);
+    img.style.transform = `translate(${translateX}px, ${translateY}px) scale(${scale})`;
+}
+
+const imageCache = new Map();
+
+async function loadImage(src) {
+    if (!src) {
+        throw new Error('Invalid image source');
+    }
+
+    if (imageCache.has(src)) {
+        const cached = imageCache.get(src);
+        if (cached instanceof Promise) {
+            return await cached;
+        }
+        return cached;
+    }
+
+    const loader = new Promise((resolve, reject) => {
+        const tempImg = new Image();
+        tempImg.onload = () => resolve(tempImg);
+        tempImg.onerror = (err) => reject(err);
+        tempImg.src = src;
+    });
+
+    imageCache.set(src, loader);
+    try {
+        const loaded = await loader;
+        imageCache.set(src, loaded);
+        return loaded;
+    } catch (error) {
+        imageCache.delete(src);
+        throw error;
+    }
+}
+
+async function generateFlattenedImageData(frame, img, settings) {
+    const frameRect = frame.getBoundingClientRect();
+    const frameWidth = Math.max(1, Math.round(frame.offsetWidth || frameRect.width || 0));
+    const frameHeight = Math.max(1, Math.round(frame.offsetHeight || frameRect.height || 0));
+
+    if (frameWidth === 0 || frameHeight === 0) {
+        throw new Error('Frame has zero size');
+    }
+
+    const imageSource = img.currentSrc || img.src;
+    const baseImage = await loadImage(imageSource);
+    const naturalWidth = baseImage.naturalWidth || baseImage.width;
+    const naturalHeight = baseImage.naturalHeight || baseImage.height;
+
+    if (!naturalWidth || !naturalHeight) {
+        throw new Error('Unable to determine image dimensions');
+    }
+
+    const baseScale = Math.max(frameWidth / naturalWidth, frameHeight / naturalHeight);
+    const userScale = (typeof settings.scale === 'number' ? settings.scale : 100) / 100;
+    const totalScale = baseScale * userScale;
+
+    const displayWidth = naturalWidth * totalScale;
+    const displayHeight = naturalHeight * totalScale;
+
+    const offsetXPercent = (typeof settings.x === 'number' ? settings.x : 100) - 100;
+    const offsetYPercent = (typeof settings.y === 'number' ? settings.y : 100) - 100;
+
+    const translateX = frameWidth * (offsetXPercent / 100);
+    const translateY = frameHeight * (offsetYPercent / 100);
+
+    const drawX = (frameWidth - displayWidth) / 2 + translateX;
+    const drawY = (frameHeight - displayHeight) / 2 + translateY;
+
+    const canvas = document.createElement('canvas');
+    canvas.width = frameWidth;
+    canvas.height = frameHeight;
+
+    const ctx = canvas.getContext('2d', { willReadFrequently: true });
+    if (!ctx) {
+        throw new Error('Failed to acquire canvas context');
+    }
+
+    ctx.clearRect(0, 0, frameWidth, frameHeight);
+    ctx.drawImage(baseImage, drawX, drawY, displayWidth, displayHeight);
+
+    return canvas.toDataURL('image/png');
+}
+
+async function createFlattenedImageMap() {
+    const flattenedMap = {};
+    const cacheKeyMap = new Map();
+
+    for (const frame of document.querySelectorAll('.image-frame')) {
+        const id = frame.getAttribute('data-id');
+        if (!id) continue;
+        const img = frame.querySelector('.editable-image');
+        if (!img) continue;
+
+        const settings = cropSettings.images[id] || { x: 100, y: 100, scale: 100 };
+        const frameWidth = Math.round(frame.offsetWidth);
+        const frameHeight = Math.round(frame.offsetHeight);
+        const cacheKey = `${img.currentSrc || img.src}|${settings.x}|${settings.y}|${settings.scale}|${frameWidth}|${frameHeight}`;
+
+        try {
+            if (cacheKey && cacheKeyMap.has(cacheKey)) {
+                flattenedMap[id] = cacheKeyMap.get(cacheKey);
+                continue;
+            }
+
+            const flattenedData = await generateFlattenedImageData(frame, img, settings);
+            flattenedMap[id] = flattenedData;
+            if (cacheKey) {
+                cacheKeyMap.set(cacheKey, flattenedData);
+            }
+        } catch (error) {
+            console.warn('Flatten image failed', id, error);
+        }
+    }
+
+    return flattenedMap;
+}
+
+// Apply crop settings to all images
+function applyAllCropSettings() {
+    document.querySelectorAll('.image-frame').forEach(frame => {
+        const id = frame.getAttribute('data-id');
+        const img = frame.querySelector('.editable-image');
+        const settings = cropSettings.images[id];
+
+        if (settings && img) {
+            applyTransform(frame, img, settings);
+        }
+    });
+}
+
+// Apply page zoom to container
+function applyPageZoom() {
+    const container = document.querySelector('.container');
+    if (container) {
+        const scale = pageZoom / 100;
+        container.style.transform = `scale(${scale})`;
+
+        // Adjust container height to account for scale transform
+        // This prevents excessive whitespace below scaled content
+        const naturalHeight = container.scrollHeight;
+        container.style.height = `${naturalHeight * scale}px`;
+    }
+}
+
+// Apply crop to current image
+function applyCurrentCrop() {
+    const frame = document.querySelector(`[data-id="${currentImageId}"]`);
+    if (!frame) return;
+
+    const img = frame.querySelector('.editable-image');
+    const settings = cropSettings.images[currentImageId];
+    if (img && settings) {
+        applyTransform(frame, img, settings);
+    }
+}
+
+// Update sliders from current image settings
+function updateSliders() {
+    const settings = cropSettings.images[currentImageId];
+    if (settings) {
+        document.getElementById('position-x').value = settings.x;
+        document.getElementById('position-y').value = settings.y;
+        document.getElementById('scale').value = settings.scale;
+        document.getElementById('x-value').textContent = settings.x + '%';
+        document.getElementById('y-value').textContent = settings.y + '%';
+        document.getElementById('scale-value').textContent = settings.scale + '%';
+    }
+}
+
+// Change size image in product info
+function changeSizeImage(imageName) {
+    if (!sizeImagesData[imageName]) {
+        console.error('Size image not found:', imageName);
+        return;
+    }
+
+    const productInfoImage = document.getElementById('product-info-image');
+    if (productInfoImage) {
+        productInfoImage.src = sizeImagesData[imageName];
+        currentSizeImage = imageName;
+        autoSave();
+    }
+}
+
+// Populate size illustration dropdown
+function populateSizeIllustrationOptions() {
+    const sizeIllustrationSelect = document.getElementById('size-illustration');
+    if (!sizeIllustrationSelect) return;
+
+    // Add size images to dropdown
+    if (sizeImagesData && Object.keys(sizeImagesData).length > 0) {
+        Object.keys(sizeImagesData).sort().forEach(imageName => {
+            const option = document.createElement('option');
+            option.value = imageName;
+            option.textContent = imageName;
+            sizeIllustrationSelect.appendChild(option);
+        });
+    }
+}
+
+// Toggle size table form
+function toggleSizeTableForm() {
+    const form = document.getElementById('size-table-form');
+    if (form) {
+        form.style.display = form.style.display === 'none' ? 'block' : 'none';
+    }
+}
+
+// Create new size table
+function createNewSizeTable() {
+    const tableType = document.getElementById('table-type').value;
+    const rowCount = parseInt(document.getElementById('row-count').value);
+    const illustration = document.getElementById('size-illustration').value;
+
+    // Validate inputs
+    if (rowCount < 1 || rowCount > 10) {
+        alert('⚠️ 행 수는 1-10 사이여야 합니다.');
+        return;
+    }
+
+    // Create illustration HTML if selected
+    let illustrationHTML = '';
+    if (illustration && sizeImagesData[illustration]) {
+        illustrationHTML = `
+        <div style="max-width: 300px; margin: 40px auto; text-align: left;">
+            <img src="${sizeImagesData[illustration]}" alt="Size illustration" style="width: 100%; height: auto;">
+        </div>
+        `;
+    }
+
+    // Define table headers based on type
+    let headerHTML = '';
+    if (tableType === 'top') {
+        headerHTML = `
+        <tr>
+            <th contenteditable="true">호칭</th>
+            <th contenteditable="true">어깨</th>
+            <th contenteditable="true">가슴</th>
+            <th contenteditable="true">밑단</th>
+            <th contenteditable="true">소매기장</th>
+            <th contenteditable="true">소매단</th>
+            <th contenteditable="true">총장</th>
+            <th contenteditable="true">암홀</th>
+        </tr>
+        `;
+    } else { // bottom
+        headerHTML = `
+        <tr>
+            <th contenteditable="true">호칭</th>
+            <th contenteditable="true">허리</th>
+            <th contenteditable="true">엉덩이</th>
+            <th contenteditable="true">밑위</th>
+            <th contenteditable="true">허벅지</th>
+            <th contenteditable="true">밑단</th>
+            <th contenteditable="true">안기장</th>
+            <th contenteditable="true">총장</th>
+        </tr>
+        `;
+    }
+
+    // Create table rows (all empty cells)
+    let rowsHTML = '';
+    const colCount = tableType === 'top' ? 8 : 8; // Both have 8 columns
+    for (let i = 0; i < rowCount; i++) {
+        rowsHTML += '<tr>';
+        for (let j = 0; j < colCount; j++) {
+            rowsHTML += '<td contenteditable="true" class="editable"></td>';
+        }
+        rowsHTML += '</tr>';
+    }
+
+    // Create full table HTML
+    const tableHTML = illustrationHTML + `
+    <table class="size-table">
+        <thead>
+            ${headerHTML}
+        </thead>
+        <tbody>
+            ${rowsHTML}
+        </tbody>
+    </table>
+    `;
+
+    // Find the size tables container and append new table
+    const container = document.getElementById('size-tables-container');
+    const newTableDiv = document.createElement('div');
+    newTableDiv.innerHTML = tableHTML;
+    container.appendChild(newTableDiv);
+
+    // Close form
+    toggleSizeTableForm();
+
+    // Reset form
+    document.getElementById('row-count').value = 1;
+    document.getElementById('size-illustration').value = '';
+
+    alert('✅ 사이즈표가 추가되었습니다.');
+}
+
+// Auto-save to localStorage
+function autoSave() {
+    // Save crop settings, page zoom, and size image selection
+    cropSettings.pageZoom = pageZoom;
+    cropSettings.sizeImage = currentSizeImage;
+    localStorage.setItem(`cropSettings_${productCode}_dana`, JSON.stringify(cropSettings));
+}
+
+// Reset current image
+function resetCurrentImage() {
+    cropSettings.images[currentImageId] = { x: 100, y: 100, scale: 100 };
+    updateSliders();
+    applyCurrentCrop();
+    autoSave();
+    alert('✅ 현재 이미지가 리셋되었습니다.');
+}
+
+// Reset all images
+function resetAllImages() {
+    if (!confirm('⚠️ 모든 이미지 설정을 리셋하시겠습니까?')) return;
+
+    imageList.forEach(img => {
+        cropSettings.images[img.id] = { x: 100, y: 100, scale: 100 };
+    });
+    updateSliders();
+    applyAllCropSettings();
+    autoSave();
+    alert('✅ 모든 이미지가 리셋되었습니다.');
+}
+
+// Read a same-origin URL as a data URL
+async function urlToDataURL(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+    }
+    const blob = await response.blob();
+    return await new Promise((resolve, reject) => {
+        const reader = new FileReader();
+        reader.onload = () => resolve(reader.result);
+        reader.onerror = () => reject(reader.error);
+        reader.readAsDataURL(blob);
+    });
+}
+
+// Replace size-library URLs in an exported clone with embedded data URLs
+async function inlineSizeImages(root) {
+    const libraryUrls = new Set(Object.values(sizeImagesData || {}));
+    const dataUrls = new Map();
+
+    for (const img of root.querySelectorAll('img')) {
+        const src = img.getAttribute('src');
+        if (!src || !libraryUrls.has(src)) continue;
+
+        try {
+            if (!dataUrls.has(src)) {
+                dataUrls.set(src, await urlToDataURL(src));
+            }
+            img.setAttribute('src', dataUrls.get(src));
+        } catch (error) {
+            // Keep the relative URL (still resolves from output/날짜/익스포트)
+            console.warn('Size image embed failed', src, error);
+        }
+    }
+}
+
+// Export HTML
+async function exportHTML() {
+    applyAllCropSettings();
+    const flattenedImageMap = await createFlattenedImageMap();
+    const transformMap = {};
+    document.querySelectorAll('.image-frame').forEach(frame => {
+        const id = frame.getAttribute('data-id');
+        const img = frame.querySelector('.editable-image');
+        if (!id || !img) return;
+        const computedStyle = window.getComputedStyle(img);
+        const transform = computedStyle.transform;
+        const origin = computedStyle.transformOrigin;
+        transformMap[id] = {
+            transform: transform && transform !== 'none' ? transform : '',
+            origin: origin && origin !== 'none' ? origin : ''
+        };
+    });
+    const clone = document.documentElement.cloneNode(true);
+
+    // Remove control panel
+    const controlPanel = clone.querySelector('.control-panel');
+    if (controlPanel) controlPanel.remove();
+
+    // Remove scripts
+    const scripts = clone.querySelectorAll('script');
+    scripts.forEach(s => s.remove());
+
+    // Apply inline styles to all images and remove frame styling
+    clone.querySelectorAll('.image-frame').forEach(frame => {
+        const id = frame.getAttribute('data-id');
+        const img = frame.querySelector('.editable-image');
+        const transformInfo = id ? transformMap[id] : null;
+        const flattenedSrc = id ? flattenedImageMap[id] : null;
+        if (img) {
+            if (flattenedSrc) {
+                img.setAttribute('src', flattenedSrc);
+                img.style.transform = 'none';
+                img.style.transformOrigin = 'center center';
+                img.style.objectFit = 'cover';
+            } else if (transformInfo && transformInfo.transform) {
+                img.style.transform = transformInfo.transform;
+                if (transformInfo.origin) {
+                    img.style.transformOrigin = transformInfo.origin;
+                } else {
+                    img.style.removeProperty('transform-origin');
+                }
+            } else {
+                img.style.removeProperty('transform');
+                img.style.removeProperty('transform-origin');
+            }
+        }
+        frame.style.cursor = 'default';
+        frame.classList.remove('selected');
+        frame.style.border = 'none';
+        frame.style.outline = 'none';
+    });
+
+    // Remove contenteditable
+    clone.querySelectorAll('[contenteditable]').forEach(el => {
+        el.removeAttribute('contenteditable');
+    });
+
+    // Remove hex pickers
+    clone.querySelectorAll('.hex-picker').forEach(picker => picker.remove());
+
+    // Embed size illustrations referenced from the shared library (export must stand alone)
+    await inlineSizeImages(clone);
+
+    // Remove inline styles from body (especially min-height)
+    const body = clone.querySelector('body');
+    if (body) {
+        body.removeAttribute('style');
+    }
+
+    const htmlContent = '<!DOCTYPE html>\n' + clone.outerHTML;
+
+    try {
+        // Send to server
+        const response = await fetch('http://localhost:5001/save-html', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                productCode: productCode,
+                htmlContent: htmlContent
+            })
+        });
+
+        if (response.ok) {
+            const result = await response.json();
+            alert(`✅ HTML 저장 완료\n경로: ${result.path}`);
+        } else {
+            const error = await response.json();
+            alert(`❌ 서버 저장 실패: ${error.error}`);
+        }
+    } catch (error) {
+        console.error('Export error:', error);
+        alert('❌ 서버 연결 실패. 서버가 실행 중인지 확인하세요.\n(python3 scripts/server.py)');
+    }
+}
+
+// Tiled JPG export settings
+const TILE_SERVER_URL = 'http://localhost:5001/save-jpg-tile';
+const TILE_PIXEL_BUDGET_PER_GB = 4 * 1024 * 1024;  // Canvas pixels per GB of device memory (16MB RGBA)
+const TILE_MAX_CANVAS_HEIGHT = 16384;              // Common browser canvas height limit
+const TILE_MIN_HEIGHT = 500;                       // Smallest tile height when retrying (CSS px)
+
+// Tile height (CSS px) sized to the device's memory
+function computeTileHeight(widthCss, scale) {
+    const deviceGB = Math.min(Math.max(navigator.deviceMemory || 4, 1), 8);
+    const canvasHeight = Math.min(
+        (deviceGB * TILE_PIXEL_BUDGET_PER_GB) / (widthCss * scale),
+        TILE_MAX_CANVAS_HEIGHT
+    );
+    return Math.max(TILE_MIN_HEIGHT, Math.floor(canvasHeight / scale));
+}
+
+function createTileSessionId() {
+    return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+}
+
+function canvasToJpegBlob(canvas, quality) {
+    return new Promise((resolve, reject) => {
+        canvas.toBlob((blob) => {
+            if (blob && blob.size > 0) {
+                resolve(blob);
+            } else {
+                reject(new Error('Blob 변환 실패'));
+            }
+        }, 'image/jpeg', quality);
+    });
+}
+
+function releaseCanvas(canvas) {
+    // Free canvas memory right away instead of waiting for GC
+    if (canvas) {
+        canvas.width = 0;
+        canvas.height = 0;
+    }
+}
+
+function downloadBlob(blob, filename) {
+    const blobUrl = URL.createObjectURL(blob);
+    const link = document.createElement('a');
+    link.href = blobUrl;
+    link.download = filename;
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+    setTimeout(() => URL.revokeObjectURL(blobUrl), 100);
+}
+
+// Upload one tile (the server appends tiles in order)
+async function uploadTile(blob, params) {
+    const query = new URLSearchParams(params);
+    const response = await fetch(`${TILE_SERVER_URL}?${query}`, {
+        method: 'POST',
+        headers: {'Content-Type': 'image/jpeg'},
+        body: blob
+    });
+    const result = await response.json().catch(() => ({}));
+    if (!response.ok || !result.success) {
+        throw new Error(result.error || `HTTP ${response.status}`);
+    }
+    return result;
+}
+
+function readSliceHeight() {
+    const input = document.getElementById('jpg-slice-height');
+    const value = input ? parseInt(input.value, 10) : NaN;
+    return Number.isFinite(value) && value > 0 ? value : null;
+}
+
+// Export as JPG (adaptive tiles, stitched on the server)
+async function exportAsJPG() {
+    applyAllCropSettings();
+    const flattenedImageMap = await createFlattenedImageMap();
+    const imageTransformStates = [];
+    const replacedImageStates = [];
+
+    document.querySelectorAll('.image-frame').forEach(frame => {
+        const id = frame.getAttribute('data-id');
+        const img = frame.querySelector('.editable-image');
+        if (!img) return;
+
+        const flattenedSrc = id ? flattenedImageMap[id] : null;
+
+        if (flattenedSrc) {
+            replacedImageStates.push({
+                img,
+                src: img.src,
+                transform: img.style.transform,
+                origin: img.style.transformOrigin,
+                objectFit: img.style.objectFit
+            });
+            img.src = flattenedSrc;
+            img.style.transform = 'none';
+            img.style.transformOrigin = 'center center';
+            img.style.objectFit = 'cover';
+        } else {
+            const computed = window.getComputedStyle(img);
+            imageTransformStates.push({
+                img,
+                transform: img.style.transform,
+                origin: img.style.transformOrigin
+            });
+            const computedTransform = computed.transform;
+            if (computedTransform && computedTransform !== 'none') {
+                img.style.transform = computedTransform;
+            }
+            const computedOrigin = computed.transformOrigin;
+            if (computedOrigin && computedOrigin !== 'none') {
+                img.style.transformOrigin = computedOrigin;
+            }
+        }
+    });
+
+    await Promise.all(replacedImageStates.map(state => {
+        if (state.img.decode) {
+            return state.img.decode().catch(() => undefined);
+        }
+        return Promise.resolve();
+    }));
+
+    const controlPanel = document.querySelector('.control-panel');
+    const container = document.querySelector('.container');
+    const body = document.body;
+
+    if (!container) {
+        alert('❌ 컨테이너를 찾을 수 없습니다.');
+        return;
+    }
+
+    // Save original styles
+    const originalTransform = container.style.transform;
+    const originalHeight = container.style.height;
+    const originalMinHeight = body.style.minHeight;
+
+    // Save original selection state
+    const selectedFrames = document.querySelectorAll('.image-frame.selected');
+    const originalSelectedIds = Array.from(selectedFrames).map(f => f.getAttribute('data-id'));
+
+    // Hide control panel
+    if (controlPanel) {
+        controlPanel.style.display = 'none';
+    }
+
+    try {
+        // Reset container transform and height for capture
+        container.style.transform = 'none';
+        container.style.height = 'auto';
+        body.style.minHeight = 'auto';
+
+        // Remove all selection styles before capture
+        document.querySelectorAll('.image-frame').forEach(frame => {
+            frame.classList.remove('selected');
+            frame.style.border = 'none';
+            frame.style.outline = 'none';
+            frame.style.boxShadow = 'none';
+        });
+
+        // Wait for layout and styles to settle
+        await new Promise(resolve => setTimeout(resolve, 150));
+
+        // Capture in tiles sized to device memory; the server stitches them into one JPG
+        const totalWidth = container.scrollWidth;
+        const totalHeight = container.scrollHeight;
+        const canvasScale = 2;  // High resolution
+        const sliceHeight = readSliceHeight();
+        const sessionId = createTileSessionId();
+        let tileHeight = computeTileHeight(totalWidth, canvasScale);
+        let usedClientDownload = false;
+        let serverResult = null;
+        let tileIndex = 0;
+        let startY = 0;
+
+        console.log(`📐 Page ${totalWidth}×${totalHeight}px, tile height ${tileHeight}px (deviceMemory: ${navigator.deviceMemory || 'unknown'})`);
+
+        while (startY < totalHeight) {
+            const chunkHeight = Math.min(tileHeight, totalHeight - startY);
+
+            let canvas = null;
+            try {
+                canvas = await html2canvas(container, {
+                    scale: canvasScale,
+                    useCORS: true,
+                    backgroundColor: '#ffffff',
+                    logging: false,
+                    allowTaint: true,
+                    windowWidth: totalWidth,
+                    windowHeight: chunkHeight,
+                    width: totalWidth,
+                    height: chunkHeight,
+                    y: startY,
+                    scrollY: -startY
+                });
+                if (!canvas || canvas.width === 0 || canvas.height === 0) {
+                    throw new Error(`Tile ${tileIndex + 1} canvas creation failed`);
+                }
+            } catch (captureError) {
+                releaseCanvas(canvas);
+                // Canvas limit hit: halve the tile height and retry from the same offset
+                if (tileHeight > TILE_MIN_HEIGHT) {
+                    tileHeight = Math.max(TILE_MIN_HEIGHT, Math.floor(tileHeight / 2));
+                    console.warn(`⚠️ ${captureError.message} → retrying with ${tileHeight}px tiles`);
+                    continue;
+                }
+                throw captureError;
+            }
+
+            const blob = await canvasToJpegBlob(canvas, 0.95);
+            releaseCanvas(canvas);
+
+            const isLast = startY + chunkHeight >= totalHeight;
+
+            if (!usedClientDownload) {
+                try {
+                    const result = await uploadTile(blob, {
+                        productCode,
+                        session: sessionId,
+                        index: tileIndex,
+                        final: isLast ? 1 : 0,
+                        ...(sliceHeight ? {slice: sliceHeight} : {})
+                    });
+                    if (isLast) {
+                        serverResult = result;
+                    }
+                } catch (serverError) {
+                    // Fall back to downloads only if the server is unreachable from the first tile
+                    if (tileIndex > 0) {
+                        throw new Error(`타일 업로드 실패 (${tileIndex + 1}번): ${serverError.message}`);
+                    }
+                    console.warn('Server save failed, falling back to browser download:', serverError.message);
+                    usedClientDownload = true;
+                }
+            }
+
+            if (usedClientDownload) {
+                downloadBlob(blob, `${productCode}_${String(tileIndex + 1).padStart(2, '0')}.jpg`);
+            }
+
+            startY += chunkHeight;
+            tileIndex++;
+        }
+
+        if (usedClientDownload) {
+            alert(`✅ JPG 다운로드 완료\n위치: 다운로드 폴더 (${tileIndex}개 타일)\n(서버 미실행 시 브라우저 다운로드)`);
+        } else {
+            let message = `✅ JPG 저장 완료\n경로: ${serverResult.path}\n(${serverResult.width}×${serverResult.height}px, 타일 ${serverResult.tiles}개)`;
+            if (serverResult.files.length > 1) {
+                message += `\n\n📄 JPG 최대 높이를 넘어 ${serverResult.files.length}개 파일로 나눠 저장:\n${serverResult.files.join('\n')}`;
+            }
+            if (serverResult.slices.length) {
+                message += `\n\n✂️ 조각 ${serverResult.slices.length}개 추가 저장 (${sliceHeight}px)`;
+            }
+            alert(message);
+        }
+
+    } catch (error) {
+        console.error('Export error:', error);
+        alert('❌ JPG 저장 실패: ' + error.message);
+    } finally {
+        imageTransformStates.forEach(state => {
+            state.img.style.transform = state.transform;
+            state.img.style.transformOrigin = state.origin || '';
+        });
+        replacedImageStates.forEach(state => {
+            state.img.src = state.src;
+            state.img.style.transform = state.transform || '';
+            state.img.style.transformOrigin = state.origin || '';
+            if (state.objectFit) {
+                state.img.style.objectFit = state.objectFit;
+            } else {
+                state.img.style.removeProperty('object-fit');
+            }
+        });
+
+        // Restore original styles
+        container.style.transform = originalTransform;
+        container.style.height = originalHeight;
+        body.style.minHeight = originalMinHeight;
+
+        // Restore selection state
+        originalSelectedIds.forEach(id => {
+            const frame = document.querySelector(`[data-id="${id}"]`);
+            if (frame) {
+                frame.classList.add('selected');
+                frame.style.border = '';
+                frame.style.outline = '';
+                frame.style.boxShadow = '';
+            }
+        });
+
+        // Restore control panel
+        if (controlPanel) {
+            controlPanel.style.display = 'block';
+        }
+    }
+}
+
+// Initialize on page load
+window.addEventListener('DOMContentLoaded', init);
@@ -0,0 +1,114 @@
+"""
+Editor runtime bundle for editable pages
+
+The editor script (scripts/editor_assets/editor.js) is written once per output
+root as a content-hashed static file instead of being inlined into every page:
+
+  output/static/editor/
+    editor-v1.{hash}.js   # immutable, served with long-lived cache headers
+    editor-v1.js          # copy of the current bundle, the name pages reference
+    editor-v1.json        # manifest: current hashed file name
+
+Pages reference the stable name by relative URL, so they also work from file://;
+the server redirects the stable name to the current hashed file. Editor fixes
+ship by re-emitting the bundle (server restart) without regenerating pages.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+EDITOR_RUNTIME_VERSION = "v1"  # Page <-> runtime contract (window.DANA_EDITOR shape)
+STATIC_DIR_NAME = "static"
+EDITOR_DIR_NAME = "editor"
+
+# Relative to output/{date}/에디터블/*.html, /editable/<code> and /archive/<date>/<code>,
+# all of which sit two levels below the output (server) root
+RUNTIME_URL = f"../../{STATIC_DIR_NAME}/{EDITOR_DIR_NAME}"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+ASSET_PATH = Path(__file__).parent / "editor_assets" / "editor.js"
+
+
+class RuntimeBundle(NamedTuple):
+    """Emitted bundle (hashed file name)"""
+    version: str
+    js: str
+
+
+def editor_dir(output_dir: Path) -> Path:
+    """Bundle folder (output/static/editor)"""
+    return output_dir / STATIC_DIR_NAME / EDITOR_DIR_NAME
+
+
+def stable_name() -> str:
+    """File name pages reference (e.g. editor-v1.js)"""
+    return f"editor-{EDITOR_RUNTIME_VERSION}.js"
+
+
+def manifest_name() -> str:
+    return f"editor-{EDITOR_RUNTIME_VERSION}.json"
+
+
+def content_hash(data: bytes) -> str:
+    """Content hash for file names (first 12 hex chars of sha256)"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _write_if_changed(path: Path, data: bytes) -> None:
+    """Atomically write only when the content differs"""
+    if path.exists() and path.read_bytes() == data:
+        return
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def emit_bundle(output_dir: Path) -> RuntimeBundle:
+    """
+    Write or refresh the bundle (unchanged files are not rewritten)
+
+    Args:
+        output_dir: Output root
+
+    Returns:
+        RuntimeBundle
+    """
+    target = editor_dir(output_dir)
+    target.mkdir(parents=True, exist_ok=True)
+
+    data = ASSET_PATH.read_bytes()
+    hashed = f"editor-{EDITOR_RUNTIME_VERSION}.{content_hash(data)}.js"
+    _write_if_changed(target / hashed, data)
+    _write_if_changed(target / stable_name(), data)
+
+    bundle = RuntimeBundle(EDITOR_RUNTIME_VERSION, hashed)
+    _write_if_changed(target / manifest_name(), json.dumps(bundle._asdict(), indent=2).encode('utf-8'))
+    return bundle
+
+
+def read_manifest(output_dir: Path) -> Optional[RuntimeBundle]:
+    """Current bundle manifest (None if missing)"""
+    try:
+        with open(editor_dir(output_dir) / manifest_name(), 'r', encoding='utf-8') as f:
+            return RuntimeBundle(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def script_tags(config: Dict[str, Any]) -> str:
+    """
+    Per-product config + runtime reference for the end of <body>
+
+    Args:
+        config: window.DANA_EDITOR value (productCode, imageList, sizeImagesData, defaultSizeImage)
+    """
+    # Keep "</script>" inside values from closing the tag early
+    config_json = json.dumps(config, ensure_ascii=False).replace("</", "<\\/")
+    return (
+        f"<script>window.DANA_EDITOR = {config_json};</script>\n"
+        f'<script src="{RUNTIME_URL}/{stable_name()}"></script>'
+    )
@@ -0,0 +1,179 @@
+"""
+Export store - content-hash deduplication + race-free file naming
+
+Exports are indexed by content hash in a small per-folder index instead of
+probing name_1, name_2 ... with exists() and rewriting identical bytes:
+
+  {export_dir}/.exports.json
+    {"version": 2,
+     "files": {"DN25FW001_dana|.jpg|<sha256>": "DN25FW001_dana.jpg", ...},   # name + content hash -> file name
+     "next": {"DN25FW001_dana|.jpg": 2, ...}}             # next suffix number per name
+
+- Same base name + same content: the existing file is returned (no disk use, no name probing)
+- Different base names always get their own file, even with identical bytes (blank or
+  shared footer slices, matching slices of two products), so every requested
+  _sNN/_partN name exists
+- New content: written to a temp file, then atomically created under the final
+  name with os.link (FileExistsError -> next number, never overwrites)
+
+The index is a dot file, so archives skip it.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+INDEX_NAME = ".exports.json"
+INDEX_VERSION = 2  # 1 keyed on the content hash alone (products/slices shared files)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_lock = threading.Lock()  # Guards index read-modify-write across server threads
+
+
+class StoredExport(NamedTuple):
+    """Store result"""
+    path: Path
+    digest: str
+    created: bool  # False if an existing file with the same content was reused
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """Content hash of a file (read in chunks so large JPGs stay bounded)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def store_bytes(directory: Path, base_name: str, extension: str, data: bytes) -> StoredExport:
+    """
+    Store an export (returns the existing file if the same content is already there)
+
+    Args:
+        directory: Export folder
+        base_name: Base file name (e.g. DN25FW001_exported_dana)
+        extension: Extension (.html, .jpg)
+        data: File content
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    digest = content_digest(data)
+
+    with _lock:
+        index = _read_index(directory)
+        key = _file_key(base_name, extension, digest)
+        existing = _lookup(directory, index, key)
+        if existing:
+            return StoredExport(existing, digest, False)
+
+        tmp_path = directory / f".{digest[:16]}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path.write_bytes(data)
+        try:
+            path = _link_new_name(directory, index, base_name, extension, tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        index["files"][key] = path.name
+        _write_index(directory, index)
+        return StoredExport(path, digest, True)
+
+
+def adopt_file(directory: Path, base_name: str, extension: str, source: Path) -> StoredExport:
+    """
+    Register a file already written to disk (a temp file in the same folder)
+
+    If the same content exists, source is removed and the existing file returned.
+    source is always cleaned up.
+    """
+    digest = file_digest(source)
+
+    with _lock:
+        try:
+            index = _read_index(directory)
+            key = _file_key(base_name, extension, digest)
+            existing = _lookup(directory, index, key)
+            if existing:
+                return StoredExport(existing, digest, False)
+
+            path = _link_new_name(directory, index, base_name, extension, source)
+            index["files"][key] = path.name
+            _write_index(directory, index)
+            return StoredExport(path, digest, True)
+        finally:
+            source.unlink(missing_ok=True)
+
+
+def _file_key(base_name: str, extension: str, digest: str) -> str:
+    """Index key (base name + extension + content hash)"""
+    return f"{base_name}|{extension}|{digest}"
+
+
+def _lookup(directory: Path, index: Dict, key: str) -> Optional[Path]:
+    """Indexed file with the same base name and content (None and entry dropped if it was deleted)"""
+    name = index["files"].get(key)
+    if not name:
+        return None
+    path = directory / name
+    if path.is_file():
+        return path
+    del index["files"][key]
+    return None
+
+
+def _link_new_name(directory: Path, index: Dict, base_name: str, extension: str, source: Path) -> Path:
+    """Atomically link source under a new name (picked from the index counter)"""
+    key = f"{base_name}|{extension}"
+    counter = index["next"].get(key, 0)
+    while True:
+        name = f"{base_name}{extension}" if counter == 0 else f"{base_name}_{counter}{extension}"
+        path = directory / name
+        try:
+            _create_exclusive(source, path)
+        except FileExistsError:
+            # File from before the index, or created first by another process
+            counter += 1
+            continue
+        index["next"][key] = counter + 1
+        return path
+
+
+def _create_exclusive(source: Path, path: Path) -> None:
+    """Create path from source only if absent (hard link; exclusive copy where links are unsupported)"""
+    try:
+        os.link(source, path)
+        return
+    except FileExistsError:
+        raise
+    except OSError:
+        pass
+
+    with open(source, "rb") as src, open(path, "xb") as dst:
+        for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b""):
+            dst.write(chunk)
+
+
+def _read_index(directory: Path) -> Dict:
+    try:
+        with open(directory / INDEX_NAME, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") == INDEX_VERSION:
+            index.setdefault("files", {})
+            index.setdefault("next", {})
+            return index
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"version": INDEX_VERSION, "files": {}, "next": {}}
+
+
+def _write_index(directory: Path, index: Dict) -> None:
+    """Temp file -> rename"""
+    tmp_path = directory / f"{INDEX_NAME}.tmp"
+    tmp_path.write_text(json.dumps(index, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, directory / INDEX_NAME)
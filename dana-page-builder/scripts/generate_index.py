@@ -3,22 +3,26 @@ DANA&PETA Index Page Generator
 Creates an index page with links to all product pages
 """
 
-import json
+import html as html_lib
 import logging
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List
 
 from config import (
     BRAND_NAME,
     DATE_FORMAT,
+    INDEX_CHUNK_SIZE,
     LOG_DATE_FORMAT,
     LOG_FILE,
     LOG_FORMAT,
     ORIGINAL_FOLDER,
     OUTPUT_DIR,
-    PRODUCTS_DATA_PATH,
+    PRODUCTS_DB_PATH,
 )
+from product_store import ProductStore
+from thumbnails import ThumbnailCache
 
 # Setup logging
 logging.basicConfig(
@@ -32,6 +36,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Appends <template> card chunks as the sentinel scrolls into view; search hydrates everything first
+INDEX_SCRIPT = """
+    <script>
+    (function () {
+        const grid = document.getElementById('products-grid');
+        const sentinel = document.getElementById('chunk-sentinel');
+        const search = document.getElementById('product-search');
+        const visibleCount = document.getElementById('visible-count');
+        const chunks = Array.from(document.querySelectorAll('template.card-chunk'));
+        let observer = null;
+
+        function appendNextChunk() {
+            const chunk = chunks.shift();
+            if (!chunk) {
+                if (observer) observer.disconnect();
+                sentinel.remove();
+                return false;
+            }
+            grid.appendChild(chunk.content);
+            chunk.remove();
+            return true;
+        }
+
+        if ('IntersectionObserver' in window) {
+            observer = new IntersectionObserver(function (entries) {
+                if (entries.some(function (entry) { return entry.isIntersecting; }) && appendNextChunk()) {
+                    // Re-observe so a sentinel that is still visible triggers the next chunk
+                    observer.unobserve(sentinel);
+                    observer.observe(sentinel);
+                }
+            }, { rootMargin: '800px 0px' });
+            observer.observe(sentinel);
+        } else {
+            while (appendNextChunk()) {}
+        }
+
+        search.addEventListener('input', function () {
+            while (appendNextChunk()) {}
+            const query = search.value.trim().toLowerCase();
+            let visible = 0;
+            grid.querySelectorAll('.product-card').forEach(function (card) {
+                const match = !query || card.dataset.search.indexOf(query) !== -1;
+                card.hidden = !match;
+                if (match) visible++;
+            });
+            visibleCount.textContent = visible;
+        });
+    })();
+    </script>
+"""
+
 
 class IndexPageGenerator:
     """Generate index page for DANA&PETA products"""
@@ -42,43 +97,69 @@ class IndexPageGenerator:
         self.date_folder = datetime.now().strftime(DATE_FORMAT)
         self.original_folder = OUTPUT_DIR / self.date_folder / ORIGINAL_FOLDER
         self.index_file = OUTPUT_DIR / "index.html"
+        self.thumbnails = ThumbnailCache()
 
     def load_products_data(self) -> None:
-        """Load products from JSON file"""
+        """Load product summaries (code, title, main image) from the product store"""
         try:
-            if not PRODUCTS_DATA_PATH.exists():
-                raise FileNotFoundError(f"❌ Products data not found: {PRODUCTS_DATA_PATH}")
+            with ProductStore() as store:
+                if store.count() == 0:
+                    raise FileNotFoundError(f"❌ Products data not found: {PRODUCTS_DB_PATH}")
 
-            with open(PRODUCTS_DATA_PATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                self.products = store.list_summaries()
 
-            self.products = data.get('products', [])
             logger.info(f"✅ Loaded {len(self.products)} products")
 
         except Exception as e:
             logger.error(f"❌ Failed to load products data: {e}")
             raise
 
-    def generate_index_html(self) -> str:
-        """Generate index page HTML"""
-
-        # Build product cards HTML
-        product_cards_html = ""
-        for product in self.products:
-            code = product['productCode']
-            title = product['title']
-            page_path = f"{self.date_folder}/{ORIGINAL_FOLDER}/{code}.html"
-
-            product_cards_html += f'''
-            <div class="product-card">
+    def build_product_card(self, product: Dict) -> str:
+        """Build one product card (lazy-loaded WebP thumbnail + code/title)"""
+        code = html_lib.escape(product['productCode'])
+        title = html_lib.escape(product['title'] or "")
+        page_path = f"{self.date_folder}/{ORIGINAL_FOLDER}/{code}.html"
+        search_text = html_lib.escape(f"{product['productCode']} {product['title'] or ''}".lower())
+
+        thumb_path = self.thumbnails.get_thumbnail(product.get('mainImage'))
+        if thumb_path:
+            thumb_html = f'<img src="{thumb_path}" alt="{title}" loading="lazy" decoding="async">'
+        else:
+            thumb_html = '<div class="product-thumb-empty">No Image</div>'
+
+        return f'''
+            <div class="product-card" data-search="{search_text}">
                 <a href="{page_path}" class="product-link">
+                    <div class="product-thumb">{thumb_html}</div>
                     <div class="product-info">
                         <div class="product-code">{code}</div>
                         <div class="product-title">{title}</div>
                     </div>
                 </a>
-            </div>
-            '''
+            </div>'''
+
+    def build_card_chunks(self) -> List[str]:
+        """Render cards in INDEX_CHUNK_SIZE chunks (first chunk inline, rest as <template>s)"""
+        chunks = []
+        for start in range(0, len(self.products), INDEX_CHUNK_SIZE):
+            cards = [self.build_product_card(p) for p in self.products[start:start + INDEX_CHUNK_SIZE]]
+            chunks.append("".join(cards))
+        return chunks
+
+    def generate_index_html(self) -> str:
+        """Generate index page HTML"""
+
+        # Build product cards HTML
+        chunks = self.build_card_chunks()
+        self.thumbnails.save_memo()
+        logger.info(
+            f"🖼️  Thumbnails: {self.thumbnails.generated} generated, {self.thumbnails.reused} reused"
+        )
+
+        product_cards_html = chunks[0] if chunks else ""
+        deferred_chunks_html = "".join(
+            f'\n        <template class="card-chunk">{chunk}\n        </template>' for chunk in chunks[1:]
+        )
 
         # Complete HTML
         html = f'''<!DOCTYPE html>
@@ -171,6 +252,47 @@ class IndexPageGenerator:
             color: inherit;
         }}
 
+        .product-card[hidden] {{
+            display: none;
+        }}
+
+        .product-thumb {{
+            aspect-ratio: 3 / 4;
+            background: #f0f0f0;
+            overflow: hidden;
+        }}
+
+        .product-thumb img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            display: block;
+        }}
+
+        .product-thumb-empty {{
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            height: 100%;
+            font-size: 12px;
+            color: #bbb;
+        }}
+
+        .product-search {{
+            display: block;
+            width: 100%;
+            max-width: 400px;
+            margin: 0 auto;
+            padding: 12px 16px;
+            font-size: 14px;
+            border: 1px solid #ddd;
+            border-radius: 8px;
+        }}
+
+        #chunk-sentinel {{
+            height: 1px;
+        }}
+
         .product-info {{
             padding: 30px 20px;
         }}
@@ -229,16 +351,23 @@ class IndexPageGenerator:
                     <span class="stat-label">Total Products:</span>
                     <span class="stat-value">{len(self.products)}</span>
                 </div>
+                <div class="stat-item">
+                    <span class="stat-label">Showing:</span>
+                    <span class="stat-value" id="visible-count">{len(self.products)}</span>
+                </div>
                 <div class="stat-item">
                     <span class="stat-label">Generated:</span>
                     <span class="stat-value">{self.date_folder}</span>
                 </div>
             </div>
+            <input type="search" id="product-search" class="product-search" placeholder="제품 코드 또는 이름 검색">
         </div>
 
-        <div class="products-grid">
+        <div class="products-grid" id="products-grid">
             {product_cards_html}
         </div>
+        <div id="chunk-sentinel"></div>
+        {deferred_chunks_html}
 
         <div class="footer">
             <div class="footer-text">
@@ -248,6 +377,7 @@ class IndexPageGenerator:
             </div>
         </div>
     </div>
+{INDEX_SCRIPT}
 </body>
 </html>'''
 
@@ -4,19 +4,22 @@ Generates product detail pages with DANA&PETA brand template
 """
 
 import base64
-import json
 import logging
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from asset_cache import EncodedAssetCache
 from config import (
     ASSETS_DIR,
     BRAND_LOGO_TEXT,
     BRAND_NAME,
     DATE_FORMAT,
     EDITABLE_FILE_PATTERN,
+    ENCODED_ASSET_CACHE_MAX_BYTES,
     EDITABLE_FOLDER,
     LOG_DATE_FORMAT,
     LOG_FILE,
@@ -24,8 +27,11 @@ from config import (
     ORIGINAL_FILE_PATTERN,
     ORIGINAL_FOLDER,
     OUTPUT_DIR,
-    PRODUCTS_DATA_PATH,
+    PRODUCTS_DB_PATH,
 )
+from product_store import ProductStore
+import editor_runtime
+import size_library
 
 # Setup logging
 logging.basicConfig(
@@ -43,28 +49,42 @@ logger = logging.getLogger(__name__)
 class DanaPageGenerator:
     """Generate DANA&PETA product detail pages"""
 
-    def __init__(self):
-        """Initialize the page generator"""
+    def __init__(self, date_folder: Optional[str] = None, asset_cache_bytes: int = ENCODED_ASSET_CACHE_MAX_BYTES):
+        """Initialize the page generator
+
+        Args:
+            date_folder: Output date folder (defaults to today; pool workers reuse the parent's)
+            asset_cache_bytes: Encoded asset cache cap (pool workers get a share of the total)
+        """
         self.products = []
-        self.date_folder = datetime.now().strftime(DATE_FORMAT)
+        self.date_folder = date_folder or datetime.now().strftime(DATE_FORMAT)
         self.output_original = OUTPUT_DIR / self.date_folder / ORIGINAL_FOLDER
         self.output_editable = OUTPUT_DIR / self.date_folder / EDITABLE_FOLDER
 
+        # Encoded images shared by both variants and across products (logos, size images)
+        self.asset_cache = EncodedAssetCache(asset_cache_bytes)
+
         # Create output directories
         self.output_original.mkdir(parents=True, exist_ok=True)
         self.output_editable.mkdir(parents=True, exist_ok=True)
 
-    def load_products_data(self) -> None:
-        """Load products from JSON file"""
+    def load_products_data(self, product_codes: Optional[List[str]] = None) -> None:
+        """Load products from the product store
+
+        Args:
+            product_codes: Only load these products (keyed lookups). None = all products
+        """
         try:
-            if not PRODUCTS_DATA_PATH.exists():
-                raise FileNotFoundError(f"❌ Products data not found: {PRODUCTS_DATA_PATH}")
+            with ProductStore() as store:
+                if store.count() == 0:
+                    raise FileNotFoundError(f"❌ Products data not found: {PRODUCTS_DB_PATH}")
 
-            with open(PRODUCTS_DATA_PATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                if product_codes:
+                    self.products = store.get_many(product_codes)
+                else:
+                    self.products = list(store.iter_products())
 
-            self.products = data.get('products', [])
-            logger.info(f"✅ Loaded {len(self.products)} products from {PRODUCTS_DATA_PATH}")
+            logger.info(f"✅ Loaded {len(self.products)} products from {PRODUCTS_DB_PATH}")
 
         except Exception as e:
             logger.error(f"❌ Failed to load products data: {e}")
@@ -86,26 +106,33 @@ class DanaPageGenerator:
                 logger.warning(f"⚠️  Image not found: {full_path}")
                 return None
 
-            with open(full_path, 'rb') as f:
-                image_data = f.read()
-                base64_data = base64.b64encode(image_data).decode('utf-8')
-
-            # Detect image format
-            suffix = full_path.suffix.lower()
-            mime_type = {
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.png': 'image/png',
-                '.gif': 'image/gif',
-                '.webp': 'image/webp'
-            }.get(suffix, 'image/jpeg')
-
-            return f"data:{mime_type};base64,{base64_data}"
+            return self.asset_cache.get_data_url(full_path)
 
         except Exception as e:
             logger.error(f"❌ Failed to convert image to base64: {e}")
             return None
 
+    def size_image_src(self, size_image_value: str, editable: bool) -> Optional[str]:
+        """Image source for the product's size illustration
+
+        Args:
+            size_image_value: sizeImage field (illustration name, e.g. "상의")
+            editable: Library URL for editable pages, embedded data URL otherwise
+        """
+        if not size_image_value or not size_image_value.strip():
+            return None
+
+        if editable:
+            url = size_library.image_url(size_library.load_library(OUTPUT_DIR), size_image_value)
+            if url:
+                return url
+
+        size_image_path = size_library.SIZE_IMAGES_DIR / f"{size_image_value.strip()}.png"
+        if not size_image_path.exists():
+            logger.warning(f"⚠️  Size image not found: {size_image_path}")
+            return None
+        return self.image_to_base64(str(size_image_path))
+
     def create_placeholder_image(self) -> str:
         """Create a placeholder SVG image as base64 data URL"""
         svg_content = '''<svg width="800" height="600" xmlns="http://www.w3.org/2000/svg">
@@ -467,31 +494,20 @@ class DanaPageGenerator:
         # Build product info HTML (Figma node 1-91: horizontal layout with image + 2-column table)
         product_info_data = product.get("productInfo", {})
 
-        # Load all size images for editable mode
+        # Size illustrations: editable pages reference the shared library by name
+        # (see size_library.py), original pages embed the one they display
         size_images_data = {}
         default_size_image = product.get("sizeImage", "상의")
+        size_image_src = self.size_image_src(product.get("sizeImage", ""), editable)
 
         if editable:
-            # Load all size images from size_images folder
-            size_images_dir = Path(__file__).parent.parent / "size_images"
-            if size_images_dir.exists():
-                for size_image_file in size_images_dir.glob("*.png"):
-                    image_name = size_image_file.stem  # filename without extension
-                    image_base64 = self.image_to_base64(str(size_image_file))
-                    if image_base64:
-                        size_images_data[image_name] = image_base64
+            size_images_data = size_library.image_urls(size_library.load_library(OUTPUT_DIR))
 
         # Get size image (same as used in size table section)
         product_info_image_html = ""
-        size_image_value = product.get("sizeImage", "")
-        if size_image_value and size_image_value.strip():
-            size_image_filename = f"{size_image_value.strip()}.png"
-            size_image_path = Path(__file__).parent.parent / "size_images" / size_image_filename
-            if size_image_path.exists():
-                product_info_image_base64 = self.image_to_base64(str(size_image_path))
-                if product_info_image_base64:
-                    img_id = ' id="product-info-image"' if editable else ''
-                    product_info_image_html = f'<img{img_id} src="{product_info_image_base64}" alt="Product info illustration" class="product-info-image">'
+        if size_image_src:
+            img_id = ' id="product-info-image"' if editable else ''
+            product_info_image_html = f'<img{img_id} src="{size_image_src}" alt="Product info illustration" class="product-info-image">'
 
         # Build 2-column table rows
         product_info_rows = ""
@@ -582,22 +598,12 @@ class DanaPageGenerator:
 
         # Get size image based on sizeImage field value
         size_image_html = ""
-        size_image_value = product.get("sizeImage", "")
-        if size_image_value and size_image_value.strip():
-            # Map size image value to PNG filename
-            size_image_filename = f"{size_image_value.strip()}.png"
-            size_image_path = Path(__file__).parent.parent / "size_images" / size_image_filename
-
-            if size_image_path.exists():
-                size_image_base64 = self.image_to_base64(str(size_image_path))
-                if size_image_base64:
-                    size_image_html = f'''
+        if size_image_src:
+            size_image_html = f'''
                     <div style="max-width: 800px; margin: 40px auto; text-align: center;">
-                        <img src="{size_image_base64}" alt="Size illustration" style="width: 100%; height: auto;">
+                        <img src="{size_image_src}" alt="Size illustration" style="width: 100%; height: auto;">
                     </div>
                     '''
-            else:
-                logger.warning(f"⚠️  Size image not found: {size_image_path}")
 
         # Check for topSizes or bottomSizes (unified template format)
         top_sizes = size_info.get("topSizes", [])
@@ -778,29 +784,20 @@ class DanaPageGenerator:
         shot_notices = notices.get("shotNotice", [])
         shot_notice_html = "<br>".join([n for n in shot_notices if n])
 
-        # Editable mode scripts
+        # Editable mode scripts (per-product config + shared runtime, see editor_runtime.py)
         editable_scripts = ""
         if editable:
-            # Generate detail points entries dynamically
+            image_list = [{"id": "hero", "label": "히어로 이미지 (메인 배경)", "type": "hero"}]
+
+            # Detail points entries
             detail_points = product.get("detailPoints", [])
-            detail_points_entries = ""
             for idx in range(len(detail_points)):
                 point_num = idx + 1
-                detail_points_entries += f'''
-                    {{id: "detailPoint{point_num}", label: "디테일 포인트 {point_num}", type: "detail"}},'''
-
-            # Generate product shot entries dynamically based on actual product shots
-            product_shots = product.get("productShots", [])
-            product_shot_entries = ""
-            for idx in range(len(product_shots)):
-                shot_num = idx + 1
-                product_shot_entries += f'''
-                    {{id: "productShot{shot_num}", label: "제품 샷 {shot_num}", type: "shot"}},'''
+                image_list.append({"id": f"detailPoint{point_num}", "label": f"디테일 포인트 {point_num}", "type": "detail"})
 
-            # Generate gallery entries dynamically for all colors
+            # Gallery entries for all colors
             gallery_by_color = product.get("galleryByColor", {})
             colors = product.get("colors", [])
-            gallery_entries = ""
 
             if gallery_by_color and colors:
                 for color_idx, color in enumerate(colors):
@@ -818,1136 +815,36 @@ class DanaPageGenerator:
                                 continue  # Skip, will be added as logoGroup
 
                             gallery_img_count += 1
-                            gallery_entries += f'''
-                    {{id: "gallery_color{color_idx+1}_{gallery_img_count}", label: "{color_name} - 갤러리 {gallery_img_count}", type: "gallery"}},'''
-
-                        # Add logo group images if they exist
-                        if len(color_images) > 3:  # Has image 4 (logoGroup1_1)
-                            gallery_entries += f'''
-                    {{id: "logoGroup_color{color_idx+1}_1_1", label: "{color_name} - 로고 그룹 1-1 (이미지 4)", type: "gallery"}},'''
-                        if len(color_images) > 4:  # Has image 5 (logoGroup1_2)
-                            gallery_entries += f'''
-                    {{id: "logoGroup_color{color_idx+1}_1_2", label: "{color_name} - 로고 그룹 1-2 (이미지 5)", type: "gallery"}},'''
-                        if len(color_images) > 6:  # Has image 7 (logoGroup2_1)
-                            gallery_entries += f'''
-                    {{id: "logoGroup_color{color_idx+1}_2_1", label: "{color_name} - 로고 그룹 2-1 (이미지 7)", type: "gallery"}},'''
-                        if len(color_images) > 7:  # Has image 8 (logoGroup2_2)
-                            gallery_entries += f'''
-                    {{id: "logoGroup_color{color_idx+1}_2_2", label: "{color_name} - 로고 그룹 2-2 (이미지 8)", type: "gallery"}},'''
-
-            # Prepare size images data for JavaScript
-            size_images_json = json.dumps(size_images_data) if size_images_data else "{}"
-
-            editable_scripts = f'''
-<script>
-                // Image list for editing
-                const imageList = [
-                    {{id: "hero", label: "히어로 이미지 (메인 배경)", type: "hero"}},{detail_points_entries}{gallery_entries}{product_shot_entries}
-                    {{id: "fabric", label: "패브릭 배경 이미지", type: "fabric"}}
-                ];
-
-                // Size images data for product info
-                const sizeImagesData = {size_images_json};
-                let currentSizeImage = "{default_size_image}";
-
-                // Crop settings storage
-                const cropSettings = {{
-                    productCode: '{product["productCode"]}',
-                    images: {{}}
-                }};
-
-                // Initialize crop settings for all images
-                imageList.forEach(img => {{
-                    cropSettings.images[img.id] = {{ x: 100, y: 100, scale: 100 }};
-                }});
-
-                // Current selected image
-                let currentImageId = imageList.length > 0 ? imageList[0].id : null;
-
-                // Page zoom level (30-100%, default 60%)
-                let pageZoom = 60;
-
-                // Drag state
-                let isDragging = false;
-                let startX, startY, startObjX, startObjY;
-
-                // Upload button elements
-                let uploadBtn;
-                let fileInput;
-
-                // Initialize
-                function init() {{
-                    // Populate image dropdown
-                    const select = document.getElementById('image-select');
-                    imageList.forEach(img => {{
-                        const option = document.createElement('option');
-                        option.value = img.id;
-                        option.textContent = img.label;
-                        select.appendChild(option);
-                    }});
-
-                    // Populate size image dropdown
-                    const sizeImageSelect = document.getElementById('size-image-select');
-                    if (sizeImageSelect && Object.keys(sizeImagesData).length > 0) {{
-                        Object.keys(sizeImagesData).sort().forEach(imageName => {{
-                            const option = document.createElement('option');
-                            option.value = imageName;
-                            option.textContent = imageName;
-                            if (imageName === currentSizeImage) {{
-                                option.selected = true;
-                            }}
-                            sizeImageSelect.appendChild(option);
-                        }});
-                    }}
-
-                    // Load settings from localStorage
-                    loadSettings();
-
-                    // Apply initial settings
-                    applyAllCropSettings();
-                    applyPageZoom();  // Apply page zoom after loading settings
-
-                    // Setup event listeners
-                    setupEventListeners();
-
-                    // Populate size illustration options
-                    populateSizeIllustrationOptions();
-
-                    // Select first image
-                    if (currentImageId) {{
-                        selectImage(currentImageId);
-                    }}
-                }}
-
-                // Setup all event listeners
-                function setupEventListeners() {{
-                    // Dropdown change
-                    document.getElementById('image-select').addEventListener('change', (e) => {{
-                        selectImage(e.target.value);
-                    }});
-
-                    // Size image dropdown change
-                    const sizeImageSelect = document.getElementById('size-image-select');
-                    if (sizeImageSelect) {{
-                        sizeImageSelect.addEventListener('change', (e) => {{
-                            changeSizeImage(e.target.value);
-                        }});
-                    }}
-
-                    // Page zoom slider
-                    document.getElementById('page-zoom').addEventListener('input', (e) => {{
-                        pageZoom = parseInt(e.target.value);
-                        document.getElementById('page-zoom-value').textContent = pageZoom + '%';
-                        applyPageZoom();
-                        autoSave();
-                    }});
-
-                    // Image position/scale sliders
-                    document.getElementById('position-x').addEventListener('input', (e) => {{
-                        const value = parseInt(e.target.value);
-                        cropSettings.images[currentImageId].x = value;
-                        document.getElementById('x-value').textContent = value + '%';
-                        applyCurrentCrop();
-                        autoSave();
-                    }});
-
-                    document.getElementById('position-y').addEventListener('input', (e) => {{
-                        const value = parseInt(e.target.value);
-                        cropSettings.images[currentImageId].y = value;
-                        document.getElementById('y-value').textContent = value + '%';
-                        applyCurrentCrop();
-                        autoSave();
-                    }});
-
-                    document.getElementById('scale').addEventListener('input', (e) => {{
-                        const value = parseInt(e.target.value);
-                        cropSettings.images[currentImageId].scale = value;
-                        document.getElementById('scale-value').textContent = value + '%';
-                        applyCurrentCrop();
-                        autoSave();
-                    }});
-
-                    // Image frame interactions
-                    document.querySelectorAll('.image-frame').forEach(frame => {{
-                        const id = frame.getAttribute('data-id');
-                        if (!id) return;
-
-                        // Click to select
-                        frame.addEventListener('click', (e) => {{
-                            if (!isDragging) {{
-                                selectImage(id);
-                                document.getElementById('image-select').value = id;
-                            }}
-                        }});
-
-                        // Drag to move
-                        frame.addEventListener('mousedown', (e) => {{
-                            e.preventDefault();
-                            if (!cropSettings.images[id]) return;
-
-                            selectImage(id);
-                            document.getElementById('image-select').value = id;
-
-                            isDragging = true;
-                            startX = e.clientX;
-                            startY = e.clientY;
-                            startObjX = cropSettings.images[id].x;
-                            startObjY = cropSettings.images[id].y;
-                            frame.classList.add('dragging');
-                        }});
-
-                        // Wheel to zoom
-                        frame.addEventListener('wheel', (e) => {{
-                            e.preventDefault();
-                            if (!cropSettings.images[id]) return;
-
-                            selectImage(id);
-                            document.getElementById('image-select').value = id;
-
-                            const delta = e.deltaY > 0 ? -5 : 5;
-                            const newScale = Math.max(100, Math.min(500,
-                                cropSettings.images[id].scale + delta
-                            ));
-
-                            cropSettings.images[id].scale = newScale;
-                            applyCurrentCrop();
-                            updateSliders();
-                            autoSave();
-                        }}, {{ passive: false }});
-                    }});
-
-                    // Global mouse move/up for drag
-                    document.addEventListener('mousemove', (e) => {{
-                        if (!isDragging) return;
-
-                        const frame = document.querySelector(`[data-id="${{currentImageId}}"]`);
-                        if (!frame || !cropSettings.images[currentImageId]) return;
-
-                        const dx = (e.clientX - startX) / frame.offsetWidth * 100;
-                        const dy = (e.clientY - startY) / frame.offsetHeight * 100;
-
-                        const scale = cropSettings.images[currentImageId].scale / 100;
-                        const maxRange = (scale - 1) * 50;
-                        const minX = -maxRange;
-                        const maxX = 100 + maxRange;
-                        const minY = -maxRange;
-                        const maxY = 100 + maxRange;
-
-                        const newX = Math.max(minX, Math.min(maxX, startObjX + dx));
-                        const newY = Math.max(minY, Math.min(maxY, startObjY + dy));
-
-                        cropSettings.images[currentImageId].x = newX;
-                        cropSettings.images[currentImageId].y = newY;
-
-                        applyCurrentCrop();
-                        updateSliders();
-                    }});
-
-                    document.addEventListener('mouseup', () => {{
-                        if (isDragging) {{
-                            isDragging = false;
-                            document.querySelectorAll('.image-frame').forEach(f => {{
-                                f.classList.remove('dragging');
-                            }});
-                            autoSave();
-                        }}
-                    }});
-
-                    // Keyboard shortcuts
-                    document.addEventListener('keydown', (e) => {{
-                        if (!currentImageId || !cropSettings.images[currentImageId]) return;
-
-                        const step = e.shiftKey ? 10 : 1;
-                        let changed = false;
-
-                        const scale = cropSettings.images[currentImageId].scale / 100;
-                        const maxRange = (scale - 1) * 50;
-                        const minX = -maxRange;
-                        const maxX = 100 + maxRange;
-                        const minY = -maxRange;
-                        const maxY = 100 + maxRange;
-
-                        switch(e.key) {{
-                            case 'ArrowLeft':
-                                e.preventDefault();
-                                cropSettings.images[currentImageId].x = Math.max(minX,
-                                    cropSettings.images[currentImageId].x - step
-                                );
-                                changed = true;
-                                break;
-                            case 'ArrowRight':
-                                e.preventDefault();
-                                cropSettings.images[currentImageId].x = Math.min(maxX,
-                                    cropSettings.images[currentImageId].x + step
-                                );
-                                changed = true;
-                                break;
-                            case 'ArrowUp':
-                                e.preventDefault();
-                                cropSettings.images[currentImageId].y = Math.max(minY,
-                                    cropSettings.images[currentImageId].y - step
-                                );
-                                changed = true;
-                                break;
-                            case 'ArrowDown':
-                                e.preventDefault();
-                                cropSettings.images[currentImageId].y = Math.min(maxY,
-                                    cropSettings.images[currentImageId].y + step
-                                );
-                                changed = true;
-                                break;
-                            case '+':
-                            case '=':
-                                e.preventDefault();
-                                cropSettings.images[currentImageId].scale = Math.min(500,
-                                    cropSettings.images[currentImageId].scale + 5
-                                );
-                                changed = true;
-                                break;
-                            case '-':
-                            case '_':
-                                e.preventDefault();
-                                cropSettings.images[currentImageId].scale = Math.max(100,
-                                    cropSettings.images[currentImageId].scale - 5
-                                );
-                                changed = true;
-                                break;
-                        }}
-
-                        if (changed) {{
-                            applyCurrentCrop();
-                            updateSliders();
-                            autoSave();
-                        }}
-                    }});
-
-                    // Size table cell keydown handler (브라우저 줌 단축키 충돌 방지)
-                    // 전역 document 레벨에서 캡처 단계로 처리하여 브라우저 줌 완전 차단
-                    document.addEventListener('keydown', (e) => {{
-                        // 현재 포커스된 요소가 사이즈표 셀인지 확인
-                        const activeElement = document.activeElement;
-                        const isSizeTableCell = activeElement &&
-                            (activeElement.tagName === 'TD' || activeElement.tagName === 'TH') &&
-                            activeElement.closest('.size-table');
-
-                        // 사이즈표 셀에서 -, =, + 키 입력 시
-                        if (isSizeTableCell && (e.key === '-' || e.key === '=' || e.key === '+')) {{
-                            e.preventDefault();  // 브라우저 기본 동작(줌) 완전 차단
-                            e.stopPropagation(); // 이벤트 전파 중지
-
-                            // Cmd/Ctrl 없이 단독으로 눌렸을 때만 문자 삽입
-                            if (!e.metaKey && !e.ctrlKey) {{
-                                document.execCommand('insertText', false, e.key);
-                            }}
-                            // Cmd/Ctrl과 함께 눌렸을 때는 아무것도 하지 않음 (줌 차단됨)
-                        }}
-                    }}, true);  // ⭐ capture: true - 캡처 단계에서 먼저 처리
-
-                    // Fabric properties cell click handler (음영 처리)
-                    document.querySelectorAll('.fabric-prop-cell.editable').forEach(cell => {{
-                        cell.addEventListener('click', (e) => {{
-                            // Grid 구조: 4열(header + 3 cells) × 5행(비침, 신축성, 안감, 두께감, 계절감)
-                            // 같은 행의 셀들만 selected 클래스 제거
-                            const allCells = Array.from(document.querySelectorAll('.fabric-prop-cell.editable'));
-                            const clickedIndex = allCells.indexOf(cell);
-                            const currentRow = Math.floor(clickedIndex / 4);  // 4열 grid
-
-                            // 같은 row에 속한 셀들만 selected 제거
-                            allCells.forEach((elem, index) => {{
-                                const elemRow = Math.floor(index / 4);
-                                if (elemRow === currentRow) {{
-                                    elem.classList.remove('selected');
-                                }}
-                            }});
-
-                            // 클릭한 셀에 selected 클래스 추가
-                            cell.classList.add('selected');
-                            autoSave();  // 변경사항 저장
-                        }});
-                    }});
-
-                    // Upload button handler
-                    uploadBtn = document.getElementById('upload-trigger-btn');
-                    fileInput = document.getElementById('file-input-global');
-
-                    uploadBtn.addEventListener('click', () => {{
-                        if (!currentImageId) {{
-                            alert('⚠️ 먼저 교체할 이미지를 선택해주세요.');
-                            return;
-                        }}
-                        fileInput.click();
-                    }});
-
-                    fileInput.addEventListener('change', (e) => {{
-                        const file = e.target.files[0];
-                        if (!file || !currentImageId) return;
-
-                        console.log('📤 Uploading image for:', currentImageId);
-
-                        const reader = new FileReader();
-                        reader.onload = (event) => {{
-                            const base64 = event.target.result;
-
-                            const frame = document.querySelector(`[data-id="${{currentImageId}}"]`);
-                            if (frame) {{
-                                const img = frame.querySelector('.editable-image');
-                                if (img) {{
-                                    img.src = base64;
-                                    console.log('✅ Image replaced:', currentImageId);
-                                    autoSave();
-                                }}
-                            }}
-
-                            e.target.value = '';
-                        }};
-                        reader.readAsDataURL(file);
-                    }});
-
-                    // Color picker handlers
-                    document.querySelectorAll('.hex-picker').forEach(picker => {{
-                        const updateColor = (e) => {{
-                            const newHex = e.target.value;
-                            const colorIndex = parseInt(e.target.getAttribute('data-color-index'));
-
-                            const swatch = e.target.closest('.color-swatch');
-                            if (swatch) {{
-                                swatch.style.backgroundColor = newHex;
-                            }}
-
-                            console.log(`Color ${{colorIndex}} updated to ${{newHex}}`);
-                        }};
-
-                        picker.addEventListener('change', updateColor);
-                        picker.addEventListener('input', updateColor);
-                    }});
-
-                    // Note: Size table form event handlers moved to inline onclick
-                }}
-
-                // Select image
-                function selectImage(imageId) {{
-                    currentImageId = imageId;
-
-                    document.querySelectorAll('.image-frame').forEach(frame => {{
-                        frame.classList.remove('selected');
-                    }});
-
-                    const selectedFrame = document.querySelector(`[data-id="${{imageId}}"]`);
-                    if (selectedFrame) {{
-                        selectedFrame.classList.add('selected');
-                        selectedFrame.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                    }}
-
-                    updateSliders();
-                }}
-
-                // Load settings from localStorage
-                function loadSettings() {{
-                    const saved = localStorage.getItem('cropSettings_{product["productCode"]}_dana');
-                    if (saved) {{
-                        try {{
-                            const settings = JSON.parse(saved);
-
-                            // Load page zoom if available
-                            if (settings.pageZoom && typeof settings.pageZoom === 'number' &&
-                                settings.pageZoom >= 30 && settings.pageZoom <= 100) {{
-                                pageZoom = settings.pageZoom;
-                                const zoomSlider = document.getElementById('page-zoom');
-                                const zoomValue = document.getElementById('page-zoom-value');
-                                if (zoomSlider) zoomSlider.value = pageZoom;
-                                if (zoomValue) zoomValue.textContent = pageZoom + '%';
-                            }}
-
-                            // Load size image selection if available
-                            if (settings.sizeImage && typeof settings.sizeImage === 'string' &&
-                                sizeImagesData[settings.sizeImage]) {{
-                                currentSizeImage = settings.sizeImage;
-                                const sizeImageSelect = document.getElementById('size-image-select');
-                                if (sizeImageSelect) sizeImageSelect.value = currentSizeImage;
-
-                                // Apply the saved size image
-                                const productInfoImage = document.getElementById('product-info-image');
-                                if (productInfoImage) {{
-                                    productInfoImage.src = sizeImagesData[currentSizeImage];
-                                }}
-                            }}
-
-                            // Validate and load only valid settings for existing images
-                            if (settings.images && typeof settings.images === 'object') {{
-                                imageList.forEach(img => {{
-                                    // Skip loading settings for hero, shot, fabric, and first gallery images
-                                    // These images always use default values (x:100, y:100, scale:100)
-                                    const isFirstGalleryImage = img.type === 'gallery' && img.id.endsWith('_1');
-                                    if (img.type === 'hero' || img.type === 'shot' || img.type === 'fabric' || isFirstGalleryImage) {{
-                                        return;  // Keep default values
-                                    }}
-
-                                    const savedImgSettings = settings.images[img.id];
-                                    if (savedImgSettings &&
-                                        typeof savedImgSettings.x === 'number' &&
-                                        typeof savedImgSettings.y === 'number' &&
-                                        typeof savedImgSettings.scale === 'number' &&
-                                        savedImgSettings.scale >= 100 && savedImgSettings.scale <= 500) {{
-                                        // Valid saved settings found, use them
-                                        cropSettings.images[img.id] = {{
-                                            x: savedImgSettings.x,
-                                            y: savedImgSettings.y,
-                                            scale: savedImgSettings.scale
-                                        }};
-                                    }}
-                                    // If invalid or missing, keep the default (100, 100, 100)
-                                }});
-                            }}
-                        }} catch (e) {{
-                            console.warn('Failed to load crop settings from localStorage:', e);
-                            // Keep default settings on error
-                        }}
-                    }}
-                }}
-
-                function computeTransform(frame, settings) {{
-                    if (!frame || !settings) {{
-                        return {{ translateX: 0, translateY: 0, scale: 1 }};
-                    }}
-
-                    const rect = frame.getBoundingClientRect();
-                    const frameWidth = frame.offsetWidth || rect.width || 0;
-                    const frameHeight = frame.offsetHeight || rect.height || 0;
-
-                    const scale = (typeof settings.scale === 'number' ? settings.scale : 100) / 100;
-                    const offsetXPercent = (typeof settings.x === 'number' ? settings.x : 100) - 100;
-                    const offsetYPercent = (typeof settings.y === 'number' ? settings.y : 100) - 100;
-
-                    const translateX = frameWidth * (offsetXPercent / 100);
-                    const translateY = frameHeight * (offsetYPercent / 100);
-
-                    return {{ translateX, translateY, scale }};
-                }}
-
-                function applyTransform(frame, img, settings) {{
-                    const {{ translateX, translateY, scale }} = computeTransform(frame, settings);
-                    img.style.transform = `translate(${{translateX}}px, ${{translateY}}px) scale(${{scale}})`;
-                }}
-
-                const imageCache = new Map();
-
-                async function loadImage(src) {{
-                    if (!src) {{
-                        throw new Error('Invalid image source');
-                    }}
-
-                    if (imageCache.has(src)) {{
-                        const cached = imageCache.get(src);
-                        if (cached instanceof Promise) {{
-                            return await cached;
-                        }}
-                        return cached;
-                    }}
-
-                    const loader = new Promise((resolve, reject) => {{
-                        const tempImg = new Image();
-                        tempImg.onload = () => resolve(tempImg);
-                        tempImg.onerror = (err) => reject(err);
-                        tempImg.src = src;
-                    }});
-
-                    imageCache.set(src, loader);
-                    try {{
-                        const loaded = await loader;
-                        imageCache.set(src, loaded);
-                        return loaded;
-                    }} catch (error) {{
-                        imageCache.delete(src);
-                        throw error;
-                    }}
-                }}
-
-                async function generateFlattenedImageData(frame, img, settings) {{
-                    const frameRect = frame.getBoundingClientRect();
-                    const frameWidth = Math.max(1, Math.round(frame.offsetWidth || frameRect.width || 0));
-                    const frameHeight = Math.max(1, Math.round(frame.offsetHeight || frameRect.height || 0));
-
-                    if (frameWidth === 0 || frameHeight === 0) {{
-                        throw new Error('Frame has zero size');
-                    }}
-
-                    const imageSource = img.currentSrc || img.src;
-                    const baseImage = await loadImage(imageSource);
-                    const naturalWidth = baseImage.naturalWidth || baseImage.width;
-                    const naturalHeight = baseImage.naturalHeight || baseImage.height;
-
-                    if (!naturalWidth || !naturalHeight) {{
-                        throw new Error('Unable to determine image dimensions');
-                    }}
-
-                    const baseScale = Math.max(frameWidth / naturalWidth, frameHeight / naturalHeight);
-                    const userScale = (typeof settings.scale === 'number' ? settings.scale : 100) / 100;
-                    const totalScale = baseScale * userScale;
-
-                    const displayWidth = naturalWidth * totalScale;
-                    const displayHeight = naturalHeight * totalScale;
-
-                    const offsetXPercent = (typeof settings.x === 'number' ? settings.x : 100) - 100;
-                    const offsetYPercent = (typeof settings.y === 'number' ? settings.y : 100) - 100;
-
-                    const translateX = frameWidth * (offsetXPercent / 100);
-                    const translateY = frameHeight * (offsetYPercent / 100);
-
-                    const drawX = (frameWidth - displayWidth) / 2 + translateX;
-                    const drawY = (frameHeight - displayHeight) / 2 + translateY;
-
-                    const canvas = document.createElement('canvas');
-                    canvas.width = frameWidth;
-                    canvas.height = frameHeight;
-
-                    const ctx = canvas.getContext('2d', {{ willReadFrequently: true }});
-                    if (!ctx) {{
-                        throw new Error('Failed to acquire canvas context');
-                    }}
-
-                    ctx.clearRect(0, 0, frameWidth, frameHeight);
-                    ctx.drawImage(baseImage, drawX, drawY, displayWidth, displayHeight);
-
-                    return canvas.toDataURL('image/png');
-                }}
-
-                async function createFlattenedImageMap() {{
-                    const flattenedMap = {{}};
-                    const cacheKeyMap = new Map();
-
-                    for (const frame of document.querySelectorAll('.image-frame')) {{
-                        const id = frame.getAttribute('data-id');
-                        if (!id) continue;
-                        const img = frame.querySelector('.editable-image');
-                        if (!img) continue;
-
-                        const settings = cropSettings.images[id] || {{ x: 100, y: 100, scale: 100 }};
-                        const frameWidth = Math.round(frame.offsetWidth);
-                        const frameHeight = Math.round(frame.offsetHeight);
-                        const cacheKey = `${{img.currentSrc || img.src}}|${{settings.x}}|${{settings.y}}|${{settings.scale}}|${{frameWidth}}|${{frameHeight}}`;
-
-                        try {{
-                            if (cacheKey && cacheKeyMap.has(cacheKey)) {{
-                                flattenedMap[id] = cacheKeyMap.get(cacheKey);
-                                continue;
-                            }}
-
-                            const flattenedData = await generateFlattenedImageData(frame, img, settings);
-                            flattenedMap[id] = flattenedData;
-                            if (cacheKey) {{
-                                cacheKeyMap.set(cacheKey, flattenedData);
-                            }}
-                        }} catch (error) {{
-                            console.warn('Flatten image failed', id, error);
-                        }}
-                    }}
-
-                    return flattenedMap;
-                }}
-
-                // Apply crop settings to all images
-                function applyAllCropSettings() {{
-                    document.querySelectorAll('.image-frame').forEach(frame => {{
-                        const id = frame.getAttribute('data-id');
-                        const img = frame.querySelector('.editable-image');
-                        const settings = cropSettings.images[id];
-
-                        if (settings && img) {{
-                            applyTransform(frame, img, settings);
-                        }}
-                    }});
-                }}
-
-                // Apply page zoom to container
-                function applyPageZoom() {{
-                    const container = document.querySelector('.container');
-                    if (container) {{
-                        const scale = pageZoom / 100;
-                        container.style.transform = `scale(${{scale}})`;
-
-                        // Adjust container height to account for scale transform
-                        // This prevents excessive whitespace below scaled content
-                        const naturalHeight = container.scrollHeight;
-                        container.style.height = `${{naturalHeight * scale}}px`;
-                    }}
-                }}
-
-                // Apply crop to current image
-                function applyCurrentCrop() {{
-                    const frame = document.querySelector(`[data-id="${{currentImageId}}"]`);
-                    if (!frame) return;
-
-                    const img = frame.querySelector('.editable-image');
-                    const settings = cropSettings.images[currentImageId];
-                    if (img && settings) {{
-                        applyTransform(frame, img, settings);
-                    }}
-                }}
-
-                // Update sliders from current image settings
-                function updateSliders() {{
-                    const settings = cropSettings.images[currentImageId];
-                    if (settings) {{
-                        document.getElementById('position-x').value = settings.x;
-                        document.getElementById('position-y').value = settings.y;
-                        document.getElementById('scale').value = settings.scale;
-                        document.getElementById('x-value').textContent = settings.x + '%';
-                        document.getElementById('y-value').textContent = settings.y + '%';
-                        document.getElementById('scale-value').textContent = settings.scale + '%';
-                    }}
-                }}
-
-                // Change size image in product info
-                function changeSizeImage(imageName) {{
-                    if (!sizeImagesData[imageName]) {{
-                        console.error('Size image not found:', imageName);
-                        return;
-                    }}
-
-                    const productInfoImage = document.getElementById('product-info-image');
-                    if (productInfoImage) {{
-                        productInfoImage.src = sizeImagesData[imageName];
-                        currentSizeImage = imageName;
-                        autoSave();
-                    }}
-                }}
-
-                // Populate size illustration dropdown
-                function populateSizeIllustrationOptions() {{
-                    const sizeIllustrationSelect = document.getElementById('size-illustration');
-                    if (!sizeIllustrationSelect) return;
-
-                    // Add size images to dropdown
-                    if (sizeImagesData && Object.keys(sizeImagesData).length > 0) {{
-                        Object.keys(sizeImagesData).sort().forEach(imageName => {{
-                            const option = document.createElement('option');
-                            option.value = imageName;
-                            option.textContent = imageName;
-                            sizeIllustrationSelect.appendChild(option);
-                        }});
-                    }}
-                }}
-
-                // Toggle size table form
-                function toggleSizeTableForm() {{
-                    const form = document.getElementById('size-table-form');
-                    if (form) {{
-                        form.style.display = form.style.display === 'none' ? 'block' : 'none';
-                    }}
-                }}
-
-                // Create new size table
-                function createNewSizeTable() {{
-                    const tableType = document.getElementById('table-type').value;
-                    const rowCount = parseInt(document.getElementById('row-count').value);
-                    const illustration = document.getElementById('size-illustration').value;
-
-                    // Validate inputs
-                    if (rowCount < 1 || rowCount > 10) {{
-                        alert('⚠️ 행 수는 1-10 사이여야 합니다.');
-                        return;
-                    }}
-
-                    // Create illustration HTML if selected
-                    let illustrationHTML = '';
-                    if (illustration && sizeImagesData[illustration]) {{
-                        illustrationHTML = `
-                        <div style="max-width: 300px; margin: 40px auto; text-align: left;">
-                            <img src="${{sizeImagesData[illustration]}}" alt="Size illustration" style="width: 100%; height: auto;">
-                        </div>
-                        `;
-                    }}
+                            image_list.append({
+                                "id": f"gallery_color{color_idx+1}_{gallery_img_count}",
+                                "label": f"{color_name} - 갤러리 {gallery_img_count}",
+                                "type": "gallery",
+                            })
+
+                        # Add logo group images if they exist (image 4, 5, 7, 8)
+                        logo_groups = [(3, 1, 1, 4), (4, 1, 2, 5), (6, 2, 1, 7), (7, 2, 2, 8)]
+                        for min_idx, group, slot, image_num in logo_groups:
+                            if len(color_images) > min_idx:
+                                image_list.append({
+                                    "id": f"logoGroup_color{color_idx+1}_{group}_{slot}",
+                                    "label": f"{color_name} - 로고 그룹 {group}-{slot} (이미지 {image_num})",
+                                    "type": "gallery",
+                                })
+
+            # Product shot entries based on actual product shots
+            product_shots = product.get("productShots", [])
+            for idx in range(len(product_shots)):
+                shot_num = idx + 1
+                image_list.append({"id": f"productShot{shot_num}", "label": f"제품 샷 {shot_num}", "type": "shot"})
 
-                    // Define table headers based on type
-                    let headerHTML = '';
-                    if (tableType === 'top') {{
-                        headerHTML = `
-                        <tr>
-                            <th contenteditable="true">호칭</th>
-                            <th contenteditable="true">어깨</th>
-                            <th contenteditable="true">가슴</th>
-                            <th contenteditable="true">밑단</th>
-                            <th contenteditable="true">소매기장</th>
-                            <th contenteditable="true">소매단</th>
-                            <th contenteditable="true">총장</th>
-                            <th contenteditable="true">암홀</th>
-                        </tr>
-                        `;
-                    }} else {{ // bottom
-                        headerHTML = `
-                        <tr>
-                            <th contenteditable="true">호칭</th>
-                            <th contenteditable="true">허리</th>
-                            <th contenteditable="true">엉덩이</th>
-                            <th contenteditable="true">밑위</th>
-                            <th contenteditable="true">허벅지</th>
-                            <th contenteditable="true">밑단</th>
-                            <th contenteditable="true">안기장</th>
-                            <th contenteditable="true">총장</th>
-                        </tr>
-                        `;
-                    }}
-
-                    // Create table rows (all empty cells)
-                    let rowsHTML = '';
-                    const colCount = tableType === 'top' ? 8 : 8; // Both have 8 columns
-                    for (let i = 0; i < rowCount; i++) {{
-                        rowsHTML += '<tr>';
-                        for (let j = 0; j < colCount; j++) {{
-                            rowsHTML += '<td contenteditable="true" class="editable"></td>';
-                        }}
-                        rowsHTML += '</tr>';
-                    }}
-
-                    // Create full table HTML
-                    const tableHTML = illustrationHTML + `
-                    <table class="size-table">
-                        <thead>
-                            ${{headerHTML}}
-                        </thead>
-                        <tbody>
-                            ${{rowsHTML}}
-                        </tbody>
-                    </table>
-                    `;
-
-                    // Find the size tables container and append new table
-                    const container = document.getElementById('size-tables-container');
-                    const newTableDiv = document.createElement('div');
-                    newTableDiv.innerHTML = tableHTML;
-                    container.appendChild(newTableDiv);
-
-                    // Close form
-                    toggleSizeTableForm();
-
-                    // Reset form
-                    document.getElementById('row-count').value = 1;
-                    document.getElementById('size-illustration').value = '';
-
-                    alert('✅ 사이즈표가 추가되었습니다.');
-                }}
-
-                // Auto-save to localStorage
-                function autoSave() {{
-                    // Save crop settings, page zoom, and size image selection
-                    cropSettings.pageZoom = pageZoom;
-                    cropSettings.sizeImage = currentSizeImage;
-                    localStorage.setItem('cropSettings_{product["productCode"]}_dana', JSON.stringify(cropSettings));
-                }}
-
-                // Reset current image
-                function resetCurrentImage() {{
-                    cropSettings.images[currentImageId] = {{ x: 100, y: 100, scale: 100 }};
-                    updateSliders();
-                    applyCurrentCrop();
-                    autoSave();
-                    alert('✅ 현재 이미지가 리셋되었습니다.');
-                }}
-
-                // Reset all images
-                function resetAllImages() {{
-                    if (!confirm('⚠️ 모든 이미지 설정을 리셋하시겠습니까?')) return;
-
-                    imageList.forEach(img => {{
-                        cropSettings.images[img.id] = {{ x: 100, y: 100, scale: 100 }};
-                    }});
-                    updateSliders();
-                    applyAllCropSettings();
-                    autoSave();
-                    alert('✅ 모든 이미지가 리셋되었습니다.');
-                }}
-
-                // Export HTML
-                async function exportHTML() {{
-                    applyAllCropSettings();
-                    const flattenedImageMap = await createFlattenedImageMap();
-                    const transformMap = {{}};
-                    document.querySelectorAll('.image-frame').forEach(frame => {{
-                        const id = frame.getAttribute('data-id');
-                        const img = frame.querySelector('.editable-image');
-                        if (!id || !img) return;
-                        const computedStyle = window.getComputedStyle(img);
-                        const transform = computedStyle.transform;
-                        const origin = computedStyle.transformOrigin;
-                        transformMap[id] = {{
-                            transform: transform && transform !== 'none' ? transform : '',
-                            origin: origin && origin !== 'none' ? origin : ''
-                        }};
-                    }});
-                    const clone = document.documentElement.cloneNode(true);
-
-                    // Remove control panel
-                    const controlPanel = clone.querySelector('.control-panel');
-                    if (controlPanel) controlPanel.remove();
-
-                    // Remove scripts
-                    const scripts = clone.querySelectorAll('script');
-                    scripts.forEach(s => s.remove());
-
-                    // Apply inline styles to all images and remove frame styling
-                    clone.querySelectorAll('.image-frame').forEach(frame => {{
-                        const id = frame.getAttribute('data-id');
-                        const img = frame.querySelector('.editable-image');
-                        const transformInfo = id ? transformMap[id] : null;
-                        const flattenedSrc = id ? flattenedImageMap[id] : null;
-                        if (img) {{
-                            if (flattenedSrc) {{
-                                img.setAttribute('src', flattenedSrc);
-                                img.style.transform = 'none';
-                                img.style.transformOrigin = 'center center';
-                                img.style.objectFit = 'cover';
-                            }} else if (transformInfo && transformInfo.transform) {{
-                                img.style.transform = transformInfo.transform;
-                                if (transformInfo.origin) {{
-                                    img.style.transformOrigin = transformInfo.origin;
-                                }} else {{
-                                    img.style.removeProperty('transform-origin');
-                                }}
-                            }} else {{
-                                img.style.removeProperty('transform');
-                                img.style.removeProperty('transform-origin');
-                            }}
-                        }}
-                        frame.style.cursor = 'default';
-                        frame.classList.remove('selected');
-                        frame.style.border = 'none';
-                        frame.style.outline = 'none';
-                    }});
-
-                    // Remove contenteditable
-                    clone.querySelectorAll('[contenteditable]').forEach(el => {{
-                        el.removeAttribute('contenteditable');
-                    }});
-
-                    // Remove hex pickers
-                    clone.querySelectorAll('.hex-picker').forEach(picker => picker.remove());
-
-                    // Remove inline styles from body (especially min-height)
-                    const body = clone.querySelector('body');
-                    if (body) {{
-                        body.removeAttribute('style');
-                    }}
-
-                    const htmlContent = '<!DOCTYPE html>\\n' + clone.outerHTML;
-
-                    try {{
-                        // Send to server
-                        const response = await fetch('http://localhost:5001/save-html', {{
-                            method: 'POST',
-                            headers: {{
-                                'Content-Type': 'application/json'
-                            }},
-                            body: JSON.stringify({{
-                                productCode: '{product["productCode"]}',
-                                htmlContent: htmlContent
-                            }})
-                        }});
-
-                        if (response.ok) {{
-                            const result = await response.json();
-                            alert(`✅ HTML 저장 완료\\n경로: ${{result.path}}`);
-                        }} else {{
-                            const error = await response.json();
-                            alert(`❌ 서버 저장 실패: ${{error.error}}`);
-                        }}
-                    }} catch (error) {{
-                        console.error('Export error:', error);
-                        alert('❌ 서버 연결 실패. 서버가 실행 중인지 확인하세요.\\n(python3 scripts/server.py)');
-                    }}
-                }}
-
-                // Export as JPG
-                async function exportAsJPG() {{
-                    applyAllCropSettings();
-                    const flattenedImageMap = await createFlattenedImageMap();
-                    const imageTransformStates = [];
-                    const replacedImageStates = [];
-
-                    document.querySelectorAll('.image-frame').forEach(frame => {{
-                        const id = frame.getAttribute('data-id');
-                        const img = frame.querySelector('.editable-image');
-                        if (!img) return;
-
-                        const flattenedSrc = id ? flattenedImageMap[id] : null;
-
-                        if (flattenedSrc) {{
-                            replacedImageStates.push({{
-                                img,
-                                src: img.src,
-                                transform: img.style.transform,
-                                origin: img.style.transformOrigin,
-                                objectFit: img.style.objectFit
-                            }});
-                            img.src = flattenedSrc;
-                            img.style.transform = 'none';
-                            img.style.transformOrigin = 'center center';
-                            img.style.objectFit = 'cover';
-                        }} else {{
-                            const computed = window.getComputedStyle(img);
-                            imageTransformStates.push({{
-                                img,
-                                transform: img.style.transform,
-                                origin: img.style.transformOrigin
-                            }});
-                            const computedTransform = computed.transform;
-                            if (computedTransform && computedTransform !== 'none') {{
-                                img.style.transform = computedTransform;
-                            }}
-                            const computedOrigin = computed.transformOrigin;
-                            if (computedOrigin && computedOrigin !== 'none') {{
-                                img.style.transformOrigin = computedOrigin;
-                            }}
-                        }}
-                    }});
-
-                    await Promise.all(replacedImageStates.map(state => {{
-                        if (state.img.decode) {{
-                            return state.img.decode().catch(() => undefined);
-                        }}
-                        return Promise.resolve();
-                    }}));
-
-                    const controlPanel = document.querySelector('.control-panel');
-                    const container = document.querySelector('.container');
-                    const body = document.body;
-
-                    if (!container) {{
-                        alert('❌ 컨테이너를 찾을 수 없습니다.');
-                        return;
-                    }}
-
-                    // Save original styles
-                    const originalTransform = container.style.transform;
-                    const originalHeight = container.style.height;
-                    const originalMinHeight = body.style.minHeight;
-
-                    // Save original selection state
-                    const selectedFrames = document.querySelectorAll('.image-frame.selected');
-                    const originalSelectedIds = Array.from(selectedFrames).map(f => f.getAttribute('data-id'));
-
-                    // Hide control panel
-                    if (controlPanel) {{
-                        controlPanel.style.display = 'none';
-                    }}
-
-                    // Declare base64Image outside try block so catch can access it
-                    let base64Image;
-
-                    try {{
-                        // Reset container transform and height for capture
-                        container.style.transform = 'none';
-                        container.style.height = 'auto';
-                        body.style.minHeight = 'auto';
-
-                        // Remove all selection styles before capture
-                        document.querySelectorAll('.image-frame').forEach(frame => {{
-                            frame.classList.remove('selected');
-                            frame.style.border = 'none';
-                            frame.style.outline = 'none';
-                            frame.style.boxShadow = 'none';
-                        }});
-
-                        // Wait for layout and styles to settle
-                        await new Promise(resolve => setTimeout(resolve, 150));
-
-                        // Capture entire container as canvas
-                        const canvas = await html2canvas(container, {{
-                            scale: 2,  // High resolution
-                            useCORS: true,
-                            backgroundColor: '#ffffff',
-                            logging: false,
-                            allowTaint: true,
-                            windowWidth: container.scrollWidth,
-                            windowHeight: container.scrollHeight,
-                            width: container.scrollWidth,
-                            height: container.scrollHeight
-                        }});
-
-                        // Convert canvas to base64
-                        base64Image = canvas.toDataURL('image/jpeg', 0.95);
-
-                        // Send to server
-                        const response = await fetch('http://localhost:5001/save-jpg', {{
-                            method: 'POST',
-                            headers: {{
-                                'Content-Type': 'application/json'
-                            }},
-                            body: JSON.stringify({{
-                                productCode: '{product["productCode"]}',
-                                imageData: base64Image
-                            }})
-                        }});
-
-                        if (response.ok) {{
-                            const result = await response.json();
-                            alert(`✅ JPG 저장 완료\\n경로: ${{result.path}}`);
-                        }} else {{
-                            // 서버 저장 실패 시 fallback으로 진행
-                            throw new Error('Server save failed');
-                        }}
-
-                    }} catch (error) {{
-                        console.error('Export error:', error);
-
-                        // Fallback: Download directly in browser when server is not running
-                        if (base64Image) {{
-                            try {{
-                                const link = document.createElement('a');
-                                const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
-                                link.download = `{product["productCode"]}_${{timestamp}}.jpg`;
-                                link.href = base64Image;
-                                link.click();
-
-                                alert('✅ JPG 다운로드 완료\\n위치: 다운로드 폴더\\n(서버 미실행 시 브라우저 다운로드)');
-                            }} catch (downloadError) {{
-                                console.error('Download error:', downloadError);
-                                alert('❌ 다운로드 실패: ' + downloadError.message);
-                            }}
-                        }} else {{
-                            alert('❌ 이미지 생성 실패. 페이지를 새로고침 후 다시 시도하세요.');
-                        }}
-                    }} finally {{
-                        imageTransformStates.forEach(state => {{
-                            state.img.style.transform = state.transform;
-                            state.img.style.transformOrigin = state.origin || '';
-                        }});
-                        replacedImageStates.forEach(state => {{
-                            state.img.src = state.src;
-                            state.img.style.transform = state.transform || '';
-                            state.img.style.transformOrigin = state.origin || '';
-                            if (state.objectFit) {{
-                                state.img.style.objectFit = state.objectFit;
-                            }} else {{
-                                state.img.style.removeProperty('object-fit');
-                            }}
-                        }});
-
-                        // Restore original styles
-                        container.style.transform = originalTransform;
-                        container.style.height = originalHeight;
-                        body.style.minHeight = originalMinHeight;
-
-                        // Restore selection state
-                        originalSelectedIds.forEach(id => {{
-                            const frame = document.querySelector(`[data-id="${{id}}"]`);
-                            if (frame) {{
-                                frame.classList.add('selected');
-                                frame.style.border = '';
-                                frame.style.outline = '';
-                                frame.style.boxShadow = '';
-                            }}
-                        }});
-
-                        // Restore control panel
-                        if (controlPanel) {{
-                            controlPanel.style.display = 'block';
-                        }}
-                    }}
-                }}
-
-                // Initialize on page load
-                window.addEventListener('DOMContentLoaded', init);
-            </script>'''
+            image_list.append({"id": "fabric", "label": "패브릭 배경 이미지", "type": "fabric"})
+
+            editable_scripts = editor_runtime.script_tags({
+                "productCode": product["productCode"],
+                "imageList": image_list,
+                "sizeImagesData": size_images_data,
+                "defaultSizeImage": default_size_image,
+            })
 
         # Control panel HTML (only for editable mode)
         control_panel_html = ""
@@ -2098,6 +995,7 @@ class DanaPageGenerator:
                     <button onclick="exportAsJPG()" style="width: 100%; padding: 12px; background: #007bff; color: white; border: none; border-radius: 6px; cursor: pointer; font-size: 14px; font-weight: bold; box-shadow: 0 2px 4px rgba(0,0,0,0.2);">
                         🖼️ JPG 다운로드
                     </button>
+                    <input type="number" id="jpg-slice-height" min="500" step="100" placeholder="마켓 조각 높이 (px, 선택)" title="입력하면 JPG를 이 높이마다 잘라 조각 파일도 저장합니다 (서버 저장 시)" style="width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 6px; font-size: 13px; box-sizing: border-box;">
                 </div>
             </div>
             '''
@@ -3190,11 +2088,77 @@ class DanaPageGenerator:
 
         return html
 
-    def generate_pages(self, product_codes: Optional[List[str]] = None) -> None:
+    def generate_variants(self, product: Dict) -> Tuple[str, str]:
+        """Render original and editable HTML for a product
+
+        generate_html runs once per variant (editable changes markup throughout the
+        page), but images are read and encoded only once: the editable render gets
+        the original render's data URLs from the asset cache.
+
+        Returns:
+            (original_html, editable_html)
+        """
+        original_html = self.generate_html(product, editable=False)
+        editable_html = self.generate_html(product, editable=True)
+        return original_html, editable_html
+
+    def generate_product(self, product: Dict) -> Dict:
+        """Generate and write both HTML variants for one product
+
+        Returns:
+            Result dict (productCode, success, original, editable, error, seconds)
+        """
+        code = product.get('productCode', '?')
+        result = {
+            "productCode": code,
+            "success": False,
+            "original": None,
+            "editable": None,
+            "error": None,
+            "seconds": 0.0
+        }
+        start_time = time.perf_counter()
+
+        try:
+            logger.info(f"🔨 Generating pages for {code}...")
+
+            # Render both variants (shared encoded images)
+            original_html, editable_html = self.generate_variants(product)
+
+            # Write original HTML
+            original_file = self.output_original / ORIGINAL_FILE_PATTERN.format(
+                productCode=code
+            )
+            with open(original_file, 'w', encoding='utf-8') as f:
+                f.write(original_html)
+            logger.info(f"✅ Generated original: {original_file}")
+
+            # Write editable HTML
+            editable_file = self.output_editable / EDITABLE_FILE_PATTERN.format(
+                productCode=code
+            )
+            with open(editable_file, 'w', encoding='utf-8') as f:
+                f.write(editable_html)
+            logger.info(f"✅ Generated editable: {editable_file}")
+
+            result.update(success=True, original=str(original_file), editable=str(editable_file))
+
+        except Exception as e:
+            logger.error(f"❌ Failed to generate pages for {code}: {e}")
+            result["error"] = str(e)
+
+        result["seconds"] = time.perf_counter() - start_time
+        return result
+
+    def generate_pages(self, product_codes: Optional[List[str]] = None, workers: int = 1) -> List[Dict]:
         """Generate HTML pages for products
 
         Args:
             product_codes: List of product codes to generate. None = all products
+            workers: Number of worker processes (1 = generate in this process)
+
+        Returns:
+            Per-product result dicts in product order
         """
         try:
             products_to_generate = self.products
@@ -3205,44 +2169,89 @@ class DanaPageGenerator:
                 ]
                 if not products_to_generate:
                     logger.warning(f"⚠️  No products found for codes: {product_codes}")
-                    return
+                    return []
 
-            logger.info(f"📝 Generating HTML pages for {len(products_to_generate)} products...")
+            workers = max(1, min(workers, len(products_to_generate)))
+            logger.info(
+                f"📝 Generating HTML pages for {len(products_to_generate)} products "
+                f"({workers} worker{'s' if workers > 1 else ''})..."
+            )
 
-            for product in products_to_generate:
-                try:
-                    code = product['productCode']
-                    logger.info(f"🔨 Generating pages for {code}...")
-
-                    # Generate original HTML
-                    original_html = self.generate_html(product, editable=False)
-                    original_file = self.output_original / ORIGINAL_FILE_PATTERN.format(
-                        productCode=code
-                    )
-                    with open(original_file, 'w', encoding='utf-8') as f:
-                        f.write(original_html)
-                    logger.info(f"✅ Generated original: {original_file}")
-
-                    # Generate editable HTML
-                    editable_html = self.generate_html(product, editable=True)
-                    editable_file = self.output_editable / EDITABLE_FILE_PATTERN.format(
-                        productCode=code
-                    )
-                    with open(editable_file, 'w', encoding='utf-8') as f:
-                        f.write(editable_html)
-                    logger.info(f"✅ Generated editable: {editable_file}")
-
-                except Exception as e:
-                    logger.error(f"❌ Failed to generate pages for {code}: {e}")
-                    continue
+            start_time = time.perf_counter()
+            if workers == 1:
+                results = [self.generate_product(product) for product in products_to_generate]
+            else:
+                results = self._generate_pages_parallel(products_to_generate, workers)
 
-            logger.info(f"✅ Successfully generated {len(products_to_generate)} products")
+            self.log_generation_report(results, time.perf_counter() - start_time)
+            if workers == 1:
+                logger.info(f"♻️  Encoded asset cache: {self.asset_cache.stats()}")
+            return results
 
         except Exception as e:
             logger.error(f"❌ Page generation failed: {e}")
             raise
 
-    def run(self, product_codes: Optional[List[str]] = None) -> None:
+    def _generate_pages_parallel(self, products: List[Dict], workers: int) -> List[Dict]:
+        """Spread products across a process pool, replaying worker logs in product order"""
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_generation_worker,
+            # Each worker keeps its own cache; split the cap so the pool stays within it
+            initargs=(self.date_folder, ENCODED_ASSET_CACHE_MAX_BYTES // workers)
+        ) as executor:
+            futures = [executor.submit(_generate_product_in_worker, product) for product in products]
+
+            results = []
+            for product, future in zip(products, futures):
+                try:
+                    result, records = future.result()
+                except Exception as e:
+                    # Worker process died (e.g. out of memory)
+                    code = product.get('productCode', '?')
+                    logger.error(f"❌ Worker failed for {code}: {e}")
+                    results.append({
+                        "productCode": code,
+                        "success": False,
+                        "original": None,
+                        "editable": None,
+                        "error": str(e),
+                        "seconds": 0.0
+                    })
+                    continue
+
+                for record in records:
+                    logging.getLogger(record.name).handle(record)
+                results.append(result)
+
+        return results
+
+    def log_generation_report(self, results: List[Dict], elapsed: float) -> None:
+        """Log an aggregated summary of a generation run"""
+        if not results:
+            return
+
+        succeeded = [r for r in results if r["success"]]
+        failed = [r for r in results if not r["success"]]
+        busy_seconds = sum(r["seconds"] for r in results)
+
+        logger.info("-" * 60)
+        logger.info(f"📊 Generation report: {len(succeeded)}/{len(results)} products succeeded")
+        logger.info(
+            f"⏱️  Wall time {elapsed:.1f}s, product time {busy_seconds:.1f}s "
+            f"(avg {busy_seconds / len(results):.2f}s/product)"
+        )
+        if succeeded:
+            slowest = max(succeeded, key=lambda r: r["seconds"])
+            logger.info(f"🐢 Slowest: {slowest['productCode']} ({slowest['seconds']:.2f}s)")
+        for result in failed:
+            logger.error(f"❌ {result['productCode']}: {result['error']}")
+        logger.info("-" * 60)
+
+        if succeeded:
+            logger.info(f"✅ Successfully generated {len(succeeded)} products")
+
+    def run(self, product_codes: Optional[List[str]] = None, workers: int = 1) -> None:
         """Run the page generation process"""
         try:
             logger.info("=" * 60)
@@ -3251,11 +2260,17 @@ class DanaPageGenerator:
 
             # Load products data
             logger.info("\n📝 Step 1: Loading products data...")
-            self.load_products_data()
+            self.load_products_data(product_codes)
+
+            # Shared editor runtime and size library referenced by the editable pages
+            bundle = editor_runtime.emit_bundle(OUTPUT_DIR)
+            logger.info(f"🧩 Editor runtime: {bundle.js}")
+            library = size_library.emit_library(OUTPUT_DIR)
+            logger.info(f"📐 Size library: {len(library)} illustrations")
 
             # Generate pages
             logger.info("\n📝 Step 2: Generating HTML pages...")
-            self.generate_pages(product_codes)
+            self.generate_pages(product_codes, workers=workers)
 
             logger.info("\n" + "=" * 60)
             logger.info("✅ Page generation completed successfully!")
@@ -3269,6 +2284,50 @@ class DanaPageGenerator:
             raise
 
 
+class _RecordBuffer(logging.Handler):
+    """Collect log records in a worker so the parent can replay them in order"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Resolve message/traceback now so the record pickles cleanly
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+_worker_generator: Optional["DanaPageGenerator"] = None
+
+
+def _init_generation_worker(date_folder: str, asset_cache_bytes: int) -> None:
+    """Process pool initializer: one generator (and asset cache share) per worker"""
+    global _worker_generator
+
+    # Workers never write to the console/log file directly; the parent replays their records
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+
+    _worker_generator = DanaPageGenerator(date_folder=date_folder, asset_cache_bytes=asset_cache_bytes)
+
+
+def _generate_product_in_worker(product: Dict) -> Tuple[Dict, List[logging.LogRecord]]:
+    """Process pool task: generate one product, returning its result and buffered logs"""
+    buffer = _RecordBuffer()
+    root_logger = logging.getLogger()
+    root_logger.addHandler(buffer)
+    try:
+        result = _worker_generator.generate_product(product)
+    finally:
+        root_logger.removeHandler(buffer)
+    return result, buffer.records
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -3278,6 +2337,8 @@ def main():
                         help='Generate all products')
     parser.add_argument('--product', nargs='+',
                         help='Generate specific products (by product codes)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for parallel generation (default: 1)')
 
     args = parser.parse_args()
 
@@ -3285,11 +2346,14 @@ def main():
     if args.all and args.product:
         parser.error("Cannot use --all and --product together")
 
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
     # product_codes 결정
     product_codes = None if args.all else args.product
 
     generator = DanaPageGenerator()
-    generator.run(product_codes=product_codes)
+    generator.run(product_codes=product_codes, workers=args.workers)
 
 
 if __name__ == "__main__":
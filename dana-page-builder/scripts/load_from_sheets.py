@@ -3,18 +3,26 @@ DANA&PETA Product Data Loader
 Loads 96-column product data from Google Sheets and downloads images
 """
 
+import argparse
+import hashlib
 import json
 import logging
 import os
 import re
+import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
 from PIL import Image
 
 # Import configuration
@@ -24,19 +32,30 @@ from config import (
     COLOR_EXTRACTION_CROP_PERCENT,
     COLOR_EXTRACTION_KMEANS_CLUSTERS,
     COLOR_EXTRACTION_KMEANS_ITERATIONS,
+    DRIVE_METADATA_BATCH_SIZE,
+    DRIVE_METADATA_FIELDS,
+    IMAGE_DOWNLOAD_CHUNK_SIZE,
+    IMAGE_DOWNLOAD_WORKERS,
+    IMAGE_MANIFEST_PATH,
     LOG_DATE_FORMAT,
     LOG_FILE,
     LOG_FORMAT,
-    PRODUCTS_DATA_PATH,
+    PRODUCTS_DB_PATH,
     REQUIRED_FIELDS,
     SCOPES,
     SERVICE_ACCOUNT_FILE,
+    SHEET_FIRST_ROW,
+    SHEET_GRID_FIELDS,
     SHEET_ID,
+    SHEET_LAST_COLUMN,
     SHEET_NAME,
-    SHEET_RANGE,
+    SHEET_ROW_BLOCK_SIZE,
     TEMPLATE_COLUMNS,
     VERSION,
 )
+from product_store import ProductStore
+from rate_limiter import ApiRateLimiter, is_retryable, shared_limiter
+from snapshot_bundle import SnapshotBundle, SnapshotError, merge_cell_values
 
 # Setup logging
 logging.basicConfig(
@@ -54,16 +73,32 @@ logger = logging.getLogger(__name__)
 class DanaDataLoader:
     """Load DANA&PETA product data from Google Sheets"""
 
-    def __init__(self):
-        """Initialize the data loader"""
+    def __init__(self, snapshot: Optional[Path] = None):
+        """
+        Initialize the data loader
+
+        Args:
+            snapshot: Snapshot bundle folder to load from instead of the Google APIs
+                      (captured with snapshot_bundle.py)
+        """
+        self.snapshot = SnapshotBundle(snapshot) if snapshot else None
         self.sheets_service = None
         self.drive_service = None
+        self.credentials = None
         self.products = []
         self.image_cache = set()
 
+        # Download plan: Drive file ID -> target filenames (deduplicated across all rows)
+        self.download_plan: Dict[str, List[str]] = {}
+        self.planned_filenames: Dict[str, str] = {}
+        self.failed_images = set()
+        self._thread_local = threading.local()
+        # Every Google API call goes through this (shared with worker threads and, via bucket files, other processes)
+        self.limiter: ApiRateLimiter = shared_limiter()
+
         # Create output directories
         ASSETS_DIR.mkdir(parents=True, exist_ok=True)
-        PRODUCTS_DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        PRODUCTS_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
         # Load existing images to cache
         if ASSETS_DIR.exists():
@@ -72,8 +107,38 @@ class DanaDataLoader:
             }
             logger.info(f"📦 Loaded {len(self.image_cache)} existing images into cache")
 
+        # Drive version (fileId, md5Checksum, modifiedTime, size) of every cached image
+        self.image_manifest: Dict[str, Dict] = self.load_image_manifest()
+
+    def load_image_manifest(self) -> Dict[str, Dict]:
+        """Load the local image manifest (filename -> Drive metadata)"""
+        if not IMAGE_MANIFEST_PATH.exists():
+            return {}
+
+        try:
+            with open(IMAGE_MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable image manifest: {e}")
+            return {}
+
+    def save_image_manifest(self) -> None:
+        """Persist the image manifest (temp file + atomic rename)"""
+        tmp_path = IMAGE_MANIFEST_PATH.with_name(f"{IMAGE_MANIFEST_PATH.name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.image_manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, IMAGE_MANIFEST_PATH)
+
     def authenticate(self) -> None:
-        """Authenticate with Google APIs"""
+        """Authenticate with Google APIs (not needed when loading from a snapshot bundle)"""
+        if self.snapshot:
+            meta = self.snapshot.meta()
+            logger.info(
+                f"📦 Using snapshot bundle {self.snapshot.path} "
+                f"(captured {meta.get('captured_at', '-')}, Google APIs not used)"
+            )
+            return
+
         try:
             if not SERVICE_ACCOUNT_FILE.exists():
                 raise FileNotFoundError(f"❌ Service Account file not found: {SERVICE_ACCOUNT_FILE}")
@@ -83,6 +148,7 @@ class DanaDataLoader:
                 scopes=SCOPES
             )
 
+            self.credentials = credentials
             self.sheets_service = build('sheets', 'v4', credentials=credentials)
             self.drive_service = build('drive', 'v3', credentials=credentials)
 
@@ -195,89 +261,373 @@ class DanaDataLoader:
 
         return None
 
-    def download_image(self, drive_url: str, output_filename: str) -> Optional[str]:
+    def plan_image(self, drive_url: str, output_filename: str) -> Optional[str]:
         """
-        Download image from Google Drive
+        Register an image in the download plan (no network access)
 
         Args:
             drive_url: Google Drive URL
             output_filename: Output filename
 
         Returns:
-            Relative path to downloaded image or None
+            Relative path the image will have once downloaded, or None
         """
         if not drive_url or drive_url.strip() == "":
             return None
 
-        # Check cache
-        if output_filename in self.image_cache:
-            logger.info(f"♻️  Using cached image: {output_filename}")
-            return f"../assets/images/{output_filename}"
+        relative_path = f"../assets/images/{output_filename}"
 
-        try:
-            file_id = self.extract_drive_file_id(drive_url)
-            if not file_id:
-                logger.warning(f"⚠️  Invalid Drive URL: {drive_url}")
-                return None
+        file_id = self.extract_drive_file_id(drive_url)
+        if not file_id:
+            if output_filename in self.image_cache:
+                logger.info(f"♻️  Using cached image: {output_filename}")
+                return relative_path
+            logger.warning(f"⚠️  Invalid Drive URL: {drive_url}")
+            return None
 
-            # Download file
-            request = self.drive_service.files().get_media(fileId=file_id)
-            file_path = ASSETS_DIR / output_filename
+        # Same filename planned twice (duplicate product rows): first one wins
+        planned_id = self.planned_filenames.get(output_filename)
+        if planned_id is not None:
+            if planned_id != file_id:
+                logger.warning(f"⚠️  {output_filename} already planned from another Drive file, keeping first")
+            return relative_path
 
-            with open(file_path, 'wb') as f:
-                downloader = request.execute()
-                f.write(downloader if isinstance(downloader, bytes) else downloader.encode())
+        self.planned_filenames[output_filename] = file_id
+        self.download_plan.setdefault(file_id, []).append(output_filename)
+        return relative_path
 
-            self.image_cache.add(output_filename)
-            logger.info(f"✅ Downloaded image: {output_filename}")
+    def fetch_drive_metadata(self, file_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch md5Checksum / modifiedTime / size for many files via Drive batch requests
 
-            return f"../assets/images/{output_filename}"
+        Args:
+            file_ids: Drive file IDs
 
-        except Exception as e:
-            logger.error(f"❌ Failed to download {drive_url}: {e}")
-            return None
+        Returns:
+            Mapping of file ID to metadata (files that failed the lookup are omitted)
+        """
+        metadata: Dict[str, Dict] = {}
+        throttled: Dict[str, Exception] = {}
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                if is_retryable(exception):
+                    throttled[request_id] = exception
+                    return
+                logger.warning(f"⚠️  Metadata lookup failed for {request_id}: {exception}")
+                return
+            metadata[request_id] = response
+
+        def execute_batch(pending: List[str]) -> None:
+            # Sub-requests are throttled individually: resend only those, via the limiter's backoff
+            throttled.clear()
+            batch = self.drive_service.new_batch_http_request(callback=on_response)
+            for file_id in pending:
+                batch.add(
+                    self.drive_service.files().get(fileId=file_id, fields=DRIVE_METADATA_FIELDS),
+                    request_id=file_id
+                )
+            batch.execute()
+            pending[:] = [file_id for file_id in pending if file_id in throttled]
+            if pending:
+                raise throttled[pending[0]]
+
+        for start in range(0, len(file_ids), DRIVE_METADATA_BATCH_SIZE):
+            pending = file_ids[start:start + DRIVE_METADATA_BATCH_SIZE]
+            count = len(pending)
+            try:
+                self.limiter.call('drive', execute_batch, pending, cost=count)
+            except Exception as e:
+                logger.warning(f"⚠️  Metadata batch failed ({count} files): {e}")
+
+        logger.info(f"✅ Fetched Drive metadata for {len(metadata)}/{len(file_ids)} files")
+        return metadata
+
+    @staticmethod
+    def _file_md5(file_path: Path) -> str:
+        """MD5 of a local file (same digest Drive reports as md5Checksum)"""
+        digest = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _same_drive_version(entry: Dict, file_id: str, metadata: Dict) -> bool:
+        """Whether a manifest entry describes the same Drive file version"""
+        if entry.get("fileId") != file_id:
+            return False
+        if metadata.get("md5Checksum"):
+            return entry.get("md5Checksum") == metadata["md5Checksum"]
+        # Files without a checksum (e.g. shortcuts): fall back to timestamp + size
+        return (
+            entry.get("modifiedTime") == metadata.get("modifiedTime")
+            and entry.get("size") == metadata.get("size")
+        )
+
+    def _record_manifest_entry(self, filename: str, file_id: str, metadata: Optional[Dict]) -> None:
+        """Remember which Drive version a local image came from"""
+        metadata = metadata or {}
+        self.image_manifest[filename] = {
+            "fileId": file_id,
+            "md5Checksum": metadata.get("md5Checksum"),
+            "modifiedTime": metadata.get("modifiedTime"),
+            "size": metadata.get("size"),
+        }
+
+    def is_image_fresh(self, filename: str, file_id: str, metadata: Optional[Dict]) -> bool:
+        """
+        Check whether the local copy of an image matches the current Drive version
 
-    def load_products_from_sheets(self) -> None:
-        """Load product data from unified template (템플릿 tab)"""
-        try:
-            logger.info(f"🚀 Loading DANA&PETA product data from unified template")
-            logger.info(f"📊 Sheet range: {SHEET_NAME}!{SHEET_RANGE}")
+        Args:
+            filename: Local filename in ASSETS_DIR
+            file_id: Drive file ID the image is planned from
+            metadata: Drive metadata for file_id (None if the lookup failed)
 
-            # Extract hyperlinks for all image columns
-            logger.info(f"📊 Extracting hyperlinks from template...")
-            rows = self.extract_hyperlinks_from_range(SHEET_NAME, SHEET_RANGE)
+        Returns:
+            True if the local file can be reused
+        """
+        if filename not in self.image_cache:
+            return False
 
-            if not rows:
-                logger.warning("⚠️  No data found in sheet")
-                return
+        # Metadata unavailable: keep the local copy rather than re-downloading blindly
+        if metadata is None:
+            return True
 
-            logger.info(f"📥 Processing {len(rows)} product rows...")
+        entry = self.image_manifest.get(filename)
+        if entry is None:
+            # Image predates the manifest: adopt it if the content matches Drive
+            drive_md5 = metadata.get("md5Checksum")
+            if drive_md5 and self._file_md5(ASSETS_DIR / filename) == drive_md5:
+                self._record_manifest_entry(filename, file_id, metadata)
+                return True
+            return False
+
+        return self._same_drive_version(entry, file_id, metadata)
+
+    def _get_thread_drive_service(self):
+        """Drive client for the current worker thread (googleapiclient is not thread-safe)"""
+        service = getattr(self._thread_local, "drive_service", None)
+        if service is None:
+            service = build('drive', 'v3', credentials=self.credentials)
+            self._thread_local.drive_service = service
+        return service
+
+    def _stream_to_file(self, file_id: str, file_path: Path) -> None:
+        """Stream a Drive file to disk in chunks (temp file + atomic rename)"""
+        request = self._get_thread_drive_service().files().get_media(fileId=file_id)
+        tmp_path = file_path.with_name(f".{file_path.name}.part")
 
-            for idx, row in enumerate(rows):
-                try:
-                    # Pad row to 302 columns if needed
-                    while len(row) < 302:
-                        row.append("")
+        try:
+            with open(tmp_path, 'wb') as f:
+                downloader = MediaIoBaseDownload(f, request, chunksize=IMAGE_DOWNLOAD_CHUNK_SIZE)
+                done = False
+                while not done:
+                    _, done = self.limiter.call('drive', downloader.next_chunk)
+            os.replace(tmp_path, file_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _fetch_planned_file(self, file_id: str, filenames: List[str]) -> None:
+        """Download one Drive file once and materialize it under every planned filename"""
+        primary_path = ASSETS_DIR / filenames[0]
+        self._stream_to_file(file_id, primary_path)
+
+        for alias in filenames[1:]:
+            alias_path = ASSETS_DIR / alias
+            if alias_path.exists():
+                alias_path.unlink()
+            try:
+                os.link(primary_path, alias_path)
+            except OSError:
+                shutil.copyfile(primary_path, alias_path)
+
+    def copy_planned_from_snapshot(self) -> None:
+        """Materialize every planned image from the snapshot bundle (no network access)"""
+        copied = reused = 0
+        for file_id, filenames in self.download_plan.items():
+            try:
+                data = self.snapshot.image_bytes(file_id)
+            except SnapshotError as e:
+                self.failed_images.update(f for f in filenames if f not in self.image_cache)
+                logger.error(f"❌ {e} ({', '.join(filenames)})")
+                continue
+
+            # Same checksum Drive reports, so the manifest stays valid for later online runs
+            metadata = {"md5Checksum": hashlib.md5(data).hexdigest(), "size": str(len(data))}
+            for filename in filenames:
+                if self.is_image_fresh(filename, file_id, metadata):
+                    reused += 1
+                    continue
+                file_path = ASSETS_DIR / filename
+                tmp_path = file_path.with_name(f".{filename}.part")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, file_path)
+                self.image_cache.add(filename)
+                self._record_manifest_entry(filename, file_id, metadata)
+                copied += 1
+
+        logger.info(
+            f"✅ Images from snapshot: {copied} copied, {reused} up to date, "
+            f"{len(self.failed_images)} missing"
+        )
+        self.download_plan = {}
+        self.planned_filenames = {}
+        self.save_image_manifest()
+
+    def execute_download_plan(self) -> None:
+        """Download every planned image concurrently (bounded worker pool)"""
+        if not self.download_plan:
+            logger.info("♻️  No new images to download")
+            return
+
+        if self.snapshot:
+            self.copy_planned_from_snapshot()
+            return
+
+        # Validate cached images against Drive metadata, keep only changed/missing files
+        metadata = self.fetch_drive_metadata(list(self.download_plan))
+        stale_plan: Dict[str, List[str]] = {}
+        reused = 0
+        for file_id, filenames in self.download_plan.items():
+            stale = [
+                filename for filename in filenames
+                if not self.is_image_fresh(filename, file_id, metadata.get(file_id))
+            ]
+            reused += len(filenames) - len(stale)
+            if stale:
+                stale_plan[file_id] = stale
+
+        logger.info(f"♻️  {reused} cached images are up to date")
+        self.download_plan = stale_plan
+
+        if not self.download_plan:
+            logger.info("♻️  No new images to download")
+            self.planned_filenames = {}
+            self.save_image_manifest()
+            return
+
+        total_images = sum(len(filenames) for filenames in self.download_plan.values())
+        logger.info(
+            f"📥 Downloading {len(self.download_plan)} unique Drive files "
+            f"({total_images} images, {IMAGE_DOWNLOAD_WORKERS} workers)..."
+        )
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=IMAGE_DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(self._fetch_planned_file, file_id, filenames): (file_id, filenames)
+                for file_id, filenames in self.download_plan.items()
+            }
 
-                    product_code = row[TEMPLATE_COLUMNS["productCode"]].strip()
-                    if not product_code:
-                        logger.warning(f"⚠️  Row {idx + 2}: No product code, skipping")
-                        continue
+            for future in as_completed(futures):
+                file_id, filenames = futures[future]
+                try:
+                    future.result()
+                    self.image_cache.update(filenames)
+                    for filename in filenames:
+                        self._record_manifest_entry(filename, file_id, metadata.get(file_id))
+                    logger.info(f"✅ Downloaded image: {', '.join(filenames)}")
+                except Exception as e:
+                    # Outdated local copies are still better than a missing image
+                    self.failed_images.update(f for f in filenames if f not in self.image_cache)
+                    logger.error(f"❌ Failed to download {file_id} ({', '.join(filenames)}): {e}")
+
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            f"✅ Image download finished in {elapsed:.1f}s "
+            f"({total_images - len(self.failed_images)} ok, {len(self.failed_images)} failed)"
+        )
+
+        self.download_plan = {}
+        self.planned_filenames = {}
+        self.save_image_manifest()
+
+    def prune_failed_images(self, product: Dict) -> None:
+        """Remove references to images whose download failed"""
+        if not self.failed_images:
+            return
+
+        def is_available(path: Optional[str]) -> bool:
+            return bool(path) and Path(path).name not in self.failed_images
+
+        images = product["images"]
+        if images.get("main_single") and not is_available(images["main_single"]):
+            images["main_single"] = None
+
+        # Detail points are kept when they still have text
+        detail_points = []
+        for point in product["detailPoints"]:
+            if point["image"] and not is_available(point["image"]):
+                point["image"] = ""
+            if point["image"] or point["text"]:
+                detail_points.append(point)
+        product["detailPoints"] = detail_points
+
+        gallery_by_color = {}
+        for color_key, color_images in product["galleryByColor"].items():
+            available = [path for path in color_images if is_available(path)]
+            if available:
+                gallery_by_color[color_key] = available
+        product["galleryByColor"] = gallery_by_color
+
+        product["productShots"] = [path for path in product["productShots"] if is_available(path)]
+
+        fabric_info = product["fabricInfo"]
+        if fabric_info.get("image") and not is_available(fabric_info["image"]):
+            fabric_info["image"] = None
 
-                    logger.info(f"📦 Processing product: {product_code}")
+    def load_products_from_sheets(self) -> None:
+        """Load product data from unified template (템플릿 tab)"""
+        try:
+            logger.info(f"🚀 Loading DANA&PETA product data from unified template")
+            logger.info(
+                f"📊 Sheet: {SHEET_NAME}!A{SHEET_FIRST_ROW}:{SHEET_LAST_COLUMN} "
+                f"({SHEET_ROW_BLOCK_SIZE} rows per request)"
+            )
 
-                    # Build product data from unified template
-                    product = self.build_product_data(row, product_code)
+            # Stream hyperlinks for all image columns block by block
+            total_rows = 0
+            for first_row, rows in self.iter_row_blocks(SHEET_NAME):
+                logger.info(f"📥 Processing rows {first_row}-{first_row + len(rows) - 1}...")
+                total_rows += len(rows)
+
+                for offset, row in enumerate(rows):
+                    row_number = first_row + offset
+                    try:
+                        # Pad row to 302 columns if needed
+                        while len(row) < 302:
+                            row.append("")
+
+                        product_code = row[TEMPLATE_COLUMNS["productCode"]].strip()
+                        if not product_code:
+                            logger.warning(f"⚠️  Row {row_number}: No product code, skipping")
+                            continue
+
+                        logger.info(f"📦 Processing product: {product_code}")
+
+                        # Build product data from unified template
+                        product = self.build_product_data(row, product_code)
+
+                        if product:
+                            self.products.append(product)
+                            logger.info(f"✅ Parsed product: {product_code}")
+
+                    except Exception as e:
+                        logger.error(f"❌ Error processing row {row_number}: {e}")
+                        import traceback
+                        logger.error(traceback.format_exc())
+                        continue
 
-                    if product:
-                        self.products.append(product)
-                        logger.info(f"✅ Loaded product: {product_code}")
+            if total_rows == 0:
+                logger.warning("⚠️  No data found in sheet")
+                return
 
-                except Exception as e:
-                    logger.error(f"❌ Error processing row {idx + 2}: {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-                    continue
+            # Download stage: every image across all rows, deduplicated by Drive file ID
+            self.execute_download_plan()
+            for product in self.products:
+                self.prune_failed_images(product)
 
             logger.info(f"✅ Successfully loaded {len(self.products)} products")
 
@@ -298,7 +648,11 @@ class DanaDataLoader:
         return value in ['-', 'N/A', '#N/A', '#REF!', ''] or not value
 
     def build_product_data(self, row: List[str], product_code: str) -> Optional[Dict]:
-        """Build product data structure from unified template (302 columns)"""
+        """
+        Build product data structure from unified template (302 columns)
+
+        Images are only planned here; they are downloaded in bulk by execute_download_plan()
+        """
         try:
             # Basic info
             product = {
@@ -323,10 +677,10 @@ class DanaDataLoader:
                 "sizeImage": None
             }
 
-            # Download main image
+            # Plan main image
             main_image_url = row[TEMPLATE_COLUMNS["mainImage"]].strip()
             if main_image_url and not self.is_empty_value(main_image_url):
-                main_image_path = self.download_image(
+                main_image_path = self.plan_image(
                     main_image_url,
                     f"{product_code}_main.jpg"
                 )
@@ -354,7 +708,7 @@ class DanaDataLoader:
 
             product["colors"] = colors_data
 
-            # Download detail point images (4 points)
+            # Plan detail point images (4 points)
             detail_points = []
             for i in range(1, 5):
                 detail_image_url = row[TEMPLATE_COLUMNS[f"detailPoint{i}Image"]].strip()
@@ -363,7 +717,7 @@ class DanaDataLoader:
                 # Add detail point if either image URL or text exists
                 image_path = None
                 if detail_image_url and not self.is_empty_value(detail_image_url):
-                    image_path = self.download_image(
+                    image_path = self.plan_image(
                         detail_image_url,
                         f"{product_code}_detail_point_{i}.jpg"
                     )
@@ -377,14 +731,14 @@ class DanaDataLoader:
 
             product["detailPoints"] = detail_points
 
-            # Download gallery images by color (8 colors × 12 images = 96 total)
+            # Plan gallery images by color (8 colors × 12 images = 96 total)
             gallery_by_color = {}
             for color_num in range(1, 9):
                 color_images = []
                 for img_num in range(1, 13):
                     gallery_url = row[TEMPLATE_COLUMNS[f"color{color_num}Gallery{img_num}"]].strip()
                     if gallery_url and not self.is_empty_value(gallery_url):
-                        image_path = self.download_image(
+                        image_path = self.plan_image(
                             gallery_url,
                             f"{product_code}_gallery_color{color_num}_{img_num}.jpg"
                         )
@@ -396,12 +750,12 @@ class DanaDataLoader:
 
             product["galleryByColor"] = gallery_by_color
 
-            # Download product shots by color (8 shots)
+            # Plan product shots by color (8 shots)
             product_shots = []
             for i in range(1, 9):
                 shot_url = row[TEMPLATE_COLUMNS[f"color{i}ProductShot"]].strip()
                 if shot_url and not self.is_empty_value(shot_url):
-                    image_path = self.download_image(
+                    image_path = self.plan_image(
                         shot_url,
                         f"{product_code}_shot_color{i}.jpg"
                     )
@@ -414,11 +768,11 @@ class DanaDataLoader:
             fabric_composition = row[TEMPLATE_COLUMNS["fabricComposition"]].strip()
             fabric_desc = row[TEMPLATE_COLUMNS["fabricDesc"]].strip()
 
-            # Download fabricImage if available
+            # Plan fabricImage if available
             fabric_image_path = None
             fabric_image_url = row[TEMPLATE_COLUMNS["fabricImage"]].strip()
             if fabric_image_url and not self.is_empty_value(fabric_image_url):
-                fabric_image_path = self.download_image(
+                fabric_image_path = self.plan_image(
                     fabric_image_url,
                     f"{product_code}_fabric.jpg"
                 )
@@ -498,79 +852,161 @@ class DanaDataLoader:
             logger.error(traceback.format_exc())
             return None
 
-    def extract_hyperlinks_from_range(self, sheet_name: str, range_spec: str) -> List[List[str]]:
+    def iter_row_blocks(
+        self, sheet_name: str, read_block: Optional[Callable[[str], List]] = None
+    ) -> Iterator[Tuple[int, List[List[str]]]]:
+        """
+        Stream the template sheet in blocks of SHEET_ROW_BLOCK_SIZE rows
+
+        Reads up to the grid's last row (gridProperties.rowCount). The API omits blank
+        rows at the end of a range, so a short or empty block is not the end of the sheet.
+        API errors are raised, so a failed read is never mistaken for the sheet end.
+        With a snapshot bundle, the captured rows are yielded instead.
+
+        Args:
+            sheet_name: Name of the sheet
+            read_block: Reads one range (default: rows with hyperlinks extracted)
+
+        Yields:
+            (sheet row number of the first row, rows)
+        """
+        if self.snapshot:
+            yield from self.snapshot.row_blocks(SHEET_ROW_BLOCK_SIZE)
+            return
+
+        if read_block is None:
+            def read_block(range_spec: str) -> List[List[str]]:
+                return self.extract_hyperlinks_from_range(sheet_name, range_spec, raise_errors=True)
+
+        row_count = self.sheet_row_count(sheet_name)
+        first_row = SHEET_FIRST_ROW
+        while first_row <= row_count:
+            last_row = min(first_row + SHEET_ROW_BLOCK_SIZE - 1, row_count)
+            range_spec = f"A{first_row}:{SHEET_LAST_COLUMN}{last_row}"
+
+            try:
+                rows = read_block(range_spec)
+            except HttpError as e:
+                # A truncated read would let save_products delete every product in the unread blocks
+                logger.error(f"❌ Failed to read {sheet_name}!{range_spec}: {e}")
+                raise
+
+            # Blank rows between products can fill the end of a block (or all of it)
+            if rows:
+                yield first_row, rows
+            first_row = last_row + 1
+
+    def extract_hyperlinks_from_range(
+        self, sheet_name: str, range_spec: str, raise_errors: bool = False
+    ) -> List[List[str]]:
         """
         Extract hyperlinks from Google Sheets cells
 
         Args:
             sheet_name: Name of the sheet
-            range_spec: Range specification (e.g., "A2:KP100")
+            range_spec: Range specification (e.g., "A2:KP201")
+            raise_errors: Re-raise API errors instead of returning an empty list
 
         Returns:
             List of rows with hyperlinks extracted
         """
         try:
-            result = self.sheets_service.spreadsheets().get(
-                spreadsheetId=SHEET_ID,
-                ranges=[f"{sheet_name}!{range_spec}"],
-                includeGridData=True
-            ).execute()
-
-            sheets = result.get('sheets', [])
-            if not sheets:
-                return []
-
-            data = sheets[0].get('data', [])
-            if not data:
-                return []
-
-            rows_data = data[0].get('rowData', [])
-            extracted_rows = []
-
-            for row in rows_data:
-                values = row.get('values', [])
-                row_values = []
-
-                for cell in values:
-                    # Check for hyperlink first
-                    hyperlink = cell.get('hyperlink')
-                    if hyperlink:
-                        row_values.append(hyperlink)
-                    else:
-                        # Fall back to formatted value
-                        formatted_value = cell.get('formattedValue', '')
-                        row_values.append(formatted_value)
-
-                extracted_rows.append(row_values)
+            # Field mask: only hyperlink/formattedValue instead of full cell formatting
+            extracted_rows = [
+                merge_cell_values(
+                    [cell.get('formattedValue', '') for cell in row],
+                    [cell.get('hyperlink') for cell in row],
+                )
+                for row in self.read_grid_range(sheet_name, range_spec, SHEET_GRID_FIELDS)
+            ]
 
-            logger.info(f"✅ Extracted {len(extracted_rows)} rows with hyperlinks from {sheet_name}")
+            logger.info(f"✅ Extracted {len(extracted_rows)} rows with hyperlinks from {sheet_name}!{range_spec}")
             return extracted_rows
 
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"❌ Failed to extract hyperlinks: {e}")
             return []
 
-    def save_products_json(self) -> None:
-        """Save products data to JSON file"""
-        try:
-            data = {
-                "products": self.products,
-                "metadata": {
-                    "totalCount": len(self.products),
-                    "lastUpdated": datetime.now().isoformat(),
-                    "version": VERSION,
-                    "brand": "DANA&PETA"
-                }
-            }
+    def sheet_row_count(self, sheet_name: str) -> int:
+        """
+        Number of rows in a sheet's grid (blank rows included)
 
-            with open(PRODUCTS_DATA_PATH, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+        Raises:
+            HttpError: API error
+        """
+        result = self.limiter.execute('sheets', self.sheets_service.spreadsheets().get(
+            spreadsheetId=SHEET_ID,
+            ranges=[sheet_name],
+            fields='sheets.properties.gridProperties.rowCount'
+        ))
+
+        sheets = result.get('sheets', [])
+        if not sheets:
+            return 0
+        return int(sheets[0].get('properties', {}).get('gridProperties', {}).get('rowCount', 0))
+
+    def read_grid_range(self, sheet_name: str, range_spec: str, fields: str) -> List[List[Dict]]:
+        """
+        Read raw grid cells for a range
 
-            logger.info(f"✅ Products data saved: {PRODUCTS_DATA_PATH}")
-            logger.info(f"📊 Total products: {len(self.products)}")
+        Args:
+            sheet_name: Name of the sheet
+            range_spec: Range specification (e.g., "A2:KP201")
+            fields: Field mask for the grid data
+
+        Returns:
+            Rows of cell dicts (only the fields in the mask)
+
+        Raises:
+            HttpError: API error
+        """
+        result = self.limiter.execute('sheets', self.sheets_service.spreadsheets().get(
+            spreadsheetId=SHEET_ID,
+            ranges=[f"{sheet_name}!{range_spec}"],
+            includeGridData=True,
+            fields=fields
+        ))
+
+        sheets = result.get('sheets', [])
+        if not sheets:
+            return []
+
+        data = sheets[0].get('data', [])
+        if not data:
+            return []
+
+        return [row.get('values', []) for row in data[0].get('rowData', [])]
+
+    def save_products(self) -> None:
+        """Upsert loaded products into the product store (only changed rows are rewritten)"""
+        try:
+            with ProductStore() as store:
+                changed = store.upsert_many(self.products)
+
+                # Products removed from the sheet disappear, as with the old full JSON rewrite
+                # (a snapshot of selected codes says nothing about the other products)
+                removed = 0
+                partial_snapshot = self.snapshot and self.snapshot.meta().get("scope") != "all"
+                if self.products and not partial_snapshot:
+                    removed = store.delete_missing(p["productCode"] for p in self.products)
+
+                store.set_metadata(
+                    totalCount=store.count(),
+                    lastUpdated=datetime.now().isoformat(),
+                    version=VERSION,
+                    brand="DANA&PETA"
+                )
+
+            logger.info(f"✅ Products data saved: {PRODUCTS_DB_PATH}")
+            logger.info(
+                f"📊 Total products: {len(self.products)} "
+                f"({changed} updated, {len(self.products) - changed} unchanged, {removed} removed)"
+            )
 
         except Exception as e:
-            logger.error(f"❌ Failed to save products JSON: {e}")
+            logger.error(f"❌ Failed to save products: {e}")
             raise
 
     def run(self) -> None:
@@ -589,9 +1025,12 @@ class DanaDataLoader:
             logger.info("🔄 Using Unified Template System (302 columns)")
             self.load_products_from_sheets()
 
-            # Step 3: Save JSON
+            # Step 3: Save to product store
             logger.info("\n📝 Step 3: Saving products data...")
-            self.save_products_json()
+            self.save_products()
+
+            if not self.snapshot:
+                logger.info(f"🚦 {self.limiter.summary()}")
 
             logger.info("\n" + "=" * 60)
             logger.info("✅ Data loading completed successfully!")
@@ -606,7 +1045,18 @@ class DanaDataLoader:
 
 def main():
     """Main entry point"""
-    loader = DanaDataLoader()
+    parser = argparse.ArgumentParser(description="Load DANA&PETA products from Google Sheets")
+    parser.add_argument(
+        "--snapshot", type=Path,
+        help="Load rows and images from a snapshot bundle instead of the Google APIs (see snapshot_bundle.py)"
+    )
+    args = parser.parse_args()
+
+    try:
+        loader = DanaDataLoader(snapshot=args.snapshot)
+    except SnapshotError as e:
+        logger.error(f"❌ {e}")
+        sys.exit(1)
     loader.run()
 
 
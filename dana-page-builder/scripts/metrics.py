@@ -0,0 +1,293 @@
+"""
+Prometheus Text-Format Metrics for DANA&PETA Page Builder
+Minimal Counter / Gauge / Histogram registry (no prometheus_client dependency)
+plus Flask request instrumentation and a /metrics route
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Default histogram buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape backslash, double quote and newline in a label value"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Render labels as {name="value",...}"""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects"""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Common base for all metric types"""
+
+    TYPE = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelKey:
+        """Convert label kwargs into a value tuple ordered by labelnames"""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name}: label mismatch (expected {self.labelnames}, got {tuple(labels)})"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render with # HELP / # TYPE headers"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter (amount must be non-negative)"""
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """Gauge that can go up and down, or be computed at scrape time"""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Register a callback evaluated on every scrape (unlabelled gauges only)"""
+        if self.labelnames:
+            raise ValueError(f"{self.name}: callbacks are only supported on unlabelled gauges")
+        self._function = function
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            try:
+                value = float(self._function())
+            except Exception:
+                return []
+            return [f"{self.name} {_format_value(value)}"]
+
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Histogram with cumulative buckets"""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # key -> (per-bucket counts, sum, count)
+        self._values: Dict[LabelKey, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for idx, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[idx] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of a with-block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(c), t, n)) for key, (c, t, n) in self._values.items())
+
+        lines = []
+        bucket_names = self.labelnames + ("le",)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(bucket_names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            base_labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{base_labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{base_labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered in the text exposition format"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if any(m.name == metric.name for m in self._metrics):
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """Render every registered metric"""
+        with self._lock:
+            metrics = list(self._metrics)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+def instrument_flask_app(app, registry: MetricsRegistry, namespace: str) -> Dict[str, _Metric]:
+    """Register request instrumentation hooks and the /metrics route on a Flask app"""
+    from flask import Response, g, request
+
+    requests_total = registry.counter(
+        f"{namespace}_http_requests_total",
+        "Total HTTP requests by route, method and status.",
+        ("route", "method", "status"),
+    )
+    latency = registry.histogram(
+        f"{namespace}_http_request_duration_seconds",
+        "HTTP request latency by route.",
+        ("route", "method"),
+    )
+    in_flight = registry.gauge(
+        f"{namespace}_http_requests_in_flight",
+        "HTTP requests currently being served.",
+    )
+
+    def _route() -> str:
+        # Label by URL rule, not raw path, so product codes don't explode cardinality
+        return request.url_rule.rule if request.url_rule is not None else "unmatched"
+
+    @app.before_request
+    def _metrics_before_request():
+        g._metrics_start = time.perf_counter()
+        g._metrics_recorded = False
+        in_flight.inc()
+
+    @app.after_request
+    def _metrics_after_request(response):
+        start = getattr(g, "_metrics_start", None)
+        if start is not None:
+            route = _route()
+            latency.observe(time.perf_counter() - start, route=route, method=request.method)
+            requests_total.inc(route=route, method=request.method, status=str(response.status_code))
+            g._metrics_recorded = True
+        return response
+
+    @app.teardown_request
+    def _metrics_teardown_request(exc):
+        start = getattr(g, "_metrics_start", None)
+        if start is None:
+            return
+        in_flight.dec()
+        # after_request is skipped when the view raised
+        if not getattr(g, "_metrics_recorded", False):
+            route = _route()
+            latency.observe(time.perf_counter() - start, route=route, method=request.method)
+            requests_total.inc(route=route, method=request.method, status="500")
+
+    @app.route("/metrics")
+    def metrics():
+        """Prometheus scrape endpoint"""
+        return Response(registry.render(), mimetype=None, content_type=MetricsRegistry.CONTENT_TYPE)
+
+    return {"requests": requests_total, "latency": latency, "in_flight": in_flight}
@@ -0,0 +1,320 @@
+"""
+Output Archive for DANA&PETA Page Builder
+Packs aged date folders into compressed archives with per-product random access
+
+File layout ({archive_dir}/{YYYY-MM-DD}.arc):
+  MAGIC
+  [block 0][block 1]...        # one independently compressed frame per product code
+  [index JSON]                 # block offsets + per-member block/offset/size/sha256
+  footer: index offset, length (<QQ) + MAGIC
+
+All files of one product share a block, so their duplicated base64 images
+compress together, and a lookup decompresses only that block.
+
+Codec: zstd when zstandard is installed, zlib otherwise (recorded in the index)
+"""
+
+import hashlib
+import json
+import os
+import struct
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+ARCHIVE_DIR_NAME = "archive"  # Archive folder under output/
+ARCHIVE_SUFFIX = ".arc"
+ARCHIVE_VERSION = 1
+ZSTD_LEVEL = 15  # Ratio/speed balance for base64-heavy HTML
+ZLIB_LEVEL = 9
+
+MAGIC = b"OUTARC01"
+FOOTER = struct.Struct("<QQ")
+
+
+class ArchiveError(Exception):
+    """Archive format or integrity error"""
+    pass
+
+
+class ArchiveResult(NamedTuple):
+    """Result of archiving one folder"""
+    path: Path
+    member_count: int
+    original_bytes: int
+    archived_bytes: int
+
+
+def default_group_key(member: str) -> str:
+    """Block group key: product code part of the file name (e.g. DN25WTS001_editable.html -> DN25WTS001)"""
+    return Path(member).name.split("_")[0].split(".")[0]
+
+
+def _load_zstd():
+    """zstandard module, or None when not installed"""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def available_codec() -> str:
+    """Codec used for new archives"""
+    return "zstd" if _load_zstd() is not None else "zlib"
+
+
+def _compressor(codec: str) -> Callable[[bytes], bytes]:
+    if codec == "zstd":
+        zstandard = _load_zstd()
+        if zstandard is None:
+            raise ArchiveError("zstd archives require zstandard: pip install zstandard")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress
+    if codec == "zlib":
+        return lambda data: zlib.compress(data, ZLIB_LEVEL)
+    raise ArchiveError(f"Unknown codec: {codec}")
+
+
+def _decompressor(codec: str) -> Callable[[bytes], bytes]:
+    if codec == "zstd":
+        zstandard = _load_zstd()
+        if zstandard is None:
+            raise ArchiveError("Reading zstd archives requires zstandard: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress
+    if codec == "zlib":
+        return zlib.decompress
+    raise ArchiveError(f"Unknown codec: {codec}")
+
+
+def archive_path_for(archive_dir: Path, folder_name: str) -> Path:
+    """Archive file path for a date folder name"""
+    return archive_dir / f"{folder_name}{ARCHIVE_SUFFIX}"
+
+
+class ArchiveReader:
+    """Archive reader (loads the index only, decompresses one block per lookup)"""
+
+    def __init__(self, path: Path):
+        """
+        Open an archive and read its index
+
+        Args:
+            path: .arc file
+
+        Raises:
+            ArchiveError: Not a valid archive
+        """
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self.index = self._read_index()
+        except Exception:
+            self._file.close()
+            raise
+        self._decompress = _decompressor(self.index["codec"])
+        # Recently decompressed blocks (reused for consecutive members of one product)
+        self._block_cache: "OrderedDict[int, bytes]" = OrderedDict()
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _read_index(self) -> Dict:
+        tail_size = FOOTER.size + len(MAGIC)
+        self._file.seek(0, os.SEEK_END)
+        file_size = self._file.tell()
+        if file_size < len(MAGIC) + tail_size:
+            raise ArchiveError(f"Archive too small: {self.path}")
+
+        self._file.seek(0)
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise ArchiveError(f"Not an archive: {self.path}")
+
+        self._file.seek(file_size - tail_size)
+        tail = self._file.read(tail_size)
+        if tail[FOOTER.size:] != MAGIC:
+            raise ArchiveError(f"Archive footer corrupted: {self.path}")
+
+        index_offset, index_length = FOOTER.unpack(tail[:FOOTER.size])
+        self._file.seek(index_offset)
+        index = json.loads(self._file.read(index_length).decode('utf-8'))
+        if index.get("version") != ARCHIVE_VERSION:
+            raise ArchiveError(f"Unsupported archive version: {index.get('version')}")
+        return index
+
+    def members(self) -> List[str]:
+        """Member paths (relative to the date folder)"""
+        return sorted(self.index["members"])
+
+    def _block(self, block_id: int) -> bytes:
+        cached = self._block_cache.get(block_id)
+        if cached is not None:
+            self._block_cache.move_to_end(block_id)
+            return cached
+
+        block = self.index["blocks"][block_id]
+        self._file.seek(block["offset"])
+        data = self._decompress(self._file.read(block["length"]))
+
+        self._block_cache[block_id] = data
+        if len(self._block_cache) > 2:
+            self._block_cache.popitem(last=False)
+        return data
+
+    def read(self, member: str, verify: bool = True) -> bytes:
+        """
+        Read one member
+
+        Args:
+            member: Member path relative to the date folder
+            verify: Check the stored sha256
+
+        Returns:
+            Original bytes
+
+        Raises:
+            KeyError: Unknown member
+            ArchiveError: Integrity check failed
+        """
+        entry = self.index["members"][member]
+        block = self._block(entry["block"])
+        data = block[entry["offset"]:entry["offset"] + entry["size"]]
+        if verify and hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            raise ArchiveError(f"Integrity check failed: {self.path.name}:{member}")
+        return data
+
+    def find_product(self, product_code: str, preferred_prefixes: Iterable[str]) -> Optional[str]:
+        """
+        Find the representative page of a product
+
+        Args:
+            product_code: Product code
+            preferred_prefixes: Folder prefixes in priority order
+
+        Returns:
+            Member path or None
+        """
+        candidates = [
+            member for member in self.members()
+            if default_group_key(member) == product_code and member.endswith(('.html', '.htm'))
+        ]
+        for prefix in preferred_prefixes:
+            for member in candidates:
+                if member.startswith(prefix):
+                    return member
+        return candidates[0] if candidates else None
+
+
+def _collect_members(folder: Path) -> Dict[str, Path]:
+    members = {}
+    for root, _, files in os.walk(folder):
+        for name in files:
+            if name.startswith('.'):
+                continue
+            path = Path(root) / name
+            members[path.relative_to(folder).as_posix()] = path
+    return members
+
+
+def archive_folder(
+    folder: Path,
+    archive_dir: Path,
+    group_key: Callable[[str], str] = default_group_key,
+) -> ArchiveResult:
+    """
+    Pack a date folder into an archive (the folder itself is left in place)
+
+    An existing archive for the same date is merged (folder contents win).
+    Every member is read back and its sha256 checked before the archive is published.
+
+    Args:
+        folder: Date folder (e.g. output/2025-01-01)
+        archive_dir: Archive folder (e.g. output/archive)
+        group_key: Member -> block group key (default: product code)
+
+    Returns:
+        ArchiveResult
+    """
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    archive_path = archive_path_for(archive_dir, folder.name)
+    tmp_path = archive_path.with_name(f".{archive_path.name}.tmp")
+
+    members: Dict[str, Callable[[], bytes]] = {}
+    mtimes: Dict[str, float] = {}
+
+    previous = ArchiveReader(archive_path) if archive_path.exists() else None
+    try:
+        if previous is not None:
+            for member in previous.members():
+                members[member] = (lambda m=member: previous.read(m))
+                mtimes[member] = previous.index["members"][member]["mtime"]
+
+        for member, path in _collect_members(folder).items():
+            members[member] = path.read_bytes
+            mtimes[member] = path.stat().st_mtime
+
+        groups: Dict[str, List[str]] = {}
+        for member in sorted(members):
+            groups.setdefault(group_key(member), []).append(member)
+
+        codec = available_codec()
+        compress = _compressor(codec)
+        index = {
+            "version": ARCHIVE_VERSION,
+            "codec": codec,
+            "folder": folder.name,
+            "created": datetime.now().isoformat(),
+            "blocks": [],
+            "members": {},
+        }
+        original_bytes = 0
+
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            for group in sorted(groups):
+                raw = bytearray()
+                for member in groups[group]:
+                    data = members[member]()
+                    index["members"][member] = {
+                        "block": len(index["blocks"]),
+                        "offset": len(raw),
+                        "size": len(data),
+                        "mtime": mtimes[member],
+                        "sha256": hashlib.sha256(data).hexdigest(),
+                    }
+                    raw += data
+                compressed = compress(bytes(raw))
+                index["blocks"].append({"offset": f.tell(), "length": len(compressed), "size": len(raw)})
+                f.write(compressed)
+                original_bytes += len(raw)
+
+            index_bytes = json.dumps(index, ensure_ascii=False).encode('utf-8')
+            index_offset = f.tell()
+            f.write(index_bytes)
+            f.write(FOOTER.pack(index_offset, len(index_bytes)))
+            f.write(MAGIC)
+    finally:
+        if previous is not None:
+            previous.close()
+
+    # Verify everything before the caller deletes the source folder
+    with ArchiveReader(tmp_path) as reader:
+        for member in reader.members():
+            reader.read(member, verify=True)
+
+    os.replace(tmp_path, archive_path)
+    return ArchiveResult(archive_path, len(index["members"]), original_bytes, archive_path.stat().st_size)
+
+
+def list_archives(archive_dir: Path) -> List[Path]:
+    """Archive files sorted by name"""
+    if not archive_dir.exists():
+        return []
+    return sorted(archive_dir.glob(f"*{ARCHIVE_SUFFIX}"))
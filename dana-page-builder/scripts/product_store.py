@@ -0,0 +1,220 @@
+"""
+DANA&PETA Product Store
+SQLite-backed product data with keyed lookup, incremental upsert and listing queries
+(replaces the monolithic data/products.json)
+"""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from config import PRODUCTS_DATA_PATH, PRODUCTS_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    code TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    main_image TEXT,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_products_position ON products (position);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ProductStore:
+    """Keyed product storage (one row per product, product dict stored as JSON)"""
+
+    def __init__(self, db_path: Path = PRODUCTS_DB_PATH, legacy_json_path: Optional[Path] = PRODUCTS_DATA_PATH):
+        """
+        Open (or create) the product store
+
+        Args:
+            db_path: SQLite database file
+            legacy_json_path: products.json imported once when the store is empty
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        # WAL: readers (generator, index, pool workers) never block the loader
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+        if legacy_json_path is not None and self.count() == 0:
+            self.import_legacy_json(Path(legacy_json_path))
+
+    def __enter__(self) -> "ProductStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self.conn.close()
+
+    def import_legacy_json(self, json_path: Path) -> int:
+        """Import products from a legacy products.json file"""
+        if not json_path.exists():
+            return 0
+
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️  Could not import legacy products data {json_path}: {e}")
+            return 0
+
+        products = data.get('products', [])
+        changed = self.upsert_many(products)
+        logger.info(f"📦 Imported {changed} products from legacy {json_path.name}")
+        return changed
+
+    def upsert(self, product: Dict, position: Optional[int] = None) -> bool:
+        """
+        Insert or update a single product
+
+        Args:
+            product: Product dict (must contain productCode)
+            position: Sort position (sheet order); keeps the existing one if None
+
+        Returns:
+            True if the stored row changed
+        """
+        with self.conn:
+            return self._upsert(product, position)
+
+    def upsert_many(self, products: Iterable[Dict]) -> int:
+        """
+        Insert or update products in one transaction, preserving their order
+
+        Returns:
+            Number of rows that changed
+        """
+        changed = 0
+        with self.conn:
+            for position, product in enumerate(products):
+                if self._upsert(product, position):
+                    changed += 1
+        return changed
+
+    def _upsert(self, product: Dict, position: Optional[int]) -> bool:
+        """Upsert without committing; unchanged products keep their updated_at"""
+        code = product['productCode']
+        data = json.dumps(product, ensure_ascii=False, sort_keys=True)
+
+        existing = self.conn.execute(
+            "SELECT position, data FROM products WHERE code = ?", (code,)
+        ).fetchone()
+
+        if existing is not None:
+            new_position = existing['position'] if position is None else position
+            if existing['data'] == data and existing['position'] == new_position:
+                return False
+            if existing['data'] == data:
+                self.conn.execute(
+                    "UPDATE products SET position = ? WHERE code = ?", (new_position, code)
+                )
+                return False
+        elif position is None:
+            row = self.conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM products").fetchone()
+            new_position = row[0]
+        else:
+            new_position = position
+
+        self.conn.execute(
+            """
+            INSERT INTO products (code, position, title, main_image, data, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(code) DO UPDATE SET
+                position = excluded.position,
+                title = excluded.title,
+                main_image = excluded.main_image,
+                data = excluded.data,
+                updated_at = excluded.updated_at
+            """,
+            (
+                code,
+                new_position,
+                product.get('title', ''),
+                (product.get('images') or {}).get('main_single'),
+                data,
+                datetime.now().isoformat(),
+            )
+        )
+        return True
+
+    def delete_missing(self, keep_codes: Iterable[str]) -> int:
+        """Delete products whose code is not in keep_codes (e.g. rows removed from the sheet)"""
+        keep = set(keep_codes)
+        stale = [row['code'] for row in self.conn.execute("SELECT code FROM products") if row['code'] not in keep]
+        with self.conn:
+            self.conn.executemany("DELETE FROM products WHERE code = ?", [(code,) for code in stale])
+        return len(stale)
+
+    def get(self, code: str) -> Optional[Dict]:
+        """Look up one product by code"""
+        row = self.conn.execute("SELECT data FROM products WHERE code = ?", (code,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def get_many(self, codes: Iterable[str]) -> List[Dict]:
+        """Look up products by code (requested order, unknown codes skipped)"""
+        products = []
+        for code in codes:
+            product = self.get(code)
+            if product is not None:
+                products.append(product)
+        return products
+
+    def iter_products(self) -> Iterator[Dict]:
+        """Iterate over all products in sheet order"""
+        for row in self.conn.execute("SELECT data FROM products ORDER BY position"):
+            yield json.loads(row['data'])
+
+    def list_summaries(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Lightweight listing for index pages (no JSON decoding)
+
+        Returns:
+            [{"productCode", "title", "mainImage", "updatedAt"}, ...] in sheet order
+        """
+        query = "SELECT code, title, main_image, updated_at FROM products ORDER BY position LIMIT ? OFFSET ?"
+        rows = self.conn.execute(query, (-1 if limit is None else limit, offset))
+        return [
+            {
+                "productCode": row['code'],
+                "title": row['title'],
+                "mainImage": row['main_image'],
+                "updatedAt": row['updated_at'],
+            }
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        """Number of stored products"""
+        return self.conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def set_metadata(self, **values: str) -> None:
+        """Store run metadata (lastUpdated, version, ...)"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO metadata (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                [(key, str(value)) for key, value in values.items()]
+            )
+
+    def get_metadata(self) -> Dict[str, str]:
+        """Return all stored metadata"""
+        return {row['key']: row['value'] for row in self.conn.execute("SELECT key, value FROM metadata")}
@@ -0,0 +1,301 @@
+"""
+Google API rate limiting - cross-process token buckets, AIMD concurrency and 429/5xx retries
+
+Every Sheets/Drive call (execute(), download chunks, batch requests) goes through
+ApiRateLimiter.call():
+
+- Token bucket per API keeps requests under the per-minute quota. Bucket state lives
+  in a locked file under RATE_LIMIT_STATE_DIR, so loader runs, snapshot captures and
+  the server started from the same folder share one budget
+- AIMD concurrency raises the in-flight limit by 1/limit per success and halves it
+  on 429/5xx, settling at the highest rate the API sustains
+- Retryable errors (429/5xx/connection) are retried after Retry-After or exponential
+  backoff with jitter. A 429 drains the shared bucket so other processes slow down too
+- stats()/summary() report calls, throttled responses and time spent waiting
+
+State files:
+  .cache/ratelimit/{api}.json   {"tokens": 12.5, "updated": 1729400000.0}
+"""
+
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: limits apply within this process only
+    fcntl = None
+
+from config import (
+    API_BACKOFF_BASE,
+    API_BACKOFF_MAX,
+    API_CONCURRENCY_INITIAL,
+    API_CONCURRENCY_MAX,
+    API_MAX_RETRIES,
+    DRIVE_REQUESTS_PER_MINUTE,
+    RATE_LIMIT_BURST_SECONDS,
+    RATE_LIMIT_STATE_DIR,
+    SHEETS_REQUESTS_PER_MINUTE,
+)
+
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+DECREASE_COOLDOWN = 1.0  # Seconds; a burst of 429s from one overload halves the limit once
+
+
+def error_status(error: BaseException) -> Optional[int]:
+    """HTTP status of an HttpError (without importing googleapiclient)"""
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Quota exceeded, transient server error or connection failure"""
+    status = error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Retry-After header of the error response, in seconds"""
+    resp = getattr(error, 'resp', None)
+    try:
+        value = resp.get('retry-after') if resp is not None else None
+        return max(0.0, float(value)) if value is not None else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket, shared across processes through a locked state file"""
+
+    def __init__(self, name: str, per_minute: float, state_dir: Optional[Path] = RATE_LIMIT_STATE_DIR):
+        """
+        Args:
+            name: Bucket name (API name)
+            per_minute: Allowed requests per minute
+            state_dir: Folder for the state file (None keeps the bucket in-process)
+        """
+        self.name = name
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * RATE_LIMIT_BURST_SECONDS)
+        self.path = state_dir / f"{name}.json" if state_dir is not None and fcntl is not None else None
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = time.time()
+
+    def _update(self, change: Callable[[float], Tuple[float, Any]]) -> Any:
+        """Apply change(tokens) -> (new tokens, result) to the refilled balance under the lock"""
+        with self._lock:
+            now = time.time()
+            if self.path is None:
+                tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._tokens, result = change(tokens)
+                self._updated = now
+                return result
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a+', encoding='utf-8') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read())
+                        tokens, updated = float(state['tokens']), float(state['updated'])
+                    except (ValueError, KeyError, TypeError):
+                        tokens, updated = self.capacity, now
+                    tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+                    tokens, result = change(tokens)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps({'tokens': tokens, 'updated': now}))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+            return result
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        Block until `cost` tokens are available
+
+        Returns:
+            Seconds spent waiting
+        """
+        cost = min(cost, self.capacity)
+
+        def take(tokens: float) -> Tuple[float, float]:
+            if tokens >= cost:
+                return tokens - cost, 0.0
+            return tokens, (cost - tokens) / self.rate
+
+        waited = 0.0
+        while True:
+            wait = self._update(take)
+            if wait <= 0:
+                return waited
+            # Re-check in short steps: another process may take the refill first
+            wait = min(wait, 1.0)
+            time.sleep(wait)
+            waited += wait
+
+    def drain(self) -> None:
+        """Empty the bucket (after a 429 every process stops bursting)"""
+        self._update(lambda tokens: (min(tokens, 0.0), None))
+
+
+class AdaptiveConcurrency:
+    """AIMD in-flight request limit (+1/limit per success, halved when throttled)"""
+
+    def __init__(self, initial: int = API_CONCURRENCY_INITIAL, minimum: int = 1, maximum: int = API_CONCURRENCY_MAX):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._last_decrease = 0.0
+
+    def acquire(self) -> float:
+        """
+        Block until a slot is free
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.perf_counter()
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+        return time.perf_counter() - started
+
+    def release(self, throttled: bool = False) -> None:
+        """Free a slot and adjust the limit"""
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                now = time.monotonic()
+                if now - self._last_decrease >= DECREASE_COOLDOWN:
+                    self.limit = max(float(self.minimum), self.limit / 2)
+                    self._last_decrease = now
+            else:
+                self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+
+class ApiRateLimiter:
+    """Wraps API calls with token buckets, AIMD concurrency, retries and wait statistics"""
+
+    def __init__(
+        self,
+        per_minute: Optional[Dict[str, float]] = None,
+        state_dir: Optional[Path] = RATE_LIMIT_STATE_DIR,
+        max_retries: int = API_MAX_RETRIES
+    ):
+        """
+        Args:
+            per_minute: Requests per minute per API (default: sheets/drive from config)
+            state_dir: Folder for shared bucket state (None keeps buckets in-process)
+            max_retries: Retries per call for retryable errors
+        """
+        if per_minute is None:
+            per_minute = {'sheets': SHEETS_REQUESTS_PER_MINUTE, 'drive': DRIVE_REQUESTS_PER_MINUTE}
+        self.buckets = {name: TokenBucket(name, rate, state_dir) for name, rate in per_minute.items()}
+        self.concurrency = AdaptiveConcurrency()
+        self.max_retries = max_retries
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'calls': 0,
+            'throttled': 0,
+            'retries': 0,
+            'failed': 0,
+            'quota_wait': 0.0,
+            'slot_wait': 0.0,
+            'backoff_wait': 0.0,
+        }
+
+    def _add(self, key: str, value: float = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += value
+
+    def call(self, api: str, func: Callable[..., Any], *args: Any, cost: float = 1.0, **kwargs: Any) -> Any:
+        """
+        Call func within the limits, retrying retryable errors with backoff
+
+        Args:
+            api: Bucket name ("sheets" or "drive")
+            func: Sends one request (e.g. request.execute, downloader.next_chunk)
+            cost: Tokens to spend (sub-request count for batch requests)
+
+        Raises:
+            Exception: Last error when it is not retryable or retries are exhausted
+        """
+        bucket = self.buckets[api]
+        attempt = 0
+        while True:
+            self._add('quota_wait', bucket.acquire(cost))
+            self._add('slot_wait', self.concurrency.acquire())
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                retryable = is_retryable(e)
+                self.concurrency.release(throttled=retryable)
+                if not retryable or attempt >= self.max_retries:
+                    self._add('failed')
+                    raise
+
+                self._add('throttled')
+                if error_status(e) == 429:
+                    bucket.drain()
+                delay = retry_after(e)
+                if delay is None:
+                    # Jitter spreads out requests that failed together
+                    delay = min(API_BACKOFF_MAX, API_BACKOFF_BASE * (2 ** attempt)) * random.uniform(0.5, 1.0)
+                self._add('retries')
+                self._add('backoff_wait', delay)
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            self.concurrency.release()
+            self._add('calls')
+            return result
+
+    def execute(self, api: str, request: Any, cost: float = 1.0) -> Any:
+        """Execute a googleapiclient request (this limiter retries instead of the library)"""
+        return self.call(api, request.execute, cost=cost)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cumulative counters plus the current concurrency limit"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['throttle_wait'] = stats['quota_wait'] + stats['slot_wait'] + stats['backoff_wait']
+        stats['concurrency_limit'] = int(self.concurrency.limit)
+        return stats
+
+    def summary(self) -> str:
+        """One-line report (wait times are summed over threads)"""
+        s = self.stats()
+        return (
+            f"API calls: {s['calls']}, throttled wait {s['throttle_wait']:.1f}s "
+            f"(quota {s['quota_wait']:.1f}s, concurrency {s['slot_wait']:.1f}s, backoff {s['backoff_wait']:.1f}s), "
+            f"429/5xx: {s['throttled']}, failed: {s['failed']}, concurrency limit: {s['concurrency_limit']}"
+        )
+
+
+_shared: Optional[ApiRateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def shared_limiter() -> ApiRateLimiter:
+    """Process-wide limiter (all loaders and worker threads share limits and statistics)"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ApiRateLimiter()
+        return _shared
@@ -1,19 +1,43 @@
 """
 Flask Local Server for DANA&PETA Page Builder
 Serves editable HTML and handles file exports to output/날짜/익스포트
+Exposes Prometheus-style operational metrics on /metrics
+Optionally evicts least recently modified date folders when output exceeds OUTPUT_QUOTA_MB
+Serves single pages out of compressed date-folder archives on /archive/<date>/<product_code>
+Serves the shared editor runtime bundle on /static/editor/<file>
+Serves the shared size illustration library on /static/size-images/<file>
+Stitches tiled JPG exports uploaded in order on /save-jpg-tile
 """
 
 import base64
+import io
 import json
 import logging
+import mimetypes
 import os
+import shutil
+import time
 from datetime import datetime
 from pathlib import Path
 
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, jsonify, redirect, request, send_file, send_from_directory
 from flask_cors import CORS
 
-from config import DATE_FORMAT, EDITABLE_FOLDER, OUTPUT_DIR
+from config import (
+    DATE_FORMAT,
+    EDITABLE_FOLDER,
+    ORIGINAL_FOLDER,
+    OUTPUT_DIR,
+    OUTPUT_QUOTA_MB,
+    OUTPUT_RETENTION_INTERVAL,
+)
+import editor_runtime
+import export_store
+import size_library
+from metrics import MetricsRegistry, instrument_flask_app
+from output_archive import ARCHIVE_DIR_NAME, ArchiveError, ArchiveReader, archive_path_for
+from storage_index import is_dated_folder, start_retention_thread
+from tile_stitcher import TileStitchError, TileStitcher
 
 # Setup logging
 logging.basicConfig(
@@ -23,12 +47,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+app = Flask(__name__, static_folder=None)  # /static/* is served by the routes below
 CORS(app)  # Enable CORS for all routes
 
 # Export folder name
 EXPORT_FOLDER = "익스포트"
 
+# Tiled JPG stitching (/save-jpg-tile, spool in output/.tiles)
+TILE_STITCHER = TileStitcher(OUTPUT_DIR / ".tiles")
+
+# Operational metrics (/metrics)
+METRICS = MetricsRegistry()
+instrument_flask_app(app, METRICS, namespace="dana")
+EXPORT_BYTES = METRICS.counter(
+    "dana_export_received_bytes_total",
+    "Request body bytes received by export routes.",
+    ("route",),
+)
+EXPORT_DECODE_SECONDS = METRICS.histogram(
+    "dana_export_decode_duration_seconds",
+    "Time spent parsing and decoding export payloads.",
+    ("route",),
+)
+EXPORT_WRITE_SECONDS = METRICS.histogram(
+    "dana_export_write_duration_seconds",
+    "Time spent writing export files to disk.",
+    ("route",),
+)
+OUTPUT_DISK_FREE = METRICS.gauge(
+    "dana_output_disk_free_bytes",
+    "Free disk space on the volume holding OUTPUT_DIR.",
+)
+
+
+def _output_disk_free() -> float:
+    """Free bytes on OUTPUT_DIR's volume (nearest existing parent if not created yet)"""
+    target = OUTPUT_DIR
+    while not target.exists() and target.parent != target:
+        target = target.parent
+    return shutil.disk_usage(target).free
+
+
+OUTPUT_DISK_FREE.set_function(_output_disk_free)
+
 
 def get_today_export_dir():
     """Get today's export directory"""
@@ -38,26 +99,18 @@ def get_today_export_dir():
     return export_dir
 
 
-def get_unique_filename(directory: Path, base_name: str, extension: str) -> Path:
-    """Generate unique filename by adding numbers if file exists"""
-    file_path = directory / f"{base_name}{extension}"
-
-    if not file_path.exists():
-        return file_path
-
-    counter = 1
-    while True:
-        file_path = directory / f"{base_name}_{counter}{extension}"
-        if not file_path.exists():
-            return file_path
-        counter += 1
+def get_protected_folders() -> set:
+    """Folders the retention task never evicts (today's editable/export folder)"""
+    return {datetime.now().strftime(DATE_FORMAT)}
 
 
 @app.route('/save-html', methods=['POST'])
 def save_html():
     """Save HTML file to output/날짜/익스포트"""
     try:
-        data = request.get_json()
+        EXPORT_BYTES.inc(request.content_length or 0, route='/save-html')
+        with EXPORT_DECODE_SECONDS.time(route='/save-html'):
+            data = request.get_json()
         product_code = data.get('productCode')
         html_content = data.get('htmlContent')
 
@@ -67,20 +120,19 @@ def save_html():
         # Get export directory
         export_dir = get_today_export_dir()
 
-        # Generate unique filename
+        # Store by content hash (identical exports reuse the existing file)
         base_name = f"{product_code}_exported_dana"
-        file_path = get_unique_filename(export_dir, base_name, ".html")
-
-        # Save HTML file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with EXPORT_WRITE_SECONDS.time(route='/save-html'):
+            stored = export_store.store_bytes(export_dir, base_name, ".html", html_content.encode('utf-8'))
 
-        logger.info(f"✅ HTML saved: {file_path}")
+        file_path = stored.path
+        logger.info(f"✅ HTML saved: {file_path}" if stored.created else f"♻️  HTML unchanged: {file_path}")
 
         return jsonify({
             'success': True,
             'path': str(file_path.relative_to(OUTPUT_DIR.parent)),
-            'filename': file_path.name
+            'filename': file_path.name,
+            'deduplicated': not stored.created
         })
 
     except Exception as e:
@@ -92,6 +144,8 @@ def save_html():
 def save_jpg():
     """Save JPG file to output/날짜/익스포트"""
     try:
+        EXPORT_BYTES.inc(request.content_length or 0, route='/save-jpg')
+        decode_start = time.perf_counter()
         data = request.get_json()
         product_code = data.get('productCode')
         image_data = data.get('imageData')
@@ -105,24 +159,24 @@ def save_jpg():
 
         # Decode base64 image
         image_bytes = base64.b64decode(image_data)
+        EXPORT_DECODE_SECONDS.observe(time.perf_counter() - decode_start, route='/save-jpg')
 
         # Get export directory
         export_dir = get_today_export_dir()
 
-        # Generate unique filename
+        # Store by content hash (identical exports reuse the existing file)
         base_name = f"{product_code}_dana"
-        file_path = get_unique_filename(export_dir, base_name, ".jpg")
+        with EXPORT_WRITE_SECONDS.time(route='/save-jpg'):
+            stored = export_store.store_bytes(export_dir, base_name, ".jpg", image_bytes)
 
-        # Save JPG file
-        with open(file_path, 'wb') as f:
-            f.write(image_bytes)
-
-        logger.info(f"✅ JPG saved: {file_path}")
+        file_path = stored.path
+        logger.info(f"✅ JPG saved: {file_path}" if stored.created else f"♻️  JPG unchanged: {file_path}")
 
         return jsonify({
             'success': True,
             'path': str(file_path.relative_to(OUTPUT_DIR.parent)),
-            'filename': file_path.name
+            'filename': file_path.name,
+            'deduplicated': not stored.created
         })
 
     except Exception as e:
@@ -130,6 +184,72 @@ def save_jpg():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/save-jpg-tile', methods=['POST'])
+def save_jpg_tile():
+    """
+    Upload one page tile as JPG (request body: tile JPG bytes)
+
+    Query:
+        productCode: Product code
+        session: Export session ID (generated by the editor)
+        index: Tile number (0-based, in order)
+        final: 1 for the last tile -> stitch and save {productCode}_dana.jpg
+        slice: (optional) Marketplace slice height in pixels
+    """
+    try:
+        EXPORT_BYTES.inc(request.content_length or 0, route='/save-jpg-tile')
+        product_code = request.args.get('productCode', '')
+        session_id = request.args.get('session', '')
+        index = request.args.get('index', type=int)
+        final = request.args.get('final') == '1'
+        slice_height = request.args.get('slice', type=int)
+
+        if not product_code or index is None:
+            return jsonify({'error': 'Missing productCode or index'}), 400
+
+        with EXPORT_DECODE_SECONDS.time(route='/save-jpg-tile'):
+            session = TILE_STITCHER.add_tile(session_id, index, request.get_data())
+
+        if not final:
+            return jsonify({'success': True, 'received': session.next_index, 'height': session.height})
+
+        # Stitch under a temp name, then register under the final name by content hash
+        export_dir = get_today_export_dir()
+        tmp_path = export_dir / f".tile-{session_id}.jpg"
+        with EXPORT_WRITE_SECONDS.time(route='/save-jpg-tile'):
+            result = TILE_STITCHER.finish(session_id, tmp_path, slice_height=slice_height)
+            files = [
+                export_store.adopt_file(export_dir, f"{product_code}_dana" + p.stem[len(tmp_path.stem):], ".jpg", p).path
+                for p in result.files + result.slices
+            ]
+        slices = files[len(result.files):]
+        files = files[:len(result.files)]
+
+        logger.info(f"✅ JPG stitched: {', '.join(p.name for p in files)} "
+                    f"({result.width}×{result.height}px, {result.tiles} tiles)")
+        if slices:
+            logger.info(f"✂️  {len(slices)} slices ({slice_height}px)")
+
+        return jsonify({
+            'success': True,
+            'path': str(files[0].relative_to(OUTPUT_DIR.parent)),
+            'filename': files[0].name,
+            'files': [p.name for p in files],
+            'slices': [p.name for p in slices],
+            'width': result.width,
+            'height': result.height,
+            'tiles': result.tiles
+        })
+
+    except TileStitchError as e:
+        logger.error(f"❌ JPG tile error: {e}")
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"❌ JPG tile error: {e}")
+        TILE_STITCHER.abort(request.args.get('session', ''))
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/editable/<product_code>')
 def serve_editable(product_code):
     """Serve editable HTML file"""
@@ -149,6 +269,94 @@ def serve_editable(product_code):
         return f"❌ Error: {e}", 500
 
 
+@app.route('/static/editor/<filename>')
+def serve_editor_runtime(filename):
+    """
+    Serve the editor runtime bundle
+
+    - editor-v1.{hash}.js: name changes with content, so cached as immutable for a year
+    - editor-v1.js (stable name pages reference): 302 to the current hashed file, revalidated every time
+    """
+    bundle = editor_runtime.read_manifest(OUTPUT_DIR) or editor_runtime.emit_bundle(OUTPUT_DIR)
+
+    if filename == editor_runtime.stable_name():
+        response = redirect(f"/static/editor/{bundle.js}", code=302)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    if not filename.startswith(f"editor-{editor_runtime.EDITOR_RUNTIME_VERSION}.") or filename.count('.') != 2:
+        return jsonify({'error': 'Not found'}), 404
+
+    response = send_from_directory(editor_runtime.editor_dir(OUTPUT_DIR), filename, conditional=True)
+    response.headers['Cache-Control'] = editor_runtime.IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+@app.route('/static/size-images/<filename>')
+def serve_size_image(filename):
+    """Serve a size illustration (content-hashed name, cached as immutable)"""
+    if filename == size_library.MANIFEST_NAME:
+        return jsonify(size_library.read_manifest(OUTPUT_DIR))
+
+    response = send_from_directory(size_library.library_dir(OUTPUT_DIR), filename, conditional=True)
+    response.headers['Cache-Control'] = size_library.IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+def open_archive(date: str) -> ArchiveReader:
+    """Open the archive of a date folder (FileNotFoundError if missing)"""
+    if not is_dated_folder(date):
+        raise FileNotFoundError(date)
+    archive_path = archive_path_for(OUTPUT_DIR / ARCHIVE_DIR_NAME, date)
+    if not archive_path.exists():
+        raise FileNotFoundError(archive_path)
+    return ArchiveReader(archive_path)
+
+
+@app.route('/archive/<date>')
+def list_archive(date):
+    """List the members of an archived date folder"""
+    try:
+        with open_archive(date) as reader:
+            return jsonify({
+                'date': date,
+                'codec': reader.index['codec'],
+                'members': reader.members()
+            })
+    except FileNotFoundError:
+        return jsonify({'error': f'Archive not found: {date}'}), 404
+    except ArchiveError as e:
+        logger.error(f"❌ Archive error: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/archive/<date>/<product_code>')
+def serve_archived(date, product_code):
+    """
+    Serve one product page from an archive (only that product's block is decompressed)
+
+    Query:
+        member: Exact member path; defaults to 원본 then 에디터블 then 익스포트
+    """
+    try:
+        with open_archive(date) as reader:
+            member = request.args.get('member') or reader.find_product(
+                product_code, (f"{ORIGINAL_FOLDER}/", f"{EDITABLE_FOLDER}/", f"{EXPORT_FOLDER}/")
+            )
+            if not member or member not in reader.index['members']:
+                return f"❌ Not found in archive {date}: {product_code}", 404
+            data = reader.read(member)
+
+        mimetype = mimetypes.guess_type(member)[0] or 'application/octet-stream'
+        return send_file(io.BytesIO(data), mimetype=mimetype, download_name=Path(member).name)
+
+    except FileNotFoundError:
+        return f"❌ Archive not found: {date}", 404
+    except ArchiveError as e:
+        logger.error(f"❌ Archive error: {e}")
+        return f"❌ Error: {e}", 500
+
+
 @app.route('/health')
 def health():
     """Health check endpoint"""
@@ -267,7 +475,25 @@ if __name__ == '__main__':
     logger.info("=" * 60)
     logger.info(f"📂 Output Directory: {OUTPUT_DIR}")
     logger.info(f"🌐 Server URL: http://localhost:5001")
+    logger.info(f"📊 Metrics: http://localhost:5001/metrics")
+    editor_bundle = editor_runtime.emit_bundle(OUTPUT_DIR)
+    logger.info(f"🧩 Editor runtime: {editor_bundle.js}")
+    size_images = size_library.emit_library(OUTPUT_DIR)
+    logger.info(f"📐 Size library: {len(size_images)} illustrations")
+    if OUTPUT_QUOTA_MB > 0:
+        logger.info(f"🧹 Retention: LRU eviction above {OUTPUT_QUOTA_MB} MB every {OUTPUT_RETENTION_INTERVAL:.0f}s")
     logger.info("=" * 60)
 
+    # Quota-driven retention (only in the reloader child so it runs once under debug=True)
+    if OUTPUT_QUOTA_MB > 0 and os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_retention_thread(
+            OUTPUT_DIR,
+            quota_bytes=OUTPUT_QUOTA_MB * 1024 * 1024,
+            interval_seconds=OUTPUT_RETENTION_INTERVAL,
+            is_dated_folder=is_dated_folder,
+            protected_names=get_protected_folders,
+            log=logger.info,
+        )
+
     # Run Flask server
     app.run(host='0.0.0.0', port=5001, debug=True)
@@ -0,0 +1,161 @@
+"""
+Size illustration library for editable pages
+
+The size illustrations (size_images/*.png) are written once per output root as
+optimized, content-hashed static files instead of being base64-embedded into
+every editable page:
+
+  output/static/size-images/
+    {hash}.png              # immutable, served with long-lived cache headers
+    size-images.json        # manifest: illustration name -> file + source hash
+
+Editable pages reference illustrations by name through the manifest (relative
+URLs, so they also work from file://). Original pages stay self-contained and
+keep embedding the one illustration they display.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR_NAME = "static"
+LIBRARY_DIR_NAME = "size-images"
+MANIFEST_NAME = "size-images.json"
+
+# Relative to output/{date}/에디터블|익스포트/*.html and /editable/<code>,
+# all of which sit two levels below the output (server) root
+LIBRARY_URL = f"../../{STATIC_DIR_NAME}/{LIBRARY_DIR_NAME}"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+SIZE_IMAGES_DIR = Path(__file__).parent.parent / "size_images"
+
+# Per-process manifest cache (generate_html runs once per product)
+_manifest_cache: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+
+def library_dir(output_dir: Path) -> Path:
+    """Library folder (output/static/size-images)"""
+    return output_dir / STATIC_DIR_NAME / LIBRARY_DIR_NAME
+
+
+def content_hash(data: bytes) -> str:
+    """Content hash for file names (first 12 hex chars of sha256)"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def optimize_png(data: bytes) -> bytes:
+    """
+    Losslessly recompress a PNG (Pillow optimize pass)
+
+    Returns the original bytes if Pillow is unavailable or the result is not smaller.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return data
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            buffer = io.BytesIO()
+            img.save(buffer, format='PNG', optimize=True)
+        optimized = buffer.getvalue()
+    except Exception as e:
+        logger.warning(f"⚠️  PNG optimize failed: {e}")
+        return data
+
+    return optimized if len(optimized) < len(data) else data
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via temp file + rename"""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def read_manifest(output_dir: Path) -> Dict[str, Dict[str, str]]:
+    """Current manifest: name -> {"file", "source"} (empty if missing)"""
+    try:
+        with open(library_dir(output_dir) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def emit_library(output_dir: Path, source_dir: Path = SIZE_IMAGES_DIR) -> Dict[str, Dict[str, str]]:
+    """
+    Write or refresh the library
+
+    Illustrations whose source bytes are unchanged are not re-optimized. Previously
+    emitted files are kept so pages generated earlier keep resolving.
+
+    Args:
+        output_dir: Output root
+        source_dir: Folder of source PNGs (name = file stem)
+
+    Returns:
+        Manifest (name -> {"file", "source"})
+    """
+    target = library_dir(output_dir)
+    target.mkdir(parents=True, exist_ok=True)
+
+    previous = read_manifest(output_dir)
+    manifest: Dict[str, Dict[str, str]] = {}
+    optimized_count = 0
+
+    for source in sorted(source_dir.glob("*.png")) if source_dir.exists() else []:
+        data = source.read_bytes()
+        source_hash = content_hash(data)
+
+        entry = previous.get(source.stem)
+        if entry and entry.get("source") == source_hash and (target / entry.get("file", "")).is_file():
+            manifest[source.stem] = entry
+            continue
+
+        optimized = optimize_png(data)
+        file_name = f"{content_hash(optimized)}.png"
+        if not (target / file_name).exists():
+            _write_atomic(target / file_name, optimized)
+        manifest[source.stem] = {"file": file_name, "source": source_hash}
+        optimized_count += 1
+
+    if manifest != previous:
+        _write_atomic(
+            target / MANIFEST_NAME,
+            json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True).encode('utf-8'),
+        )
+
+    _manifest_cache[str(output_dir)] = manifest
+    if optimized_count:
+        logger.info(f"📐 Size library: {optimized_count} illustration(s) optimized")
+    return manifest
+
+
+def load_library(output_dir: Path) -> Dict[str, Dict[str, str]]:
+    """Manifest for page generation (emitted on first use, cached per process)"""
+    key = str(output_dir)
+    if key not in _manifest_cache:
+        _manifest_cache[key] = read_manifest(output_dir) or emit_library(output_dir)
+    return _manifest_cache[key]
+
+
+def image_url(manifest: Dict[str, Dict[str, str]], name: str) -> Optional[str]:
+    """Relative URL of an illustration by name (None if unknown)"""
+    entry = manifest.get(name.strip()) if name else None
+    if not entry:
+        return None
+    return f"{LIBRARY_URL}/{quote(entry['file'])}"
+
+
+def image_urls(manifest: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+    """All illustrations as name -> relative URL (editor dropdown data)"""
+    return {name: image_url(manifest, name) for name in sorted(manifest)}
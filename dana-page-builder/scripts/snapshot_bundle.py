@@ -0,0 +1,347 @@
+"""
+Snapshot bundles - template rows + referenced images stored locally for offline loading
+
+Capture reads the selected template rows (formatted values, hyperlinks and text
+formatting) and downloads every Drive image they reference into one bundle.
+DanaDataLoader(snapshot=...) then serves rows and images from the bundle instead
+of the Google APIs, so re-generation, template experiments and benchmarks run at
+local-disk speed without network access:
+
+  {bundle}/
+    snapshot.db                # SQLite: meta, rows (row number/code/values/hyperlinks/formatting), images (file ID -> hash)
+    blobs/{sha[:2]}/{sha256}   # Image bytes, content-addressed (shared images are stored once)
+
+Usage:
+  python scripts/snapshot_bundle.py DN25FW001 DN25FW002
+  python scripts/snapshot_bundle.py --all --out snapshots/full
+  python scripts/load_from_sheets.py --snapshot snapshots/full
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from config import (
+    IMAGE_DOWNLOAD_WORKERS,
+    SHEET_ID,
+    SHEET_NAME,
+    SNAPSHOT_GRID_FIELDS,
+    SNAPSHOTS_DIR,
+    TEMPLATE_COLUMNS,
+)
+
+SNAPSHOT_FORMAT = "dana-snapshot/1"
+DB_NAME = "snapshot.db"
+BLOBS_DIR_NAME = "blobs"
+
+# Cells captured as images (Drive links only)
+DRIVE_URL_PATTERN = re.compile(r"(drive|docs)\.google\.com/")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    row_number INTEGER PRIMARY KEY,
+    code TEXT NOT NULL,
+    cells TEXT NOT NULL,
+    hyperlinks TEXT,
+    formatting TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_rows_code ON rows (code);
+CREATE TABLE IF NOT EXISTS images (
+    file_id TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+"""
+
+
+class SnapshotError(Exception):
+    """Missing or malformed bundle, or data the bundle does not contain"""
+    pass
+
+
+class SnapshotSummary(NamedTuple):
+    """Capture result"""
+    path: Path
+    rows: int
+    images: int
+    image_bytes: int
+    missing_codes: List[str]
+    failed_images: List[str]
+
+
+class SnapshotBundle:
+    """Read/write access to a snapshot bundle"""
+
+    def __init__(self, path: Path, create: bool = False):
+        """
+        Open a snapshot bundle
+
+        Args:
+            path: Bundle folder
+            create: Create the bundle if it does not exist (otherwise it must exist)
+
+        Raises:
+            SnapshotError: Bundle missing or in another format
+        """
+        self.path = Path(path)
+        db_path = self.path / DB_NAME
+        if not create and not db_path.exists():
+            raise SnapshotError(f"Snapshot bundle not found: {self.path}")
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.executescript(SCHEMA)
+
+        fmt = self.meta().get("format")
+        if create and fmt is None:
+            self.set_meta(format=SNAPSHOT_FORMAT)
+        elif fmt != SNAPSHOT_FORMAT:
+            raise SnapshotError(f"Unsupported snapshot format {fmt!r}: {self.path}")
+
+    def __enter__(self) -> "SnapshotBundle":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # --- Metadata ---
+
+    def meta(self) -> Dict[str, str]:
+        return dict(self.conn.execute("SELECT key, value FROM meta"))
+
+    def set_meta(self, **values: Any) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, str(value)) for key, value in values.items()],
+            )
+
+    # --- Rows ---
+
+    def put_row(
+        self,
+        row_number: int,
+        code: str,
+        cells: List[str],
+        hyperlinks: List[Optional[str]],
+        formatting: List[Optional[List[Dict]]],
+    ) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO rows (row_number, code, cells, hyperlinks, formatting) VALUES (?, ?, ?, ?, ?)",
+                (
+                    row_number,
+                    code,
+                    json.dumps(cells, ensure_ascii=False),
+                    json.dumps(hyperlinks, ensure_ascii=False),
+                    json.dumps(formatting, ensure_ascii=False),
+                ),
+            )
+
+    def iter_rows(self) -> Iterator[Tuple[int, List[str], List[Optional[str]]]]:
+        """(row number, formatted values, hyperlinks) in sheet order"""
+        for row_number, cells, hyperlinks in self.conn.execute(
+            "SELECT row_number, cells, hyperlinks FROM rows ORDER BY row_number"
+        ):
+            yield row_number, json.loads(cells), json.loads(hyperlinks or "[]")
+
+    def row_blocks(self, block_size: int) -> Iterator[Tuple[int, List[List[str]]]]:
+        """
+        Rows as the loader reads them from the sheet (hyperlink, else formatted value)
+
+        Yields:
+            (row number of the first row, rows) for runs of consecutive rows, at most block_size each
+        """
+        first_row, block = None, []
+        for row_number, cells, hyperlinks in self.iter_rows():
+            if block and (row_number != first_row + len(block) or len(block) >= block_size):
+                yield first_row, block
+                block = []
+            if not block:
+                first_row = row_number
+            block.append(merge_cell_values(cells, hyperlinks))
+        if block:
+            yield first_row, block
+
+    def codes(self) -> List[str]:
+        return [c for (c,) in self.conn.execute("SELECT code FROM rows WHERE code != '' ORDER BY row_number")]
+
+    # --- Images ---
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.path / BLOBS_DIR_NAME / sha256[:2] / sha256
+
+    def has_image(self, file_id: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM images WHERE file_id = ?", (file_id,)).fetchone() is not None
+
+    def put_image_file(self, file_id: str, source: Path) -> str:
+        """Move a downloaded file into the blob store (identical content shares one blob)"""
+        digest = hashlib.sha256()
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+        blob_path = self._blob_path(sha256)
+        size = source.stat().st_size
+        if blob_path.exists():
+            source.unlink()
+        else:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source, blob_path)
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO images (file_id, sha256, size) VALUES (?, ?, ?)",
+                (file_id, sha256, size),
+            )
+        return sha256
+
+    def image_bytes(self, file_id: str) -> bytes:
+        """
+        Raises:
+            SnapshotError: Image not in the bundle
+        """
+        found = self.conn.execute("SELECT sha256 FROM images WHERE file_id = ?", (file_id,)).fetchone()
+        if found is None:
+            raise SnapshotError(f"Image not in snapshot: {file_id}")
+        return self._blob_path(found[0]).read_bytes()
+
+    def image_stats(self) -> Dict[str, int]:
+        count, total = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM images").fetchone()
+        return {"images": count, "bytes": total}
+
+
+def merge_cell_values(cells: List[str], hyperlinks: List[Optional[str]]) -> List[str]:
+    """Hyperlink first, formatted value otherwise (same rule as extract_hyperlinks_from_range)"""
+    merged = []
+    for index, value in enumerate(cells):
+        hyperlink = hyperlinks[index] if index < len(hyperlinks) else None
+        merged.append(hyperlink or value)
+    return merged
+
+
+def capture_snapshot(loader, bundle_path: Path, codes: Optional[List[str]] = None, log=print) -> SnapshotSummary:
+    """
+    Capture template rows and their Drive images into a bundle
+
+    Args:
+        loader: Authenticated DanaDataLoader
+        bundle_path: Bundle folder (an existing bundle is updated, known images are not re-downloaded)
+        codes: Product codes to capture (None captures every row with a product code)
+        log: Progress logger
+    """
+    wanted = {c.strip() for c in codes} if codes else None
+    code_column = TEMPLATE_COLUMNS["productCode"]
+    found = set()
+    captured = 0
+    failed: List[str] = []
+
+    def read_block(range_spec: str) -> List[List[Dict]]:
+        return loader.read_grid_range(SHEET_NAME, range_spec, SNAPSHOT_GRID_FIELDS)
+
+    with SnapshotBundle(bundle_path, create=True) as bundle:
+        bundle.set_meta(
+            sheet_id=SHEET_ID,
+            tab=SHEET_NAME,
+            scope="all" if wanted is None else "codes",
+            captured_at=datetime.now().isoformat(timespec="seconds"),
+        )
+
+        pending: Dict[str, str] = {}  # Drive file ID -> first URL seen
+        for first_row, rows in loader.iter_row_blocks(SHEET_NAME, read_block=read_block):
+            for offset, row in enumerate(rows):
+                cells = [cell.get("formattedValue", "") for cell in row]
+                hyperlinks = [cell.get("hyperlink") for cell in row]
+                code = cells[code_column].strip() if len(cells) > code_column else ""
+                if not code or (wanted is not None and code not in wanted):
+                    continue
+
+                bundle.put_row(first_row + offset, code, cells, hyperlinks, [cell.get("textFormatRuns") for cell in row])
+                found.add(code)
+                captured += 1
+
+                for url in merge_cell_values(cells, hyperlinks):
+                    if isinstance(url, str) and DRIVE_URL_PATTERN.search(url):
+                        file_id = loader.extract_drive_file_id(url)
+                        if file_id and file_id not in pending and not bundle.has_image(file_id):
+                            pending[file_id] = url
+
+        log(f"📥 Captured {captured} rows, downloading {len(pending)} new images ({IMAGE_DOWNLOAD_WORKERS} workers)...")
+
+        # Workers stream to temp files; blobs are registered on this thread (sqlite connection)
+        with tempfile.TemporaryDirectory(dir=bundle.path) as tmp_dir:
+            with ThreadPoolExecutor(max_workers=IMAGE_DOWNLOAD_WORKERS) as executor:
+                futures = {
+                    executor.submit(loader._stream_to_file, file_id, Path(tmp_dir) / file_id): file_id
+                    for file_id in pending
+                }
+                for future in as_completed(futures):
+                    file_id = futures[future]
+                    try:
+                        future.result()
+                        bundle.put_image_file(file_id, Path(tmp_dir) / file_id)
+                    except Exception as e:
+                        failed.append(pending[file_id])
+                        log(f"❌ Failed to download {file_id}: {e}")
+
+        stats = bundle.image_stats()
+
+    missing = sorted(wanted - found) if wanted else []
+    return SnapshotSummary(Path(bundle_path), captured, stats["images"], stats["bytes"], missing, failed)
+
+
+def main():
+    """Capture entry point"""
+    parser = argparse.ArgumentParser(description="Capture template rows + images into an offline snapshot bundle")
+    parser.add_argument("codes", nargs="*", help="Product codes to capture")
+    parser.add_argument("--all", action="store_true", help="Capture every row with a product code")
+    parser.add_argument("--out", type=Path, help="Bundle folder (default: snapshots/{YYYYMMDD_HHMMSS})")
+    args = parser.parse_args()
+
+    if not args.codes and not args.all:
+        parser.error("Pass product codes or --all")
+    if args.codes and args.all:
+        parser.error("Product codes and --all are mutually exclusive")
+
+    from load_from_sheets import DanaDataLoader, logger
+
+    bundle_path = args.out or (SNAPSHOTS_DIR / datetime.now().strftime("%Y%m%d_%H%M%S"))
+    logger.info(f"📦 Capturing snapshot bundle: {bundle_path}")
+
+    loader = DanaDataLoader()
+    loader.authenticate()
+    summary = capture_snapshot(loader, bundle_path, codes=None if args.all else args.codes, log=logger.info)
+
+    logger.info(
+        f"✅ Snapshot saved: {summary.rows} rows, {summary.images} images "
+        f"({summary.image_bytes / 1024 / 1024:.1f} MB)"
+    )
+    if summary.missing_codes:
+        logger.warning(f"⚠️  Codes not found in sheet: {', '.join(summary.missing_codes)}")
+    if summary.failed_images:
+        logger.warning(f"⚠️  {len(summary.failed_images)} images failed to download")
+    logger.info(f"💡 Load offline: python scripts/load_from_sheets.py --snapshot {summary.path}")
+
+    if summary.missing_codes or summary.failed_images:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
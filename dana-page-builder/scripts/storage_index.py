@@ -0,0 +1,395 @@
+"""
+Storage Index for DANA&PETA Page Builder
+Single-pass size/mtime accounting of the output tree, persisted as a manifest
+
+Directories whose mtime is unchanged since the last scan reuse their cached
+file listing. Files rewritten in place do not bump the directory mtime,
+so use rescan=True when exact numbers matter.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+MANIFEST_NAME = ".storage_manifest.json"
+MANIFEST_VERSION = 1
+DATED_FOLDER_FORMATS = ("%Y-%m-%d", "%Y%m%d")  # Current (config.DATE_FORMAT) and legacy folder names
+
+
+def _join(rel: str, name: str) -> str:
+    return f"{rel}/{name}" if rel else name
+
+
+def parse_folder_date(name: str) -> Optional[datetime]:
+    """Date of a dated output folder name (YYYY-MM-DD or YYYYMMDD), else None"""
+    for date_format in DATED_FOLDER_FORMATS:
+        try:
+            return datetime.strptime(name, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def is_dated_folder(name: str) -> bool:
+    """Whether a folder name is a dated output folder (shared by the server and cleanup)"""
+    return parse_folder_date(name) is not None
+
+
+class EvictionUnit(NamedTuple):
+    """Eviction candidate (dated folder or root file)"""
+    path: Path
+    size: int
+    last_mtime_ns: int
+
+
+class EvictionPlan(NamedTuple):
+    """Quota enforcement plan"""
+    victims: List[EvictionUnit]
+    managed_bytes: int    # Size the quota applies to (dated folders + matching root files, protected ones included)
+    excess_bytes: int     # Bytes over the quota (<= 0 when within quota)
+    evictable_bytes: int  # Bytes that may be deleted now (protected units excluded)
+
+    @property
+    def clearable(self) -> bool:
+        """Whether deleting evictable units can bring the tree under the quota"""
+        return self.excess_bytes <= self.evictable_bytes
+
+
+class StorageIndex:
+    """Size / file count / latest mtime index of a directory tree"""
+
+    def __init__(self, root: Path, persist: bool = True):
+        """
+        Initialize the index (loads the manifest when persist is set)
+
+        Args:
+            root: Directory to index
+            persist: Load and save the manifest under root
+        """
+        self.root = Path(root)
+        self.persist = persist
+        self.manifest_path = self.root / MANIFEST_NAME
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+
+        # rel path -> {"mtime_ns", "files": {name: [size, mtime_ns]}, "dirs": [name, ...]}
+        self._dirs: Dict[str, Dict] = {}
+        # rel path -> (subtree size, file count, latest mtime_ns)
+        self._totals: Dict[str, Tuple[int, int, int]] = {}
+
+        if self.persist:
+            self._load_manifest()
+
+    def _load_manifest(self) -> None:
+        """Load the manifest (ignored on version mismatch or parse error)"""
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self._dirs = data.get("dirs", {})
+        except (OSError, json.JSONDecodeError):
+            self._dirs = {}
+
+    def save(self) -> None:
+        """Persist the manifest (temp file + atomic rename)"""
+        if not self.persist or not self.root.exists():
+            return
+        tmp_path = self.manifest_path.with_name(f"{MANIFEST_NAME}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": MANIFEST_VERSION, "dirs": self._dirs}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def scan(self, rescan: bool = False) -> "StorageIndex":
+        """
+        Walk the tree, reusing cached listings of unchanged directories
+
+        Args:
+            rescan: Ignore the manifest and list every directory again
+
+        Returns:
+            self
+        """
+        previous = {} if rescan else self._dirs
+        dirs: Dict[str, Dict] = {}
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+
+        if not self.root.exists():
+            self._dirs = {}
+            self._aggregate()
+            return self
+
+        stack = [("", self.root.stat().st_mtime_ns)]
+        while stack:
+            rel, mtime_ns = stack.pop()
+            cached = previous.get(rel)
+
+            if cached is not None and cached["mtime_ns"] == mtime_ns:
+                # Entries unchanged: reuse the listing, only descend into subdirectories
+                entry = cached
+                self.dirs_reused += 1
+                for name in entry["dirs"]:
+                    child_rel = _join(rel, name)
+                    try:
+                        child_mtime = os.stat(self.root / child_rel).st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+                    stack.append((child_rel, child_mtime))
+            else:
+                files: Dict[str, List[int]] = {}
+                subdirs: List[str] = []
+                try:
+                    with os.scandir(self.root / rel) as it:
+                        for item in it:
+                            if item.is_dir(follow_symlinks=False):
+                                subdirs.append(item.name)
+                                stack.append((_join(rel, item.name), item.stat(follow_symlinks=False).st_mtime_ns))
+                            elif item.is_file(follow_symlinks=False):
+                                if not rel and item.name.startswith(MANIFEST_NAME):
+                                    continue
+                                stat = item.stat(follow_symlinks=False)
+                                files[item.name] = [stat.st_size, stat.st_mtime_ns]
+                except FileNotFoundError:
+                    continue
+                entry = {"mtime_ns": mtime_ns, "files": files, "dirs": sorted(subdirs)}
+                self.dirs_scanned += 1
+
+            dirs[rel] = entry
+
+        self._dirs = dirs
+        self._aggregate()
+        return self
+
+    def _aggregate(self) -> None:
+        """Compute subtree totals bottom-up (each directory visited once)"""
+        totals: Dict[str, Tuple[int, int, int]] = {}
+        depth = lambda rel: rel.count("/") + 1 if rel else 0
+
+        for rel in sorted(self._dirs, key=depth, reverse=True):
+            entry = self._dirs[rel]
+            file_stats = entry["files"].values()
+            size = sum(stat[0] for stat in file_stats)
+            count = len(entry["files"])
+            latest = max((stat[1] for stat in file_stats), default=0)
+
+            for name in entry["dirs"]:
+                child = totals.get(_join(rel, name))
+                if child is not None and child[1]:
+                    size += child[0]
+                    count += child[1]
+                    latest = max(latest, child[2])
+
+            # Trees without files fall back to the directory mtime
+            totals[rel] = (size, count, latest if count else entry["mtime_ns"])
+
+        self._totals = totals
+
+    def _rel(self, path: Path) -> str:
+        """Path relative to root ("" for root itself)"""
+        rel = Path(os.path.realpath(path)).relative_to(os.path.realpath(self.root)).as_posix()
+        return "" if rel == "." else rel
+
+    def size(self, path: Path) -> int:
+        """Size of a directory subtree or a single file (bytes)"""
+        rel = self._rel(path)
+        if rel in self._totals:
+            return self._totals[rel][0]
+        stat = self._file_stat(rel)
+        return stat[0] if stat else 0
+
+    def file_count(self, path: Path) -> int:
+        """Number of files under a directory"""
+        total = self._totals.get(self._rel(path))
+        return total[1] if total else 0
+
+    def last_mtime_ns(self, path: Path) -> int:
+        """Latest file mtime under a directory (LRU key)"""
+        rel = self._rel(path)
+        if rel in self._totals:
+            return self._totals[rel][2]
+        stat = self._file_stat(rel)
+        return stat[1] if stat else 0
+
+    def total_size(self) -> int:
+        """Total size of the indexed tree"""
+        return self._totals.get("", (0, 0, 0))[0]
+
+    def _file_stat(self, rel: str) -> Optional[List[int]]:
+        parent, _, name = rel.rpartition("/")
+        entry = self._dirs.get(parent)
+        return entry["files"].get(name) if entry else None
+
+    def root_files(self) -> List[Tuple[str, int, int]]:
+        """Files directly under root as [(name, size, mtime_ns)]"""
+        entry = self._dirs.get("")
+        if not entry:
+            return []
+        return [(name, stat[0], stat[1]) for name, stat in entry["files"].items()]
+
+    def root_dirs(self) -> List[str]:
+        """Directory names directly under root"""
+        entry = self._dirs.get("")
+        return list(entry["dirs"]) if entry else []
+
+
+def select_lru_victims(units: Iterable[EvictionUnit], total_bytes: int, quota_bytes: int) -> List[EvictionUnit]:
+    """
+    Pick victims until the tree fits the quota (least recently modified first, one sort)
+
+    Args:
+        units: Evictable units
+        total_bytes: Current total size
+        quota_bytes: Target maximum size
+
+    Returns:
+        Units to delete, in LRU order
+    """
+    victims = []
+    excess = total_bytes - quota_bytes
+    if excess <= 0:
+        return victims
+
+    for unit in sorted(units, key=lambda u: u.last_mtime_ns):
+        if excess <= 0:
+            break
+        victims.append(unit)
+        excess -= unit.size
+    return victims
+
+
+def eviction_units(
+    index: StorageIndex,
+    is_dated_folder: Callable[[str], bool],
+    root_file_suffixes: Tuple[str, ...] = (),
+    exclude_names: Iterable[str] = (),
+) -> List[EvictionUnit]:
+    """
+    Collect evictable units from a scanned index (dated folders + root files by suffix)
+
+    Args:
+        index: Scanned StorageIndex
+        is_dated_folder: Predicate for dated folder names
+        root_file_suffixes: Root file suffixes that may be evicted (e.g. (".html",))
+        exclude_names: Names that are never evicted (e.g. today's folder)
+    """
+    excluded = set(exclude_names)
+    units = []
+
+    for name in index.root_dirs():
+        if name in excluded or not is_dated_folder(name):
+            continue
+        path = index.root / name
+        units.append(EvictionUnit(path, index.size(path), index.last_mtime_ns(path)))
+
+    if not root_file_suffixes:
+        return units
+
+    for name, size, mtime_ns in index.root_files():
+        if name in excluded or not name.endswith(root_file_suffixes):
+            continue
+        units.append(EvictionUnit(index.root / name, size, mtime_ns))
+
+    return units
+
+
+def plan_eviction(
+    index: StorageIndex,
+    is_dated_folder: Callable[[str], bool],
+    quota_bytes: int,
+    root_file_suffixes: Tuple[str, ...] = (),
+    exclude_names: Iterable[str] = (),
+) -> EvictionPlan:
+    """
+    Plan deletions that bring the evictable data under the quota
+
+    The quota applies to the eviction units (dated folders + root files) only.
+    Counting trees that are never evicted (archive/, static/, edits/, .tiles, assets)
+    would delete every dated folder as soon as those trees alone exceed the quota.
+    Protected units (today / in-progress folders) count toward the size but are kept;
+    if deleting everything else still leaves an excess, nothing is deleted
+    (clearable=False).
+
+    Args:
+        index: Scanned StorageIndex
+        is_dated_folder: Predicate for dated folder names
+        quota_bytes: Maximum allowed size
+        root_file_suffixes: Root file suffixes that may be evicted
+        exclude_names: Names that are never evicted (e.g. today's folder)
+    """
+    managed = eviction_units(index, is_dated_folder, root_file_suffixes)
+    excluded = set(exclude_names)
+    units = [unit for unit in managed if unit.path.name not in excluded]
+
+    managed_bytes = sum(unit.size for unit in managed)
+    evictable_bytes = sum(unit.size for unit in units)
+    excess = managed_bytes - quota_bytes
+    victims = select_lru_victims(units, managed_bytes, quota_bytes) if 0 < excess <= evictable_bytes else []
+    return EvictionPlan(victims, managed_bytes, excess, evictable_bytes)
+
+
+def delete_unit(unit: EvictionUnit) -> None:
+    """Delete an eviction unit (whole tree for folders)"""
+    if unit.path.is_dir():
+        shutil.rmtree(unit.path)
+    elif unit.path.exists():
+        unit.path.unlink()
+
+
+def start_retention_thread(
+    output_dir: Path,
+    quota_bytes: int,
+    interval_seconds: float,
+    is_dated_folder: Callable[[str], bool],
+    protected_names: Callable[[], Iterable[str]],
+    root_file_suffixes: Tuple[str, ...] = (),
+    log: Callable[[str], None] = print,
+) -> threading.Thread:
+    """
+    Start the periodic quota-driven retention task (daemon thread)
+
+    Args:
+        output_dir: Output root
+        quota_bytes: Maximum size of dated folders + root files (fixed trees such as archive/ excluded)
+        interval_seconds: Seconds between runs
+        is_dated_folder: Predicate for dated folder names
+        protected_names: Returns names that are never evicted (today / in-progress folders)
+        root_file_suffixes: Root file suffixes that may be evicted
+        log: Log function
+
+    Returns:
+        The started thread
+    """
+    def run() -> None:
+        index = StorageIndex(output_dir)
+        while True:
+            try:
+                index.scan()
+                plan = plan_eviction(
+                    index, is_dated_folder, quota_bytes, root_file_suffixes, exclude_names=protected_names()
+                )
+                if not plan.clearable:
+                    log(f"⚠️  Retention: dated folders use {plan.managed_bytes / 1024 / 1024:.1f} MB, "
+                        f"{plan.excess_bytes / 1024 / 1024:.1f} MB over quota, but only "
+                        f"{plan.evictable_bytes / 1024 / 1024:.1f} MB is evictable; skipping (today / in-progress folders are protected)")
+                victims = plan.victims
+                for unit in victims:
+                    delete_unit(unit)
+                    log(f"🗑️  Retention: removed {unit.path.name} ({unit.size / 1024 / 1024:.1f} MB, "
+                        f"last modified {datetime.fromtimestamp(unit.last_mtime_ns / 1e9):%Y-%m-%d %H:%M})")
+                if victims:
+                    index.scan()
+                index.save()
+            except Exception as e:
+                log(f"⚠️  Retention run failed: {e}")
+            time.sleep(interval_seconds)
+
+    thread = threading.Thread(target=run, name="output-retention", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,106 @@
+"""
+Thumbnail Cache for DANA&PETA Page Builder
+Small WebP thumbnails keyed by source image content hash (generated once per image)
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import OUTPUT_DIR, THUMBNAIL_MAX_SIZE, THUMBNAIL_QUALITY, THUMBNAILS_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class ThumbnailCache:
+    """Generate and reuse WebP thumbnails under output/assets/thumbs"""
+
+    def __init__(self, thumbs_dir: Path = THUMBNAILS_DIR):
+        """Initialize the cache and load the stat memo"""
+        self.thumbs_dir = thumbs_dir
+        self.thumbs_dir.mkdir(parents=True, exist_ok=True)
+        self.memo_path = self.thumbs_dir / ".memo.json"
+        self.generated = 0
+        self.reused = 0
+
+        # source path -> {mtime_ns, size, hash}: skips re-hashing unchanged images
+        self.memo: Dict[str, Dict] = {}
+        if self.memo_path.exists():
+            try:
+                with open(self.memo_path, 'r', encoding='utf-8') as f:
+                    self.memo = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self.memo = {}
+
+    def save_memo(self) -> None:
+        """Persist the stat memo (temp file + atomic rename)"""
+        tmp_path = self.memo_path.with_name(f"{self.memo_path.name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.memo, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.memo_path)
+
+    def _content_hash(self, source: Path) -> str:
+        """Content hash of the source image (memoized by path + mtime + size)"""
+        stat = source.stat()
+        key = str(source.resolve())
+        entry = self.memo.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["hash"]
+
+        digest = hashlib.sha256()
+        with open(source, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        content_hash = digest.hexdigest()[:24]
+
+        self.memo[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": content_hash}
+        return content_hash
+
+    def get_thumbnail(self, image_path: Optional[str]) -> Optional[str]:
+        """
+        Return the thumbnail for a product image, generating it on first use
+
+        Args:
+            image_path: Image path as stored in product data (e.g. "../assets/images/X_main.jpg")
+
+        Returns:
+            Thumbnail path relative to OUTPUT_DIR (e.g. "assets/thumbs/ab12....webp") or None
+        """
+        if not image_path:
+            return None
+
+        source = OUTPUT_DIR / image_path.replace("../", "") if image_path.startswith("../") else Path(image_path)
+        if not source.exists():
+            return None
+
+        try:
+            content_hash = self._content_hash(source)
+            width, height = THUMBNAIL_MAX_SIZE
+            thumb_path = self.thumbs_dir / f"{content_hash}_{width}x{height}.webp"
+
+            if thumb_path.exists():
+                self.reused += 1
+            else:
+                self._render(source, thumb_path)
+                self.generated += 1
+
+            return thumb_path.relative_to(OUTPUT_DIR).as_posix()
+
+        except Exception as e:
+            logger.warning(f"⚠️  Thumbnail failed for {source.name}: {e}")
+            return None
+
+    @staticmethod
+    def _render(source: Path, thumb_path: Path) -> None:
+        """Downscale to THUMBNAIL_MAX_SIZE and write WebP atomically"""
+        from PIL import Image
+
+        with Image.open(source) as img:
+            img = img.convert('RGB')
+            img.thumbnail(THUMBNAIL_MAX_SIZE)
+            tmp_path = thumb_path.with_name(f".{thumb_path.name}.tmp")
+            img.save(tmp_path, format='WEBP', quality=THUMBNAIL_QUALITY, method=4)
+        os.replace(tmp_path, thumb_path)
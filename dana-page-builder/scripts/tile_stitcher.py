@@ -0,0 +1,216 @@
+"""
+Tiled JPG stitching - join the page tiles the editor uploads in order into one JPG
+
+The editor captures the page in tiles sized to the device's memory
+(/save-jpg-tile); the server decodes each tile as it arrives and appends its
+RGBX rows to a spool file. After the last tile the spool is memory-mapped and
+each output JPG is encoded from its row range mapped in place, so memory use on
+both sides is bounded by one tile (the page is never loaded as a whole).
+
+Spool layout ({spool_dir}/):
+  {session}.rgbx   # width x accumulated height x 4 bytes (row-major RGBX, X unused)
+
+Pages taller than the JPG limit (65500px) are written as _part1, _part2 ...;
+with slice_height, marketplace-sized slices (_s01, _s02 ...) are written too.
+"""
+
+import io
+import mmap
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+JPEG_MAX_DIMENSION = 65500  # Below the libjpeg limit (65535)
+DEFAULT_QUALITY = 92
+SESSION_MAX_AGE = 3600  # Seconds an unfinished session's spool is kept
+
+# 4-byte pixels: Pillow copies RGB (3-byte) buffers but maps RGBX buffers in place
+SPOOL_MODE = "RGBX"
+SPOOL_BYTES_PER_PIXEL = 4
+
+SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class TileStitchError(Exception):
+    """Tile order / format error (client request problem)"""
+    pass
+
+
+class TileSession(NamedTuple):
+    """Stitching session in progress"""
+    spool_path: Path
+    width: int
+    height: int
+    next_index: int
+    updated_at: float
+
+
+class StitchResult(NamedTuple):
+    """Stitching result"""
+    width: int
+    height: int
+    tiles: int
+    files: List[Path]     # Final JPG(s) (several above the height limit)
+    slices: List[Path]    # Requested slice JPGs
+
+
+class TileStitcher:
+    """Per-session tile spool + final JPG encoding (thread-safe)"""
+
+    def __init__(self, spool_dir: Path, max_age_seconds: float = SESSION_MAX_AGE) -> None:
+        """
+        Args:
+            spool_dir: Spool folder
+            max_age_seconds: Sessions idle longer than this are cleaned up
+        """
+        self.spool_dir = spool_dir
+        self.max_age_seconds = max_age_seconds
+        self._sessions: Dict[str, TileSession] = {}
+        self._lock = threading.Lock()
+
+    def add_tile(self, session_id: str, index: int, data: bytes) -> TileSession:
+        """
+        Append one tile (index starts at 0 and must arrive in order)
+
+        Tiles whose width differs from the first tile (rounding) are cropped or
+        padded with white to the first tile's width.
+
+        Raises:
+            TileStitchError: Bad session ID / order / image format
+        """
+        from PIL import Image
+
+        if not SESSION_ID_PATTERN.match(session_id or ""):
+            raise TileStitchError(f"Invalid session ID: {session_id!r}")
+
+        try:
+            tile = Image.open(io.BytesIO(data))
+            tile.load()
+        except Exception as e:
+            raise TileStitchError(f"Cannot read tile image: {e}")
+        if tile.mode != SPOOL_MODE:
+            tile = tile.convert(SPOOL_MODE)
+        if tile.width == 0 or tile.height == 0:
+            raise TileStitchError("Empty tile (canvas creation failed)")
+
+        with self._lock:
+            self._purge_stale()
+            session = self._sessions.get(session_id)
+
+            if index == 0:
+                if session:
+                    session.spool_path.unlink(missing_ok=True)
+                self.spool_dir.mkdir(parents=True, exist_ok=True)
+                session = TileSession(self.spool_dir / f"{session_id}.rgbx", tile.width, 0, 0, time.time())
+                session.spool_path.write_bytes(b"")
+            elif session is None:
+                raise TileStitchError(f"Unknown session: {session_id} (resend from the first tile)")
+
+            if index != session.next_index:
+                raise TileStitchError(f"Tile out of order: expected {session.next_index}, got {index}")
+
+            if tile.width != session.width:
+                canvas = Image.new(SPOOL_MODE, (session.width, tile.height), (255, 255, 255, 255))
+                canvas.paste(tile.crop((0, 0, min(tile.width, session.width), tile.height)), (0, 0))
+                tile = canvas
+
+            with open(session.spool_path, "ab") as f:
+                f.write(tile.tobytes())
+
+            session = session._replace(
+                height=session.height + tile.height,
+                next_index=index + 1,
+                updated_at=time.time(),
+            )
+            self._sessions[session_id] = session
+            return session
+
+    def finish(
+        self,
+        session_id: str,
+        output_path: Path,
+        quality: int = DEFAULT_QUALITY,
+        slice_height: Optional[int] = None,
+    ) -> StitchResult:
+        """
+        Encode the spool as JPG and clean up the session
+
+        Args:
+            session_id: Session ID
+            output_path: Final JPG path ({stem}_part{n}.jpg above the height limit)
+            quality: JPG quality
+            slice_height: If set, also write {stem}_s{nn}.jpg every this many pixels
+
+        Raises:
+            TileStitchError: Unknown session / no tiles
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None or session.height == 0:
+            raise TileStitchError(f"No tiles to stitch: {session_id}")
+
+        files: List[Path] = []
+        slices: List[Path] = []
+        try:
+            with open(session.spool_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as spool:
+                    parts = _row_ranges(session.height, JPEG_MAX_DIMENSION)
+                    for part_no, (top, bottom) in enumerate(parts, 1):
+                        path = output_path if len(parts) == 1 else output_path.with_name(
+                            f"{output_path.stem}_part{part_no}{output_path.suffix}"
+                        )
+                        _save_jpeg(spool, session.width, (top, bottom), path, quality)
+                        files.append(path)
+
+                    if slice_height:
+                        for slice_no, (top, bottom) in enumerate(_row_ranges(session.height, slice_height), 1):
+                            path = output_path.with_name(f"{output_path.stem}_s{slice_no:02d}{output_path.suffix}")
+                            _save_jpeg(spool, session.width, (top, bottom), path, quality)
+                            slices.append(path)
+        finally:
+            session.spool_path.unlink(missing_ok=True)
+
+        return StitchResult(session.width, session.height, session.next_index, files, slices)
+
+    def abort(self, session_id: str) -> None:
+        """Cancel a session (delete its spool)"""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session:
+            session.spool_path.unlink(missing_ok=True)
+
+    def _purge_stale(self) -> None:
+        """Clean up old unfinished sessions (call with the lock held)"""
+        cutoff = time.time() - self.max_age_seconds
+        for session_id, session in list(self._sessions.items()):
+            if session.updated_at < cutoff:
+                session.spool_path.unlink(missing_ok=True)
+                del self._sessions[session_id]
+
+
+def _row_ranges(height: int, step: int) -> List[tuple]:
+    """Split [0, height) into ranges of step rows"""
+    step = max(1, int(step))
+    return [(top, min(top + step, height)) for top in range(0, height, step)]
+
+
+def _save_jpeg(spool: mmap.mmap, width: int, rows: tuple, path: Path, quality: int) -> None:
+    """Write a row range of the spool as JPG, mapped without copying (temp file -> rename)"""
+    from PIL import Image
+
+    top, bottom = rows
+    stride = width * SPOOL_BYTES_PER_PIXEL
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with memoryview(spool)[top * stride:bottom * stride] as buffer:
+        region = Image.frombuffer(SPOOL_MODE, (width, bottom - top), buffer, "raw", SPOOL_MODE, 0, 1)
+        try:
+            # Mapped images are readonly, which makes some Pillow versions copy them in save()
+            # (the encoder only reads)
+            region.readonly = 0
+            region.save(tmp_path, format="JPEG", quality=quality)
+        finally:
+            # Drop the buffer reference before the mmap closes
+            del region
+    tmp_path.replace(path)
@@ -0,0 +1,91 @@
+"""
+DanaDataLoader: a failed read or a block of blank rows must not be mistaken for the end of the sheet
+
+Run from dana-page-builder/: python -m pytest tests
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+# load_from_sheets imports these at module level
+pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+httplib2 = pytest.importorskip("httplib2")
+errors = pytest.importorskip("googleapiclient.errors")
+
+
+@pytest.fixture
+def loader_module(tmp_path, monkeypatch):
+    """load_from_sheets imported with config paths (PROJECT_ROOT = cwd) under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+    for name in ("config", "product_store", "rate_limiter", "snapshot_bundle", "load_from_sheets"):
+        sys.modules.pop(name, None)
+    module = importlib.import_module("load_from_sheets")
+    monkeypatch.setattr(module, "SHEET_ROW_BLOCK_SIZE", 2)
+    return module
+
+
+def sheet_loader(loader_module, monkeypatch, blocks, row_count):
+    """Loader reading {range: codes (None = blank row) or None (HTTP 500)} with API calls faked"""
+
+    def read_grid_range(sheet_name, range_spec, fields):
+        block = blocks[range_spec]
+        if block is None:
+            raise errors.HttpError(httplib2.Response({"status": 500}), b"backend error")
+        # Like the API: blank rows inside a range are empty, blank rows at its end are omitted
+        while block and block[-1] is None:
+            block = block[:-1]
+        return [[{"formattedValue": code}] if code else [] for code in block]
+
+    loader = loader_module.DanaDataLoader()
+    monkeypatch.setattr(loader, "authenticate", lambda: None)
+    monkeypatch.setattr(loader, "sheet_row_count", lambda sheet_name: row_count)
+    monkeypatch.setattr(loader, "read_grid_range", read_grid_range)
+    monkeypatch.setattr(loader, "build_product_data", lambda row, code: {"productCode": code})
+    monkeypatch.setattr(loader, "execute_download_plan", lambda: None)
+    return loader
+
+
+def test_failed_block_keeps_products_of_unread_blocks(loader_module, monkeypatch):
+    codes = ["DN001", "DN002", "DN003", "DN004", "DN005", "DN006"]
+    with loader_module.ProductStore() as store:
+        store.upsert_many({"productCode": code} for code in codes)
+
+    blocks = {"A2:KP3": codes[0:2], "A4:KP5": None, "A6:KP7": codes[4:6]}
+    loader = sheet_loader(loader_module, monkeypatch, blocks, row_count=7)
+
+    with pytest.raises(errors.HttpError):
+        loader.run()
+
+    with loader_module.ProductStore() as store:
+        assert store.get("DN005") is not None
+        assert store.get("DN006") is not None
+        assert store.count() == len(codes)
+
+
+def test_blank_rows_across_block_boundary_keep_later_products(loader_module, monkeypatch):
+    with loader_module.ProductStore() as store:
+        store.upsert_many({"productCode": code} for code in ["DN001", "DN002", "DN003", "DN009"])
+
+    # Rows 3-6 are blank: block A2:KP3 comes back short and A4:KP5 empty
+    blocks = {
+        "A2:KP3": ["DN001", None],
+        "A4:KP5": [None, None],
+        "A6:KP7": [None, "DN002"],
+        "A8:KP8": ["DN003"],
+    }
+    loader = sheet_loader(loader_module, monkeypatch, blocks, row_count=8)
+    loader.run()
+
+    assert [p["productCode"] for p in loader.products] == ["DN001", "DN002", "DN003"]
+    with loader_module.ProductStore() as store:
+        assert store.get("DN002") is not None
+        assert store.get("DN003") is not None
+        assert store.get("DN009") is None
+        assert store.count() == 3
@@ -0,0 +1,73 @@
+"""
+TileStitcher: finish() encodes from the memory-mapped spool without loading the page
+
+Run from dana-page-builder/: python -m pytest tests
+"""
+
+import io
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+Image = pytest.importorskip("PIL.Image")
+
+from tile_stitcher import SPOOL_BYTES_PER_PIXEL, TileStitcher  # noqa: E402
+
+STATUS_PATH = Path("/proc/self/status")
+
+
+def rss_anon_bytes() -> int:
+    """Anonymous resident memory (heap; the mapped spool counts as file-backed)"""
+    for line in STATUS_PATH.read_text().splitlines():
+        if line.startswith("RssAnon:"):
+            return int(line.split()[1]) * 1024
+    raise RuntimeError("RssAnon missing from /proc/self/status")
+
+
+def png_tile(width: int, height: int, color: tuple) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.skipif(not STATUS_PATH.exists(), reason="needs /proc/self/status (Linux)")
+def test_finish_peak_memory_stays_below_page_size(tmp_path):
+    width, tile_height, tiles = 2000, 1000, 14
+    stitcher = TileStitcher(tmp_path / "spool")
+    for index in range(tiles):
+        stitcher.add_tile("page", index, png_tile(width, tile_height, (index * 15, 120, 200)))
+    spool_bytes = width * tile_height * tiles * SPOOL_BYTES_PER_PIXEL  # ~112 MB
+
+    baseline = rss_anon_bytes()
+    peak = baseline
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, rss_anon_bytes())
+            done.wait(0.002)
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    try:
+        result = stitcher.finish("page", tmp_path / "page.jpg", slice_height=5000)
+    finally:
+        done.set()
+        sampler.join()
+
+    # Copying the page (RGB frombuffer or crop) would add at least spool_bytes * 3/4
+    assert peak - baseline < spool_bytes // 4
+
+    assert (result.width, result.height, result.tiles) == (width, tile_height * tiles, tiles)
+    with Image.open(result.files[0]) as page:
+        assert page.size == (width, tile_height * tiles)
+        assert page.mode == "RGB"
+        assert page.getpixel((10, 10))[2] == pytest.approx(200, abs=8)
+    assert [Image.open(path).height for path in result.slices] == [5000, 5000, 4000]
+    assert not any((tmp_path / "spool").iterdir())
@@ -0,0 +1,117 @@
+"""
+SheetsLoader 시작 시간 벤치마크 (time-to-first-request)
+
+매 실행을 새 프로세스에서 측정합니다 (모듈 캐시가 없는 콜드 스타트 기준):
+  import      : src.sheets_loader.loader 임포트
+  init        : SheetsLoader() 생성 (인증 정보 로드)
+  first call  : 첫 Sheets 요청 완료까지 (서비스 생성 + 토큰 발급 + A1 셀 조회)
+  drive build : Drive 서비스 생성 (--with-drive 지정 시, 이전 방식의 즉시 생성 비용 비교용)
+
+실행 방법:
+  python scripts/bench_startup.py
+  python scripts/bench_startup.py --runs 10 --with-drive
+
+환경변수:
+  GOOGLE_SERVICE_ACCOUNT_FILE, GOOGLE_SHEET_ID (generate_batch.py와 동일)
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가 (모듈 임포트용)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+cwd = Path.cwd()
+
+
+def measure_once(service_account_file: str, sheet_id: str, with_drive: bool) -> dict:
+    """현재 프로세스에서 1회 측정 (자식 프로세스 모드)"""
+    timings = {}
+
+    t0 = time.perf_counter()
+    from src.sheets_loader.loader import SheetsLoader
+    timings["import"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    loader = SheetsLoader(Path(service_account_file))
+    timings["init"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    (
+        loader.service.spreadsheets()
+        .values()
+        .get(spreadsheetId=sheet_id, range=f"{loader.TAB_NAME}!A1:A1")
+        .execute()
+    )
+    timings["first call"] = time.perf_counter() - t0
+
+    if with_drive:
+        t0 = time.perf_counter()
+        loader.drive_service
+        timings["drive build"] = time.perf_counter() - t0
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SheetsLoader 시작 시간 벤치마크')
+    parser.add_argument('--runs', type=int, default=5, help='측정 횟수 (기본 5)')
+    parser.add_argument('--with-drive', action='store_true', help='Drive 서비스 생성 시간도 측정')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    service_account_file = os.getenv(
+        "GOOGLE_SERVICE_ACCOUNT_FILE",
+        str(cwd / "credentials" / "service-account.json")
+    )
+    sheet_id = os.getenv(
+        "GOOGLE_SHEET_ID",
+        "1ipkHdYdQhIAfUBkNUWHkFqcgP0aOXLVO14MYXWscEPk"
+    )
+
+    if args.child:
+        print(json.dumps(measure_once(service_account_file, sheet_id, args.with_drive)))
+        return
+
+    if not Path(service_account_file).exists():
+        print(f"❌ Service Account 파일을 찾을 수 없습니다: {service_account_file}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"⏱️  SheetsLoader 시작 시간 벤치마크 ({args.runs}회, 회당 새 프로세스)")
+    print("=" * 60)
+
+    command = [sys.executable, str(Path(__file__).resolve()), '--child']
+    if args.with_drive:
+        command.append('--with-drive')
+
+    results = []
+    for i in range(args.runs):
+        t0 = time.perf_counter()
+        proc = subprocess.run(command, capture_output=True, text=True)
+        wall = time.perf_counter() - t0
+        if proc.returncode != 0:
+            print(f"❌ 측정 실패 (#{i + 1}):\n{proc.stderr.strip()}")
+            sys.exit(1)
+        timings = json.loads(proc.stdout.strip().splitlines()[-1])
+        timings["process"] = wall
+        results.append(timings)
+        ttfr = timings["import"] + timings["init"] + timings["first call"]
+        print(f"  #{i + 1}: time-to-first-request {ttfr * 1000:.0f} ms (프로세스 전체 {wall * 1000:.0f} ms)")
+
+    print()
+    print(f"{'단계':<14}{'중앙값':>10}{'최소':>10}{'최대':>10}")
+    for key in results[0]:
+        values = [r[key] * 1000 for r in results]
+        print(f"{key:<14}{statistics.median(values):>8.0f}ms{min(values):>8.0f}ms{max(values):>8.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+CLI 시작 시간 회귀 검사 (python -X importtime 기반)
+
+각 엔트리 포인트를 `--help`로 새 프로세스에서 실행하고 -X importtime 출력을 집계해
+1) 전체 임포트 시간이 예산(ms)을 넘는지
+2) 인자 파싱 전에 무거운 모듈(Google API, bs4, pydantic, PIL, numpy)이 로드되는지
+를 검사합니다. 하나라도 실패하면 종료 코드 1을 반환합니다.
+
+실행 방법:
+  python scripts/check_import_budget.py
+  python scripts/check_import_budget.py --budget-ms 200 --runs 5 --verbose
+"""
+
+import re
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+scripts_dir = Path(__file__).parent
+
+# 기본 예산 (ms, 회당 최소값 기준) - 인터프리터 자체 시작 비용 포함
+DEFAULT_BUDGET_MS = 150
+
+# 검사 대상: (스크립트, 인자)
+ENTRY_POINTS = [
+    ("generate_batch.py", ["--help"]),
+    ("cleanup.py", ["--help"]),
+    ("bench_startup.py", ["--help"]),
+    ("generate_client.py", ["--help"]),
+]
+
+# --help 실행 중 로드되면 안 되는 모듈 (최상위 패키지 이름)
+FORBIDDEN_MODULES = ("googleapiclient", "google", "bs4", "pydantic", "PIL", "numpy", "jinja2")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$")
+
+
+class ImportRecord(NamedTuple):
+    """-X importtime 한 줄"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """-X importtime 출력 파싱 (헤더/기타 출력은 무시)"""
+    records = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            depth = (len(indent) - 1) // 2
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def measure(script: str, script_args: List[str]) -> List[ImportRecord]:
+    """새 프로세스에서 1회 실행 후 임포트 기록 반환"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(scripts_dir / script), *script_args],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"{script} 실행 실패 (종료 코드 {proc.returncode}):\n{tail}")
+    return parse_importtime(proc.stderr)
+
+
+def total_ms(records: List[ImportRecord]) -> float:
+    """최상위 임포트의 누적 시간 합계 (ms)"""
+    return sum(r.cumulative_us for r in records if r.depth == 0) / 1000
+
+
+def forbidden_loaded(records: List[ImportRecord]) -> List[str]:
+    """로드된 금지 모듈 목록"""
+    return sorted({
+        r.module for r in records
+        if r.module.split(".")[0] in FORBIDDEN_MODULES
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CLI 시작 시간(-X importtime) 예산 검사')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'엔트리 포인트별 임포트 시간 예산 (ms, 기본 {DEFAULT_BUDGET_MS})')
+    parser.add_argument('--runs', type=int, default=3, help='엔트리 포인트별 실행 횟수 (최소값 사용, 기본 3)')
+    parser.add_argument('--verbose', action='store_true', help='가장 느린 최상위 임포트 5개 출력')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"⏱️  CLI 임포트 시간 예산 검사 (예산 {args.budget_ms:.0f} ms, {args.runs}회 중 최소)")
+    print("=" * 60)
+
+    failures = 0
+    for script, script_args in ENTRY_POINTS:
+        label = f"{script} {' '.join(script_args)}"
+        try:
+            runs = [measure(script, script_args) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            failures += 1
+            continue
+
+        best = min(runs, key=total_ms)
+        elapsed = total_ms(best)
+        forbidden = forbidden_loaded(best)
+
+        ok = elapsed <= args.budget_ms and not forbidden
+        print(f"{'✅' if ok else '❌'} {label:<32} {elapsed:>7.1f} ms")
+        if elapsed > args.budget_ms:
+            print(f"   ⚠️  예산 초과: {elapsed - args.budget_ms:.1f} ms")
+        if forbidden:
+            print(f"   ⚠️  인자 파싱 전에 로드된 무거운 모듈: {', '.join(forbidden)}")
+
+        if args.verbose or not ok:
+            top: Dict[str, int] = {r.module: r.cumulative_us for r in best if r.depth == 0}
+            for module, us in sorted(top.items(), key=lambda item: item[1], reverse=True)[:5]:
+                print(f"      {us / 1000:>7.1f} ms  {module}")
+
+        if not ok:
+            failures += 1
+
+    print()
+    if failures:
+        print(f"❌ {failures}개 엔트리 포인트가 예산 검사에 실패했습니다")
+        sys.exit(1)
+    print("✅ 모든 엔트리 포인트가 예산 내에서 시작합니다")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,20 +5,67 @@ PB Product Generator - Output Cleanup Script
 """
 
 import os
+import sys
 import shutil
 import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+# 플러그인 루트 (src 모듈 임포트용)
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+
+from src.utils.storage_index import StorageIndex, delete_unit, is_dated_folder, plan_eviction
+from src.utils.output_archive import (
+    ARCHIVE_DIR_NAME,
+    ArchiveReader,
+    archive_folder,
+    available_codec,
+    list_archives,
+)
+
+# 루트 경로별 스토리지 인덱스 (실행당 트리 1회 스캔)
+_INDEXES: Dict[Path, StorageIndex] = {}
+# --rescan: 매니페스트를 무시하고 전체 재스캔
+FORCE_RESCAN = False
+
+
+def get_index(path: Path, persist: bool = False) -> StorageIndex:
+    """
+    경로를 포함하는 스토리지 인덱스 반환 (없으면 스캔)
+
+    이미 스캔한 상위 트리가 있으면 재사용합니다 (예: output → output/assets/images).
+
+    Args:
+        path: 조회할 경로
+        persist: 새로 만들 때 매니페스트 저장/재사용 여부
+
+    Returns:
+        스캔된 StorageIndex
+    """
+    path = path.resolve()
+    for root, index in _INDEXES.items():
+        if path == root or root in path.parents:
+            return index
+
+    index = StorageIndex(path, persist=persist).scan(rescan=FORCE_RESCAN)
+    if persist:
+        index.save()
+    _INDEXES[path] = index
+    return index
+
+
+def refresh_index(path: Path) -> None:
+    """삭제 후 인덱스 갱신 (변경된 디렉토리만 다시 읽음)"""
+    index = _INDEXES.get(path.resolve())
+    if index is not None:
+        index.scan()
+        index.save()
 
 
 def get_dir_size(path: Path) -> int:
-    """디렉토리 크기 계산 (bytes)"""
-    total = 0
-    for entry in path.rglob('*'):
-        if entry.is_file():
-            total += entry.stat().st_size
-    return total
+    """디렉토리 크기 계산 (bytes, 스토리지 인덱스 기준)"""
+    return get_index(path).size(path)
 
 
 def format_size(bytes_size: int) -> str:
@@ -30,16 +77,17 @@ def format_size(bytes_size: int) -> str:
     return f"{bytes_size:.1f} TB"
 
 
+# 루트에서 정리 대상이 되는 파일 확장자
+HTML_SUFFIXES = ('.html', '.htm')
+
+
 def get_dated_folders(output_dir: Path) -> List[Tuple[Path, datetime]]:
     """날짜별 폴더 목록 가져오기 (YYYYMMDD 형식)"""
-    folders = []
-    for item in output_dir.iterdir():
-        if item.is_dir() and item.name.isdigit() and len(item.name) == 8:
-            try:
-                date = datetime.strptime(item.name, "%Y%m%d")
-                folders.append((item, date))
-            except ValueError:
-                continue
+    folders = [
+        (output_dir / name, datetime.strptime(name, "%Y%m%d"))
+        for name in get_index(output_dir, persist=True).root_dirs()
+        if is_dated_folder(name)
+    ]
     return sorted(folders, key=lambda x: x[1])
 
 
@@ -48,41 +96,68 @@ def get_old_html_files(output_dir: Path, days: int) -> List[Tuple[Path, datetime
     cutoff = datetime.now() - timedelta(days=days)
     old_files = []
 
-    for item in output_dir.iterdir():
-        if item.is_file() and item.suffix in ['.html', '.htm']:
-            mtime = datetime.fromtimestamp(item.stat().st_mtime)
+    for name, size, mtime_ns in get_index(output_dir, persist=True).root_files():
+        if name.endswith(HTML_SUFFIXES):
+            mtime = datetime.fromtimestamp(mtime_ns / 1e9)
             if mtime < cutoff:
-                old_files.append((item, mtime))
+                old_files.append((output_dir / name, mtime))
 
     return sorted(old_files, key=lambda x: x[1])
 
 
-def cleanup_by_age(output_dir: Path, days: int, dry_run: bool = False) -> Tuple[int, int]:
-    """오래된 파일/폴더 삭제"""
+def cleanup_by_age(output_dir: Path, days: int, dry_run: bool = False, archive: bool = False) -> Tuple[int, int]:
+    """오래된 파일/폴더 삭제
+
+    Args:
+        output_dir: Output 디렉토리 경로
+        days: N일 이상 오래된 파일 삭제
+        dry_run: 시뮬레이션 모드
+        archive: 날짜별 폴더를 삭제 대신 output/archive/{YYYYMMDD}.arc로 압축 보관
+                 (루트 HTML 파일은 그대로 유지)
+
+    Returns:
+        Tuple[int, int]: (처리된 항목 수, 확보된 바이트)
+    """
     cutoff = datetime.now() - timedelta(days=days)
     deleted_count = 0
     freed_bytes = 0
 
-    print(f"\n🗑️  오래된 파일 정리 (기준: {days}일 이전)\n")
+    if archive:
+        print(f"\n📦 오래된 날짜 폴더 아카이브 (기준: {days}일 이전, 코덱: {available_codec()})\n")
+    else:
+        print(f"\n🗑️  오래된 파일 정리 (기준: {days}일 이전)\n")
     print(f"   기준 날짜: {cutoff.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-    # 날짜별 폴더 삭제
+    # 날짜별 폴더 삭제 (또는 아카이브 후 삭제)
+    archive_dir = output_dir / ARCHIVE_DIR_NAME
     folders = get_dated_folders(output_dir)
     for folder, date in folders:
         if date < cutoff:
             size = get_dir_size(folder)
             if dry_run:
-                print(f"   [DRY RUN] 삭제 예정: {folder.name}/ ({format_size(size)})")
+                action = "아카이브 예정" if archive else "삭제 예정"
+                print(f"   [DRY RUN] {action}: {folder.name}/ ({format_size(size)})")
+            elif archive:
+                result = archive_folder(folder, archive_dir)
+                print(f"   아카이브: {folder.name}/ ({format_size(size)}) → "
+                      f"{result.path.name} ({format_size(result.archived_bytes)}, {result.member_count}개 파일)")
+                shutil.rmtree(folder)
+                size = max(size - result.archived_bytes, 0)
             else:
                 print(f"   삭제 중: {folder.name}/ ({format_size(size)})")
                 shutil.rmtree(folder)
             deleted_count += 1
             freed_bytes += size
 
+    if archive:
+        if deleted_count and not dry_run:
+            refresh_index(output_dir)
+        return deleted_count, freed_bytes
+
     # 루트의 오래된 HTML 파일 삭제
     old_files = get_old_html_files(output_dir, days)
     for file_path, mtime in old_files:
-        size = file_path.stat().st_size
+        size = get_dir_size(file_path)
         if dry_run:
             print(f"   [DRY RUN] 삭제 예정: {file_path.name} ({format_size(size)})")
         else:
@@ -91,56 +166,55 @@ def cleanup_by_age(output_dir: Path, days: int, dry_run: bool = False) -> Tuple[
         deleted_count += 1
         freed_bytes += size
 
+    if deleted_count and not dry_run:
+        refresh_index(output_dir)
+
     return deleted_count, freed_bytes
 
 
 def cleanup_by_size(output_dir: Path, max_size_mb: int, dry_run: bool = False) -> Tuple[int, int]:
-    """크기 제한 기반 정리 (오래된 것부터 삭제)"""
+    """크기 제한 기반 정리 (마지막 수정이 가장 오래된 것부터 삭제 - LRU)
+
+    날짜별 폴더와 루트 HTML 파일을 하나의 목록으로 모아 마지막 수정 시각 순으로
+    한 번 정렬한 뒤, 초과분이 해소될 때까지 앞에서부터 삭제합니다.
+    """
     max_bytes = max_size_mb * 1024 * 1024
-    current_size = get_dir_size(output_dir)
+    index = get_index(output_dir, persist=True)
+    # 삭제 단위만 쿼터에 포함 (archive/, static/, edits/ 등 고정 트리는 지워지지 않으므로 제외)
+    plan = plan_eviction(index, is_dated_folder, max_bytes, root_file_suffixes=HTML_SUFFIXES)
+    current_size = plan.managed_bytes
 
-    if current_size <= max_bytes:
-        print(f"\n✅ 현재 크기 {format_size(current_size)} ≤ 최대 크기 {format_size(max_bytes)}")
+    if plan.excess_bytes <= 0:
+        print(f"\n✅ 날짜 폴더 + 루트 HTML 크기 {format_size(current_size)} ≤ 최대 크기 {format_size(max_bytes)}")
         print("   정리 불필요\n")
         return 0, 0
 
     print(f"\n🗑️  크기 기반 정리 (최대: {format_size(max_bytes)})\n")
-    print(f"   현재 크기: {format_size(current_size)}")
-    print(f"   초과 크기: {format_size(current_size - max_bytes)}\n")
+    print(f"   날짜 폴더 + 루트 HTML 크기: {format_size(current_size)}")
+    print(f"   초과 크기: {format_size(plan.excess_bytes)}\n")
+
+    if not plan.clearable:
+        print(f"⚠️  삭제 가능한 항목 {format_size(plan.evictable_bytes)}로는 초과분을 해소할 수 없어 건너뜁니다\n")
+        return 0, 0
+
+    victims = plan.victims
 
     deleted_count = 0
     freed_bytes = 0
 
-    # 오래된 날짜 폴더부터 삭제
-    folders = get_dated_folders(output_dir)
-    for folder, date in folders:
-        if current_size - freed_bytes <= max_bytes:
-            break
-
-        size = get_dir_size(folder)
+    for unit in victims:
+        label = f"{unit.path.name}/" if unit.path.is_dir() else unit.path.name
+        last_used = datetime.fromtimestamp(unit.last_mtime_ns / 1e9).strftime('%Y-%m-%d %H:%M')
         if dry_run:
-            print(f"   [DRY RUN] 삭제 예정: {folder.name}/ ({format_size(size)})")
+            print(f"   [DRY RUN] 삭제 예정: {label} ({format_size(unit.size)}, 마지막 수정 {last_used})")
         else:
-            print(f"   삭제 중: {folder.name}/ ({format_size(size)})")
-            shutil.rmtree(folder)
+            print(f"   삭제 중: {label} ({format_size(unit.size)}, 마지막 수정 {last_used})")
+            delete_unit(unit)
         deleted_count += 1
-        freed_bytes += size
-
-    # 아직 초과하면 루트의 오래된 HTML도 삭제
-    if current_size - freed_bytes > max_bytes:
-        old_files = get_old_html_files(output_dir, days=0)  # 모든 파일
-        for file_path, mtime in old_files:
-            if current_size - freed_bytes <= max_bytes:
-                break
+        freed_bytes += unit.size
 
-            size = file_path.stat().st_size
-            if dry_run:
-                print(f"   [DRY RUN] 삭제 예정: {file_path.name} ({format_size(size)})")
-            else:
-                print(f"   삭제 중: {file_path.name} ({format_size(size)})")
-                file_path.unlink()
-            deleted_count += 1
-            freed_bytes += size
+    if deleted_count and not dry_run:
+        refresh_index(output_dir)
 
     return deleted_count, freed_bytes
 
@@ -164,10 +238,10 @@ def show_stats(output_dir: Path, images_dir: Path, data_dir: Path, cache_dir: Pa
 
     # Output 폴더 통계 (HTML)
     if output_exists:
-        output_size = get_dir_size(output_dir)
+        output_size = get_index(output_dir, persist=True).total_size()
         total_size += output_size
         folders = get_dated_folders(output_dir)
-        html_files = list(output_dir.glob('*.html'))
+        html_files = [file_path for file_path, _ in get_old_html_files(output_dir, days=0)]
 
         print(f"\n📄 HTML 파일: {output_dir}")
         print(f"💾 크기: {format_size(output_size)}")
@@ -184,11 +258,23 @@ def show_stats(output_dir: Path, images_dir: Path, data_dir: Path, cache_dir: Pa
         if html_files:
             print("\n📄 루트 HTML 파일:")
             for file_path in html_files:
-                size = file_path.stat().st_size
-                mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+                size = get_dir_size(file_path)
+                mtime = datetime.fromtimestamp(get_index(output_dir).last_mtime_ns(file_path) / 1e9)
                 age_days = (datetime.now() - mtime).days
                 print(f"   {file_path.name} - {format_size(size):>10} ({age_days}일 전)")
 
+    # 아카이브 통계
+    archives = list_archives(output_dir / ARCHIVE_DIR_NAME)
+    if archives:
+        print(f"\n📦 아카이브: {output_dir / ARCHIVE_DIR_NAME}")
+        for archive_path in archives:
+            with ArchiveReader(archive_path) as reader:
+                member_count = len(reader.index["members"])
+                original_size = sum(block["size"] for block in reader.index["blocks"])
+            archived_size = get_dir_size(archive_path)
+            print(f"   {archive_path.name} - {format_size(archived_size):>10} "
+                  f"(원본 {format_size(original_size)}, {member_count}개 파일)")
+
     # 이미지 폴더 통계
     if images_exists:
         images_size = get_dir_size(images_dir)
@@ -357,19 +443,20 @@ def cleanup_products(data_dir: Path, days: int = 0, dry_run: bool = False) -> Tu
     return deleted_count, freed_bytes
 
 
-def cleanup_html(output_dir: Path, days: int, dry_run: bool = False) -> Tuple[int, int]:
+def cleanup_html(output_dir: Path, days: int, dry_run: bool = False, archive: bool = False) -> Tuple[int, int]:
     """HTML 파일만 정리 (날짜별 폴더 + 루트 HTML)
 
     Args:
         output_dir: Output 디렉토리 경로
         days: N일 이상 오래된 파일 삭제
         dry_run: 시뮬레이션 모드
+        archive: 날짜별 폴더를 삭제 대신 압축 아카이브로 보관
 
     Returns:
         Tuple[int, int]: (삭제된 파일 수, 확보된 바이트)
     """
     # cleanup_by_age와 동일하지만 이름을 명확하게
-    return cleanup_by_age(output_dir, days, dry_run)
+    return cleanup_by_age(output_dir, days, dry_run, archive=archive)
 
 
 def cleanup_cache(cache_dir: Path, days: int = 0, dry_run: bool = False) -> Tuple[int, int]:
@@ -427,8 +514,8 @@ def cleanup_all(output_dir: Path, images_dir: Path, data_dir: Path, cache_dir: P
     output_count = 0
     output_size = 0
     if output_dir.exists():
-        output_size = get_dir_size(output_dir)
-        output_count = sum(1 for _ in output_dir.rglob('*') if _.is_file())
+        output_size = get_index(output_dir, persist=True).total_size()
+        output_count = get_index(output_dir).file_count(output_dir)
         total_count += output_count
         total_size += output_size
 
@@ -437,7 +524,7 @@ def cleanup_all(output_dir: Path, images_dir: Path, data_dir: Path, cache_dir: P
     images_size = 0
     if images_dir.exists():
         images_size = get_dir_size(images_dir)
-        images_count = sum(1 for _ in images_dir.rglob('*') if _.is_file())
+        images_count = get_index(images_dir).file_count(images_dir)
         total_count += images_count
         total_size += images_size
 
@@ -446,7 +533,7 @@ def cleanup_all(output_dir: Path, images_dir: Path, data_dir: Path, cache_dir: P
     data_size = 0
     if data_dir.exists():
         data_size = get_dir_size(data_dir)
-        data_count = sum(1 for _ in data_dir.rglob('*') if _.is_file())
+        data_count = get_index(data_dir).file_count(data_dir)
         total_count += data_count
         total_size += data_size
 
@@ -455,7 +542,7 @@ def cleanup_all(output_dir: Path, images_dir: Path, data_dir: Path, cache_dir: P
     cache_size = 0
     if cache_dir.exists():
         cache_size = get_dir_size(cache_dir)
-        cache_count = sum(1 for _ in cache_dir.rglob('*') if _.is_file())
+        cache_count = get_index(cache_dir).file_count(cache_dir)
         total_count += cache_count
         total_size += cache_size
 
@@ -547,7 +634,9 @@ def main():
   %(prog)s --cache --days 7           # Figma 캐시만 정리 (7일 이상)
   %(prog)s --all                      # 전체 삭제 (HTML + 이미지 + 데이터 + 캐시)
   %(prog)s --all --dry-run            # 전체 삭제 시뮬레이션
-  %(prog)s --max-size 500             # HTML 파일 크기 제한 (500MB)
+  %(prog)s --max-size 500             # HTML 파일 크기 제한 (500MB, 마지막 수정 오래된 순)
+  %(prog)s --stats --rescan           # 매니페스트 무시하고 전체 재스캔
+  %(prog)s --html --days 30 --archive # 30일 이전 날짜 폴더를 삭제 대신 압축 보관
         """
     )
 
@@ -588,7 +677,17 @@ def main():
     parser.add_argument(
         '--max-size',
         type=int,
-        help='최대 크기 (MB) - 초과 시 오래된 것부터 삭제 (HTML만 해당)'
+        help='최대 크기 (MB) - 초과 시 마지막 수정이 오래된 것부터 삭제 (HTML만 해당)'
+    )
+    parser.add_argument(
+        '--archive',
+        action='store_true',
+        help='--days와 함께 사용: 날짜별 폴더를 삭제하지 않고 output/archive/에 압축 보관'
+    )
+    parser.add_argument(
+        '--rescan',
+        action='store_true',
+        help='스토리지 매니페스트(output/.storage_manifest.json)를 무시하고 전체 재스캔'
     )
     parser.add_argument(
         '--html',
@@ -622,6 +721,8 @@ def main():
     )
 
     args = parser.parse_args()
+    global FORCE_RESCAN
+    FORCE_RESCAN = args.rescan
     output_dir = Path(args.output_dir)
     images_dir = Path(args.images_dir)
     data_dir = Path(args.data_dir)
@@ -646,7 +747,7 @@ def main():
             print("❌ --html 옵션은 --days와 함께 사용해야 합니다.")
             print("   예: python3 cleanup.py --html --days 7\n")
             return
-        count, size = cleanup_html(output_dir, args.days, dry_run=args.dry_run)
+        count, size = cleanup_html(output_dir, args.days, dry_run=args.dry_run, archive=args.archive)
         if count > 0:
             print(f"\n✅ HTML 정리 완료: {count}개 항목, {format_size(size)} 확보\n")
         else:
@@ -691,7 +792,7 @@ def main():
     if args.days:
         print("ℹ️  --days 옵션만 사용 시 HTML 파일을 정리합니다.")
         print("   다른 타입: --html, --images, --cache 옵션 사용\n")
-        count, size = cleanup_by_age(output_dir, args.days, dry_run=args.dry_run)
+        count, size = cleanup_by_age(output_dir, args.days, dry_run=args.dry_run, archive=args.archive)
         if count > 0:
             print(f"\n✅ HTML 정리 완료: {count}개 항목, {format_size(size)} 확보\n")
         else:
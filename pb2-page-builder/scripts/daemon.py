@@ -0,0 +1,230 @@
+"""
+상주 생성 데몬 - SheetsLoader/ProductDataBuilder/이미지 캐시/생성 모듈을 메모리에 유지
+
+매 /generate 호출마다 새 프로세스를 띄우면 인증, API 클라이언트 생성,
+bs4/pydantic 임포트, 에디터 템플릿 로드를 반복합니다. 데몬은 이를 시작 시 한 번만 수행하고,
+제품 생성 요청은 시트 조회 + 이미지 다운로드(캐시 미적중분)만 수행합니다.
+
+Port 5002 (localhost 전용)에서 실행:
+- /health (GET): 상태, 가동 시간, 생성 횟수, 이미지 캐시 통계
+- /generate (POST): {"code": "VD25FPT003", "output_dir": "/abs/path/output"} → 제품 생성
+- /reload (POST): 이미지 캐시 비우기
+- /metrics (GET): Prometheus 텍스트 포맷 운영 메트릭
+
+생성 요청은 순차 처리됩니다 (Google API 클라이언트는 스레드 안전하지 않음).
+
+실행 방법:
+  python scripts/daemon.py
+  python scripts/generate_client.py VD25FPT003   # 데몬에 생성 요청 (데몬이 없으면 직접 실행)
+
+환경변수 (선택):
+  PB2_DAEMON_PORT=5002            # 데몬 포트
+  PB2_IMAGE_CACHE_MB=512          # 이미지 캐시 크기 (MB)
+  PB2_IMAGE_CACHE_TTL=600         # 이미지 캐시 유효 시간 (초)
+"""
+
+import os
+import sys
+import time
+import threading
+from pathlib import Path
+from datetime import datetime
+from flask import Flask, jsonify, request
+from dotenv import load_dotenv
+
+# 프로젝트 루트 (모듈 임포트용)
+project_root = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(project_root))
+
+from src.editable_html import generate_editable_html
+from src.editor_runtime import bundle as runtime_bundle
+from src.sheets_loader.image_cache import ImageCache
+from src.sheets_loader.loader import SheetsLoader
+from src.sheets_loader.product_builder import ProductDataBuilder
+from src.utils.metrics import MetricsRegistry, instrument_flask_app
+
+# .env 파일 로드 (CWD 기준)
+env_path = Path.cwd() / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+DAEMON_PORT = int(os.getenv('PB2_DAEMON_PORT') or 5002)
+IMAGE_CACHE_MB = int(os.getenv('PB2_IMAGE_CACHE_MB') or 512)
+IMAGE_CACHE_TTL = float(os.getenv('PB2_IMAGE_CACHE_TTL') or 600)
+
+# Flask 앱 초기화
+app = Flask(__name__)
+
+# 운영 메트릭 (/metrics)
+METRICS = MetricsRegistry()
+instrument_flask_app(app, METRICS, namespace="pb2_daemon")
+GENERATE_SECONDS = METRICS.histogram(
+    "pb2_daemon_generate_phase_duration_seconds",
+    "Time spent in each product generation phase.",
+    ("phase",),
+)
+
+
+class GenerationService:
+    """상주 생성 서비스 (로더/빌더/이미지 캐시 보관)"""
+
+    def __init__(self, service_account_file: Path, sheet_id: str) -> None:
+        """
+        Args:
+            service_account_file: Service Account JSON 파일 경로
+            sheet_id: 기본 Google Sheets ID
+        """
+        self.sheet_id = sheet_id
+        self.started_at = time.time()
+        self.generated = 0
+        self.lock = threading.Lock()
+
+        self.loader = SheetsLoader(service_account_file)
+        self.image_cache = ImageCache(
+            max_bytes=IMAGE_CACHE_MB * 1024 * 1024,
+            ttl_seconds=IMAGE_CACHE_TTL,
+        )
+        self.loader.image_cache = self.image_cache
+        self.builder = ProductDataBuilder(
+            enable_color_extraction=True,
+            sheets_loader=self.loader,
+        )
+
+    def warm_up(self) -> None:
+        """API 클라이언트 생성 + 액세스 토큰 발급 (첫 요청 지연 제거)"""
+        self.loader.service
+        self.loader.drive_service
+        self.loader.find_product_row(self.sheet_id, "")
+
+    def generate(self, product_code: str, output_dir: Path, sheet_id: str) -> dict:
+        """
+        단일 제품 Editable HTML 생성
+
+        Returns:
+            {"code", "name", "file", "size_mb", "timings"}
+
+        Raises:
+            LookupError: 시트에 제품 코드가 없는 경우
+        """
+        timings = {}
+        with self.lock:
+            started = time.perf_counter()
+            row_number = self.loader.find_product_row(sheet_id, product_code)
+            if row_number is None:
+                raise LookupError(f"제품 코드 '{product_code}'를 찾을 수 없습니다")
+            row = self.loader.load_row(sheet_id, row_number)
+            timings["fetch"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            product = self.builder.build_product_data(row)
+            timings["build"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            html_content = generate_editable_html(product, self.loader)
+            timings["render"] = time.perf_counter() - started
+
+            today = datetime.now().strftime("%Y%m%d")
+            editable_dir = output_dir / today / "editable"
+            editable_dir.mkdir(exist_ok=True, parents=True)
+            runtime_bundle.emit_bundle(output_dir)
+            output_file = editable_dir / f"{product.product_code}_editable_v4.html"
+            output_file.write_text(html_content, encoding="utf-8")
+            self.generated += 1
+
+        for phase, seconds in timings.items():
+            GENERATE_SECONDS.observe(seconds, phase=phase)
+
+        return {
+            "code": product.product_code,
+            "name": product.product_name,
+            "row": row_number,
+            "file": str(output_file),
+            "size_mb": len(html_content) / 1024 / 1024,
+            "timings": timings,
+        }
+
+
+SERVICE: GenerationService = None
+
+
+@app.route('/health')
+def health():
+    """데몬 상태"""
+    return jsonify({
+        "status": "ok",
+        "pid": os.getpid(),
+        "uptime": time.time() - SERVICE.started_at,
+        "generated": SERVICE.generated,
+        "busy": SERVICE.lock.locked(),
+        "image_cache": SERVICE.image_cache.stats(),
+    })
+
+
+@app.route('/generate', methods=['POST'])
+def generate():
+    """제품 생성 요청 처리"""
+    data = request.get_json(silent=True) or {}
+    product_code = str(data.get('code') or '').strip()
+    if not product_code:
+        return jsonify({"error": "code가 필요합니다"}), 400
+
+    output_dir = Path(data.get('output_dir') or (Path.cwd() / "output"))
+    if not output_dir.is_absolute():
+        return jsonify({"error": "output_dir는 절대 경로여야 합니다"}), 400
+
+    sheet_id = data.get('sheet_id') or SERVICE.sheet_id
+    print(f"📝 생성 요청: {product_code} → {output_dir}")
+
+    try:
+        result = SERVICE.generate(product_code, output_dir, sheet_id)
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception as e:
+        print(f"❌ 생성 실패 ({product_code}): {e}")
+        return jsonify({"error": f"생성 실패: {e}"}), 500
+
+    timings = result["timings"]
+    print(
+        f"✅ {result['code']} 완료: 조회 {timings['fetch']:.1f}초, "
+        f"변환 {timings['build']:.1f}초, 렌더링 {timings['render']:.1f}초"
+    )
+    return jsonify(result)
+
+
+@app.route('/reload', methods=['POST'])
+def reload():
+    """이미지 캐시 비우기 (Drive 이미지 교체 후 즉시 반영)"""
+    SERVICE.image_cache.clear()
+    return jsonify({"status": "ok"})
+
+
+if __name__ == '__main__':
+    service_account_file = Path(os.getenv(
+        "GOOGLE_SERVICE_ACCOUNT_FILE",
+        str(Path.cwd() / "credentials" / "service-account.json")
+    ))
+    sheet_id = os.getenv(
+        "GOOGLE_SHEET_ID",
+        "1ipkHdYdQhIAfUBkNUWHkFqcgP0aOXLVO14MYXWscEPk"
+    )
+
+    print("=" * 60)
+    print("🔥 PB2 상주 생성 데몬")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    try:
+        SERVICE = GenerationService(service_account_file, sheet_id)
+        SERVICE.warm_up()
+    except Exception as e:
+        print(f"❌ 초기화 실패: {e}")
+        sys.exit(1)
+
+    print(f"✅ 로더/빌더 준비 완료 ({time.perf_counter() - started:.1f}초)")
+    print(f"🖼️  이미지 캐시: {IMAGE_CACHE_MB} MB, TTL {IMAGE_CACHE_TTL:.0f}초")
+    print(f"🌐 Daemon URL: http://127.0.0.1:{DAEMON_PORT}")
+    print("=" * 60)
+    print()
+
+    # localhost 전용 (요청이 임의 output_dir에 파일을 쓰므로 외부 노출 금지)
+    app.run(host='127.0.0.1', port=DAEMON_PORT, debug=False, threaded=True)
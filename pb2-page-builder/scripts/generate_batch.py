@@ -24,6 +24,20 @@ V4 개선사항:
   # 특정 행들만 지정 (쉼표로 구분)
   python scripts/generate_batch.py --rows 2,5,10
 
+  # 시트 변경 감시 (변경된 제품만 재생성, Ctrl+C로 종료)
+  python scripts/generate_batch.py --watch --interval 30
+
+  # 스냅샷 번들로 생성 (Google API/네트워크 없음, scripts/snapshot.py로 캡처)
+  python scripts/generate_batch.py --all --snapshot snapshots/20251020
+
+  # 파이프라인 단계별 워커 수 조정 (기본: rows=2,images=4,build=1,render=1,write=1)
+  python scripts/generate_batch.py --all --workers images=8,render=2 --queue-size 3
+
+처리 흐름 (src/utils/batch_pipeline.py):
+  행 조회 → 이미지 다운로드 → 변환/검증 → 렌더링 → 저장
+  단계마다 워커 스레드를 두고 크기 제한 큐로 연결해, 다음 제품의 다운로드가
+  이전 제품의 렌더링과 겹칩니다 (전체 시간 ≈ 가장 느린 단계).
+
 환경변수 설정 (선택):
   export GOOGLE_SERVICE_ACCOUNT_FILE=/path/to/service-account.json
   export GOOGLE_SHEET_ID=your-sheet-id
@@ -31,11 +45,12 @@ V4 개선사항:
 
 import os
 import sys
+import time
+import shutil
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from dotenv import load_dotenv
+from typing import Any, List, Dict, Optional, Tuple, TYPE_CHECKING
 
 # 프로젝트 루트를 sys.path에 추가 (모듈 임포트용)
 project_root = Path(__file__).parent.parent
@@ -44,23 +59,18 @@ sys.path.insert(0, str(project_root))
 # 현재 작업 디렉토리 (파일 경로용)
 cwd = Path.cwd()
 
-# .env 파일 로드 (CWD 기준)
-env_file = cwd / ".env"
-if env_file.exists():
-    load_dotenv(env_file)
+from src.editor_runtime import bundle as runtime_bundle
+from src.sheets_loader.row_snapshot import RowChange, RowSnapshot
+from src.sheets_loader.utils import drive_urls
+from src.utils.batch_pipeline import DEFAULT_QUEUE_SIZE, BatchPipeline, Stage
 
-from src.sheets_loader.loader import SheetsLoader
-from src.sheets_loader.product_builder import ProductDataBuilder
+# Google API/bs4/pydantic 모듈은 인자 검증 후 main()에서 임포트 (--help, 잘못된 인자는 즉시 종료)
+if TYPE_CHECKING:
+    from src.sheets_loader.loader import SheetsLoader
+    from src.sheets_loader.product_builder import ProductDataBuilder
 
-# generate_editable_html 함수 임포트
-import importlib.util
-spec = importlib.util.spec_from_file_location(
-    "generate_editable_html",
-    project_root / "scripts" / "generate_editable_html.py"
-)
-generate_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(generate_module)
-generate_editable_html = generate_module.generate_editable_html
+# 파이프라인 단계별 기본 워커 수 (네트워크 단계는 여러 개, CPU 단계는 GIL 때문에 1개)
+DEFAULT_STAGE_WORKERS = {"rows": 2, "images": 4, "build": 1, "render": 1, "write": 1}
 
 
 def get_today_folder(output_dir: Path) -> Tuple[Path, Path]:
@@ -80,10 +90,13 @@ def get_today_folder(output_dir: Path) -> Tuple[Path, Path]:
     editable_dir.mkdir(exist_ok=True, parents=True)
     export_dir.mkdir(exist_ok=True, parents=True)
 
+    # 페이지가 참조하는 에디터 런타임 번들 (output/static/editor, 변경 시에만 갱신)
+    runtime_bundle.emit_bundle(output_dir)
+
     return editable_dir, export_dir
 
 
-def get_all_product_rows(loader: SheetsLoader, sheet_id: str) -> List[int]:
+def get_all_product_rows(loader: "SheetsLoader", sheet_id: str) -> List[int]:
     """
     시트에서 제품 코드가 있는 모든 행 번호 찾기
 
@@ -96,20 +109,8 @@ def get_all_product_rows(loader: SheetsLoader, sheet_id: str) -> List[int]:
     """
     print("📊 시트 전체 스캔 중...")
 
-    # 전체 시트 데이터 로드 (A열만 - 제품 코드)
     try:
-        range_name = "A:A"  # A열 전체
-        values = loader.service.spreadsheets().values().get(
-            spreadsheetId=sheet_id,
-            range=range_name
-        ).execute()
-
-        rows_data = values.get('values', [])
-        product_rows = []
-
-        for idx, row in enumerate(rows_data[1:], start=2):  # 헤더 제외, 2번 행부터
-            if row and row[0] and str(row[0]).strip():  # 제품 코드가 있으면
-                product_rows.append(idx)
+        product_rows = loader.get_product_rows(sheet_id)
 
         print(f"✅ 총 {len(product_rows)}개 제품 발견")
         return product_rows
@@ -119,35 +120,123 @@ def get_all_product_rows(loader: SheetsLoader, sheet_id: str) -> List[int]:
         return []
 
 
-def generate_product_editable_html(
-    loader: SheetsLoader,
-    builder: ProductDataBuilder,
-    sheet_id: str,
-    row_number: int,
-    editable_dir: Path
-) -> Optional[Dict]:
+def parse_stage_workers(spec: Optional[str]) -> Dict[str, int]:
     """
-    단일 제품 Editable HTML V4 생성
+    단계별 워커 수 파싱 (생략한 단계는 기본값)
 
-    Returns:
-        성공 시 제품 정보 딕셔너리, 실패 시 None
+    Args:
+        spec: "images=8,render=2" 형식 문자열
+
+    Raises:
+        ValueError: 알 수 없는 단계 / 잘못된 숫자
+    """
+    workers = dict(DEFAULT_STAGE_WORKERS)
+    for part in (spec or "").split(","):
+        if not part.strip():
+            continue
+        name, _, value = part.partition("=")
+        name = name.strip()
+        if name not in workers:
+            raise ValueError(f"알 수 없는 단계: {name} (가능: {', '.join(workers)})")
+        count = int(value)
+        if count < 1:
+            raise ValueError(f"{name} 워커 수는 1 이상이어야 합니다")
+        workers[name] = count
+    return workers
+
+
+class PrefetchedImageLoader:
+    """
+    렌더링용 로더 래퍼 - 다운로드 단계가 작업에 담아 둔 이미지 바이트를 사용
+
+    미리 받지 못한 URL만 원래 로더로 다운로드하고, 다운로드 단계에서 실패한 URL은
+    다시 시도하지 않고 같은 오류를 냅니다 (제한기 재시도를 이미 거친 실패).
+    그 밖의 속성은 원래 로더로 위임합니다.
     """
-    try:
-        # 데이터 로드
-        row = loader.load_row(sheet_id, row_number)
 
-        # ProductData 변환
-        product = builder.build_product_data(row)
+    def __init__(self, loader: "SheetsLoader", images: Dict[str, bytes], errors: Dict[str, str]) -> None:
+        """
+        Args:
+            loader: 작업 스레드용 로더
+            images: Drive 파일 ID → 이미지 바이트
+            errors: URL → 다운로드 오류 메시지
+        """
+        self.loader = loader
+        self.images = images
+        self.errors = errors
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+    def download_image(self, drive_url: str, output_path: Path) -> bool:
+        """SheetsLoader.download_image와 같은 계약"""
+        if drive_url in self.errors:
+            raise Exception(self.errors[drive_url])
+        data = self.images.get(self.loader.drive_file_id(drive_url) or "")
+        if data is None:
+            return self.loader.download_image(drive_url, output_path)
+        output_path.write_bytes(data)
+        return True
+
+
+def build_product_pipeline(
+    loader: "SheetsLoader",
+    builder: "ProductDataBuilder",
+    sheet_id: str,
+    editable_dir: Path,
+    stage_workers: Dict[str, int],
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    prefetch_images: bool = True,
+) -> BatchPipeline:
+    """
+    제품 Editable HTML 생성 파이프라인
 
-        # Editable HTML V4 생성
-        html_content = generate_editable_html(product, loader)
+    입력 항목은 (행 번호, 이미 읽은 행 값 또는 None), 결과는 제품 정보 딕셔너리입니다.
+    네트워크를 쓰는 단계는 워커마다 loader.for_worker()로 만든 전용 로더를 사용합니다.
 
-        # 파일 저장
+    Args:
+        prefetch_images: 이미지 다운로드 단계 포함 여부 (스냅샷 번들은 로컬이라 불필요)
+    """
+    from src.editable_html import generate_editable_html
+
+    def fetch_row(worker_loader: "SheetsLoader", job: Tuple[int, Optional[List[str]]]) -> Dict[str, Any]:
+        row_number, row = job
+        if row is None:
+            row = worker_loader.load_row(sheet_id, row_number)
+        return {"row_number": row_number, "row": row}
+
+    def fetch_images(worker_loader: "SheetsLoader", job: Dict[str, Any]) -> Dict[str, Any]:
+        # 행의 Drive 이미지를 작업에 담아 렌더링 단계로 전달 (큐 크기가 보관 개수를 제한)
+        images: Dict[str, bytes] = {}
+        errors: Dict[str, str] = {}
+        for url in drive_urls(job["row"]):
+            file_id = worker_loader.drive_file_id(url)
+            if file_id in images:
+                continue
+            try:
+                images[file_id] = worker_loader.read_image(url)
+            except Exception as e:
+                errors[url] = str(e)
+        job["images"], job["image_errors"] = images, errors
+        return job
+
+    def build(_: Any, job: Dict[str, Any]) -> Dict[str, Any]:
+        job["product"] = builder.build_product_data(job["row"])
+        return job
+
+    def render(worker_loader: "SheetsLoader", job: Dict[str, Any]) -> Dict[str, Any]:
+        if "images" in job:
+            worker_loader = PrefetchedImageLoader(worker_loader, job.pop("images"), job["image_errors"])
+        job["html"] = generate_editable_html(job["product"], worker_loader)
+        return job
+
+    def write(_: Any, job: Dict[str, Any]) -> Dict:
+        product, html_content = job["product"], job.pop("html")
         output_file = editable_dir / f"{product.product_code}_editable_v4.html"
         output_file.write_text(html_content, encoding="utf-8")
 
         return {
-            'row': row_number,
+            'row': job["row_number"],
             'code': product.product_code,
             'name': product.product_name,
             'file': output_file,
@@ -158,11 +247,158 @@ def generate_product_editable_html(
                 for data in product.gallery_by_color.values()
                 if isinstance(data, dict) and 'images' in data
             ),
+            'image_errors': job.get("image_errors", {}),
         }
 
-    except Exception as e:
-        print(f"  ⚠️  Row {row_number} 처리 실패: {e}")
-        return None
+    stages = [Stage("rows", fetch_row, stage_workers["rows"], setup=loader.for_worker)]
+    if prefetch_images:
+        stages.append(Stage("images", fetch_images, stage_workers["images"], setup=loader.for_worker))
+    stages += [
+        Stage("build", build, stage_workers["build"]),
+        Stage("render", render, stage_workers["render"], setup=loader.for_worker),
+        Stage("write", write, stage_workers["write"]),
+    ]
+    return BatchPipeline(stages, queue_size=queue_size)
+
+
+def print_image_errors(result: Dict) -> None:
+    """다운로드에 실패해 페이지에서 빠진 이미지"""
+    errors = result.get('image_errors') or {}
+    if errors:
+        print(f"     ⚠️  이미지 {len(errors)}개 다운로드 실패 (페이지에서 제외):")
+        for error in errors.values():
+            print(f"        - {error}")
+
+
+def print_pipeline_stats(pipeline: BatchPipeline) -> None:
+    """단계별 처리 시간 (span = 워커 합계 / 워커 수, 가장 느린 단계가 전체 시간을 결정)"""
+    stats = pipeline.stats()
+    slowest = max(stats, key=lambda stage: stage["span"])
+    print(f"⏱️  파이프라인 {pipeline.elapsed:.1f}초 (순차 처리 시 약 {sum(s['busy'] for s in stats):.1f}초)")
+    for stage in stats:
+        marker = " ← 병목" if stage is slowest else ""
+        print(
+            f"   {stage['name']:<7} {stage['span']:6.1f}초 "
+            f"({stage['workers']} workers, {stage['items']}개){marker}"
+        )
+
+
+def sync_changed_rows(
+    loader: "SheetsLoader",
+    builder: "ProductDataBuilder",
+    sheet_id: str,
+    output_dir: Path,
+    snapshot: RowSnapshot,
+    stage_workers: Dict[str, int],
+    queue_size: int = DEFAULT_QUEUE_SIZE
+) -> Dict[str, List]:
+    """
+    전체 행을 한 번에 읽어 스냅샷과 비교하고 변경된 제품만 재생성
+
+    날짜가 바뀌어 오늘 폴더에 없는 미변경 제품은 직전 날짜 폴더에서 복사합니다.
+
+    Returns:
+        {'success': [...], 'failed': [코드...], 'copied': [코드...], 'removed': [코드...]}
+    """
+    rows = loader.load_all_rows(sheet_id)
+    diff = snapshot.diff(rows)
+
+    editable_dir, _ = get_today_folder(output_dir)
+    today = editable_dir.parent.name
+    previous_dir = output_dir / snapshot.date_folder / "editable" if snapshot.date_folder else None
+
+    results = {'success': [], 'failed': [], 'copied': [], 'removed': diff.removed}
+    to_generate: List[RowChange] = list(diff.changed)
+
+    for entry in diff.unchanged:
+        target = editable_dir / f"{entry.code}_editable_v4.html"
+        if target.exists():
+            continue
+        source = previous_dir / target.name if previous_dir else None
+        if source is not None and source.exists():
+            shutil.copy2(source, target)
+            results['copied'].append(entry.code)
+        else:
+            to_generate.append(entry)
+
+    print(f"🔍 변경 {len(diff.changed)}개, 미변경 {len(diff.unchanged)}개, 삭제 {len(diff.removed)}개")
+
+    pipeline = build_product_pipeline(loader, builder, sheet_id, editable_dir, stage_workers, queue_size)
+    jobs = [(entry.row_number, entry.row) for entry in to_generate]
+    for done, outcome in enumerate(pipeline.run(jobs), 1):
+        entry = to_generate[outcome.index]
+        if outcome.error is None:
+            result = outcome.value
+            snapshot.record(entry)
+            results['success'].append(result)
+            print(f"[{done}/{len(jobs)}] ✅ {result['code']} - {result['name']} ({result['size']:.1f} MB)")
+            print_image_errors(result)
+        else:
+            # 다음 변경 감지 시 다시 시도
+            print(f"[{done}/{len(jobs)}] ⚠️  Row {entry.row_number} ({entry.code}) 처리 실패 ({outcome.stage}): {outcome.error}")
+            snapshot.forget(entry.code)
+            results['failed'].append(entry.code)
+
+    for code in diff.removed:
+        snapshot.forget(code)
+
+    snapshot.date_folder = today
+    return results
+
+
+def watch_sheet(
+    loader: "SheetsLoader",
+    builder: "ProductDataBuilder",
+    sheet_id: str,
+    output_dir: Path,
+    interval: float,
+    stage_workers: Dict[str, int],
+    queue_size: int = DEFAULT_QUEUE_SIZE
+) -> None:
+    """
+    시트 변경 감시 루프
+
+    interval초마다 Drive 파일 버전만 조회하고(셀 데이터 미포함),
+    버전이 바뀌었을 때만 전체 행을 읽어 변경된 제품을 재생성합니다.
+    """
+    snapshot = RowSnapshot(sheet_id)
+    print(f"👀 시트 변경 감시 시작 ({interval:.0f}초 간격, Ctrl+C로 종료)")
+    if snapshot.version:
+        print(f"   마지막 동기화 버전: {snapshot.version} ({len(snapshot.rows)}개 제품)")
+    print()
+
+    try:
+        while True:
+            try:
+                meta = loader.get_sheet_version(sheet_id)
+                version = meta.get("version")
+
+                if version != snapshot.version:
+                    print(f"🔄 시트 변경 감지: 버전 {snapshot.version} → {version} ({meta.get('modifiedTime')})")
+                    started = time.perf_counter()
+                    results = sync_changed_rows(
+                        loader, builder, sheet_id, output_dir, snapshot, stage_workers, queue_size
+                    )
+                    snapshot.version = version
+                    snapshot.save()
+
+                    print(
+                        f"✅ 동기화 완료: 재생성 {len(results['success'])}개, 실패 {len(results['failed'])}개, "
+                        f"복사 {len(results['copied'])}개 ({time.perf_counter() - started:.1f}초)"
+                    )
+                    if results['failed']:
+                        print(f"   ❌ 실패: {', '.join(results['failed'])}")
+                    if results['removed']:
+                        print(f"   🗑️  시트에서 사라진 제품: {', '.join(results['removed'])}")
+                    print()
+
+            except Exception as e:
+                print(f"⚠️  감시 중 오류 (다음 주기에 재시도): {e}")
+
+            time.sleep(interval)
+
+    except KeyboardInterrupt:
+        print("\n👋 감시 종료")
 
 
 def main():
@@ -180,6 +416,12 @@ def main():
   # 특정 행만 생성
   python scripts/generate_batch.py --rows 2,5,10
 
+  # 시트 변경 감시 (변경된 제품만 재생성)
+  python scripts/generate_batch.py --watch
+
+  # 스냅샷 번들로 생성 (오프라인)
+  python scripts/generate_batch.py --all --snapshot snapshots/20251020
+
 폴더 구조:
   output/{YYYYMMDD}/editable/    # 오늘 날짜 폴더에 생성
   output/{YYYYMMDD}/export/      # 서버가 자동 생성 (익스포트용)
@@ -190,11 +432,48 @@ def main():
     group.add_argument('--start', type=int, help='시작 행 번호')
     group.add_argument('--all', action='store_true', help='모든 제품 생성')
     group.add_argument('--rows', type=str, help='특정 행 번호 (쉼표로 구분, 예: 2,5,10)')
+    group.add_argument('--watch', action='store_true', help='시트 변경 감시 (변경된 제품만 재생성)')
 
     parser.add_argument('--end', type=int, help='종료 행 번호 (--start와 함께 사용)')
+    parser.add_argument('--interval', type=float, default=30, help='--watch 버전 확인 간격 (초, 기본 30)')
+    parser.add_argument('--snapshot', type=Path, help='시트 대신 스냅샷 번들 폴더에서 로드 (scripts/snapshot.py로 캡처)')
+    parser.add_argument('--workers', type=str, help='단계별 워커 수 (예: images=8,render=2, 기본 rows=2,images=4,build=1,render=1,write=1)')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE, help=f'단계 사이 대기 제품 수 (기본 {DEFAULT_QUEUE_SIZE})')
 
     args = parser.parse_args()
 
+    if args.snapshot and args.watch:
+        parser.error("--watch는 스냅샷 번들과 함께 사용할 수 없습니다 (스냅샷은 변하지 않음)")
+
+    try:
+        stage_workers = parse_stage_workers(args.workers)
+    except ValueError as e:
+        parser.error(f"--workers: {e}")
+    if args.queue_size < 1:
+        parser.error("--queue-size는 1 이상이어야 합니다")
+
+    # 행 번호 인자 검증 (무거운 모듈 임포트 전)
+    row_numbers: List[int] = []
+    if args.rows:
+        try:
+            row_numbers = [int(r.strip()) for r in args.rows.split(',')]
+        except ValueError:
+            parser.error(f"--rows 형식이 올바르지 않습니다: {args.rows}")
+    elif args.start:
+        if args.end and args.end < args.start:
+            parser.error(f"--end({args.end})가 --start({args.start})보다 작습니다")
+        row_numbers = list(range(args.start, args.end + 1)) if args.end else [args.start]
+    if any(r < 2 for r in row_numbers):
+        parser.error("행 번호는 2 이상이어야 합니다 (1행은 헤더)")
+
+    from dotenv import load_dotenv
+    from src.sheets_loader.product_builder import ProductDataBuilder
+
+    # .env 파일 로드 (CWD 기준)
+    env_file = cwd / ".env"
+    if env_file.exists():
+        load_dotenv(env_file)
+
     # 환경변수 또는 기본값 (CWD 기준)
     service_account_file = os.getenv(
         "GOOGLE_SERVICE_ACCOUNT_FILE",
@@ -205,25 +484,42 @@ def main():
         "1ipkHdYdQhIAfUBkNUWHkFqcgP0aOXLVO14MYXWscEPk"
     )
 
-    # 설정 검증
-    if not Path(service_account_file).exists():
-        print(f"❌ Service Account 파일을 찾을 수 없습니다: {service_account_file}")
-        sys.exit(1)
-
     print("=" * 60)
     print("🎨 Figma Editable HTML V4 일괄 생성")
     print("=" * 60)
-    print(f"Service Account: {service_account_file}")
-    print(f"Sheet ID: {sheet_id}")
-    print()
 
-    # SheetsLoader 초기화
-    try:
-        loader = SheetsLoader(Path(service_account_file))
-        print("✅ SheetsLoader 초기화 완료")
-    except Exception as e:
-        print(f"❌ SheetsLoader 초기화 실패: {e}")
-        sys.exit(1)
+    if args.snapshot:
+        # 스냅샷 번들: Service Account/Google API 모듈 불필요
+        from src.sheets_loader.snapshot_bundle import SnapshotError, SnapshotLoader
+
+        try:
+            loader = SnapshotLoader(args.snapshot)
+        except SnapshotError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        sheet_id = loader.meta.get("sheet_id", sheet_id)
+        print(f"📦 Snapshot: {args.snapshot} (캡처 {loader.meta.get('captured_at', '-')})")
+        print(f"Sheet ID: {sheet_id}")
+        print()
+    else:
+        from src.sheets_loader.loader import SheetsLoader
+
+        # 설정 검증
+        if not Path(service_account_file).exists():
+            print(f"❌ Service Account 파일을 찾을 수 없습니다: {service_account_file}")
+            sys.exit(1)
+
+        print(f"Service Account: {service_account_file}")
+        print(f"Sheet ID: {sheet_id}")
+        print()
+
+        # SheetsLoader 초기화
+        try:
+            loader = SheetsLoader(Path(service_account_file))
+            print("✅ SheetsLoader 초기화 완료")
+        except Exception as e:
+            print(f"❌ SheetsLoader 초기화 실패: {e}")
+            sys.exit(1)
 
     # ProductDataBuilder 초기화
     builder = ProductDataBuilder(
@@ -240,21 +536,17 @@ def main():
     print(f"📁 익스포트 폴더: output/{today}/export/")
     print()
 
-    # 처리할 행 번호 결정
-    row_numbers = []
+    # 감시 모드
+    if args.watch:
+        watch_sheet(loader, builder, sheet_id, output_dir, args.interval, stage_workers, args.queue_size)
+        return
 
+    # 처리할 행 번호 결정 (--rows/--start는 인자 검증 단계에서 결정)
     if args.all:
         row_numbers = get_all_product_rows(loader, sheet_id)
         if not row_numbers:
             print("❌ 제품을 찾을 수 없습니다")
             sys.exit(1)
-    elif args.rows:
-        row_numbers = [int(r.strip()) for r in args.rows.split(',')]
-    elif args.start:
-        if args.end:
-            row_numbers = list(range(args.start, args.end + 1))
-        else:
-            row_numbers = [args.start]
 
     print()
     print(f"📋 처리 대상: {len(row_numbers)}개 행")
@@ -267,20 +559,28 @@ def main():
         'failed': []
     }
 
-    for idx, row_num in enumerate(row_numbers, 1):
-        print(f"[{idx}/{len(row_numbers)}] Row {row_num} 처리 중...")
-
-        result = generate_product_editable_html(
-            loader, builder, sheet_id, row_num, editable_dir
-        )
+    pipeline = build_product_pipeline(
+        loader, builder, sheet_id, editable_dir, stage_workers, args.queue_size,
+        prefetch_images=not args.snapshot,
+    )
+    jobs = [(row_num, None) for row_num in row_numbers]
 
-        if result:
+    for done, outcome in enumerate(pipeline.run(jobs), 1):
+        row_num = outcome.item[0]
+        if outcome.error is None:
+            result = outcome.value
             results['success'].append(result)
-            print(f"  ✅ {result['code']} - {result['name']}")
+            print(f"[{done}/{len(jobs)}] ✅ Row {row_num}: {result['code']} - {result['name']}")
             print(f"     파일: {result['file'].name} ({result['size']:.1f} MB)")
+            print_image_errors(result)
         else:
+            print(f"[{done}/{len(jobs)}] ⚠️  Row {row_num} 처리 실패 ({outcome.stage}): {outcome.error}")
             results['failed'].append(row_num)
 
+    # 완료 순서 → 행 순서
+    results['success'].sort(key=lambda r: r['row'])
+    results['failed'].sort()
+
     # 최종 요약
     print()
     print("=" * 60)
@@ -288,6 +588,10 @@ def main():
     print("=" * 60)
     print(f"✅ 성공: {len(results['success'])}개")
     print(f"❌ 실패: {len(results['failed'])}개")
+    print_pipeline_stats(pipeline)
+    limiter = getattr(loader, "limiter", None)  # 스냅샷 번들은 API 호출 없음
+    if limiter is not None:
+        print(f"🚦 {limiter.summary()}")
     print()
 
     if results['success']:
@@ -296,7 +600,8 @@ def main():
         for r in results['success']:
             total_size += r['size']
             print(f"   - {r['file'].name}")
-            print(f"     {r['colors']}색, 갤러리 {r['gallery']}장, {r['size']:.1f} MB")
+            missing = f", 이미지 실패 {len(r['image_errors'])}개" if r['image_errors'] else ""
+            print(f"     {r['colors']}색, 갤러리 {r['gallery']}장, {r['size']:.1f} MB{missing}")
         print(f"\n   💾 전체 용량: {total_size:.1f} MB")
 
     if results['failed']:
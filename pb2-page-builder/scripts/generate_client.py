@@ -0,0 +1,108 @@
+"""
+상주 생성 데몬 클라이언트 (표준 라이브러리만 사용, 즉시 시작)
+
+데몬(scripts/daemon.py)이 실행 중이면 생성 요청만 전달하고,
+없으면 generate_editable_html.py를 현재 프로세스로 직접 실행합니다.
+
+실행 방법:
+  python scripts/generate_client.py VD25FPT003
+  python scripts/generate_client.py VD25FPT003 --no-fallback   # 데몬 없으면 실패
+"""
+
+import os
+import sys
+import json
+import argparse
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+scripts_dir = Path(__file__).parent.resolve()
+
+DAEMON_PORT = int(os.getenv('PB2_DAEMON_PORT') or 5002)
+DAEMON_URL = f"http://127.0.0.1:{DAEMON_PORT}"
+
+# 데몬 생존 확인은 짧게, 생성은 이미지 다운로드를 고려해 넉넉하게
+HEALTH_TIMEOUT = 0.5
+GENERATE_TIMEOUT = 600
+
+
+def daemon_available() -> bool:
+    """데몬 응답 여부"""
+    try:
+        with urllib.request.urlopen(f"{DAEMON_URL}/health", timeout=HEALTH_TIMEOUT) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def request_generate(product_code: str, output_dir: Path) -> dict:
+    """
+    데몬에 생성 요청
+
+    Returns:
+        데몬 응답 JSON
+
+    Raises:
+        RuntimeError: 데몬이 오류를 반환한 경우
+    """
+    payload = {"code": product_code, "output_dir": str(output_dir)}
+    sheet_id = os.getenv("GOOGLE_SHEET_ID")
+    if sheet_id:
+        payload["sheet_id"] = sheet_id
+
+    req = urllib.request.Request(
+        f"{DAEMON_URL}/generate",
+        data=json.dumps(payload).encode('utf-8'),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=GENERATE_TIMEOUT) as response:
+            return json.loads(response.read().decode('utf-8'))
+    except urllib.error.HTTPError as e:
+        try:
+            message = json.loads(e.read().decode('utf-8')).get("error", str(e))
+        except ValueError:
+            message = str(e)
+        raise RuntimeError(message)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='상주 데몬으로 단일 제품 Editable HTML 생성')
+    parser.add_argument('product_code', help='제품 코드 (예: VD25FPT003)')
+    parser.add_argument('--no-fallback', action='store_true', help='데몬이 없으면 직접 실행하지 않고 실패')
+    args = parser.parse_args()
+
+    if not daemon_available():
+        if args.no_fallback:
+            print(f"❌ 데몬이 실행 중이 아닙니다: {DAEMON_URL}")
+            print("   시작: python scripts/daemon.py")
+            sys.exit(1)
+        print("ℹ️  데몬 없음 → 직접 실행 (상주 실행: python scripts/daemon.py)")
+        script = scripts_dir / "generate_editable_html.py"
+        os.execv(sys.executable, [sys.executable, str(script), args.product_code])
+
+    output_dir = Path.cwd() / "output"
+    print(f"🔥 데몬으로 생성 요청: {args.product_code}")
+    try:
+        result = request_generate(args.product_code, output_dir)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    except (urllib.error.URLError, OSError) as e:
+        print(f"❌ 데몬 요청 실패: {e}")
+        sys.exit(1)
+
+    timings = result["timings"]
+    print(f"✅ 제품: {result['code']} - {result['name']} ({result['row']}행)")
+    print(f"✅ 파일 생성: {result['file']}")
+    print(f"   파일 크기: {result['size_mb']:.1f} MB")
+    print(
+        f"   ⏱️  조회 {timings['fetch']:.1f}초 / 변환 {timings['build']:.1f}초 / "
+        f"렌더링 {timings['render']:.1f}초"
+    )
+
+
+if __name__ == '__main__':
+    main()
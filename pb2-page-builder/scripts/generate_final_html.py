@@ -21,23 +21,30 @@ import sys
 import base64
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, TYPE_CHECKING
 
 # 프로젝트 루트를 sys.path에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.sheets_loader.loader import SheetsLoader
-from src.sheets_loader.product_builder import ProductDataBuilder
+# generate_html()은 src/editable_html.py에서도 임포트되므로
+# Google API/pydantic 모듈은 main()에서만 임포트
+if TYPE_CHECKING:
+    from src.sheets_loader.loader import SheetsLoader
 
 
-def image_to_base64(sheets_loader: SheetsLoader, image_url: str) -> Optional[str]:
+def image_to_base64(
+    sheets_loader: "SheetsLoader",
+    image_url: str,
+    encoded: Optional[Dict[str, Optional[str]]] = None,
+) -> Optional[str]:
     """
     이미지를 Google Drive에서 다운로드하고 Base64로 변환
 
     Args:
         sheets_loader: SheetsLoader 인스턴스 (Google Drive API 사용)
         image_url: 이미지 URL (Google Drive)
+        encoded: Drive 파일 ID → data URL 캐시 (같은 파일은 한 번만 다운로드/인코딩)
 
     Returns:
         Base64 data URL (예: "data:image/jpeg;base64,...")
@@ -45,6 +52,12 @@ def image_to_base64(sheets_loader: SheetsLoader, image_url: str) -> Optional[str
     if not image_url:
         return None
 
+    if encoded is not None:
+        key = sheets_loader.drive_file_id(image_url) or image_url
+        if key not in encoded:
+            encoded[key] = image_to_base64(sheets_loader, image_url)
+        return encoded[key]
+
     try:
         # 임시 파일에 이미지 다운로드
         with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp_file:
@@ -83,17 +96,26 @@ def generate_html(product, sheets_loader):
 
     print("🖼️  이미지 다운로드 및 Base64 변환 중...")
 
+    # 같은 Drive 파일이 여러 섹션(컬러 이미지 + 갤러리 등)에 쓰여도 한 번만 다운로드
+    encoded: Dict[str, Optional[str]] = {}
+    requested = 0
+
+    def encode(image_url: str) -> Optional[str]:
+        nonlocal requested
+        requested += 1
+        return image_to_base64(sheets_loader, image_url, encoded)
+
     # 1. 메인 이미지 (Product Hero 섹션)
     main_image_base64 = None
     if product.main_image:
         print(f"  - 메인 이미지: {str(product.main_image)[:50]}...")
-        main_image_base64 = image_to_base64(sheets_loader, str(product.main_image))
+        main_image_base64 = encode(str(product.main_image))
 
     # 2. 컬러 이미지 (Color Variants 섹션)
     color_images_base64 = []
     for i, color in enumerate(product.colors, 1):
         print(f"  - 컬러 {i} 이미지 ({color.color_name}): {str(color.color_image)[:50]}...")
-        base64_img = image_to_base64(sheets_loader, str(color.color_image))
+        base64_img = encode(str(color.color_image))
         color_images_base64.append({
             'name': color.color_name,
             'hex': color.color_hex or '#cccccc',
@@ -114,7 +136,7 @@ def generate_html(product, sheets_loader):
 
         base64_list = []
         for img_url in images:
-            base64_img = image_to_base64(sheets_loader, str(img_url))
+            base64_img = encode(str(img_url))
             if base64_img:
                 base64_list.append(base64_img)
         if base64_list:
@@ -127,7 +149,7 @@ def generate_html(product, sheets_loader):
     detail_images_base64 = []
     for i, point in enumerate(product.detail_points, 1):
         print(f"  - 디테일 포인트 {i}: {str(point.detail_image)[:50]}...")
-        base64_img = image_to_base64(sheets_loader, str(point.detail_image))
+        base64_img = encode(str(point.detail_image))
         detail_images_base64.append({
             'image': base64_img,
             'text': point.detail_text
@@ -137,27 +159,27 @@ def generate_html(product, sheets_loader):
     fabric_image_base64 = None
     if product.fabric_info.fabric_image:
         print(f"  - 소재 이미지: {str(product.fabric_info.fabric_image)[:50]}...")
-        fabric_image_base64 = image_to_base64(sheets_loader, str(product.fabric_info.fabric_image))
+        fabric_image_base64 = encode(str(product.fabric_info.fabric_image))
 
     # 6. 체크포인트 이미지 (Check Point 섹션) - 이미지 제거됨, 변환 불필요
     # checkpoint_image_base64 = None
     # if product.checkpoint:
     #     print(f"  - 체크포인트: {str(product.checkpoint.checkpoint_image)[:50]}...")
-    #     checkpoint_image_base64 = image_to_base64(sheets_loader, str(product.checkpoint.checkpoint_image))
+    #     checkpoint_image_base64 = encode(str(product.checkpoint.checkpoint_image))
 
     # 7. 모델 이미지 (Model 섹션)
     model_images_base64 = []
     for i, model in enumerate(product.model_info, 1):
         if model.model_image:
             print(f"  - 모델 {i} 이미지: {str(model.model_image)[:50]}...")
-            base64_img = image_to_base64(sheets_loader, str(model.model_image))
+            base64_img = encode(str(model.model_image))
             model_images_base64.append({
                 'image': base64_img,
                 'measurements': model.model_measurements,
                 'size': model.model_size
             })
 
-    print("✅ 이미지 변환 완료!")
+    print(f"✅ 이미지 변환 완료! ({requested}회 참조 → {len(encoded)}개 고유 파일)")
     print()
 
     # HTML 생성
@@ -572,6 +594,9 @@ def generate_html(product, sheets_loader):
 
 
 def main():
+    from src.sheets_loader.loader import SheetsLoader
+    from src.sheets_loader.product_builder import ProductDataBuilder
+
     # 1. 환경변수 또는 기본값 설정
     service_account_file = os.getenv(
         "GOOGLE_SERVICE_ACCOUNT_FILE",
@@ -6,6 +6,20 @@ Port 5001에서 실행:
 - /editable/<product_code>: 에디터블 HTML 제공 (최신 날짜 폴더)
 - /save-html: HTML 저장 (POST) → export 폴더
 - /save-jpg: JPG 저장 (POST) → export 폴더
+- /save-jpg-tile: 페이지 타일 업로드 (POST, 순서대로) → 마지막 타일 후 JPG 하나로 스티칭 → export 폴더
+- /save-edits: 편집 문서(크롭/텍스트/컬러 변경분) 저장 (POST) → output/edits/<product_code>/vNNNN.json
+- /edits/<product_code>: 저장된 편집 버전 목록, /edits/<product_code>/<version>: 편집 문서 (?diff=N: 버전 간 차이)
+- /materialize/<product_code>: 원본 에디터블 + 편집 문서 → 편집이 반영된 페이지 (?version=N, 기본 최신)
+- /metrics: Prometheus 텍스트 포맷 운영 메트릭
+- /archive/<YYYYMMDD>: 아카이브 멤버 목록 (JSON)
+- /archive/<YYYYMMDD>/<product_code>: 아카이브에서 제품 페이지 하나만 추출해 제공
+- /static/editor/<file>: 에디터 런타임 번들 (해시 파일은 장기 캐시, 고정 이름은 해시 파일로 리다이렉트)
+
+보존 정책 (선택):
+  OUTPUT_QUOTA_MB 설정 시 OUTPUT_RETENTION_INTERVAL초(기본 3600)마다
+  날짜 폴더 + 루트 HTML 크기(archive/ 등 고정 폴더 제외)를 확인하고
+  마지막 수정이 오래된 것부터 삭제
+  (오늘 폴더와 최신 에디터블 폴더는 항상 보존)
 
 폴더 구조:
   output/
@@ -20,15 +34,37 @@ Port 5001에서 실행:
 import os
 import sys
 import base64
+import io
 import json
+import mimetypes
+import shutil
+import time
 from pathlib import Path
 from datetime import datetime
-from flask import Flask, send_file, jsonify, request
+from flask import Flask, send_file, send_from_directory, jsonify, request, redirect
 from flask_cors import CORS
 from dotenv import load_dotenv
 
 # 프로젝트 루트 (모듈 임포트용)
 project_root = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(project_root))
+
+from src.utils.metrics import MetricsRegistry, instrument_flask_app
+from src.utils.storage_index import is_dated_folder, start_retention_thread
+from src.utils.output_archive import ARCHIVE_DIR_NAME, ArchiveError, ArchiveReader, archive_path_for
+from src.utils.tile_stitcher import TileStitchError, TileStitcher
+from src.utils import export_store
+from src.utils.edit_document import (
+    EDITS_DIR_NAME,
+    EditDocumentError,
+    EditStore,
+    diff_documents,
+    materialize_html,
+    source_hash,
+    validate_document,
+    validate_product_code,
+)
+from src.editor_runtime import bundle as runtime_bundle
 
 # .env 파일 로드 (프로젝트 폴더 우선, 없으면 현재 디렉토리)
 env_path = Path.cwd() / ".env"
@@ -39,12 +75,56 @@ else:
     print(f"⚠️ .env 파일 없음: {env_path}")
 
 # Flask 앱 초기화
-app = Flask(__name__)
+app = Flask(__name__, static_folder=None)  # /static/editor는 에디터 런타임 번들 라우트가 처리
 CORS(app)  # CORS 활성화 (브라우저 보안)
 
 # 출력 디렉토리 (환경변수 또는 CWD 기준)
 OUTPUT_DIR = Path(os.getenv('OUTPUT_DIR') or (Path.cwd() / "output"))
 
+# 보존 정책 (OUTPUT_QUOTA_MB 미설정 시 비활성)
+OUTPUT_QUOTA_MB = int(os.getenv('OUTPUT_QUOTA_MB') or 0)
+OUTPUT_RETENTION_INTERVAL = float(os.getenv('OUTPUT_RETENTION_INTERVAL') or 3600)
+
+# 타일 JPG 스티칭 (/save-jpg-tile, 스풀은 output/.tiles)
+TILE_STITCHER = TileStitcher(OUTPUT_DIR / ".tiles")
+
+# 편집 문서 버전 저장소 (/save-edits, output/edits)
+EDIT_STORE = EditStore(OUTPUT_DIR / EDITS_DIR_NAME)
+
+# 운영 메트릭 (/metrics)
+METRICS = MetricsRegistry()
+instrument_flask_app(app, METRICS, namespace="pb2")
+EXPORT_BYTES = METRICS.counter(
+    "pb2_export_received_bytes_total",
+    "Request body bytes received by export routes.",
+    ("route",),
+)
+EXPORT_DECODE_SECONDS = METRICS.histogram(
+    "pb2_export_decode_duration_seconds",
+    "Time spent parsing and decoding export payloads.",
+    ("route",),
+)
+EXPORT_WRITE_SECONDS = METRICS.histogram(
+    "pb2_export_write_duration_seconds",
+    "Time spent writing export files to disk.",
+    ("route",),
+)
+OUTPUT_DISK_FREE = METRICS.gauge(
+    "pb2_output_disk_free_bytes",
+    "Free disk space on the volume holding OUTPUT_DIR.",
+)
+
+
+def _output_disk_free() -> float:
+    """OUTPUT_DIR 볼륨 여유 공간 (없으면 가장 가까운 상위 폴더 기준)"""
+    target = OUTPUT_DIR
+    while not target.exists() and target.parent != target:
+        target = target.parent
+    return shutil.disk_usage(target).free
+
+
+OUTPUT_DISK_FREE.set_function(_output_disk_free)
+
 
 def get_latest_date_folder() -> Path:
     """
@@ -53,10 +133,10 @@ def get_latest_date_folder() -> Path:
     Returns:
         최신 날짜 폴더 Path (없으면 오늘 날짜 폴더 생성)
     """
-    # 숫자로만 구성된 디렉토리 찾기 (YYYYMMDD)
+    # 날짜 폴더 찾기 (YYYYMMDD, cleanup과 같은 판별 함수)
     date_folders = [
         d for d in OUTPUT_DIR.iterdir()
-        if d.is_dir() and d.name.isdigit() and len(d.name) == 8
+        if d.is_dir() and is_dated_folder(d.name)
     ]
 
     if not date_folders:
@@ -86,29 +166,9 @@ def get_export_folder() -> Path:
     return export_dir
 
 
-def get_unique_filename(directory: Path, base_name: str, extension: str) -> Path:
-    """
-    중복 파일명 처리 (자동 suffix 추가)
-
-    Args:
-        directory: 저장 디렉토리
-        base_name: 기본 파일명
-        extension: 확장자 (.html, .jpg)
-
-    Returns:
-        고유한 파일 경로
-    """
-    file_path = directory / f"{base_name}{extension}"
-
-    if not file_path.exists():
-        return file_path
-
-    counter = 1
-    while True:
-        file_path = directory / f"{base_name}_{counter}{extension}"
-        if not file_path.exists():
-            return file_path
-        counter += 1
+def get_protected_folders() -> set:
+    """보존 정책에서 제외할 폴더 (오늘 익스포트 폴더 + 최신 에디터블 폴더)"""
+    return {datetime.now().strftime("%Y%m%d"), get_latest_date_folder().name}
 
 
 @app.route('/')
@@ -204,37 +264,43 @@ def index():
         return f"<h1>❌ Error</h1><p>{str(e)}</p>", 500
 
 
+def editable_candidates(product_code: str) -> list:
+    """제품 코드로 찾을 에디터블 파일 후보 (최신 날짜 폴더, 우선순위 순)"""
+    editable_folder = get_editable_folder()
+
+    # 파일명 패턴 매칭 (예: VD25FPT003_v4 → VD25FPT003_editable_v4.html)
+    # product_code가 _v4로 끝나는 경우 (예: VD25FPT003_v4)
+    if product_code.endswith("_v4"):
+        base_code = product_code[:-3]  # _v4 제거
+        return [
+            editable_folder / f"{base_code}_editable_v4.html",  # VD25FPT003_editable_v4.html
+            editable_folder / f"{product_code}_editable.html",  # VD25FPT003_v4_editable.html
+            editable_folder / f"{product_code}.html",           # VD25FPT003_v4.html
+        ]
+
+    # product_code가 _v4로 끝나지 않는 경우 (예: VD25FPT003)
+    return [
+        editable_folder / f"{product_code}_editable_v4.html",
+        editable_folder / f"{product_code}_editable.html",
+        editable_folder / f"{product_code}.html",
+    ]
+
+
+def find_editable_file(product_code: str):
+    """첫 번째로 존재하는 에디터블 파일 (없으면 None)"""
+    for path in editable_candidates(product_code):
+        if path.exists():
+            return path
+    return None
+
+
 @app.route('/editable/<product_code>')
 def serve_editable(product_code):
     """에디터블 HTML 파일 제공 (최신 날짜 폴더)"""
     try:
         editable_folder = get_editable_folder()
-
-        # 파일명 패턴 매칭 (예: VD25FPT003_v4 → VD25FPT003_editable_v4.html)
-        possible_files = []
-
-        # product_code가 _v4로 끝나는 경우 (예: VD25FPT003_v4)
-        if product_code.endswith("_v4"):
-            base_code = product_code[:-3]  # _v4 제거
-            possible_files = [
-                editable_folder / f"{base_code}_editable_v4.html",  # VD25FPT003_editable_v4.html
-                editable_folder / f"{product_code}_editable.html",  # VD25FPT003_v4_editable.html
-                editable_folder / f"{product_code}.html",           # VD25FPT003_v4.html
-            ]
-        else:
-            # product_code가 _v4로 끝나지 않는 경우 (예: VD25FPT003)
-            possible_files = [
-                editable_folder / f"{product_code}_editable_v4.html",
-                editable_folder / f"{product_code}_editable.html",
-                editable_folder / f"{product_code}.html",
-            ]
-
-        # 첫 번째로 존재하는 파일 찾기
-        file_path = None
-        for path in possible_files:
-            if path.exists():
-                file_path = path
-                break
+        possible_files = editable_candidates(product_code)
+        file_path = find_editable_file(product_code)
 
         if not file_path:
             return f"""<h1>❌ File not found</h1>
@@ -250,11 +316,87 @@ def serve_editable(product_code):
         return f"<h1>❌ Error</h1><p>{str(e)}</p>", 500
 
 
+@app.route('/static/editor/<filename>')
+def serve_editor_runtime(filename):
+    """
+    에디터 런타임 번들 제공
+
+    - editor-v4.{hash}.js/css: 내용이 바뀌면 이름도 바뀌므로 1년 immutable 캐시
+    - editor-v4.js/css (페이지가 참조하는 고정 이름): 현재 해시 파일로 302 (매번 재확인)
+    """
+    bundle = runtime_bundle.read_manifest(OUTPUT_DIR) or runtime_bundle.emit_bundle(OUTPUT_DIR)
+    current = {runtime_bundle.stable_name(kind): getattr(bundle, kind) for kind in runtime_bundle.ASSET_KINDS}
+
+    if filename in current:
+        response = redirect(f"/static/editor/{current[filename]}", code=302)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    if not filename.startswith(f"editor-{runtime_bundle.EDITOR_RUNTIME_VERSION}.") or filename.count('.') != 2:
+        return jsonify({'error': 'Not found'}), 404
+
+    response = send_from_directory(runtime_bundle.editor_dir(OUTPUT_DIR), filename, conditional=True)
+    response.headers['Cache-Control'] = runtime_bundle.IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+def open_archive(date: str) -> ArchiveReader:
+    """날짜 아카이브 열기 (없으면 FileNotFoundError)"""
+    if not is_dated_folder(date):
+        raise FileNotFoundError(date)
+    archive_path = archive_path_for(OUTPUT_DIR / ARCHIVE_DIR_NAME, date)
+    if not archive_path.exists():
+        raise FileNotFoundError(archive_path)
+    return ArchiveReader(archive_path)
+
+
+@app.route('/archive/<date>')
+def list_archive(date):
+    """아카이브 멤버 목록"""
+    try:
+        with open_archive(date) as reader:
+            return jsonify({
+                "date": date,
+                "codec": reader.index["codec"],
+                "members": reader.members()
+            })
+    except FileNotFoundError:
+        return jsonify({"error": f"Archive not found: {date}"}), 404
+    except ArchiveError as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route('/archive/<date>/<product_code>')
+def serve_archived(date, product_code):
+    """
+    아카이브에서 제품 페이지 하나만 추출해 제공 (해당 제품 블록만 해제)
+
+    Query:
+        member: 정확한 멤버 경로 (예: export/VD25FPT003_exported.html), 생략 시 editable → export 순
+    """
+    try:
+        with open_archive(date) as reader:
+            member = request.args.get('member') or reader.find_product(product_code, ("editable/", "export/"))
+            if not member or member not in reader.index["members"]:
+                return f"<h1>❌ File not found</h1><p>Product Code: {product_code}</p><p>Archive: {date}</p>", 404
+            data = reader.read(member)
+
+        mimetype = mimetypes.guess_type(member)[0] or 'application/octet-stream'
+        return send_file(io.BytesIO(data), mimetype=mimetype, download_name=Path(member).name)
+
+    except FileNotFoundError:
+        return f"<h1>❌ Archive not found</h1><p>{date}</p>", 404
+    except ArchiveError as e:
+        return f"<h1>❌ Error</h1><p>{str(e)}</p>", 500
+
+
 @app.route('/save-html', methods=['POST'])
 def save_html():
     """HTML 파일 저장 (현재 날짜 export 폴더)"""
     try:
-        data = request.get_json()
+        EXPORT_BYTES.inc(request.content_length or 0, route='/save-html')
+        with EXPORT_DECODE_SECONDS.time(route='/save-html'):
+            data = request.get_json()
         product_code = data.get('productCode')
         html_content = data.get('htmlContent')
 
@@ -264,21 +406,22 @@ def save_html():
         # 현재 날짜 export 폴더
         export_dir = get_export_folder()
 
-        # 고유한 파일명 생성
-        file_path = get_unique_filename(
-            export_dir,
-            f"{product_code}_exported",
-            ".html"
-        )
-
-        # 파일 저장
-        file_path.write_text(html_content, encoding='utf-8')
-
-        print(f"✅ HTML saved: {file_path}")
+        # 내용 해시 기준 저장 (같은 내용이면 기존 파일 재사용)
+        with EXPORT_WRITE_SECONDS.time(route='/save-html'):
+            stored = export_store.store_bytes(
+                export_dir,
+                f"{product_code}_exported",
+                ".html",
+                html_content.encode('utf-8')
+            )
+
+        file_path = stored.path
+        print(f"✅ HTML saved: {file_path}" if stored.created else f"♻️  HTML unchanged: {file_path}")
         return jsonify({
             "success": True,
             "path": str(file_path),
-            "filename": file_path.name
+            "filename": file_path.name,
+            "deduplicated": not stored.created
         })
 
     except Exception as e:
@@ -290,6 +433,8 @@ def save_html():
 def save_jpg():
     """JPG 파일 저장 (현재 날짜 export 폴더)"""
     try:
+        EXPORT_BYTES.inc(request.content_length or 0, route='/save-jpg')
+        decode_start = time.perf_counter()
         data = request.get_json()
         product_code = data.get('productCode')
         image_data = data.get('imageData')
@@ -332,26 +477,23 @@ def save_jpg():
             base64_part = image_data
 
         image_bytes = base64.b64decode(base64_part)
+        EXPORT_DECODE_SECONDS.observe(time.perf_counter() - decode_start, route='/save-jpg')
         print(f"   디코딩된 바이트 길이: {len(image_bytes)} bytes ({len(image_bytes) / 1024:.1f} KB)")
 
         # 현재 날짜 export 폴더
         export_dir = get_export_folder()
 
-        # 고유한 파일명 생성
-        file_path = get_unique_filename(
-            export_dir,
-            product_code,
-            ".jpg"
-        )
-
-        # 파일 저장
-        file_path.write_bytes(image_bytes)
+        # 내용 해시 기준 저장 (같은 내용이면 기존 파일 재사용)
+        with EXPORT_WRITE_SECONDS.time(route='/save-jpg'):
+            stored = export_store.store_bytes(export_dir, product_code, ".jpg", image_bytes)
 
-        print(f"✅ JPG saved: {file_path}")
+        file_path = stored.path
+        print(f"✅ JPG saved: {file_path}" if stored.created else f"♻️  JPG unchanged: {file_path}")
         return jsonify({
             "success": True,
             "path": str(file_path),
-            "filename": file_path.name
+            "filename": file_path.name,
+            "deduplicated": not stored.created
         })
 
     except Exception as e:
@@ -359,6 +501,184 @@ def save_jpg():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/save-jpg-tile', methods=['POST'])
+def save_jpg_tile():
+    """
+    페이지 타일 JPG 업로드 (요청 본문: 타일 JPG 바이트)
+
+    Query:
+        productCode: 제품 코드
+        session: 익스포트 세션 ID (에디터가 생성)
+        index: 타일 번호 (0부터 순서대로)
+        final: 1이면 마지막 타일 → 스티칭 후 {productCode}.jpg 저장
+        slice: (선택) 마켓 업로드용 조각 높이 (px)
+    """
+    try:
+        EXPORT_BYTES.inc(request.content_length or 0, route='/save-jpg-tile')
+        product_code = request.args.get('productCode', '')
+        session_id = request.args.get('session', '')
+        index = request.args.get('index', type=int)
+        final = request.args.get('final') == '1'
+        slice_height = request.args.get('slice', type=int)
+
+        if not product_code or index is None:
+            return jsonify({"error": "Missing productCode or index"}), 400
+
+        with EXPORT_DECODE_SECONDS.time(route='/save-jpg-tile'):
+            session = TILE_STITCHER.add_tile(session_id, index, request.get_data())
+
+        if not final:
+            return jsonify({"success": True, "received": session.next_index, "height": session.height})
+
+        # 임시 이름으로 스티칭 → 내용 해시 기준으로 최종 이름에 등록
+        export_dir = get_export_folder()
+        tmp_path = export_dir / f".tile-{session_id}.jpg"
+        with EXPORT_WRITE_SECONDS.time(route='/save-jpg-tile'):
+            result = TILE_STITCHER.finish(session_id, tmp_path, slice_height=slice_height)
+            files = [
+                export_store.adopt_file(export_dir, product_code + p.stem[len(tmp_path.stem):], ".jpg", p).path
+                for p in result.files + result.slices
+            ]
+        slices = files[len(result.files):]
+        files = files[:len(result.files)]
+
+        print(f"✅ JPG stitched: {', '.join(p.name for p in files)} "
+              f"({result.width}×{result.height}px, 타일 {result.tiles}개)")
+        if slices:
+            print(f"   ✂️ 조각 {len(slices)}개 ({slice_height}px)")
+
+        return jsonify({
+            "success": True,
+            "path": str(files[0]),
+            "filename": files[0].name,
+            "files": [p.name for p in files],
+            "slices": [p.name for p in slices],
+            "width": result.width,
+            "height": result.height,
+            "tiles": result.tiles
+        })
+
+    except TileStitchError as e:
+        print(f"❌ Save JPG tile error: {e}")
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        print(f"❌ Save JPG tile error: {e}")
+        TILE_STITCHER.abort(request.args.get('session', ''))
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route('/save-edits', methods=['POST'])
+def save_edits():
+    """
+    편집 문서 저장 (요청 본문: {productCode, edits})
+
+    원본 에디터블 파일의 상대 경로/해시를 함께 기록해 /materialize가 같은 원본에 적용합니다.
+    직전 버전과 내용이 같으면 새 버전을 만들지 않습니다.
+    """
+    try:
+        EXPORT_BYTES.inc(request.content_length or 0, route='/save-edits')
+        with EXPORT_DECODE_SECONDS.time(route='/save-edits'):
+            data = request.get_json(silent=True) or {}
+        product_code = data.get('productCode')
+        if not product_code:
+            return jsonify({"error": "Missing productCode"}), 400
+
+        # find_editable_file이 제품 코드로 파일 경로를 만들므로 먼저 검증 (../ 등 거부)
+        validate_product_code(product_code)
+        doc = validate_document(data.get('edits'), product_code)
+        source_path = find_editable_file(product_code)
+        if source_path:
+            doc["source"] = str(source_path.relative_to(OUTPUT_DIR))
+            doc["sourceHash"] = source_hash(source_path.read_bytes())
+
+        with EXPORT_WRITE_SECONDS.time(route='/save-edits'):
+            saved = EDIT_STORE.save(product_code, doc)
+
+        status = "saved" if saved.created else "unchanged"
+        print(f"✅ Edits {status}: {saved.path} ({saved.size / 1024:.1f} KB)")
+        return jsonify({
+            "success": True,
+            "version": saved.version,
+            "created": saved.created,
+            "bytes": saved.size,
+            "path": str(saved.path),
+            "source": doc.get("source")
+        })
+
+    except EditDocumentError as e:
+        print(f"❌ Save edits error: {e}")
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        print(f"❌ Save edits error: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route('/edits/<product_code>')
+def list_edits(product_code):
+    """저장된 편집 버전 목록 (JSON)"""
+    try:
+        versions = EDIT_STORE.versions(product_code)
+    except EditDocumentError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({
+        "productCode": product_code,
+        "versions": versions,
+        "latest": versions[-1] if versions else None
+    })
+
+
+@app.route('/edits/<product_code>/<int:version>')
+def get_edits(product_code, version):
+    """편집 문서 하나 (JSON), ?diff=N이면 N 버전 대비 차이"""
+    try:
+        doc = EDIT_STORE.load(product_code, version)
+        if doc is None:
+            return jsonify({"error": f"편집 버전이 없습니다: {product_code} v{version}"}), 404
+
+        against = request.args.get('diff', type=int)
+        if against is None:
+            return jsonify(doc)
+
+        base = EDIT_STORE.load(product_code, against)
+        if base is None:
+            return jsonify({"error": f"편집 버전이 없습니다: {product_code} v{against}"}), 404
+        return jsonify({"from": against, "to": version, "diff": diff_documents(base, doc)})
+
+    except EditDocumentError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@app.route('/materialize/<product_code>')
+def materialize(product_code):
+    """
+    편집이 반영된 페이지 제공 (원본 에디터블 + 편집 문서)
+
+    브라우저에서 열면 에디터 런타임이 크롭 설정까지 복원하므로,
+    전체 HTML/JPG는 이 페이지의 HTML 다운로드/JPG 버튼으로 필요할 때 생성합니다.
+    """
+    try:
+        validate_product_code(product_code)
+        doc = EDIT_STORE.load(product_code, request.args.get('version', type=int))
+        if doc is None:
+            return f"<h1>❌ 저장된 편집이 없습니다</h1><p>Product Code: {product_code}</p>", 404
+
+        source_path = OUTPUT_DIR / doc["source"] if doc.get("source") else find_editable_file(product_code)
+        if not source_path or not source_path.exists():
+            return f"<h1>❌ 원본 에디터블 파일이 없습니다</h1><p>{doc.get('source') or product_code}</p>", 404
+
+        source_bytes = source_path.read_bytes()
+        if doc.get("sourceHash") and doc["sourceHash"] != source_hash(source_bytes):
+            print(f"⚠️ 원본이 편집 저장 후 변경되었습니다: {source_path.name} (텍스트 ID가 어긋날 수 있음)")
+
+        html = materialize_html(source_bytes.decode('utf-8'), doc)
+        return html, 200, {'Content-Type': 'text/html; charset=utf-8'}
+
+    except EditDocumentError as e:
+        return f"<h1>❌ Error</h1><p>{e}</p>", 400
+    except Exception as e:
+        return f"<h1>❌ Error</h1><p>{str(e)}</p>", 500
+
+
 if __name__ == '__main__':
     # 최신 날짜 폴더 정보
     latest_date_folder = get_latest_date_folder()
@@ -373,8 +693,24 @@ if __name__ == '__main__':
     print(f"📁 에디터블 폴더: {editable_folder}")
     print(f"💾 익스포트 폴더: {export_folder}")
     print(f"🌐 Server URL: http://localhost:5001")
+    print(f"📊 Metrics: http://localhost:5001/metrics")
+    editor_bundle = runtime_bundle.emit_bundle(OUTPUT_DIR)
+    print(f"🧩 에디터 런타임: {editor_bundle.js}, {editor_bundle.css}")
+    if OUTPUT_QUOTA_MB > 0:
+        print(f"🧹 보존 정책: {OUTPUT_QUOTA_MB} MB 초과 시 LRU 삭제 ({OUTPUT_RETENTION_INTERVAL:.0f}초 주기)")
     print("=" * 60)
     print()
 
+    # 쿼터 기반 보존 정책 (백그라운드 데몬 스레드)
+    if OUTPUT_QUOTA_MB > 0:
+        start_retention_thread(
+            OUTPUT_DIR,
+            quota_bytes=OUTPUT_QUOTA_MB * 1024 * 1024,
+            interval_seconds=OUTPUT_RETENTION_INTERVAL,
+            is_dated_folder=is_dated_folder,
+            protected_names=get_protected_folders,
+            root_file_suffixes=('.html', '.htm'),
+        )
+
     # Port 5001에서 실행 (5000은 macOS AirPlay가 사용)
     app.run(host='0.0.0.0', port=5001, debug=False)
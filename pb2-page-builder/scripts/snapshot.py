@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+스냅샷 번들 캡처 - 선택한 제품 행 + 참조 이미지를 로컬 번들 하나로 저장
+
+번들로 생성하면 Google API/네트워크 없이 같은 결과를 재현합니다
+(재생성, 템플릿 실험, 벤치마크를 로컬 디스크 속도로).
+
+실행 방법:
+  # 특정 제품만 캡처
+  python scripts/snapshot.py VD25FPT003 VD25FPT004
+
+  # 코드가 있는 모든 행 캡처
+  python scripts/snapshot.py --all --out snapshots/full
+
+  # 번들로 생성
+  python scripts/generate_batch.py --all --snapshot snapshots/full
+  python scripts/generate_editable_html.py VD25FPT003 --snapshot snapshots/full
+
+번들 구조: src/sheets_loader/snapshot_bundle.py 참고
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가 (모듈 임포트용)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# 현재 작업 디렉토리 (파일 경로용)
+cwd = Path.cwd()
+
+
+def format_size(bytes_size: float) -> str:
+    """바이트를 읽기 쉬운 형식으로 변환"""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if bytes_size < 1024.0:
+            return f"{bytes_size:.1f} {unit}"
+        bytes_size /= 1024.0
+    return f"{bytes_size:.1f} TB"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="제품 행 + 참조 이미지를 오프라인 스냅샷 번들로 캡처",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python scripts/snapshot.py VD25FPT003 VD25FPT004
+  python scripts/snapshot.py --all --out snapshots/full
+
+기존 번들 폴더를 지정하면 행/이미지를 추가·갱신합니다 (이미 있는 이미지는 다시 받지 않음).
+        """
+    )
+    parser.add_argument('codes', nargs='*', help='캡처할 제품 코드')
+    parser.add_argument('--all', action='store_true', help='코드가 있는 모든 행 캡처')
+    parser.add_argument('--out', type=Path, help='번들 폴더 (기본: snapshots/{YYYYMMDD_HHMMSS})')
+
+    args = parser.parse_args()
+    if not args.codes and not args.all:
+        parser.error("제품 코드 또는 --all을 지정하세요")
+    if args.codes and args.all:
+        parser.error("제품 코드와 --all은 함께 사용할 수 없습니다")
+
+    from dotenv import load_dotenv
+    from src.sheets_loader.loader import SheetsLoader
+    from src.sheets_loader.snapshot_bundle import capture_snapshot
+
+    # .env 파일 로드 (CWD 기준)
+    env_file = cwd / ".env"
+    if env_file.exists():
+        load_dotenv(env_file)
+
+    service_account_file = os.getenv(
+        "GOOGLE_SERVICE_ACCOUNT_FILE",
+        str(cwd / "credentials" / "service-account.json")
+    )
+    sheet_id = os.getenv(
+        "GOOGLE_SHEET_ID",
+        "1ipkHdYdQhIAfUBkNUWHkFqcgP0aOXLVO14MYXWscEPk"
+    )
+
+    if not Path(service_account_file).exists():
+        print(f"❌ Service Account 파일을 찾을 수 없습니다: {service_account_file}")
+        sys.exit(1)
+
+    bundle_path = args.out or (cwd / "snapshots" / datetime.now().strftime("%Y%m%d_%H%M%S"))
+
+    print("=" * 60)
+    print("📦 스냅샷 번들 캡처")
+    print("=" * 60)
+    print(f"Sheet ID: {sheet_id}")
+    print(f"대상: {'모든 제품' if args.all else ', '.join(args.codes)}")
+    print(f"번들: {bundle_path}")
+    print()
+
+    try:
+        loader = SheetsLoader(Path(service_account_file))
+        summary = capture_snapshot(loader, sheet_id, bundle_path, codes=None if args.all else args.codes)
+    except Exception as e:
+        print(f"❌ 캡처 실패: {e}")
+        sys.exit(1)
+
+    print()
+    print(f"✅ 행 {summary.rows}개, 이미지 {summary.images}개 ({format_size(summary.image_bytes)})")
+    if summary.missing_codes:
+        print(f"⚠️  시트에 없는 코드: {', '.join(summary.missing_codes)}")
+    if summary.failed_images:
+        print(f"⚠️  다운로드 실패 이미지 {len(summary.failed_images)}개 (번들 생성 시 해당 이미지는 실패 처리)")
+    print()
+    print("💡 번들로 생성:")
+    print(f"   python scripts/generate_batch.py --all --snapshot {bundle_path}")
+
+    if summary.missing_codes or summary.failed_images:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
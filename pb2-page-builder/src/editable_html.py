@@ -0,0 +1,783 @@
+"""
+Editable HTML V4 생성 (라이브러리)
+
+scripts/generate_editable_html.py(단일 제품 CLI)와 scripts/generate_batch.py(일괄 생성)가
+공통으로 사용하는 생성 로직입니다. 임포트만으로는 부작용(sys.path/.env 변경)이 없습니다.
+
+에디터 JS/CSS는 src/editor_runtime/의 공유 번들로 분리되어 있으며,
+페이지를 저장하는 쪽이 output 루트에 번들을 생성합니다 (runtime_bundle.emit_bundle).
+"""
+
+import base64
+import hashlib
+from typing import TYPE_CHECKING
+
+from bs4 import BeautifulSoup
+
+from src.editor_runtime import bundle as runtime_bundle
+
+if TYPE_CHECKING:
+    from src.sheets_loader.loader import SheetsLoader
+
+# 페이지 렌더링용 프레임 규칙 (익스포트 HTML에서도 필요하므로 인라인 유지)
+PAGE_CSS = '''
+        /* Editable image frame */
+        .image-frame {
+            position: relative;
+            overflow: hidden;
+            cursor: move;
+        }
+
+        /* V4: 고정 뷰포트 + 전체 원본 이미지 (position absolute로 변경) */
+        .editable-image {
+            width: auto !important;
+            height: auto !important;
+            max-width: none;
+            max-height: none;
+            position: absolute;
+            top: 0;
+            left: 0;
+            transform-origin: top left;
+            transition: none;
+        }
+        '''
+
+
+def build_image_list(product):
+    """ProductData에서 모든 이미지 리스트 생성"""
+    image_list = []
+
+    # 메인 이미지
+    if product.main_image:
+        image_list.append({
+            "id": "mainImage",
+            "label": "메인 이미지",
+            "type": "main"
+        })
+
+    # 색상 이미지 (color_hex 포함)
+    for i, color in enumerate(product.colors):
+        image_list.append({
+            "id": f"color{i+1}",
+            "label": f"컬러 {color.color_name}",
+            "type": "color",
+            "color_name": color.color_name,
+            "color_hex": color.color_hex
+        })
+
+    # 갤러리 이미지
+    for color_name, images in product.gallery_by_color.items():
+        if isinstance(images, list):
+            for j, img_url in enumerate(images):
+                image_list.append({
+                    "id": f"gallery_{color_name}_{j+1}",
+                    "label": f"{color_name} - 갤러리 {j+1}",
+                    "type": "gallery"
+                })
+
+    # 디테일 포인트 이미지
+    for i, point in enumerate(product.detail_points):
+        image_list.append({
+            "id": f"detail{i+1}",
+            "label": f"디테일 포인트 {i+1}",
+            "type": "detail"
+        })
+
+    # 소재 이미지
+    if product.fabric_info and product.fabric_info.fabric_image:
+        image_list.append({
+            "id": "fabricImage",
+            "label": "소재 이미지",
+            "type": "fabric"
+        })
+
+    # 체크포인트 이미지
+    if product.checkpoint and product.checkpoint.checkpoint_image:
+        image_list.append({
+            "id": "checkpointImage",
+            "label": "체크포인트 이미지",
+            "type": "checkpoint"
+        })
+
+    # 모델 이미지
+    for i, model in enumerate(product.model_info):
+        if model.model_image:
+            image_list.append({
+                "id": f"model{i+1}",
+                "label": f"모델 {i+1}",
+                "type": "model"
+            })
+
+    return image_list
+
+
+def remove_info_sections(soup):
+    """
+    .info 클래스를 가진 div 제거 (제품 정보 박스, 푸터 등)
+    """
+    info_divs = soup.find_all('div', class_='info')
+    removed_count = 0
+    for div in info_divs:
+        div.decompose()
+        removed_count += 1
+
+    if removed_count > 0:
+        print(f"   ✅ {removed_count}개 .info 섹션 제거 완료")
+    return soup
+
+
+def add_color_selector_styles(soup):
+    """
+    Color Selector와 Lifestyle Gallery 섹션의 컬러 칩에 클릭 가능 표시 추가
+    """
+    total_chips = 0
+
+    # 1. Color Selector 섹션 (26x26px 컬러칩)
+    color_selector = soup.find('div', class_='section--color-selector')
+    if color_selector:
+        color_chips = color_selector.find_all('div', style=lambda s: s and '26px' in s)
+        for chip in color_chips:
+            style = chip.get('style', '')
+            if 'cursor' not in style:
+                chip['style'] = style + ' cursor: pointer; transition: transform 0.2s ease;'
+            chip['class'] = chip.get('class', []) + ['color-chip-clickable', 'color-chip-selector']
+        total_chips += len(color_chips)
+        print(f"   ✅ Color Selector: {len(color_chips)}개 컬러 칩 발견")
+    else:
+        print("   ⚠️ Color Selector 섹션을 찾을 수 없습니다")
+
+    # 2. Lifestyle Gallery 섹션 (42x42px 컬러칩)
+    lifestyle_gallery = soup.find('div', class_='section--lifestyle-gallery')
+    if lifestyle_gallery:
+        gallery_chips = lifestyle_gallery.find_all('div', style=lambda s: s and '42px' in s and 'background' in s)
+        for chip in gallery_chips:
+            style = chip.get('style', '')
+            if 'cursor' not in style:
+                chip['style'] = style + ' cursor: pointer; transition: transform 0.2s ease;'
+            chip['class'] = chip.get('class', []) + ['color-chip-clickable', 'color-chip-gallery']
+        total_chips += len(gallery_chips)
+        print(f"   ✅ Lifestyle Gallery: {len(gallery_chips)}개 컬러 칩 발견")
+    else:
+        print("   ⚠️ Lifestyle Gallery 섹션을 찾을 수 없습니다")
+
+    print(f"   ✅ 총 {total_chips}개 컬러 칩에 클릭 표시 추가 완료")
+    return soup
+
+
+def add_gallery_section_indexes(soup, product):
+    """
+    V4.2: 모든 Lifestyle Gallery 섹션에 data-gallery-index와 data-gallery-color 속성 추가
+    """
+    gallery_sections = soup.find_all('div', class_='section--lifestyle-gallery')
+
+    if not gallery_sections:
+        print("   ⚠️ Lifestyle Gallery 섹션을 찾을 수 없습니다")
+        return soup
+
+    # product.colors에서 색상 이름 추출
+    color_names = [color.color_name for color in product.colors] if product.colors else []
+
+    for idx, section in enumerate(gallery_sections):
+        section['data-gallery-index'] = str(idx)
+
+        # 색상 이름 추가 (범위 내에 있으면)
+        if idx < len(color_names):
+            section['data-gallery-color'] = color_names[idx]
+        else:
+            section['data-gallery-color'] = f"색상{idx + 1}"
+
+    print(f"   ✅ {len(gallery_sections)}개 갤러리 섹션에 인덱스 부여 완료")
+    return soup
+
+
+def wrap_images_with_frames_sequential(soup, image_list):
+    """
+    BeautifulSoup으로 이미지를 image-frame으로 감싸기
+
+    순차적 매칭: HTML의 이미지 순서와 image_list 순서가 일치한다고 가정
+    """
+    all_imgs = soup.find_all('img')
+
+    print(f"   총 {len(all_imgs)}개 이미지 발견")
+    print(f"   이미지 리스트: {len(image_list)}개")
+
+    # 순차적으로 매칭
+    for idx, img in enumerate(all_imgs):
+        # 이미 image-frame으로 감싸진 경우 스킵
+        if img.parent and img.parent.get('class') and 'image-frame' in img.parent.get('class', []):
+            continue
+
+        # image_list 범위 내에서 ID 할당
+        if idx < len(image_list):
+            image_id = image_list[idx]["id"]
+        else:
+            # 범위 초과 시 임시 ID
+            image_id = f"unknown_{idx}"
+
+        # div.image-frame으로 감싸기
+        frame = soup.new_tag('div', **{
+            'class': 'image-frame',
+            'data-id': image_id,
+            'style': img.get('style', '')  # 원본 스타일 유지
+        })
+
+        # img 스타일 제거 (frame으로 이동)
+        img['style'] = ''
+        img['class'] = img.get('class', []) + ['editable-image']
+
+        # img를 frame으로 감싸기
+        img.wrap(frame)
+
+    print(f"   ✅ {len(all_imgs)}개 이미지를 image-frame으로 감쌌습니다")
+
+
+def build_sampling_grids(soup):
+    """
+    image-frame별 스포이드 샘플링 그리드 생성 (ColorExtractor.build_sampling_grid)
+
+    이미지 src(base64 data URL)를 디코딩해 평균 색상 그리드를 만듭니다.
+    같은 이미지가 여러 프레임에 쓰이면 한 번만 계산합니다.
+
+    Returns:
+        {image_id: {"w", "h", "rgb"}}
+    """
+    from src.sheets_loader.color_extractor import ColorExtractor
+
+    extractor = ColorExtractor()
+    grids = {}
+    grids_by_src = {}
+
+    for frame in soup.find_all('div', class_='image-frame'):
+        img = frame.find('img')
+        src = img.get('src', '') if img else ''
+        header, _, data = src.partition(',')
+        if not header.startswith('data:image/') or not header.endswith(';base64'):
+            continue
+
+        if src not in grids_by_src:
+            grids_by_src[src] = extractor.build_sampling_grid(base64.b64decode(data))
+        if grids_by_src[src]:
+            grids[frame['data-id']] = grids_by_src[src]
+
+    print(f"   ✅ {len(grids)}개 이미지 샘플링 그리드 생성 ({len(grids_by_src)}개 고유 이미지)")
+    return grids
+
+
+def pool_image_payloads(soup):
+    """
+    이미지 data URL을 페이지 하나의 페이로드 테이블로 모으기 (내용 해시로 중복 제거)
+
+    img src를 비우고 data-payload="p{n}"으로 테이블 항목을 참조하게 합니다.
+    페이지 로드 시 테이블이 Blob object URL로 복원되므로 (runtime_bundle.payload_tags)
+    같은 이미지가 여러 번 쓰여도 페이지에는 한 번만 들어갑니다.
+
+    Returns:
+        {payload_id: [mime, base64]}
+    """
+    payloads = {}
+    ids_by_hash = {}
+    referenced = 0
+
+    for img in soup.find_all('img'):
+        src = img.get('src', '')
+        header, _, data = src.partition(',')
+        if not header.startswith('data:') or not header.endswith(';base64'):
+            continue
+
+        digest = hashlib.sha1(data.encode('ascii')).hexdigest()
+        if digest not in ids_by_hash:
+            payload_id = f"p{len(payloads)}"
+            ids_by_hash[digest] = payload_id
+            payloads[payload_id] = [header[len('data:'):-len(';base64')], data]
+
+        del img['src']
+        img['data-payload'] = ids_by_hash[digest]
+        referenced += 1
+
+    print(f"   ✅ 이미지 {referenced}개 → 페이로드 {len(payloads)}개 (중복 {referenced - len(payloads)}개 제거)")
+    return payloads
+
+
+def defer_gallery_images(soup):
+    """
+    Lifestyle Gallery 이미지를 지연 복원 대상으로 표시
+
+    갤러리는 컬러별 최대 수십 장의 원본 크기 이미지라 로드 시 전부 디코딩하면
+    첫 화면과 탭 메모리 비용이 큽니다. data-defer 이미지는 페이로드 복원 스크립트가
+    화면 근처에 올 때 또는 에디터에서 해당 이미지/컬러를 선택할 때 src를 채웁니다.
+    컬러별 이미지 블록에는 data-gallery-block(컬러명)을 붙여 컬러 단위로 복원합니다.
+    """
+    deferred = 0
+    for section in soup.find_all('div', class_='section--lifestyle-gallery'):
+        color_name = None
+        for block in section.find_all('div', recursive=False):
+            imgs = block.find_all('img')
+            if not imgs:
+                # 컬러 헤더 (컬러칩 + 컬러명)
+                name_span = block.find('span')
+                if name_span:
+                    color_name = name_span.get_text(strip=True)
+                continue
+
+            if color_name:
+                block['data-gallery-block'] = color_name
+            for img in imgs:
+                img['data-defer'] = 'gallery'
+                img['loading'] = 'lazy'
+                img['decoding'] = 'async'
+                deferred += 1
+
+    print(f"   ✅ 갤러리 이미지 {deferred}개 지연 로딩 설정")
+
+
+def assign_text_edit_ids(soup):
+    """
+    텍스트 요소에 data-edit-id(t0, t1 ...) 부여
+
+    편집 문서(/save-edits)는 텍스트 변경분을 이 ID로 기록하고, 같은 원본 페이지에
+    다시 적용합니다 (src/utils/edit_document.py). 대상은 에디터의 텍스트 편집 모드와
+    같은 기준: 이미지를 포함하지 않고 직접 텍스트를 가진 요소입니다.
+    """
+    from bs4 import NavigableString
+    from bs4.element import Comment
+
+    root = soup.find(class_='container') or soup.body or soup
+    assigned = 0
+    for element in root.find_all(True):
+        if element.name in ('script', 'style') or element.find('img'):
+            continue
+        if 'image-frame' in element.get('class', []):
+            continue
+        has_direct_text = any(
+            isinstance(node, NavigableString) and not isinstance(node, Comment) and node.strip()
+            for node in element.contents
+        )
+        if has_direct_text:
+            element['data-edit-id'] = f"t{assigned}"
+            assigned += 1
+
+    print(f"   ✅ 텍스트 요소 {assigned}개에 편집 ID 부여")
+
+
+def generate_editable_html(product, loader: "SheetsLoader") -> str:
+    """
+    Editable HTML 생성 (이미지 편집 가능)
+
+    Args:
+        product: ProductData 인스턴스
+        loader: SheetsLoader 인스턴스 (이미지 다운로드용)
+
+    Returns:
+        HTML 문자열 (중복 제거된 이미지 페이로드 테이블 포함, editable 기능 탑재)
+    """
+    # 기존 generate_html 함수를 import하여 사용
+    # 견고한 import 처리: 플러그인/프로젝트 디렉토리 양쪽 지원
+    try:
+        # 플러그인 디렉토리에서 실행 시 (정상 경로)
+        from scripts.generate_final_html import generate_html as generate_base_html
+    except ModuleNotFoundError:
+        # 프로젝트 디렉토리에서 실행 시 - 플러그인 경로 추가
+        import sys
+        from pathlib import Path
+        plugin_root = Path(__file__).parent.parent
+        if str(plugin_root) not in sys.path:
+            sys.path.insert(0, str(plugin_root))
+        from scripts.generate_final_html import generate_html as generate_base_html
+
+    print("📝 기본 HTML 생성 중...")
+    base_html = generate_base_html(product, loader)
+
+    print("✏️ Editable 기능 추가 중...")
+
+    # BeautifulSoup으로 파싱
+    soup = BeautifulSoup(base_html, 'html.parser')
+
+    # V4 수정 1: .info 섹션 제거 (V3에서 유지)
+    print("   🗑️ .info 섹션 제거 중...")
+    soup = remove_info_sections(soup)
+
+    # V4 수정 2: inline object-fit 제거 함수 **삭제** (이미지 왜곡 방지)
+    print("   ✅ inline object-fit 유지 (이미지 왜곡 방지)")
+
+    # V4 수정 3: Color Selector 컬러 칩에 클릭 표시 (V3에서 유지)
+    print("   🎨 컬러 칩 클릭 표시 추가 중...")
+    soup = add_color_selector_styles(soup)
+
+    # V4.2: 갤러리 섹션에 인덱스 부여
+    print("   📋 갤러리 섹션 인덱스 부여 중...")
+    soup = add_gallery_section_indexes(soup, product)
+
+    # imageList 동적 생성
+    print("   🎯 이미지 리스트 생성 중...")
+    image_list = build_image_list(product)
+    print(f"   총 {len(image_list)}개 이미지 발견")
+
+    # 이미지를 image-frame으로 감싸기 (순차적 매칭)
+    print("   🖼️  이미지 frame 래핑 중...")
+    wrap_images_with_frames_sequential(soup, image_list)
+
+    # 스포이드 샘플링 그리드 (클릭 시 캔버스 디코딩 대신 배열 조회)
+    print("   🎯 스포이드 샘플링 그리드 생성 중...")
+    sampling_grids = build_sampling_grids(soup)
+
+    # 이미지 페이로드 테이블 (중복 이미지는 한 번만 포함, 로드 시 Blob URL로 복원)
+    print("   📦 이미지 페이로드 중복 제거 중...")
+    payloads = pool_image_payloads(soup)
+
+    # 갤러리 이미지는 화면 근처/선택 시에만 디코딩
+    print("   💤 갤러리 이미지 지연 로딩 설정 중...")
+    defer_gallery_images(soup)
+
+    # 편집 문서용 텍스트 ID (변경분 저장/적용 기준)
+    print("   🏷️  텍스트 편집 ID 부여 중...")
+    assign_text_edit_ids(soup)
+
+    # html2canvas 스크립트 추가 (head에)
+    head = soup.find('head')
+    if head:
+        html2canvas_script = soup.new_tag('script', src='https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.1/html2canvas.min.js')
+        head.append(html2canvas_script)
+
+    # CSS 추가 (V4: object-fit 수정) - 렌더링에 필요한 프레임 규칙만 인라인, 에디터 UI는 런타임 번들
+    style_tag = soup.find('style')
+    if style_tag:
+        style_tag.string = style_tag.string + PAGE_CSS
+    if head:
+        head.append(BeautifulSoup(runtime_bundle.head_tags(), 'html.parser'))
+
+    # Control panel HTML 생성 (V4: 스포이드 도구 개선)
+    control_panel_html = f'''
+    <div class="control-panel">
+        <h3 style="margin: 0 0 20px 0; font-size: 18px; font-weight: bold; text-align: center; border-bottom: 2px solid #333; padding-bottom: 10px;">
+            이미지 편집 도구
+        </h3>
+
+        <!-- V4: Real Eyedropper Tool -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #f0f8ff; border-radius: 6px; border-left: 4px solid #0066cc;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600; color: #003d82;">🎨 스포이드 도구</h4>
+            <button id="eyedropper-btn" onclick="activateEyedropper()" style="width: 100%; padding: 10px; background: #0066cc; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 13px; font-weight: 600; margin-bottom: 10px;">
+                🔍 스포이드 활성화
+            </button>
+            <div id="eyedropper-status" style="font-size: 12px; color: #666; line-height: 1.5;">
+                💡 버튼 클릭 → 이미지 클릭 → 색상 추출 (Shift+클릭: 원본 해상도)
+            </div>
+            <div id="eyedropper-result" class="color-display" style="display: none; margin-top: 10px;">
+                <div id="extracted-swatch" class="color-swatch"></div>
+                <div style="flex: 1;">
+                    <div id="extracted-hex" style="font-weight: bold; font-size: 13px; font-family: 'Courier New', monospace;"></div>
+                    <div style="font-size: 11px; color: #666;">추출된 색상</div>
+                </div>
+            </div>
+        </div>
+
+        <!-- Page Zoom -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #e7f3ff; border-radius: 6px;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600;">🖥️ 페이지 줌</h4>
+            <div>
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    화면 표시: <span id="page-zoom-value" style="font-weight: bold; color: #0066cc;">60%</span>
+                </label>
+                <input type="range" id="page-zoom" min="30" max="100" value="60" step="5" style="width: 100%;">
+            </div>
+        </div>
+
+        <!-- Image Selector -->
+        <div style="margin-bottom: 20px;">
+            <label style="display: block; margin-bottom: 8px; font-size: 13px; font-weight: 600;">📷 이미지 선택</label>
+            <select id="image-select" style="width: 100%; padding: 8px; font-size: 13px; border: 1px solid #ccc; border-radius: 4px;">
+                <!-- Options populated by JavaScript -->
+            </select>
+        </div>
+
+        <!-- Image Replace Section -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #fff8dc; border-radius: 6px; border-left: 4px solid #ffa500;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600; color: #cc6600;">🖼️ 이미지 교체</h4>
+
+            <!-- Option 1: Internal Image Selection (Thumbnail Grid) -->
+            <div style="margin-bottom: 15px;">
+                <label style="display: block; margin-bottom: 8px; font-size: 12px; font-weight: 600;">
+                    내부 이미지 선택 (썸네일 클릭)
+                </label>
+
+                <!-- Thumbnail Grid Container -->
+                <div id="thumbnail-grid" style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 8px; max-height: 300px; overflow-y: auto; padding: 8px; background: #f9f9f9; border-radius: 4px; margin-bottom: 10px;">
+                    <!-- Thumbnails populated by JavaScript -->
+                </div>
+
+                <button onclick="replaceFromInternal()" style="width: 100%; padding: 8px; background: #28a745; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 12px; font-weight: 600;">
+                    ✅ 적용
+                </button>
+            </div>
+
+            <!-- Option 2: File Upload -->
+            <div style="margin-bottom: 10px;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px; font-weight: 600;">
+                    파일 업로드
+                </label>
+                <input type="file" id="replace-image-file" accept="image/*" style="width: 100%; padding: 6px; font-size: 11px; border: 1px solid #ccc; border-radius: 4px; margin-bottom: 8px;">
+                <button onclick="replaceFromFile()" style="width: 100%; padding: 8px; background: #007bff; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 12px; font-weight: 600;">
+                    📤 업로드 및 적용
+                </button>
+            </div>
+
+            <!-- Crop Settings Option -->
+            <div style="margin-top: 12px; padding-top: 10px; border-top: 1px solid #ddd;">
+                <label style="display: flex; align-items: center; gap: 8px; font-size: 12px; cursor: pointer; margin-bottom: 8px;">
+                    <input type="checkbox" id="keep-crop-settings" checked style="cursor: pointer;">
+                    <span>크롭 설정 유지</span>
+                </label>
+                <div style="font-size: 10px; color: #666; margin-top: 8px; line-height: 1.5; background: #f0f8ff; padding: 8px; border-radius: 4px;">
+                    💡 <strong>전체 원본 이미지가 이미 로드되어 있습니다!</strong><br>
+                    확대/이동 슬라이더로 숨겨진 영역까지 자유롭게 탐색할 수 있습니다.
+                </div>
+            </div>
+        </div>
+
+        <!-- Image Add Section (NEW) -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #e8f5e9; border-radius: 6px; border-left: 4px solid #4caf50;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600; color: #2e7d32;">➕ 이미지 추가 (갤러리)</h4>
+
+            <!-- Color Selection -->
+            <div style="margin-bottom: 10px;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px; font-weight: 600;">
+                    컬러 선택
+                </label>
+                <select id="add-image-color-select" style="width: 100%; padding: 6px; font-size: 12px; border: 1px solid #ccc; border-radius: 4px; margin-bottom: 8px;">
+                    <option value="">-- 컬러 선택 --</option>
+                </select>
+            </div>
+
+            <!-- File Upload -->
+            <div style="margin-bottom: 10px;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px; font-weight: 600;">
+                    이미지 파일
+                </label>
+                <input type="file" id="add-image-file" accept="image/*" style="width: 100%; padding: 6px; font-size: 11px; border: 1px solid #ccc; border-radius: 4px; margin-bottom: 8px;">
+            </div>
+
+            <button onclick="addImageToGallery()" style="width: 100%; padding: 10px; background: #4caf50; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 12px; font-weight: 600;">
+                ✅ 갤러리에 추가
+            </button>
+
+            <div style="font-size: 10px; color: #2e7d32; margin-top: 8px; line-height: 1.5;">
+                💡 선택한 컬러의 라이프스타일 갤러리에 이미지 컨테이너가 추가됩니다.
+            </div>
+        </div>
+
+        <!-- Image Delete Section -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #ffe6e6; border-radius: 6px; border-left: 4px solid #dc3545;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600; color: #c82333;">🗑️ 이미지 삭제</h4>
+            <div style="font-size: 11px; color: #721c24; margin-bottom: 10px; padding: 8px; background: #f8d7da; border-radius: 4px;">
+                ⚠️ 삭제된 이미지는 투명 영역으로 대체됩니다
+            </div>
+            <button onclick="deleteCurrentImage()" style="width: 100%; padding: 10px; background: #dc3545; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 12px; font-weight: 600;">
+                ❌ 선택한 이미지 삭제
+            </button>
+        </div>
+
+        <!-- Position Controls -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #f8f9fa; border-radius: 6px;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600;">🎯 위치 조절</h4>
+
+            <div style="margin-bottom: 12px;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    좌우 (X): <span id="x-value" style="font-weight: bold; color: #007bff;">100%</span>
+                </label>
+                <input type="range" id="position-x" min="0" max="200" value="100" step="1" style="width: 100%;">
+            </div>
+
+            <div style="margin-bottom: 0;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    상하 (Y): <span id="y-value" style="font-weight: bold; color: #007bff;">100%</span>
+                </label>
+                <input type="range" id="position-y" min="0" max="200" value="100" step="1" style="width: 100%;">
+            </div>
+        </div>
+
+        <!-- Scale Control -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #f8f9fa; border-radius: 6px;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600;">🔍 확대/축소</h4>
+            <div>
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    크기: <span id="scale-value" style="font-weight: bold; color: #28a745;">100%</span>
+                </label>
+                <input type="range" id="scale" min="50" max="500" value="100" step="1" style="width: 100%;">
+            </div>
+        </div>
+
+        <!-- Reset Buttons -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #f8d7da; border-radius: 6px;">
+            <h4 style="margin: 0 0 10px 0; font-size: 14px; font-weight: 600;">🔄 리셋</h4>
+            <button onclick="resetCurrentImage()" style="width: 100%; padding: 8px; margin-bottom: 8px; background: #dc3545; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 12px; font-weight: 600;">
+                현재 이미지 리셋
+            </button>
+        </div>
+
+        <!-- Gap Control (V4.3: Unified Gallery/Detail/Hero) -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #e8f5e9; border-radius: 6px;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600;">📐 이미지 간격 조정</h4>
+
+            <!-- V4.3: Gap Type Selector -->
+            <div style="margin-bottom: 10px;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    조정 대상:
+                </label>
+                <select id="gap-type-selector" style="width: 100%; padding: 6px; border: 1px solid #2e7d32; border-radius: 4px; font-size: 12px; background: white; cursor: pointer;">
+                    <option value="gallery">갤러리 이미지 간격</option>
+                    <option value="detail">디테일 섹션 간격</option>
+                    <option value="hero">히어로-상품명 간격</option>
+                </select>
+            </div>
+
+            <!-- V4.3: Gallery Section Selector (conditionally visible) -->
+            <div id="gallery-section-selector-wrapper" style="margin-bottom: 10px;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    섹션 선택:
+                </label>
+                <select id="gallery-section-selector" style="width: 100%; padding: 6px; border: 1px solid #2e7d32; border-radius: 4px; font-size: 12px; background: white; cursor: pointer;">
+                    <option value="all">전체 갤러리 (일괄 적용)</option>
+                    <!-- 섹션 옵션은 JavaScript에서 동적 생성 -->
+                </select>
+            </div>
+
+            <div>
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    간격: <span id="gap-value" style="font-weight: bold; color: #2e7d32;">21px</span>
+                </label>
+                <input type="range" id="gap-slider" min="0" max="300" value="21" step="1" style="width: 100%;">
+            </div>
+
+            <div id="gap-help-text" style="font-size: 10px; color: #2e7d32; margin-top: 8px; line-height: 1.5;">
+                💡 갤러리 섹션의 이미지 간격을 조절합니다.
+            </div>
+        </div>
+
+        <!-- Text Box Size Control (V4.2: Click to Select) -->
+        <div id="text-box-control" style="display: none; margin-bottom: 20px; padding: 15px; background: #fff8e1; border-radius: 6px;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600;">📏 텍스트 박스 크기 조절</h4>
+
+            <div style="margin-bottom: 10px; padding: 8px; background: #fff; border-radius: 4px; border: 1px solid #f57c00;">
+                <div style="font-size: 11px; font-weight: 600; color: #666; margin-bottom: 5px;">선택된 요소:</div>
+                <div id="selected-text-info" style="font-size: 12px; color: #333;">없음</div>
+                <button id="deselect-text" onclick="deselectTextElement()" style="margin-top: 8px; width: 100%; padding: 6px; background: #dc3545; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 11px; font-weight: 600;">
+                    선택 해제
+                </button>
+            </div>
+
+            <div style="margin-bottom: 10px;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    너비 (Width): <span id="text-width-value" style="font-weight: bold; color: #f57c00;">auto</span>
+                </label>
+                <input type="range" id="text-width" min="50" max="2000" value="200" step="10" style="width: 100%;">
+            </div>
+
+            <div style="margin-bottom: 10px;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    높이 (Height): <span id="text-height-value" style="font-weight: bold; color: #f57c00;">auto</span>
+                </label>
+                <input type="range" id="text-height" min="20" max="500" value="50" step="5" style="width: 100%;">
+            </div>
+
+            <div style="margin-bottom: 0;">
+                <label style="display: block; margin-bottom: 5px; font-size: 12px;">
+                    글자 크기 (Font Size): <span id="text-fontsize-value" style="font-weight: bold; color: #f57c00;">14px</span>
+                </label>
+                <input type="range" id="text-fontsize" min="8" max="100" value="14" step="1" style="width: 100%;">
+            </div>
+
+            <div style="font-size: 10px; color: #f57c00; margin-top: 8px; line-height: 1.5;">
+                💡 텍스트 요소를 클릭하여 선택한 후 크기를 조절하세요.
+            </div>
+        </div>
+
+        <!-- Text Edit Mode Toggle + Format Tools -->
+        <div style="margin-bottom: 20px; padding: 15px; background: #fff3cd; border-radius: 6px; border-left: 4px solid #ffc107;">
+            <h4 style="margin: 0 0 12px 0; font-size: 14px; font-weight: 600; color: #856404;">✏️ 텍스트 편집</h4>
+            <label style="display: flex; align-items: center; gap: 8px; font-size: 12px; cursor: pointer; margin-bottom: 12px;">
+                <input type="checkbox" id="text-edit-mode" onchange="toggleTextEditing()" style="cursor: pointer;">
+                <span>텍스트 편집 모드</span>
+            </label>
+
+            <!-- Format Toolbar (shown when edit mode is active) -->
+            <div id="format-toolbar" style="display: none; margin-top: 12px; padding: 10px; background: #fff; border-radius: 4px; border: 1px solid #ddd;">
+                <div style="margin-bottom: 8px; font-size: 11px; font-weight: 600; color: #666;">서식 도구:</div>
+
+                <div style="display: flex; gap: 6px; margin-bottom: 10px;">
+                    <button onclick="formatText('bold')" style="flex: 1; padding: 8px; background: #333; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 12px; font-weight: bold;" title="볼드 (Ctrl+B)">
+                        <b>B</b> 볼드
+                    </button>
+                    <button onclick="formatText('removeFormat')" style="flex: 1; padding: 8px; background: #dc3545; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 11px;" title="서식 제거">
+                        ❌ 제거
+                    </button>
+                </div>
+
+                <div style="margin-bottom: 0;">
+                    <label style="display: block; margin-bottom: 6px; font-size: 11px; font-weight: 600;">글씨 크기:</label>
+                    <div style="display: flex; gap: 6px; align-items: center;">
+                        <button onclick="decreaseFontSize()" style="padding: 8px 12px; background: #6c757d; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 16px; font-weight: bold;" title="글씨 크기 감소 (바로 적용)">
+                            −
+                        </button>
+                        <input type="number" id="font-size-input" value="24" min="10" max="100" step="1" style="flex: 1; padding: 8px; border: 1px solid #ddd; border-radius: 4px; text-align: center; font-size: 12px;" />
+                        <button onclick="increaseFontSize()" style="padding: 8px 12px; background: #6c757d; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 16px; font-weight: bold;" title="글씨 크기 증가 (바로 적용)">
+                            +
+                        </button>
+                    </div>
+                </div>
+            </div>
+
+            <div style="font-size: 10px; color: #856404; margin-top: 8px; line-height: 1.5;">
+                💡 텍스트를 선택한 후 서식 도구를 사용하세요.
+            </div>
+        </div>
+
+        <!-- Export Buttons -->
+        <div style="margin-top: 20px; display: flex; gap: 10px; flex-direction: column;">
+            <button onclick="saveEdits()" style="width: 100%; padding: 12px; background: #6f42c1; color: white; border: none; border-radius: 6px; cursor: pointer; font-size: 14px; font-weight: bold;" title="크롭/텍스트/컬러 변경분만 저장 (수 KB)">
+                💾 편집 저장 (변경분)
+            </button>
+            <button onclick="exportHTML()" style="width: 100%; padding: 12px; background: #28a745; color: white; border: none; border-radius: 6px; cursor: pointer; font-size: 14px; font-weight: bold;">
+                ✅ HTML 다운로드
+            </button>
+            <button onclick="exportAsJPG()" style="width: 100%; padding: 12px; background: #007bff; color: white; border: none; border-radius: 6px; cursor: pointer; font-size: 14px; font-weight: bold;">
+                🖼️ 전체 페이지 JPG (타일링)
+            </button>
+            <input type="number" id="jpg-slice-height" min="500" step="100" placeholder="마켓 조각 높이 (px, 선택)" title="입력하면 JPG를 이 높이마다 잘라 조각 파일도 저장합니다 (서버 저장 시)" style="width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 6px; font-size: 13px; box-sizing: border-box;">
+        </div>
+    </div>
+    '''
+
+    # 에디터 런타임 (src/editor_runtime/editor.js) - 페이지에는 제품별 설정과 번들 참조만 포함
+    javascript_code = runtime_bundle.payload_tags(payloads) + "\n" + runtime_bundle.body_tags({
+        "productCode": product.product_code,
+        "imageList": image_list,
+        "samplingGrids": sampling_grids,
+    })
+
+    # body 태그 처리: 기존 컨텐츠를 .container로 감싸기
+    body = soup.find('body')
+    if body:
+        # 기존 body의 모든 컨텐츠를 가져오기
+        body_contents = list(body.children)
+
+        # 기존 컨텐츠를 div.container로 감싸기
+        container = soup.new_tag('div', **{'class': 'container'})
+
+        # body를 비우고 container 추가
+        body.clear()
+        body.append(container)
+
+        # 기존 컨텐츠를 container에 추가
+        for content in body_contents:
+            container.append(content)
+
+        # Control panel을 body 맨 앞에 추가
+        control_panel_soup = BeautifulSoup(control_panel_html, 'html.parser')
+        body.insert(0, control_panel_soup)
+
+        # 설정 + 런타임 스크립트를 body 맨 끝에 추가
+        script_soup = BeautifulSoup(javascript_code, 'html.parser')
+        body.append(script_soup)
+
+    print("✅ Editable HTML V4 완성!")
+
+    return str(soup)
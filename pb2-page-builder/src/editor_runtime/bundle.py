@@ -0,0 +1,205 @@
+"""
+에디터 런타임 번들 - 에디터 JS/CSS를 콘텐츠 해시 정적 파일로 한 번만 생성
+
+출력 구조 (output/static/editor/):
+  editor-v4.{hash}.js / .css   # 불변 파일 (서버가 장기 캐시 헤더로 제공)
+  editor-v4.js / .css          # 최신 번들 사본 (페이지가 참조하는 고정 이름)
+  editor-v4.json               # 매니페스트: 고정 이름 → 현재 해시 파일
+
+페이지는 고정 이름을 상대 경로로 참조하므로 file://로 열어도 동작하고,
+서버는 고정 이름 요청을 현재 해시 파일로 리다이렉트합니다.
+에디터 수정은 번들만 다시 생성하면 (서버 재시작) 기존 페이지에 바로 반영됩니다.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+EDITOR_RUNTIME_VERSION = "v4"  # 페이지 ↔ 런타임 계약 버전 (window.PB2_EDITOR 형식)
+STATIC_DIR_NAME = "static"     # output/ 아래 정적 파일 폴더
+EDITOR_DIR_NAME = "editor"
+
+# 페이지 기준 상대 경로: output/{날짜}/editable/*.html, /editable/<code>, /archive/<날짜>/<code>
+# 모두 두 단계 위가 output 루트(서버 루트)
+RUNTIME_URL = f"../../{STATIC_DIR_NAME}/{EDITOR_DIR_NAME}"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+ASSET_DIR = Path(__file__).parent
+ASSET_KINDS = ("js", "css")
+
+
+class RuntimeBundle(NamedTuple):
+    """생성된 번들 정보 (해시 파일 이름)"""
+    version: str
+    js: str
+    css: str
+
+
+def editor_dir(output_dir: Path) -> Path:
+    """번들 폴더 (output/static/editor)"""
+    return output_dir / STATIC_DIR_NAME / EDITOR_DIR_NAME
+
+
+def stable_name(kind: str) -> str:
+    """페이지가 참조하는 고정 파일 이름 (예: editor-v4.js)"""
+    return f"editor-{EDITOR_RUNTIME_VERSION}.{kind}"
+
+
+def manifest_name() -> str:
+    return f"editor-{EDITOR_RUNTIME_VERSION}.json"
+
+
+def content_hash(data: bytes) -> str:
+    """파일 이름용 콘텐츠 해시 (sha256 앞 12자리)"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def load_assets() -> Dict[str, bytes]:
+    """런타임 소스 파일 (src/editor_runtime/editor.js, editor.css)"""
+    return {kind: (ASSET_DIR / f"editor.{kind}").read_bytes() for kind in ASSET_KINDS}
+
+
+def _write_if_changed(path: Path, data: bytes) -> None:
+    """내용이 다를 때만 원자적으로 쓰기"""
+    if path.exists() and path.read_bytes() == data:
+        return
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def emit_bundle(output_dir: Path) -> RuntimeBundle:
+    """
+    번들 생성/갱신 (내용이 같으면 파일을 다시 쓰지 않음)
+
+    Args:
+        output_dir: output 루트
+
+    Returns:
+        RuntimeBundle
+    """
+    target = editor_dir(output_dir)
+    target.mkdir(parents=True, exist_ok=True)
+
+    names = {}
+    for kind, data in load_assets().items():
+        hashed = f"editor-{EDITOR_RUNTIME_VERSION}.{content_hash(data)}.{kind}"
+        _write_if_changed(target / hashed, data)
+        _write_if_changed(target / stable_name(kind), data)
+        names[kind] = hashed
+
+    bundle = RuntimeBundle(EDITOR_RUNTIME_VERSION, names["js"], names["css"])
+    manifest = json.dumps(bundle._asdict(), indent=2).encode("utf-8")
+    _write_if_changed(target / manifest_name(), manifest)
+    return bundle
+
+
+def read_manifest(output_dir: Path) -> Optional[RuntimeBundle]:
+    """현재 번들 매니페스트 (없으면 None)"""
+    path = editor_dir(output_dir) / manifest_name()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return RuntimeBundle(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def head_tags() -> str:
+    """페이지 <head>에 넣을 런타임 스타일 참조"""
+    return f'<link rel="stylesheet" href="{RUNTIME_URL}/{stable_name("css")}">'
+
+
+# 이미지 페이로드 테이블 → Blob object URL 복원 (런타임 번들이 없어도 이미지가 보이도록 인라인)
+# data-defer 이미지(갤러리)는 화면 근처에 올 때(IntersectionObserver) 또는
+# window.PB2_HYDRATE(root) 호출 시(에디터 선택/익스포트)에만 src를 채워 디코딩을 미룸
+HYDRATE_PAYLOADS_JS = """(function () {
+    var table = document.getElementById('pb2-payloads');
+    if (!table) return;
+    var payloads = JSON.parse(table.textContent);
+    table.remove();
+    var urls = {};
+    Object.keys(payloads).forEach(function (id) {
+        var binary = atob(payloads[id][1]);
+        var bytes = new Uint8Array(binary.length);
+        for (var i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+        urls[id] = URL.createObjectURL(new Blob([bytes], { type: payloads[id][0] }));
+    });
+    var deferred = [];
+    document.querySelectorAll('img[data-payload]').forEach(function (img) {
+        var url = urls[img.getAttribute('data-payload')];
+        if (!url) return;
+        if (img.hasAttribute('data-defer')) {
+            img.setAttribute('data-deferred-src', url);
+            deferred.push(img);
+        } else {
+            img.src = url;
+        }
+    });
+    function hydrate(img) {
+        var url = img.getAttribute('data-deferred-src');
+        if (!url) return;
+        img.removeAttribute('data-deferred-src');
+        img.src = url;
+    }
+    function hydrateWithin(el) {
+        if (el.hasAttribute('data-deferred-src')) hydrate(el);
+        el.querySelectorAll('img[data-deferred-src]').forEach(hydrate);
+    }
+    var observer = 'IntersectionObserver' in window ? new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (!entry.isIntersecting) return;
+            observer.unobserve(entry.target);
+            hydrateWithin(entry.target);
+        });
+    }, { rootMargin: '1500px 0px' }) : null;
+    deferred.forEach(function (img) {
+        var frame = img.closest('.image-frame') || img;
+        if (observer) observer.observe(frame); else hydrate(img);
+    });
+    window.PB2_HYDRATE = function (root) {
+        var imgs = Array.prototype.slice.call((root || document).querySelectorAll('img[data-deferred-src]'));
+        if (root && root.hasAttribute && root.hasAttribute('data-deferred-src')) imgs.push(root);
+        imgs.forEach(function (img) {
+            img.loading = 'eager';
+            hydrate(img);
+        });
+        return Promise.all(imgs.map(function (img) {
+            return img.decode ? img.decode().catch(function () {}) : null;
+        }));
+    };
+})();"""
+
+
+def payload_tags(payloads: Dict[str, Any]) -> str:
+    """
+    페이지 <body> 끝에 넣을 이미지 페이로드 테이블 + 복원 스크립트
+
+    Args:
+        payloads: {payload_id: [mime, base64]} (img[data-payload]가 참조)
+    """
+    if not payloads:
+        return ""
+    # base64/MIME 문자열에는 "<"가 없으므로 JSON 그대로 삽입
+    payload_json = json.dumps(payloads, separators=(",", ":"))
+    return (
+        f'<script id="pb2-payloads" type="application/json">{payload_json}</script>\n'
+        f"<script>{HYDRATE_PAYLOADS_JS}</script>"
+    )
+
+
+def body_tags(config: Dict[str, Any]) -> str:
+    """
+    페이지 <body> 끝에 넣을 제품별 설정 + 런타임 스크립트 참조
+
+    Args:
+        config: window.PB2_EDITOR 값 (productCode, imageList)
+    """
+    # </script> 조기 종료 방지
+    config_json = json.dumps(config, ensure_ascii=False).replace("</", "<\\/")
+    return (
+        f"<script>window.PB2_EDITOR = {config_json};</script>\n"
+        f'<script src="{RUNTIME_URL}/{stable_name("js")}"></script>'
+    )
@@ -0,0 +1,2592 @@
+/*
+ * PB2 Editable HTML V4 에디터 런타임
+ *
+ * 페이지마다 인라인으로 넣던 에디터 스크립트를 공유 번들로 분리한 것입니다.
+ * 제품별 값은 페이지가 이 스크립트보다 먼저 선언하는 window.PB2_EDITOR에서 읽습니다:
+ *   window.PB2_EDITOR = { productCode: "...", imageList: [...], samplingGrids: {...} }
+ * /materialize 페이지는 저장된 편집 문서를 window.PB2_EDITS로 함께 넣습니다.
+ */
+
+// Product code for localStorage
+const productCode = window.PB2_EDITOR.productCode;
+
+// Image list (generated from ProductData)
+const imageList = window.PB2_EDITOR.imageList;
+
+// 스포이드 샘플링 그리드: image_id -> {w, h, rgb(base64, 행 우선 RGB)} (생성 시 미리 평균)
+const samplingGrids = window.PB2_EDITOR.samplingGrids || {};
+const decodedGrids = {};
+
+// 편집 문서 (/save-edits): 크롭 설정 + 텍스트/컬러 변경분
+const EDIT_FORMAT = 'pb2-edits/1';
+const baseEdits = window.PB2_EDITS || null;            // /materialize로 연 페이지의 편집 문서
+const textBaseline = {};                                // data-edit-id -> 로드 시 innerHTML
+const chosenColors = Object.assign({}, baseEdits ? baseEdits.colors : {});  // 컬러명 -> 칩 색상
+
+// Crop settings storage (V4: version field added)
+const cropSettings = {
+    version: 'v4',  // V4 version identifier for localStorage
+    productCode: productCode,
+    images: {}
+};
+
+// Initialize crop settings
+imageList.forEach(img => {
+    cropSettings.images[img.id] = { x: 100, y: 100, scale: 100 };
+});
+
+// Current selected image
+let currentImageId = imageList.length > 0 ? imageList[0].id : null;
+
+// Selected thumbnail for replacement
+let selectedThumbnailId = null;
+
+// Page zoom level
+let pageZoom = 60;
+
+// Drag state
+let isDragging = false;
+let startX, startY, startObjX, startObjY;
+
+// V4: Eyedropper state
+let eyedropperActive = false;
+let extractedColor = null;
+
+// V4: Text edit mode
+let textEditMode = false;
+
+// V4.1: Gallery gap and text padding
+// V4.2: Changed to per-section gallery gaps
+// V4.3: Unified gap settings for gallery/detail/hero
+let gapSettings = {
+    gallery: {all: 21},  // Stores: section_index -> gap_px, all -> gap_px
+    detail: 161,           // Detail section gap (single value)
+    hero: 60               // Hero to product name spacing (single value)
+};
+let currentGapType = 'gallery';         // Current gap type being edited
+let selectedGallerySection = 'all';     // Selected gallery section (only for gallery type)
+
+// V4.2: Text box size control (replaced padding)
+let selectedTextElement = null;  // Currently selected text element
+let textElementIdCounter = 0;    // Auto-increment ID for text elements
+let textSizes = {};              // Stores: element_id -> (width, height, fontSize)
+
+// V4: Toggle text editing
+function toggleTextEditing() {
+    textEditMode = !textEditMode;
+    const formatToolbar = document.getElementById('format-toolbar');
+
+    if (textEditMode) {
+        // Show format toolbar
+        formatToolbar.style.display = 'block';
+
+        // Enable text editing on all text elements
+        document.querySelectorAll('.container *').forEach(el => {
+            // 텍스트를 포함하고 이미지가 아닌 요소만
+            if (el.childNodes.length > 0 &&
+                !el.querySelector('img') &&
+                !el.classList.contains('control-panel') &&
+                !el.classList.contains('image-frame') &&
+                !el.closest('.control-panel')) {
+
+                // 직접 텍스트 노드를 포함하는 요소만
+                let hasDirectText = false;
+                el.childNodes.forEach(node => {
+                    if (node.nodeType === Node.TEXT_NODE && node.textContent.trim()) {
+                        hasDirectText = true;
+                    }
+                });
+
+                if (hasDirectText || (el.innerText && el.innerText.trim() && el.children.length === 0)) {
+                    el.setAttribute('contenteditable', 'true');
+                    el.style.outline = '1px dashed #007bff';
+                    el.style.outlineOffset = '2px';
+                }
+            }
+        });
+        console.log('✏️ 텍스트 편집 모드 활성화');
+    } else {
+        // Hide format toolbar
+        formatToolbar.style.display = 'none';
+
+        // Disable text editing
+        document.querySelectorAll('[contenteditable="true"]').forEach(el => {
+            el.removeAttribute('contenteditable');
+            el.style.outline = '';
+            el.style.outlineOffset = '';
+        });
+        console.log('✏️ 텍스트 편집 모드 비활성화');
+    }
+}
+
+// Format text (bold or remove formatting)
+function formatText(command) {
+    if (!textEditMode) {
+        alert('⚠️ 먼저 텍스트 편집 모드를 활성화하세요!');
+        return;
+    }
+
+    try {
+        if (command === 'bold') {
+            document.execCommand('bold', false, null);
+            console.log('✅ 볼드 적용');
+        } else if (command === 'removeFormat') {
+            document.execCommand('removeFormat', false, null);
+            console.log('✅ 서식 제거');
+        }
+    } catch (e) {
+        console.error('서식 적용 실패:', e);
+        alert('❌ 서식 적용 실패: ' + e.message);
+    }
+}
+
+// Apply font size to selected text (helper function)
+function applyFontSizeToSelection(size) {
+    if (!textEditMode) {
+        alert('⚠️ 먼저 텍스트 편집 모드를 활성화하세요!');
+        return false;
+    }
+
+    try {
+        const selection = window.getSelection();
+        if (!selection.rangeCount) {
+            alert('⚠️ 텍스트를 먼저 선택하세요!');
+            return false;
+        }
+
+        const range = selection.getRangeAt(0);
+        const selectedText = range.toString();
+
+        if (!selectedText) {
+            alert('⚠️ 텍스트를 먼저 선택하세요!');
+            return false;
+        }
+
+        // Create a span element with the desired font size
+        const span = document.createElement('span');
+        span.style.fontSize = size;
+        span.textContent = selectedText;
+
+        // Replace the selected text with the span
+        range.deleteContents();
+        range.insertNode(span);
+
+        // Re-select the newly inserted span to maintain selection
+        const newRange = document.createRange();
+        newRange.selectNodeContents(span);
+        selection.removeAllRanges();
+        selection.addRange(newRange);
+
+        console.log(`✅ 글씨 크기 ${size} 적용`);
+        return true;
+    } catch (e) {
+        console.error('글씨 크기 변경 실패:', e);
+        alert('❌ 글씨 크기 변경 실패: ' + e.message);
+        return false;
+    }
+}
+
+// Decrease font size and apply immediately
+function decreaseFontSize() {
+    const input = document.getElementById('font-size-input');
+    const currentSize = parseInt(input.value);
+    const newSize = Math.max(10, currentSize - 2);  // Min 10px
+    input.value = newSize;
+
+    // Apply immediately
+    applyFontSizeToSelection(newSize + 'px');
+}
+
+// Increase font size and apply immediately
+function increaseFontSize() {
+    const input = document.getElementById('font-size-input');
+    const currentSize = parseInt(input.value);
+    const newSize = Math.min(100, currentSize + 2);  // Max 100px
+    input.value = newSize;
+
+    // Apply immediately
+    applyFontSizeToSelection(newSize + 'px');
+}
+
+// Initialize
+function init() {
+    console.log('✅ Editable mode V4.2 initialized');
+    console.log(`📷 Total images: ${imageList.length}`);
+    populateImageSelect();
+    populateThumbnailGrid();  // NEW: Populate thumbnail grid instead of dropdown
+    populateAddImageColorSelect();  // NEW: Populate color dropdown for adding images
+    populateGallerySectionSelector();  // V4.2: Populate gallery section dropdown
+    captureTextBaseline();
+    loadSettings();
+    setupImageLoadCrop();
+    applyPageZoom();
+    applyGap();              // V4.3 FIX: Apply gallery gap (per-section)
+    setupEventListeners();
+    setupColorChipHandlers();
+    selectImage(currentImageId);
+}
+
+// V4.2: Populate gallery section selector dropdown
+function populateGallerySectionSelector() {
+    const selector = document.getElementById('gallery-section-selector');
+    const sections = document.querySelectorAll('.section--lifestyle-gallery[data-gallery-index]');
+
+    sections.forEach(section => {
+        const index = section.getAttribute('data-gallery-index');
+        const color = section.getAttribute('data-gallery-color');
+        const option = document.createElement('option');
+        option.value = index;
+        option.textContent = `${color} 갤러리`;
+        selector.appendChild(option);
+    });
+
+    console.log(`📋 갤러리 섹션 드롭다운 생성: ${sections.length}개`);
+}
+
+// Populate image dropdown
+function populateImageSelect() {
+    const select = document.getElementById('image-select');
+    imageList.forEach(img => {
+        const option = document.createElement('option');
+        option.value = img.id;
+        option.textContent = img.label;
+        select.appendChild(option);
+    });
+}
+
+// Populate thumbnail grid
+function populateThumbnailGrid() {
+    const grid = document.getElementById('thumbnail-grid');
+    if (!grid) {
+        console.error('❌ Thumbnail grid not found');
+        return;
+    }
+
+    // Clear existing thumbnails
+    grid.innerHTML = '';
+
+    imageList.forEach(img => {
+        // Find the actual image element in the DOM
+        const frame = document.querySelector(`[data-id="${img.id}"]`);
+        const imgElement = frame?.querySelector('.editable-image');
+
+        if (!imgElement) {
+            console.warn(`⚠️ Image not found for ${img.id}`);
+            return;
+        }
+
+        // Create thumbnail container
+        const thumbnailDiv = document.createElement('div');
+        thumbnailDiv.className = 'thumbnail-item';
+        thumbnailDiv.setAttribute('data-image-id', img.id);
+
+        // Create thumbnail image
+        const thumbnailImg = document.createElement('img');
+        thumbnailImg.src = imgElement.src || imgElement.getAttribute('data-deferred-src') || '';
+        thumbnailImg.alt = img.label;
+        thumbnailImg.loading = 'lazy';
+        thumbnailImg.decoding = 'async';
+
+        // Create label
+        const label = document.createElement('div');
+        label.className = 'thumbnail-label';
+        label.textContent = img.label;
+
+        // Append elements
+        thumbnailDiv.appendChild(thumbnailImg);
+        thumbnailDiv.appendChild(label);
+
+        // Add click handler
+        thumbnailDiv.addEventListener('click', () => {
+            selectThumbnail(img.id);
+        });
+
+        grid.appendChild(thumbnailDiv);
+    });
+
+    console.log(`🖼️ ${imageList.length}개 썸네일 생성 완료`);
+}
+
+// Select thumbnail for replacement
+function selectThumbnail(imageId) {
+    // Remove previous selection
+    document.querySelectorAll('.thumbnail-item').forEach(item => {
+        item.classList.remove('selected');
+    });
+
+    // Add selection to clicked thumbnail
+    const selectedThumbnail = document.querySelector(`.thumbnail-item[data-image-id="${imageId}"]`);
+    if (selectedThumbnail) {
+        selectedThumbnail.classList.add('selected');
+        selectedThumbnailId = imageId;
+
+        // Find image info
+        const imageInfo = imageList.find(img => img.id === imageId);
+        const label = imageInfo ? imageInfo.label : imageId;
+
+        console.log(`👉 썸네일 선택: ${label}`);
+    }
+}
+
+// Populate add image color dropdown
+function populateAddImageColorSelect() {
+    const select = document.getElementById('add-image-color-select');
+
+    // Extract unique color names from imageList (color type only)
+    const colorNames = new Set();
+    imageList.forEach(img => {
+        if (img.type === 'color' && img.color_name) {
+            colorNames.add(img.color_name);
+        }
+    });
+
+    // Add options
+    colorNames.forEach(colorName => {
+        const option = document.createElement('option');
+        option.value = colorName;
+        option.textContent = colorName;
+        select.appendChild(option);
+    });
+
+    // 컬러 선택 시 해당 컬러 갤러리 이미지 복원 (지연 로딩 블록)
+    select.addEventListener('change', () => {
+        if (!select.value) return;
+        const block = document.querySelector(
+            `.section--lifestyle-gallery [data-gallery-block="${CSS.escape(select.value)}"]`
+        );
+        if (block) hydrateImages(block);
+    });
+
+    console.log(`🎨 컬러 드롭다운에 ${colorNames.size}개 컬러 추가됨`);
+}
+
+// Add image to gallery
+function addImageToGallery() {
+    const colorSelect = document.getElementById('add-image-color-select');
+    const fileInput = document.getElementById('add-image-file');
+
+    // Validation
+    if (!colorSelect.value) {
+        alert('⚠️ 컬러를 먼저 선택하세요!');
+        return;
+    }
+
+    if (!fileInput.files || fileInput.files.length === 0) {
+        alert('⚠️ 이미지 파일을 선택하세요!');
+        return;
+    }
+
+    const selectedColor = colorSelect.value;
+    const file = fileInput.files[0];
+
+    if (!file.type.startsWith('image/')) {
+        alert('❌ 이미지 파일만 업로드할 수 있습니다!');
+        return;
+    }
+
+    // Read file as base64
+    const reader = new FileReader();
+    reader.onload = function(e) {
+        const imageData = e.target.result;
+
+        // Find lifestyle gallery section
+        const lifestyleGallery = document.querySelector('.section--lifestyle-gallery');
+        if (!lifestyleGallery) {
+            alert('❌ 라이프스타일 갤러리 섹션을 찾을 수 없습니다!');
+            return;
+        }
+
+        // Find or create color group container
+        let colorContainer = null;
+        const allContainers = lifestyleGallery.querySelectorAll('[style*="margin-bottom: 56px"]');
+
+        // Search for existing color container
+        allContainers.forEach(container => {
+            const colorChip = container.querySelector('[style*="42px"][style*="background"]');
+            if (colorChip) {
+                const colorNameSpan = colorChip.parentElement?.querySelector('span');
+                if (colorNameSpan && colorNameSpan.textContent.trim() === selectedColor) {
+                    colorContainer = container;
+                }
+            }
+        });
+
+        // Create new color container if not found
+        if (!colorContainer) {
+            alert(`⚠️ "${selectedColor}" 컬러의 갤러리 섹션을 찾을 수 없습니다.\n\n빈 컨테이너 생성 기능은 아직 구현되지 않았습니다.`);
+            return;
+        }
+
+        // Create new image frame
+        const newImageId = `gallery_${selectedColor}_added_${Date.now()}`;
+
+        // Create image-frame div
+        const imageFrame = document.createElement('div');
+        imageFrame.className = 'image-frame';
+        imageFrame.setAttribute('data-id', newImageId);
+        imageFrame.style.cssText = 'width: 580px; height: 773px; margin-bottom: 20px; position: relative; overflow: hidden; cursor: move;';
+
+        // Create img element
+        const img = document.createElement('img');
+        img.className = 'editable-image';
+        img.src = imageData;
+        img.style.cssText = 'position: absolute; top: 0; left: 0; width: auto; height: auto; max-width: none; max-height: none; transform-origin: top left;';
+
+        // Append
+        imageFrame.appendChild(img);
+
+        // Find grid container (첫 번째 grid 컨테이너)
+        const gridContainer = colorContainer.querySelector('[style*="display: grid"]');
+        if (gridContainer) {
+            gridContainer.appendChild(imageFrame);
+        } else {
+            alert('❌ 이미지 그리드 컨테이너를 찾을 수 없습니다!');
+            return;
+        }
+
+        // Add to imageList
+        imageList.push({
+            id: newImageId,
+            label: `${selectedColor} - 추가됨`,
+            type: 'gallery'
+        });
+
+        // Add to cropSettings
+        cropSettings.images[newImageId] = { x: 100, y: 100, scale: 100 };
+
+        // Wait for image to load, then apply transform
+        img.onload = function() {
+            const frameWidth = imageFrame.offsetWidth;
+            const frameHeight = imageFrame.offsetHeight;
+            const imgWidth = img.naturalWidth;
+            const imgHeight = img.naturalHeight;
+
+            const scaleX = frameWidth / imgWidth;
+            const scaleY = frameHeight / imgHeight;
+            const baseScale = Math.max(scaleX, scaleY);
+
+            img.style.transform = `translate(0px, 0px) scale(${baseScale})`;
+
+            console.log(`✅ 이미지 추가 완료: ${newImageId}`);
+            alert(`✅ "${selectedColor}" 갤러리에 이미지가 추가되었습니다!\n\n이미지를 클릭하여 편집할 수 있습니다.`);
+
+            // Select the new image
+            selectImage(newImageId);
+
+            // Re-setup event listeners for new image
+            setupEventListeners();
+        };
+
+        // Clear file input
+        fileInput.value = '';
+    };
+
+    reader.onerror = function() {
+        alert('❌ 파일 읽기 실패!');
+    };
+
+    reader.readAsDataURL(file);
+}
+
+// Replace from internal image
+function replaceFromInternal() {
+    if (!selectedThumbnailId) {
+        alert('⚠️ 썸네일 그리드에서 교체할 이미지를 선택하세요!');
+        return;
+    }
+
+    if (!currentImageId) {
+        alert('⚠️ 먼저 편집할 이미지를 선택하세요!');
+        return;
+    }
+
+    const sourceFrame = document.querySelector(`[data-id="${selectedThumbnailId}"]`);
+    const sourceImg = sourceFrame?.querySelector('.editable-image');
+    if (!sourceImg) {
+        alert('❌ 선택한 이미지를 찾을 수 없습니다!');
+        return;
+    }
+
+    const keepCrop = document.getElementById('keep-crop-settings').checked;
+    replaceImageSrc(sourceImg.src, keepCrop);
+}
+
+// Replace from file upload
+function replaceFromFile() {
+    const fileInput = document.getElementById('replace-image-file');
+    if (!fileInput.files || fileInput.files.length === 0) {
+        alert('⚠️ 업로드할 파일을 선택하세요!');
+        return;
+    }
+
+    if (!currentImageId) {
+        alert('⚠️ 먼저 편집할 이미지를 선택하세요!');
+        return;
+    }
+
+    const file = fileInput.files[0];
+    if (!file.type.startsWith('image/')) {
+        alert('❌ 이미지 파일만 업로드할 수 있습니다!');
+        return;
+    }
+
+    const reader = new FileReader();
+    reader.onload = function(e) {
+        const keepCrop = document.getElementById('keep-crop-settings').checked;
+        replaceImageSrc(e.target.result, keepCrop);
+        fileInput.value = '';
+    };
+    reader.onerror = function() {
+        alert('❌ 파일 읽기 실패!');
+    };
+    reader.readAsDataURL(file);
+}
+
+// Core replacement logic (고정 뷰포트 + 전체 원본 이미지)
+function replaceImageSrc(newSrc, keepCrop) {
+    const frame = document.querySelector(`[data-id="${currentImageId}"]`);
+    const img = frame?.querySelector('.editable-image');
+    if (!img) {
+        alert('❌ 이미지를 찾을 수 없습니다!');
+        return;
+    }
+
+    // Replace image (frame size remains fixed)
+    img.src = newSrc;
+
+    // 생성 시 만든 샘플링 그리드는 이전 이미지 기준 → 원본 캔버스로 추출
+    delete samplingGrids[currentImageId];
+    delete decodedGrids[currentImageId];
+
+    // Reset crop settings if not keeping
+    if (!keepCrop) {
+        cropSettings.images[currentImageId] = { x: 100, y: 100, scale: 100 };
+        updateSliders();
+        applyCurrentCrop();
+    }
+
+    autoSave();
+    console.log(`✅ 이미지 교체 완료: ${currentImageId}`);
+    alert(`✅ 이미지가 교체되었습니다!\n${keepCrop ? '크롭 설정 유지됨' : '크롭 설정 리셋됨'}\n\n💡 전체 원본 이미지가 로드되었습니다. 확대/이동으로 숨겨진 영역을 탐색하세요!`);
+}
+
+// Delete current image
+function deleteCurrentImage() {
+    if (!currentImageId) {
+        alert('⚠️ 먼저 삭제할 이미지를 선택하세요!');
+        return;
+    }
+
+    // Find image info
+    const imageInfo = imageList.find(img => img.id === currentImageId);
+    const imageName = imageInfo ? imageInfo.label : currentImageId;
+
+    // Confirmation dialog
+    const confirmed = confirm(`⚠️ "${imageName}" 이미지를 삭제하시겠습니까?\n\n삭제된 영역은 제거되고 아래 콘텐츠가 위로 올라옵니다.`);
+    if (!confirmed) {
+        return;
+    }
+
+    // Find frame
+    const frame = document.querySelector(`[data-id="${currentImageId}"]`);
+    if (!frame) {
+        alert('❌ 이미지를 찾을 수 없습니다!');
+        return;
+    }
+
+    // Animate and remove from DOM
+    frame.style.transition = 'all 0.3s ease';
+    frame.style.height = '0';
+    frame.style.opacity = '0';
+    frame.style.marginBottom = '0';
+    frame.style.overflow = 'hidden';
+
+    // Remove from DOM after animation
+    setTimeout(() => {
+        frame.remove();
+        console.log(`🗑️ 이미지 삭제 완료: ${imageName}`);
+
+        // Select first available image
+        const remainingFrames = document.querySelectorAll('.image-frame');
+        if (remainingFrames.length > 0) {
+            const firstFrame = remainingFrames[0];
+            const firstId = firstFrame.getAttribute('data-id');
+            selectImage(firstId);
+        } else {
+            currentImageId = null;
+        }
+    }, 300);
+
+    alert(`✅ "${imageName}" 이미지가 삭제됩니다!\n\n아래 콘텐츠가 위로 올라옵니다.`);
+}
+
+// V4: Activate Eyedropper Tool
+function activateEyedropper() {
+    eyedropperActive = true;
+    document.body.classList.add('eyedropper-active');
+    document.getElementById('eyedropper-status').innerHTML = '🎯 <strong>이미지를 클릭하세요!</strong> (ESC로 취소)';
+    document.getElementById('eyedropper-btn').style.background = '#ff6b6b';
+    document.getElementById('eyedropper-btn').textContent = '❌ 취소 (ESC)';
+    console.log('🔍 스포이드 도구 활성화');
+}
+
+// V4: Deactivate Eyedropper Tool
+function deactivateEyedropper() {
+    eyedropperActive = false;
+    document.body.classList.remove('eyedropper-active');
+    document.getElementById('eyedropper-status').innerHTML = '💡 버튼 클릭 → 이미지 클릭 → 색상 추출 (Shift+클릭: 원본 해상도)';
+    document.getElementById('eyedropper-btn').style.background = '#0066cc';
+    document.getElementById('eyedropper-btn').textContent = '🔍 스포이드 활성화';
+    console.log('🔍 스포이드 도구 비활성화');
+}
+
+// RGB -> HEX
+function rgbToHex(r, g, b) {
+    return '#' + [r, g, b].map(c => {
+        const hex = c.toString(16);
+        return hex.length === 1 ? '0' + hex : hex;
+    }).join('');
+}
+
+// Click position -> 이미지 내 상대 좌표 (0~1, 크롭/줌 transform 반영)
+function relativeClickPosition(imgElement, clientX, clientY) {
+    const rect = imgElement.getBoundingClientRect();
+    return {
+        fx: Math.min(Math.max((clientX - rect.left) / rect.width, 0), 1),
+        fy: Math.min(Math.max((clientY - rect.top) / rect.height, 0), 1)
+    };
+}
+
+// 샘플링 그리드 조회 (O(1), 그리드가 없으면 null)
+function sampleFromGrid(imageId, fx, fy) {
+    const grid = samplingGrids[imageId];
+    if (!grid) return null;
+
+    if (!decodedGrids[imageId]) {
+        const binary = atob(grid.rgb);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        decodedGrids[imageId] = bytes;
+    }
+
+    const col = Math.min(grid.w - 1, Math.floor(fx * grid.w));
+    const row = Math.min(grid.h - 1, Math.floor(fy * grid.h));
+    const offset = (row * grid.w + col) * 3;
+    const bytes = decodedGrids[imageId];
+    return rgbToHex(bytes[offset], bytes[offset + 1], bytes[offset + 2]);
+}
+
+// 원본 해상도 캔버스 캐시 (src별 1회 디코딩)
+const samplingCanvases = new Map();
+
+async function getSamplingCanvas(src) {
+    if (!samplingCanvases.has(src)) {
+        samplingCanvases.set(src, loadImage(src).then(img => {
+            const canvas = document.createElement('canvas');
+            canvas.width = img.naturalWidth;
+            canvas.height = img.naturalHeight;
+            const ctx = canvas.getContext('2d', { willReadFrequently: true });
+            ctx.drawImage(img, 0, 0);
+            return { canvas, ctx };
+        }).catch(err => {
+            samplingCanvases.delete(src);
+            throw new Error('이미지 로드 실패');
+        }));
+    }
+    return samplingCanvases.get(src);
+}
+
+// 원본 해상도 5x5 평균 (getImageData 1회)
+async function sampleFromCanvas(imgElement, fx, fy) {
+    const { canvas, ctx } = await getSamplingCanvas(imgElement.src);
+    const size = 5;
+    const halfSize = Math.floor(size / 2);
+    const pixelX = Math.floor(fx * canvas.width);
+    const pixelY = Math.floor(fy * canvas.height);
+
+    const left = Math.max(0, pixelX - halfSize);
+    const top = Math.max(0, pixelY - halfSize);
+    const right = Math.min(canvas.width, pixelX + halfSize + 1);
+    const bottom = Math.min(canvas.height, pixelY + halfSize + 1);
+    const data = ctx.getImageData(left, top, right - left, bottom - top).data;
+
+    let r = 0, g = 0, b = 0;
+    const count = data.length / 4;
+    for (let i = 0; i < data.length; i += 4) {
+        r += data[i];
+        g += data[i + 1];
+        b += data[i + 2];
+    }
+    return rgbToHex(Math.round(r / count), Math.round(g / count), Math.round(b / count));
+}
+
+// V4: Extract color from image (기본: 샘플링 그리드, Shift+클릭 또는 그리드 없음: 원본 캔버스)
+async function extractColorFromImage(imgElement, clientX, clientY, fullPrecision = false) {
+    const { fx, fy } = relativeClickPosition(imgElement, clientX, clientY);
+    const frame = imgElement.closest('.image-frame');
+    const imageId = frame ? frame.getAttribute('data-id') : null;
+
+    if (!fullPrecision && imageId) {
+        const hex = sampleFromGrid(imageId, fx, fy);
+        if (hex) return hex;
+    }
+    return await sampleFromCanvas(imgElement, fx, fy);
+}
+
+// V4: Color Chip 핸들러 (Lifestyle Gallery + Color Selector 동기화)
+function setupColorChipHandlers() {
+    // Get all clickable chips from both sections
+    const allColorChips = document.querySelectorAll('.color-chip-clickable');
+    console.log(`🎨 총 컬러 칩 ${allColorChips.length}개 발견`);
+
+    // Build a map of color names to chip elements
+    const colorChipsByName = {};
+
+    allColorChips.forEach(chip => {
+        // Find the color name from the sibling text (span with color name)
+        const parent = chip.parentElement;
+        if (!parent) return;
+
+        const colorNameSpan = parent.querySelector('span');
+        if (!colorNameSpan) return;
+
+        const colorName = colorNameSpan.textContent.trim();
+        if (!colorName) return;
+
+        // Group chips by color name
+        if (!colorChipsByName[colorName]) {
+            colorChipsByName[colorName] = [];
+        }
+        colorChipsByName[colorName].push(chip);
+    });
+
+    // Log grouped chips
+    console.log('🎨 컬러별 그룹:', Object.keys(colorChipsByName).map(name => {
+        return `${name}: ${colorChipsByName[name].length}개`;
+    }).join(', '));
+
+    // Add click handlers
+    allColorChips.forEach(chip => {
+        chip.addEventListener('click', (e) => {
+            if (extractedColor) {
+                // Find color name for this chip
+                const parent = chip.parentElement;
+                if (!parent) return;
+
+                const colorNameSpan = parent.querySelector('span');
+                if (!colorNameSpan) return;
+
+                const colorName = colorNameSpan.textContent.trim();
+
+                // Update ALL chips with this color name (both sections)
+                const chipsToUpdate = colorChipsByName[colorName] || [];
+                chipsToUpdate.forEach(c => {
+                    c.style.background = extractedColor;
+                    c.style.backgroundColor = extractedColor;
+                });
+                chosenColors[colorName] = extractedColor;
+
+                console.log(`🎨 "${colorName}" 컬러 칩 ${chipsToUpdate.length}개 업데이트: ${extractedColor}`);
+                alert(`✅ "${colorName}" 컬러 칩 ${chipsToUpdate.length}개가 ${extractedColor}로 업데이트되었습니다!`);
+            } else {
+                alert('⚠️ 먼저 스포이드 도구로 색상을 추출하세요!');
+            }
+            e.stopPropagation();
+        });
+    });
+}
+
+// Setup event listeners
+function setupEventListeners() {
+    // V4: ESC to deactivate eyedropper
+    document.addEventListener('keydown', (e) => {
+        if (e.key === 'Escape' && eyedropperActive) {
+            deactivateEyedropper();
+        }
+    });
+
+    // V4: Click on image to extract color
+    document.querySelectorAll('.image-frame').forEach(frame => {
+        const img = frame.querySelector('.editable-image');
+        if (img) {
+            img.addEventListener('click', async (e) => {
+                if (eyedropperActive) {
+                    e.preventDefault();
+                    e.stopPropagation();
+
+                    try {
+                        const color = await extractColorFromImage(img, e.clientX, e.clientY, e.shiftKey);
+                        extractedColor = color;
+
+                        // Show extracted color
+                        document.getElementById('eyedropper-result').style.display = 'flex';
+                        document.getElementById('extracted-swatch').style.backgroundColor = color;
+                        document.getElementById('extracted-hex').textContent = color;
+
+                        console.log(`🎨 색상 추출 완료: ${color}`);
+                        deactivateEyedropper();
+                        // alert(`✅ 색상 추출 완료: ${color}\n\n이제 Color 섹션의 컬러 칩을 클릭하여 색상을 적용하세요!`);
+                    } catch (err) {
+                        console.error('색상 추출 실패:', err);
+                        alert('❌ 색상 추출 실패: ' + err.message);
+                        deactivateEyedropper();
+                    }
+                }
+            });
+        }
+    });
+
+    // Page zoom
+    document.getElementById('page-zoom').addEventListener('input', (e) => {
+        pageZoom = parseInt(e.target.value);
+        document.getElementById('page-zoom-value').textContent = pageZoom + '%';
+        applyPageZoom();
+        autoSave();
+    });
+
+    // Image select
+    document.getElementById('image-select').addEventListener('change', (e) => {
+        selectImage(e.target.value);
+    });
+
+    // Position/Scale sliders
+    document.getElementById('position-x').addEventListener('input', (e) => {
+        const value = parseInt(e.target.value);
+        cropSettings.images[currentImageId].x = value;
+        document.getElementById('x-value').textContent = value + '%';
+        applyCurrentCrop();
+        autoSave();
+    });
+
+    document.getElementById('position-y').addEventListener('input', (e) => {
+        const value = parseInt(e.target.value);
+        cropSettings.images[currentImageId].y = value;
+        document.getElementById('y-value').textContent = value + '%';
+        applyCurrentCrop();
+        autoSave();
+    });
+
+    document.getElementById('scale').addEventListener('input', (e) => {
+        const value = parseInt(e.target.value);
+        cropSettings.images[currentImageId].scale = value;
+        document.getElementById('scale-value').textContent = value + '%';
+        applyCurrentCrop();
+        autoSave();
+    });
+
+    // V4.3: Gap type selector
+    document.getElementById('gap-type-selector').addEventListener('change', (e) => {
+        currentGapType = e.target.value;
+
+        // Show/hide gallery section selector
+        const gallerySelectorWrapper = document.getElementById('gallery-section-selector-wrapper');
+        if (currentGapType === 'gallery') {
+            gallerySelectorWrapper.style.display = 'block';
+        } else {
+            gallerySelectorWrapper.style.display = 'none';
+        }
+
+        // Update slider value and help text
+        let currentGap;
+        let helpText;
+
+        if (currentGapType === 'gallery') {
+            currentGap = gapSettings.gallery[selectedGallerySection] || gapSettings.gallery.all || 21;
+            helpText = '💡 갤러리 섹션의 이미지 간격을 조절합니다.';
+        } else if (currentGapType === 'detail') {
+            currentGap = gapSettings.detail;
+            helpText = '💡 디테일 섹션의 이미지 간격을 조절합니다.';
+        } else { // hero
+            currentGap = gapSettings.hero;
+            helpText = '💡 히어로 이미지와 상품명 사이의 간격을 조절합니다.';
+        }
+
+        document.getElementById('gap-slider').value = currentGap;
+        document.getElementById('gap-value').textContent = currentGap + 'px';
+        document.getElementById('gap-help-text').textContent = helpText;
+
+        console.log(`📋 간격 조정 대상 변경: ${currentGapType} (현재: ${currentGap}px)`);
+    });
+
+    // V4.2: Gallery section selector
+    document.getElementById('gallery-section-selector').addEventListener('change', (e) => {
+        selectedGallerySection = e.target.value;
+
+        // 선택한 갤러리 섹션 이미지 복원
+        const section = document.querySelector(`.section--lifestyle-gallery[data-gallery-index="${selectedGallerySection}"]`);
+        if (section) hydrateImages(section);
+
+        // Update slider to show current section's gap
+        const currentGap = gapSettings.gallery[selectedGallerySection] || gapSettings.gallery.all || 21;
+        document.getElementById('gap-slider').value = currentGap;
+        document.getElementById('gap-value').textContent = currentGap + 'px';
+
+        console.log(`📋 갤러리 섹션 선택: ${selectedGallerySection} (현재 간격: ${currentGap}px)`);
+    });
+
+    // V4.3: Unified gap slider
+    document.getElementById('gap-slider').addEventListener('input', (e) => {
+        const gap = parseInt(e.target.value);
+
+        // Update gap settings based on current type
+        if (currentGapType === 'gallery') {
+            gapSettings.gallery[selectedGallerySection] = gap;
+        } else if (currentGapType === 'detail') {
+            gapSettings.detail = gap;
+        } else { // hero
+            gapSettings.hero = gap;
+        }
+
+        document.getElementById('gap-value').textContent = gap + 'px';
+        applyGap();
+        autoSave();
+    });
+
+    // V4.3 FIX: Text element click selection - canvas 내부만 선택
+    const allTextElements = document.querySelectorAll('.canvas div, .canvas span, .canvas p, .canvas h1, .canvas h2, .canvas h3, .canvas h4, .canvas h5, .canvas h6');
+    let passedFilters = 0;
+    let filteredByParent = 0;
+    let filteredByChildCount = 0;
+    let filteredByTextLength = 0;
+
+    console.log(`🔍 텍스트 요소 스캔 시작: ${allTextElements.length}개 후보`);
+
+    allTextElements.forEach(el => {
+        // V4.3 FIX: Skip control panel and empty elements
+        // NOTE: image-frame, canvas-wrapper 내부의 텍스트는 허용, 해당 요소 자체만 제외
+        if (el.closest('.control-panel') ||
+            el.classList.contains('image-frame') ||    // image-frame 자체만 제외
+            el.classList.contains('canvas-wrapper') ||  // canvas-wrapper 자체만 제외
+            el.classList.contains('canvas') ||
+            !el.textContent.trim()) {
+            filteredByParent++;
+            return;
+        }
+
+        // V4.3 FIX: 실제 콘텐츠를 담은 요소만 선택 (자식이 많은 구조용 div 제외)
+        const childDivs = el.querySelectorAll('div');
+        if (childDivs.length > 10) {  // 자식 div가 10개 이상이면 구조용 컨테이너로 간주
+            filteredByChildCount++;
+            return;
+        }
+
+        // V4.3 FIX: 실제 텍스트 내용이 있는 요소만 선택
+        const textContent = el.textContent.trim();
+        if (textContent.length < 2) {  // 2자 미만 제외
+            filteredByTextLength++;
+            return;
+        }
+
+        passedFilters++;
+        el.addEventListener('click', (e) => {
+            e.stopPropagation();
+            selectTextElement(el);
+        });
+
+        // Add hover effect
+        el.style.cursor = 'pointer';
+        el.addEventListener('mouseenter', () => {
+            if (el !== selectedTextElement) {
+                el.style.outline = '1px solid rgba(76, 175, 80, 0.3)';
+            }
+        });
+        el.addEventListener('mouseleave', () => {
+            if (el !== selectedTextElement) {
+                el.style.outline = '';
+            }
+        });
+    });
+
+    // V4.3 FIX: 필터링 요약 로그
+    console.log(`✅ 텍스트 요소 필터링 완료:`);
+    console.log(`  - 전체 후보: ${allTextElements.length}개`);
+    console.log(`  - 부모/클래스 필터: ${filteredByParent}개 제외`);
+    console.log(`  - 자식 div 개수: ${filteredByChildCount}개 제외`);
+    console.log(`  - 텍스트 길이: ${filteredByTextLength}개 제외`);
+    console.log(`  - ✨ 최종 선택 가능: ${passedFilters}개`);
+
+    // V4.2: Text size sliders
+    document.getElementById('text-width').addEventListener('input', (e) => {
+        const width = parseInt(e.target.value);
+        document.getElementById('text-width-value').textContent = width + 'px';
+        applyTextSize('width', width);
+    });
+
+    document.getElementById('text-height').addEventListener('input', (e) => {
+        const height = parseInt(e.target.value);
+        document.getElementById('text-height-value').textContent = height + 'px';
+        applyTextSize('height', height);
+    });
+
+    document.getElementById('text-fontsize').addEventListener('input', (e) => {
+        const fontSize = parseInt(e.target.value);
+        document.getElementById('text-fontsize-value').textContent = fontSize + 'px';
+        applyTextSize('fontSize', fontSize);
+    });
+
+    // Drag events on image frames (V4: 스포이드 모드 시 비활성화)
+    document.querySelectorAll('.image-frame').forEach(frame => {
+        const img = frame.querySelector('.editable-image');
+        if (img) {
+            frame.addEventListener('mousedown', (e) => {
+                if (eyedropperActive) return; // V4: 스포이드 모드에서는 드래그 비활성화
+
+                isDragging = true;
+                startX = e.clientX;
+                startY = e.clientY;
+
+                const imgId = frame.getAttribute('data-id');
+                const settings = cropSettings.images[imgId];
+                startObjX = settings.x;
+                startObjY = settings.y;
+
+                selectImage(imgId);
+                e.preventDefault();
+            });
+        }
+    });
+
+    document.addEventListener('mousemove', (e) => {
+        if (!isDragging || eyedropperActive) return;
+
+        const frame = document.querySelector(`[data-id="${currentImageId}"]`);
+        if (!frame) return;
+
+        const dx = e.clientX - startX;
+        const dy = e.clientY - startY;
+
+        // Convert pixels to percentage (relative to frame size)
+        const frameWidth = frame.offsetWidth;
+        const frameHeight = frame.offsetHeight;
+
+        const dxPercent = (dx / frameWidth) * 100;
+        const dyPercent = (dy / frameHeight) * 100;
+
+        cropSettings.images[currentImageId].x = Math.max(0, Math.min(200, startObjX + dxPercent));
+        cropSettings.images[currentImageId].y = Math.max(0, Math.min(200, startObjY + dyPercent));
+
+        updateSliders();
+        applyCurrentCrop();
+    });
+
+    document.addEventListener('mouseup', () => {
+        if (isDragging) {
+            isDragging = false;
+            autoSave();
+        }
+    });
+
+    // Wheel zoom on image frames
+    document.querySelectorAll('.image-frame').forEach(frame => {
+        frame.addEventListener('wheel', (e) => {
+            if (eyedropperActive) return; // V4: 스포이드 모드에서는 줌 비활성화
+
+            e.preventDefault();
+
+            const imgId = frame.getAttribute('data-id');
+            if (!imgId) return;
+
+            selectImage(imgId);
+
+            const delta = e.deltaY > 0 ? -5 : 5;
+            const currentScale = cropSettings.images[imgId].scale;
+            const newScale = Math.max(50, Math.min(500, currentScale + delta));
+
+            cropSettings.images[imgId].scale = newScale;
+            updateSliders();
+            applyCurrentCrop();
+            autoSave();
+        });
+    });
+}
+
+// Select image
+function selectImage(id) {
+    // Remove previous selection
+    document.querySelectorAll('.image-frame').forEach(f => f.classList.remove('selected'));
+
+    // Add selection to current frame
+    const frame = document.querySelector(`[data-id="${id}"]`);
+    if (frame) {
+        frame.classList.add('selected');
+        hydrateImages(frame);
+    }
+
+    currentImageId = id;
+
+    // Update dropdown
+    document.getElementById('image-select').value = id;
+
+    updateSliders();
+}
+
+// Update sliders to match current image
+function updateSliders() {
+    const settings = cropSettings.images[currentImageId];
+    if (settings) {
+        document.getElementById('position-x').value = settings.x;
+        document.getElementById('x-value').textContent = Math.round(settings.x) + '%';
+        document.getElementById('position-y').value = settings.y;
+        document.getElementById('y-value').textContent = Math.round(settings.y) + '%';
+        document.getElementById('scale').value = settings.scale;
+        document.getElementById('scale-value').textContent = settings.scale + '%';
+    }
+}
+
+// Apply crop to current image (V4: object-fit: cover 효과를 transform으로 구현)
+function applyCurrentCrop() {
+    const frame = document.querySelector(`[data-id="${currentImageId}"]`);
+    if (!frame) return;
+
+    const img = frame.querySelector('.editable-image');
+    const settings = cropSettings.images[currentImageId];
+
+    if (img && settings) {
+        // 원본 이미지 크기
+        const imgWidth = img.naturalWidth;
+        const imgHeight = img.naturalHeight;
+
+        // Frame 크기 (뷰포트)
+        const frameWidth = frame.offsetWidth;
+        const frameHeight = frame.offsetHeight;
+
+        // object-fit: cover 효과를 transform으로 구현
+        const scaleX = frameWidth / imgWidth;
+        const scaleY = frameHeight / imgHeight;
+        const baseScale = Math.max(scaleX, scaleY);  // cover 효과
+
+        // 사용자 스케일
+        const userScale = settings.scale / 100;
+        const totalScale = baseScale * userScale;
+
+        // 위치 오프셋 (픽셀 단위)
+        const tx = (settings.x - 100) / 100 * frameWidth;
+        const ty = (settings.y - 100) / 100 * frameHeight;
+
+        img.style.transform = `translate(${tx}px, ${ty}px) scale(${totalScale})`;
+    }
+}
+
+// Apply page zoom
+function applyPageZoom() {
+    const container = document.querySelector('.container');
+    if (container) {
+        const scale = pageZoom / 100;
+        container.style.transform = `scale(${scale})`;
+
+        // Adjust height to prevent whitespace
+        const naturalHeight = container.scrollHeight;
+        container.style.height = `${naturalHeight * scale}px`;
+    }
+}
+
+// V4.2: Apply gallery gap to selected section(s)
+// V4.3: Unified gap application for gallery/detail/hero
+function applyGap() {
+    if (currentGapType === 'gallery') {
+        // Apply gallery gap
+        if (selectedGallerySection === 'all') {
+            // Apply to all gallery sections - V4.3 FIX: 더 안전한 DOM 쿼리
+            const gallerySections = document.querySelectorAll('.section--lifestyle-gallery');
+            gallerySections.forEach(section => {
+                // 첫 번째 직접 자식 div 중 flex-direction: column을 가진 것 찾기
+                const containers = section.querySelectorAll(':scope > div');
+                containers.forEach(container => {
+                    const computedStyle = getComputedStyle(container);
+                    if (computedStyle.flexDirection === 'column') {
+                        // gap 스타일 업데이트 (있으면 교체, 없으면 추가)
+                        const currentStyle = container.getAttribute('style') || '';
+                        let newStyle;
+                        if (/gap:\s*\d+px/.test(currentStyle)) {
+                            newStyle = currentStyle.replace(/gap:\s*\d+px/, `gap: ${gapSettings.gallery.all}px`);
+                        } else {
+                            // gap이 없으면 추가
+                            newStyle = currentStyle + (currentStyle.endsWith(';') ? '' : '; ') + `gap: ${gapSettings.gallery.all}px;`;
+                        }
+                        container.setAttribute('style', newStyle.trim());
+                    }
+                });
+            });
+            console.log(`📐 전체 갤러리 간격: ${gapSettings.gallery.all}px`);
+        } else {
+            // Apply to specific gallery section - V4.3 FIX
+            const section = document.querySelector(`.section--lifestyle-gallery[data-gallery-index="${selectedGallerySection}"]`);
+            if (section) {
+                const containers = section.querySelectorAll(':scope > div');
+                containers.forEach(container => {
+                    const computedStyle = getComputedStyle(container);
+                    if (computedStyle.flexDirection === 'column') {
+                        const currentStyle = container.getAttribute('style') || '';
+                        const gap = gapSettings.gallery[selectedGallerySection] || 21;
+                        let newStyle;
+                        if (/gap:\s*\d+px/.test(currentStyle)) {
+                            newStyle = currentStyle.replace(/gap:\s*\d+px/, `gap: ${gap}px`);
+                        } else {
+                            newStyle = currentStyle + (currentStyle.endsWith(';') ? '' : '; ') + `gap: ${gap}px;`;
+                        }
+                        container.setAttribute('style', newStyle.trim());
+                        console.log(`📐 갤러리 섹션 ${selectedGallerySection} 간격: ${gap}px`);
+                    }
+                });
+            }
+        }
+    } else if (currentGapType === 'detail') {
+        // Apply detail section gap - V4.3 FIX
+        const detailSection = document.querySelector('.section--material-detail');
+        if (detailSection) {
+            const containers = detailSection.querySelectorAll(':scope > div');
+            containers.forEach(container => {
+                const computedStyle = getComputedStyle(container);
+                if (computedStyle.flexDirection === 'column') {
+                    const currentStyle = container.getAttribute('style') || '';
+                    let newStyle;
+                    if (/gap:\s*\d+px/.test(currentStyle)) {
+                        newStyle = currentStyle.replace(/gap:\s*\d+px/, `gap: ${gapSettings.detail}px`);
+                    } else {
+                        newStyle = currentStyle + (currentStyle.endsWith(';') ? '' : '; ') + `gap: ${gapSettings.detail}px;`;
+                    }
+                    container.setAttribute('style', newStyle.trim());
+                    console.log(`📐 디테일 섹션 간격: ${gapSettings.detail}px`);
+                }
+            });
+        } else {
+            console.warn('⚠️ 디테일 섹션을 찾을 수 없습니다.');
+        }
+    } else if (currentGapType === 'hero') {
+        // Apply hero to product name spacing (via margin-top of color-variants section) - V4.3 FIX
+        const colorVariantsSection = document.querySelector('.section--color-variants');
+        if (colorVariantsSection) {
+            const currentStyle = colorVariantsSection.getAttribute('style') || '';
+            let newStyle;
+            if (/margin:\s*\d+px\s+auto\s+0/.test(currentStyle)) {
+                newStyle = currentStyle.replace(/margin:\s*\d+px\s+auto\s+0/, `margin: ${gapSettings.hero}px auto 0`);
+            } else {
+                // margin 스타일이 없으면 추가
+                newStyle = currentStyle + (currentStyle.endsWith(';') ? '' : '; ') + `margin: ${gapSettings.hero}px auto 0;`;
+            }
+            colorVariantsSection.setAttribute('style', newStyle.trim());
+            console.log(`📐 히어로-상품명 간격: ${gapSettings.hero}px`);
+        } else {
+            console.warn('⚠️ 상품명 섹션을 찾을 수 없습니다.');
+        }
+    }
+}
+
+// V4.2: Select text element
+function selectTextElement(element) {
+    // Deselect previous element
+    if (selectedTextElement) {
+        selectedTextElement.style.outline = '';
+    }
+
+    // Select new element
+    selectedTextElement = element;
+    element.style.outline = '2px dashed #4CAF50';
+
+    // Assign ID if not exists (생성 시 부여된 편집 ID 우선 → 새로고침 후에도 같은 ID)
+    if (!element.dataset.textId) {
+        element.dataset.textId = element.dataset.editId || `text-element-${textElementIdCounter++}`;
+    }
+
+    // V4.3: Add resize handles
+    addResizeHandles(element);
+
+    // Show control panel
+    const panel = document.getElementById('text-box-control');
+    panel.style.display = 'block';
+
+    // Update info display
+    const info = element.textContent.substring(0, 30) + (element.textContent.length > 30 ? '...' : '');
+    document.getElementById('selected-text-info').textContent = info;
+
+    // Load current sizes
+    const savedSizes = textSizes[element.dataset.textId] || {};
+    const currentWidth = savedSizes.width || parseInt(getComputedStyle(element).width) || 200;
+    const currentHeight = savedSizes.height || parseInt(getComputedStyle(element).height) || 50;
+    const currentFontSize = savedSizes.fontSize || parseInt(getComputedStyle(element).fontSize) || 14;
+
+    // Update sliders
+    document.getElementById('text-width').value = currentWidth;
+    document.getElementById('text-width-value').textContent = currentWidth + 'px';
+    document.getElementById('text-height').value = currentHeight;
+    document.getElementById('text-height-value').textContent = currentHeight + 'px';
+    document.getElementById('text-fontsize').value = currentFontSize;
+    document.getElementById('text-fontsize-value').textContent = currentFontSize + 'px';
+}
+
+// V4.2: Deselect text element
+function deselectTextElement() {
+    if (selectedTextElement) {
+        selectedTextElement.style.outline = '';
+        selectedTextElement = null;
+    }
+
+    // V4.3: Remove resize handles
+    removeResizeHandles();
+
+    // Hide control panel
+    const panel = document.getElementById('text-box-control');
+    panel.style.display = 'none';
+
+    // Clear info
+    document.getElementById('selected-text-info').textContent = '없음';
+}
+
+// Helper: Compute offsetTop of a node relative to a section container
+function computeRelativeTop(node, section) {
+    if (!node) return 0;
+    if (!section || node === section) return node.offsetTop || 0;
+
+    let total = 0;
+    let current = node;
+
+    while (current && current !== section) {
+        total += current.offsetTop || 0;
+        current = current.offsetParent;
+    }
+
+    return total;
+}
+
+// Helper: Convert absolute-bottom anchored containers to top-based anchors
+function ensureAnchorForHeight(element) {
+    let anchor = element;
+
+    console.log('🔍 ensureAnchorForHeight 시작:', {
+        element: element.tagName,
+        className: element.className,
+        textContent: element.textContent?.substring(0, 20)
+    });
+
+    while (anchor && anchor !== document.body) {
+        const style = getComputedStyle(anchor);
+
+        console.log(`🔎 Anchor 검사:`, {
+            position: style.position,
+            transform: style.transform,
+            top: style.top,
+            bottom: style.bottom,
+            className: anchor.className
+        });
+
+        if (style.position === 'absolute' && style.bottom !== 'auto') {
+            // 🔍 V4.3.1: bottom이 있어도 matrix 센터 앵커 체크를 우선 수행
+            const transform = style.transform || '';
+            let isCenterTransform = false;
+
+            // matrix 형식 감지: matrix(1, 0, 0, 1, translateX, translateY)
+            if (transform.startsWith('matrix')) {
+                const matrixMatch = transform.match(/matrix\(([^)]+)\)/);
+                if (matrixMatch) {
+                    const values = matrixMatch[1].split(',').map(v => parseFloat(v.trim()));
+                    if (values.length === 6) {
+                        const translateX = values[4];
+                        const translateY = values[5];
+                        const elementWidth = anchor.offsetWidth || 200;
+                        const elementHeight = anchor.offsetHeight || 50;
+
+                        if (translateX < 0 && translateY < 0) {
+                            const isXCenter = Math.abs(translateX + elementWidth / 2) < 10;
+                            const isYCenter = Math.abs(translateY + elementHeight / 2) < 10;
+                            if (isXCenter || isYCenter) {
+                                isCenterTransform = true;
+                                console.log('🔍 Matrix 센터 감지 (bottom 브랜치):', {
+                                    translateX: translateX,
+                                    translateY: translateY,
+                                    elementWidth: elementWidth,
+                                    elementHeight: elementHeight,
+                                    isXCenter: isXCenter,
+                                    isYCenter: isYCenter
+                                });
+                            }
+                        }
+                    }
+                }
+            }
+
+            // translate(-50%, -50%) 패턴도 체크
+            if (!isCenterTransform && transform.includes('translate') && (
+                transform.includes('-50%, -50%') ||
+                (transform.includes('-50%') && transform.split(',').filter(p => p.includes('-50%')).length >= 2) ||
+                transform.match(/translate\(\s*-50%.*-50%/) ||
+                transform.match(/translateX\(\s*-50%.*translateY\(\s*-50%/)
+            )) {
+                isCenterTransform = true;
+                console.log('✅ Translate 센터 감지 (bottom 브랜치)');
+            }
+
+            // 센터 앵커로 감지되면 center 모드로 처리
+            if (isCenterTransform) {
+                console.log('✅ 센터 앵커 감지됨 (bottom 브랜치)!');
+                const section = anchor.closest('.section');
+
+                if (section && !section.dataset.originalHeight) {
+                    section.dataset.originalHeight = String(section.offsetHeight);
+                }
+
+                if (!anchor.dataset.anchorMode) {
+                    anchor.dataset.anchorMode = 'center';
+
+                    if (section && style.top) {
+                        const sectionHeight = section.offsetHeight;
+                        let centerPx;
+                        if (style.top.includes('%') && sectionHeight) {
+                            const percent = parseFloat(style.top);
+                            centerPx = (percent / 100) * sectionHeight;
+                        } else {
+                            centerPx = parseFloat(style.top) || 0;
+                        }
+
+                        const ratio = centerPx / sectionHeight;
+                        anchor.dataset.anchorCenterRatio = String(ratio);
+                        console.log(`📌 Center anchor 설정: centerPx=${centerPx}, ratio=${ratio.toFixed(3)}`);
+                    }
+                }
+
+                return { anchor, section };
+            }
+
+            // 일반 bottom 앵커 처리
+            const section = anchor.closest('.section');
+
+            if (section && !section.dataset.originalHeight) {
+                section.dataset.originalHeight = String(section.offsetHeight);
+            }
+
+            if (anchor.dataset.anchorConverted !== 'true') {
+                let topWithinSection;
+                if (section) {
+                    const sectionHeight = section.offsetHeight;
+                    const anchorHeight = anchor.offsetHeight || parseFloat(style.height) || 0;
+                    const bottomValue = parseFloat(style.bottom) || 0;
+                    topWithinSection = Math.max(0, sectionHeight - anchorHeight - bottomValue);
+                } else {
+                    topWithinSection = parseFloat(style.top) || 0;
+                }
+
+                anchor.dataset.anchorOriginalBottom = style.bottom;
+                anchor.dataset.anchorConverted = 'true';
+                anchor.dataset.anchorTop = String(topWithinSection);
+                anchor.style.bottom = 'auto';
+                anchor.style.top = `${topWithinSection}px`;
+                if (style.display === 'flex' && style.justifyContent !== 'flex-start') {
+                    anchor.dataset.anchorOriginalJustify = style.justifyContent;
+                    anchor.style.justifyContent = 'flex-start';
+                    console.log(`🎯 Anchor justify-content 조정: flex-start`);
+                }
+                console.log(`📌 Anchor converted to top: top=${anchor.style.top} (was bottom=${style.bottom})`);
+            }
+
+            return { anchor, section };
+        } else if (
+            style.position === 'absolute' &&
+            style.top && style.top !== 'auto'
+        ) {
+            // 더 유연한 센터 앵커 감지
+            const transform = style.transform || '';
+
+            // matrix 형식 감지: matrix(1, 0, 0, 1, translateX, translateY)
+            let isCenterTransform = false;
+
+            // 1. translate(-50%, -50%) 패턴
+            if (transform.includes('translate') && (
+                transform.includes('-50%, -50%') ||
+                (transform.includes('-50%') && transform.split(',').filter(p => p.includes('-50%')).length >= 2) ||
+                transform.match(/translate\(\s*-50%.*-50%/) ||
+                transform.match(/translateX\(\s*-50%.*translateY\(\s*-50%/)
+            )) {
+                isCenterTransform = true;
+            }
+
+            // 2. matrix 형식 감지 (예: matrix(1, 0, 0, 1, -101, -74.5))
+            if (!isCenterTransform && transform.startsWith('matrix')) {
+                const matrixMatch = transform.match(/matrix\(([^)]+)\)/);
+                if (matrixMatch) {
+                    const values = matrixMatch[1].split(',').map(v => parseFloat(v.trim()));
+                    if (values.length === 6) {
+                        const translateX = values[4];
+                        const translateY = values[5];
+                        // 음수 offset이면서 요소 크기의 절반 정도인 경우 센터 정렬로 판단
+                        const elementWidth = anchor.offsetWidth || 200;
+                        const elementHeight = anchor.offsetHeight || 50;
+
+                        if (translateX < 0 && translateY < 0) {
+                            const isXCenter = Math.abs(translateX + elementWidth / 2) < 10;
+                            const isYCenter = Math.abs(translateY + elementHeight / 2) < 10;
+                            if (isXCenter || isYCenter) {
+                                isCenterTransform = true;
+                                console.log('🔍 Matrix 센터 감지:', {
+                                    translateX: translateX,
+                                    translateY: translateY,
+                                    elementWidth: elementWidth,
+                                    elementHeight: elementHeight,
+                                    isXCenter: isXCenter,
+                                    isYCenter: isYCenter
+                                });
+                            }
+                        }
+                    }
+                }
+            }
+
+            console.log(`🎯 센터 변환 체크:`, {
+                transform: transform,
+                isCenterTransform: isCenterTransform,
+                top: style.top
+            });
+
+            if (isCenterTransform) {
+                console.log('✅ 센터 앵커 감지됨!');
+                const section = anchor.closest('.section');
+
+                if (section && !section.dataset.originalHeight) {
+                    section.dataset.originalHeight = String(section.offsetHeight);
+                }
+
+                if (!anchor.dataset.anchorMode) {
+                    anchor.dataset.anchorMode = 'center';
+
+                    if (section) {
+                        const sectionHeight = section.offsetHeight;
+                        let centerPx;
+                        if (style.top.includes('%') && sectionHeight) {
+                            const percent = parseFloat(style.top);
+                            centerPx = sectionHeight * (isNaN(percent) ? 0 : percent / 100);
+                        } else {
+                            centerPx = parseFloat(style.top) || anchor.offsetTop || 0;
+                        }
+
+                        if (sectionHeight) {
+                            anchor.dataset.anchorCenterRatio = String(centerPx / sectionHeight);
+                        } else {
+                            anchor.dataset.anchorCenterPx = String(centerPx);
+                        }
+
+                        console.log(`📌 Center anchor 설정:`, {
+                            centerPx: centerPx,
+                            ratio: anchor.dataset.anchorCenterRatio,
+                            sectionHeight: sectionHeight
+                        });
+                    }
+                }
+
+                return { anchor, section };
+            }
+        }
+        anchor = anchor.parentElement;
+    }
+
+    return null;
+}
+
+function handleHeightChange(element, desiredHeight) {
+    console.log('🔧 handleHeightChange 시작:', {
+        element: element.tagName,
+        className: element.className,
+        desiredHeight: desiredHeight
+    });
+
+    const anchorInfo = ensureAnchorForHeight(element);
+    const computedStyle = getComputedStyle(element);
+    const currentHeight = element.offsetHeight || parseFloat(computedStyle.height) || 0;
+    const target = Number(desiredHeight);
+    const resolvedHeight = Number.isFinite(target) ? target : currentHeight;
+    const delta = resolvedHeight - currentHeight;
+
+    element.style.height = `${resolvedHeight}px`;
+
+    const sectionForUpdate = anchorInfo?.section || element.closest('.section');
+    if (sectionForUpdate && !sectionForUpdate.dataset.originalHeight) {
+        sectionForUpdate.dataset.originalHeight = String(sectionForUpdate.offsetHeight);
+    }
+
+    if (anchorInfo) {
+        const { anchor, section } = anchorInfo;
+
+        console.log('📍 Anchor 정보:', {
+            anchorMode: anchor.dataset.anchorMode,
+            anchorCenterRatio: anchor.dataset.anchorCenterRatio,
+            delta: delta
+        });
+
+        if (anchor.dataset.anchorMode === 'center') {
+            console.log('🎯 센터 모드: 위치 변경 없이 종료');
+            delete element.dataset.anchorRef;
+            return resolvedHeight;
+        }
+
+        if (!anchor.dataset.anchorId) {
+            anchor.dataset.anchorId = `anchor-${Date.now()}-${Math.random().toString(36).slice(2, 8)}`;
+        } else {
+            const storedTop = parseFloat(anchor.dataset.anchorTop || computeRelativeTop(anchor, section));
+            anchor.dataset.anchorTop = String(storedTop);
+            anchor.style.top = `${storedTop}px`;
+            anchor.style.bottom = 'auto';
+        }
+
+        element.dataset.anchorRef = anchor.dataset.anchorId;
+
+        if (section) {
+            const previousHeight = section.offsetHeight;
+            const relativeTop = computeRelativeTop(anchor, section);
+            const requiredHeight = Math.ceil(relativeTop + anchor.offsetHeight);
+            const baseHeight = Number(section.dataset.originalHeight || previousHeight);
+            const desiredSectionHeight = Math.max(baseHeight, requiredHeight);
+
+            if (Math.abs(previousHeight - desiredSectionHeight) > 0.5) {
+                section.style.height = `${desiredSectionHeight}px`;
+                console.log(`🏗️ Section(${section.className || section.id || 'anonymous'}) height 조정: ${previousHeight}px → ${desiredSectionHeight}px`);
+            }
+        }
+    }
+
+    return resolvedHeight;
+}
+
+// V4.2: Apply text size changes
+function applyTextSize(property, value) {
+    if (!selectedTextElement) return;
+
+    const elementId = selectedTextElement.dataset.textId;
+
+    // Initialize if not exists
+    if (!textSizes[elementId]) {
+        textSizes[elementId] = {};
+    }
+
+    // Apply style
+    if (property === 'width') {
+        selectedTextElement.style.width = value + 'px';
+        textSizes[elementId].width = value;
+    } else if (property === 'height') {
+        const resolvedHeight = handleHeightChange(selectedTextElement, value);
+        textSizes[elementId].height = resolvedHeight;
+        console.log(`📏 높이 변경: ${resolvedHeight}px`);
+    } else if (property === 'fontSize') {
+        selectedTextElement.style.fontSize = value + 'px';
+        textSizes[elementId].fontSize = value;
+    }
+
+    console.log(`📏 텍스트 크기 변경 [${elementId}]: ${property}=${value}px`);
+    autoSave();
+}
+
+// V4.3: Text box drag resize functionality
+let resizeActive = false;
+let resizeDirection = null;
+let resizeStartX, resizeStartY, resizeStartWidth, resizeStartHeight;
+let resizeStartTop, resizeStartLeft;  // V4.3 FIX: Store initial position
+
+// V4.3: Add resize handles to selected text element
+function addResizeHandles(element) {
+    // Remove existing handles first
+    removeResizeHandles();
+
+    // V4.3 FIX: Store and change parent .section overflow
+    const sectionParent = element.closest('.section');
+    if (sectionParent) {
+        element.dataset.sectionOriginalOverflow = getComputedStyle(sectionParent).overflow;
+        sectionParent.style.overflow = 'visible';
+        console.log(`🔓 .section overflow 열기: ${element.dataset.sectionOriginalOverflow} → visible`);
+    }
+
+    // V4.3 FIX: 핸들은 absolute로 부모 기준 배치되므로 position 변경 불필요
+    console.log(`📍 Position 변경 안 함 (레이아웃 보존)`);
+
+    // V4.3 FIX: Store original z-index and overflow before changing
+    const computedStyle = getComputedStyle(element);
+    element.dataset.originalZIndex = computedStyle.zIndex;
+    element.dataset.originalOverflow = computedStyle.overflow;
+    console.log(`💾 원본 스타일 저장: zIndex=${computedStyle.zIndex}, overflow=${computedStyle.overflow}`);
+
+    // V4.3 FIX: Apply z-index and overflow for handle visibility
+    element.style.zIndex = '10';
+    element.style.overflow = 'visible';
+    console.log(`🔧 스타일 변경: zIndex=10, overflow=visible (핸들 표시용)`);
+
+    // Add text-selected class
+    element.classList.add('text-selected');
+
+    // Create 4 edge handles (top, right, bottom, left)
+    const directions = ['top', 'right', 'bottom', 'left'];
+    directions.forEach(direction => {
+        const handle = document.createElement('div');
+        handle.className = `resize-handle resize-handle-${direction}`;
+        handle.dataset.direction = direction;
+
+        // Add mousedown event
+        handle.addEventListener('mousedown', (e) => {
+            e.preventDefault();
+            e.stopPropagation();
+            startResize(e, direction);
+        });
+
+        element.appendChild(handle);
+    });
+
+    console.log(`✅ 리사이즈 핸들 추가: ${element.dataset.textId}`);
+}
+
+// V4.3: Remove resize handles
+function removeResizeHandles() {
+    const handles = document.querySelectorAll('.resize-handle');
+    handles.forEach(handle => handle.remove());
+
+    // V4.3 FIX: Restore parent .section overflow
+    const selectedElement = document.querySelector('.text-selected');
+    if (selectedElement) {
+        const sectionParent = selectedElement.closest('.section');
+        if (sectionParent && selectedElement.dataset.sectionOriginalOverflow) {
+            sectionParent.style.overflow = selectedElement.dataset.sectionOriginalOverflow;
+            console.log(`🔒 .section overflow 복원: ${selectedElement.dataset.sectionOriginalOverflow}`);
+            delete selectedElement.dataset.sectionOriginalOverflow;
+        }
+
+        // Restore anchor-specific adjustments
+        if (selectedElement.dataset.anchorRef) {
+            const anchorElement = document.querySelector('[data-anchor-id="' + selectedElement.dataset.anchorRef + '"]');
+            if (anchorElement) {
+                const originalJustify = anchorElement.dataset.anchorOriginalJustify;
+                if (originalJustify) {
+                    anchorElement.style.justifyContent = originalJustify;
+                    delete anchorElement.dataset.anchorOriginalJustify;
+                    console.log('🎯 Anchor justify-content 복원: ' + originalJustify);
+                }
+
+                delete anchorElement.dataset.anchorTop;
+                delete anchorElement.dataset.anchorCenterRatio;
+                delete anchorElement.dataset.anchorCenterPx;
+                delete anchorElement.dataset.anchorMode;
+                delete anchorElement.dataset.anchorConverted;
+                delete anchorElement.dataset.anchorId;
+            }
+            delete selectedElement.dataset.anchorRef;
+        }
+
+        // V4.3 FIX: Restore element's original z-index and overflow
+        if (selectedElement.dataset.originalZIndex) {
+            selectedElement.style.zIndex = selectedElement.dataset.originalZIndex;
+            console.log(`🔙 z-index 복원: ${selectedElement.dataset.originalZIndex}`);
+            delete selectedElement.dataset.originalZIndex;
+        }
+        if (selectedElement.dataset.originalOverflow) {
+            selectedElement.style.overflow = selectedElement.dataset.originalOverflow;
+            console.log(`🔙 overflow 복원: ${selectedElement.dataset.originalOverflow}`);
+            delete selectedElement.dataset.originalOverflow;
+        }
+
+        console.log(`✓ 원본 스타일 복원 완료`);
+    }
+
+    // Remove text-selected class from all elements
+    document.querySelectorAll('.text-selected').forEach(el => {
+        el.classList.remove('text-selected');
+    });
+}
+
+// V4.3: Start resize operation
+function startResize(e, direction) {
+    if (!selectedTextElement) return;
+
+    resizeActive = true;
+    resizeDirection = direction;
+    resizeStartX = e.clientX;
+    resizeStartY = e.clientY;
+    resizeStartWidth = parseInt(getComputedStyle(selectedTextElement).width);
+    resizeStartHeight = parseInt(getComputedStyle(selectedTextElement).height);
+
+    // V4.3 FIX: Only track top/left for absolute positioned elements
+    const computedStyle = getComputedStyle(selectedTextElement);
+    const positionType = computedStyle.position;
+
+    if (positionType === 'absolute') {
+        resizeStartTop = parseInt(computedStyle.top) || 0;
+        resizeStartLeft = parseInt(computedStyle.left) || 0;
+        console.log(`📍 Position 추적: absolute (${resizeStartTop}px, ${resizeStartLeft}px)`);
+    } else {
+        resizeStartTop = 0;
+        resizeStartLeft = 0;
+        console.log(`📍 Position 타입: ${positionType} (top/left 조정 건너뜀)`);
+    }
+
+    // Add global mousemove and mouseup listeners
+    document.addEventListener('mousemove', doResize);
+    document.addEventListener('mouseup', stopResize);
+
+    console.log(`🔄 리사이즈 시작: ${direction}, 초기 크기: ${resizeStartWidth}x${resizeStartHeight}px`);
+}
+
+// V4.3: Perform resize operation
+function doResize(e) {
+    if (!resizeActive || !selectedTextElement) return;
+
+    const deltaX = e.clientX - resizeStartX;
+    const deltaY = e.clientY - resizeStartY;
+
+    let newWidth = resizeStartWidth;
+    let newHeight = resizeStartHeight;
+    let newTop = resizeStartTop;
+    let newLeft = resizeStartLeft;
+
+    // Calculate new dimensions based on direction
+    if (resizeDirection === 'right') {
+        newWidth = resizeStartWidth + deltaX;
+    } else if (resizeDirection === 'left') {
+        // V4.3 FIX: Adjust both width and left position
+        newWidth = resizeStartWidth - deltaX;
+        newLeft = resizeStartLeft + deltaX;
+    } else if (resizeDirection === 'bottom') {
+        newHeight = resizeStartHeight + deltaY;
+    } else if (resizeDirection === 'top') {
+        // V4.3 FIX: Adjust both height and top position
+        newHeight = resizeStartHeight - deltaY;
+        newTop = resizeStartTop + deltaY;
+    }
+
+    // Enforce minimum size
+    const minWidth = 50;
+    const minHeight = 20;
+
+    if (newWidth < minWidth) {
+        // V4.3 FIX: Don't move left position if hitting minimum width
+        if (resizeDirection === 'left') {
+            newLeft = resizeStartLeft + (resizeStartWidth - minWidth);
+        }
+        newWidth = minWidth;
+    }
+
+    if (newHeight < minHeight) {
+        // V4.3 FIX: Don't move top position if hitting minimum height
+        if (resizeDirection === 'top') {
+            newTop = resizeStartTop + (resizeStartHeight - minHeight);
+        }
+        newHeight = minHeight;
+    }
+
+    // Apply new dimensions
+    selectedTextElement.style.width = newWidth + 'px';
+
+    if (resizeDirection === 'bottom') {
+        newHeight = handleHeightChange(selectedTextElement, newHeight);
+    } else {
+        selectedTextElement.style.height = newHeight + 'px';
+    }
+
+    // V4.3 FIX: Only adjust top/left for absolute positioned elements
+    // Don't force position change - this would break layout
+    const currentPosition = getComputedStyle(selectedTextElement).position;
+    if (currentPosition === 'absolute' && (resizeDirection === 'top' || resizeDirection === 'left')) {
+        if (resizeDirection === 'top') {
+            selectedTextElement.style.top = newTop + 'px';
+            console.log(`↕️ Top 조정: ${newTop}px`);
+        }
+        if (resizeDirection === 'left') {
+            selectedTextElement.style.left = newLeft + 'px';
+            console.log(`↔️ Left 조정: ${newLeft}px`);
+        }
+    }
+
+    // Update sliders
+    document.getElementById('text-width').value = newWidth;
+    document.getElementById('text-width-value').textContent = newWidth + 'px';
+    document.getElementById('text-height').value = newHeight;
+    document.getElementById('text-height-value').textContent = newHeight + 'px';
+}
+
+// V4.3: Stop resize operation
+function stopResize(e) {
+    if (!resizeActive) return;
+
+    resizeActive = false;
+
+    // Remove global listeners
+    document.removeEventListener('mousemove', doResize);
+    document.removeEventListener('mouseup', stopResize);
+
+    // Save final dimensions
+    if (selectedTextElement) {
+        const elementId = selectedTextElement.dataset.textId;
+        const finalWidth = parseInt(selectedTextElement.style.width);
+        const finalHeight = parseInt(selectedTextElement.style.height);
+
+        if (!textSizes[elementId]) {
+            textSizes[elementId] = {};
+        }
+
+        textSizes[elementId].width = finalWidth;
+        textSizes[elementId].height = finalHeight;
+
+        autoSave();
+
+        console.log(`✅ 리사이즈 완료 [${elementId}]: ${finalWidth}x${finalHeight}px`);
+    }
+}
+
+// V4.2: Auto-save to localStorage
+// V4.3: Save unified gap settings
+function autoSave() {
+    cropSettings.pageZoom = pageZoom;
+    cropSettings.gapSettings = gapSettings;  // V4.3: Unified gap settings (gallery/detail/hero)
+    cropSettings.textSizes = textSizes;      // V4.2: Text element sizes
+    localStorage.setItem(`cropSettings_${productCode}`, JSON.stringify(cropSettings));
+}
+
+// Load settings from localStorage
+function loadSettings() {
+    // /materialize 페이지는 편집 문서의 크롭 설정이 우선
+    const saved = baseEdits && baseEdits.cropSettings
+        ? JSON.stringify(baseEdits.cropSettings)
+        : localStorage.getItem(`cropSettings_${productCode}`);
+    if (saved) {
+        try {
+            const settings = JSON.parse(saved);
+
+            // V4 FIX: Version check - ignore old settings and use defaults
+            if (settings.version !== 'v4') {
+                console.log('⚠️ Old version settings detected, using defaults');
+                console.log(`   Old version: ${settings.version || 'unknown'}, Current: v4`);
+                // Don't return! Continue to apply default transforms below
+            } else {
+                // Load page zoom
+                if (settings.pageZoom) {
+                    pageZoom = settings.pageZoom;
+                    document.getElementById('page-zoom').value = pageZoom;
+                    document.getElementById('page-zoom-value').textContent = pageZoom + '%';
+                }
+
+                // Load image settings
+                Object.keys(settings.images || {}).forEach(id => {
+                    if (cropSettings.images[id]) {
+                        cropSettings.images[id] = settings.images[id];
+                    }
+                });
+
+                // V4.3: Load gap settings (unified gallery/detail/hero)
+                if (settings.gapSettings) {
+                    gapSettings = settings.gapSettings;
+                    // Update slider for current gap type
+                    let currentGap;
+                    if (currentGapType === 'gallery') {
+                        currentGap = gapSettings.gallery[selectedGallerySection] || gapSettings.gallery.all || 21;
+                    } else if (currentGapType === 'detail') {
+                        currentGap = gapSettings.detail;
+                    } else { // hero
+                        currentGap = gapSettings.hero;
+                    }
+                    document.getElementById('gap-slider').value = currentGap;
+                    document.getElementById('gap-value').textContent = currentGap + 'px';
+                } else if (settings.galleryGaps) {
+                    // V4.2 backward compatibility: Convert old galleryGaps to new gapSettings
+                    gapSettings.gallery = settings.galleryGaps;
+                    const currentGap = gapSettings.gallery[selectedGallerySection] || gapSettings.gallery.all || 21;
+                    document.getElementById('gap-slider').value = currentGap;
+                    document.getElementById('gap-value').textContent = currentGap + 'px';
+                }
+
+                // V4.2: Load text element sizes
+                if (settings.textSizes) {
+                    textSizes = settings.textSizes;
+                    // Apply saved sizes to elements
+                    Object.keys(textSizes).forEach(elementId => {
+                        const element = document.querySelector(`[data-text-id="${elementId}"]`);
+                        if (element) {
+                            const sizes = textSizes[elementId];
+                            if (sizes.width) element.style.width = sizes.width + 'px';
+                            if (sizes.height) element.style.height = sizes.height + 'px';
+                            if (sizes.fontSize) element.style.fontSize = sizes.fontSize + 'px';
+                        }
+                    });
+                }
+            }
+
+            console.log('✅ Settings loaded from localStorage');
+        } catch (e) {
+            console.warn('Failed to load settings:', e);
+        }
+    }
+
+    // V4 FIX: ALWAYS apply transforms (moved outside if block)
+    // This ensures images display correctly on first load
+    imageList.forEach(img => {
+        const frame = document.querySelector(`[data-id="${img.id}"]`);
+        const imgEl = frame?.querySelector('.editable-image');
+        if (imgEl) {
+            applyStoredCrop(frame, imgEl, img.id);
+        }
+    });
+}
+
+// 저장된 크롭 설정을 이미지 하나에 적용 (아직 로드 전이면 건너뜀 → 로드 시 적용)
+function applyStoredCrop(frame, imgEl, id) {
+    const s = cropSettings.images[id];
+    if (!s || !imgEl.naturalWidth) return;
+
+    // 원본 이미지 크기
+    const imgWidth = imgEl.naturalWidth;
+    const imgHeight = imgEl.naturalHeight;
+
+    // Frame 크기 (뷰포트)
+    const frameWidth = frame.offsetWidth;
+    const frameHeight = frame.offsetHeight;
+
+    // object-fit: cover 효과를 transform으로 구현
+    const scaleX = frameWidth / imgWidth;
+    const scaleY = frameHeight / imgHeight;
+    const baseScale = Math.max(scaleX, scaleY);
+
+    // 사용자 스케일
+    const userScale = s.scale / 100;
+    const totalScale = baseScale * userScale;
+
+    // 위치 오프셋 (픽셀 단위)
+    const tx = (s.x - 100) / 100 * frameWidth;
+    const ty = (s.y - 100) / 100 * frameHeight;
+
+    imgEl.style.transform = `translate(${tx}px, ${ty}px) scale(${totalScale})`;
+}
+
+// 아직 디코딩되지 않은 이미지(지연 갤러리 등)는 로드 완료 시 크롭 적용
+function setupImageLoadCrop() {
+    document.querySelectorAll('.image-frame').forEach(frame => {
+        const imgEl = frame.querySelector('.editable-image');
+        if (!imgEl || imgEl.naturalWidth) return;
+        imgEl.addEventListener('load', () => {
+            applyStoredCrop(frame, imgEl, frame.getAttribute('data-id'));
+        }, { once: true });
+    });
+}
+
+// 지연 이미지 복원 + 디코딩 대기 (페이로드 테이블이 없는 페이지는 즉시 완료)
+function hydrateImages(root) {
+    return window.PB2_HYDRATE ? window.PB2_HYDRATE(root) : Promise.resolve();
+}
+
+// Reset current image
+function resetCurrentImage() {
+    if (currentImageId && cropSettings.images[currentImageId]) {
+        cropSettings.images[currentImageId] = { x: 100, y: 100, scale: 100 };
+        updateSliders();
+        applyCurrentCrop();
+        autoSave();
+    }
+}
+
+// 편집 ID가 있는 텍스트 요소의 편집 UI 흔적(contenteditable, 점선, 리사이즈 핸들)을 뺀 innerHTML
+function cleanEditableHTML(element) {
+    const clone = element.cloneNode(true);
+    clone.querySelectorAll('.resize-handle').forEach(handle => handle.remove());
+    clone.querySelectorAll('[contenteditable]').forEach(el => {
+        el.removeAttribute('contenteditable');
+        el.style.outline = '';
+        el.style.outlineOffset = '';
+        if (!el.getAttribute('style')) el.removeAttribute('style');
+    });
+    return clone.innerHTML;
+}
+
+// 로드 시 텍스트 기준값 저장 (편집 저장 시 이 값과 다른 요소만 보냄)
+function captureTextBaseline() {
+    document.querySelectorAll('[data-edit-id]').forEach(el => {
+        textBaseline[el.dataset.editId] = cleanEditableHTML(el);
+    });
+}
+
+// 편집 문서 생성: 크롭 설정 + 변경된 텍스트 + 고른 컬러 (이미지 데이터 없음)
+function collectEditDocument() {
+    autoSave();
+    const texts = Object.assign({}, baseEdits ? baseEdits.texts : {});
+    document.querySelectorAll('[data-edit-id]').forEach(el => {
+        const html = cleanEditableHTML(el);
+        if (html !== textBaseline[el.dataset.editId]) {
+            texts[el.dataset.editId] = html;
+        }
+    });
+    return {
+        format: EDIT_FORMAT,
+        productCode: productCode,
+        cropSettings: cropSettings,
+        texts: texts,
+        colors: chosenColors
+    };
+}
+
+// 편집 저장 (변경분만 서버에 버전으로 저장, 전체 HTML/JPG는 /materialize에서 생성)
+async function saveEdits() {
+    try {
+        const edits = collectEditDocument();
+        const body = JSON.stringify({productCode: productCode, edits: edits});
+
+        const response = await fetch('http://localhost:5001/save-edits', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: body
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            const status = result.created ? '저장' : '변경 없음 (기존 버전 유지)';
+            alert(`✅ 편집 ${status}: v${result.version}\n` +
+                  `크기: ${(result.bytes / 1024).toFixed(1)} KB (텍스트 ${Object.keys(edits.texts).length}개, 컬러 ${Object.keys(edits.colors).length}개)\n` +
+                  `보기: http://localhost:5001/materialize/${productCode}?version=${result.version}`);
+        } else {
+            alert('❌ 편집 저장 실패: ' + result.error);
+        }
+    } catch (e) {
+        alert('❌ 편집 저장 실패: ' + e.message + '\n서버가 실행 중인지 확인하세요.');
+        console.error(e);
+    }
+}
+
+// Blob/object URL → data URL
+async function blobUrlToDataURL(url) {
+    const blob = await (await fetch(url)).blob();
+    return await new Promise((resolve, reject) => {
+        const reader = new FileReader();
+        reader.onload = () => resolve(reader.result);
+        reader.onerror = () => reject(reader.error);
+        reader.readAsDataURL(blob);
+    });
+}
+
+// 페이로드 테이블에서 복원된 이미지(img[data-payload])의 Blob URL을 data URL로 치환
+async function inlinePayloadImages(html) {
+    const blobUrls = new Set();
+    document.querySelectorAll('img[data-payload]').forEach(img => {
+        if (img.src.startsWith('blob:')) blobUrls.add(img.src);
+    });
+
+    for (const url of blobUrls) {
+        const dataUrl = await blobUrlToDataURL(url);
+        html = html.split(url).join(dataUrl);
+    }
+    return html;
+}
+
+// Export HTML
+async function exportHTML() {
+    try {
+        // Clone container
+        const container = document.querySelector('.container');
+        const clone = container.cloneNode(true);
+
+        // Remove transform
+        clone.style.transform = 'none';
+        clone.style.height = 'auto';
+
+        // 지연 갤러리 이미지 포함 전체 복원
+        await hydrateImages(document);
+
+        // Get full HTML (페이로드 Blob URL → data URL, 저장 파일 단독으로 열리도록)
+        const fullHTML = await inlinePayloadImages(document.documentElement.outerHTML);
+
+        // Remove control panel
+        const cleanHTML = fullHTML.replace(/<div class="control-panel">.*?<\/div>/s, '');
+
+        // Send to server
+        const response = await fetch('http://localhost:5001/save-html', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({
+                productCode: productCode,
+                htmlContent: cleanHTML
+            })
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            alert(`✅ HTML 저장 완료!\n파일: ${result.filename}`);
+        } else {
+            alert('❌ HTML 저장 실패: ' + result.error);
+        }
+    } catch (e) {
+        alert('❌ HTML 저장 실패: ' + e.message);
+        console.error(e);
+    }
+}
+
+// Load image helper
+function loadImage(src) {
+    return new Promise((resolve, reject) => {
+        const img = new Image();
+        img.crossOrigin = 'anonymous';
+        img.onload = () => resolve(img);
+        img.onerror = reject;
+        img.src = src;
+    });
+}
+
+// Generate flattened image data (Dana&Peta 방식)
+async function generateFlattenedImageData(frame, img, settings) {
+    const frameRect = frame.getBoundingClientRect();
+    const frameWidth = Math.max(1, Math.round(frame.offsetWidth || frameRect.width || 0));
+    const frameHeight = Math.max(1, Math.round(frame.offsetHeight || frameRect.height || 0));
+
+    if (frameWidth === 0 || frameHeight === 0) {
+        throw new Error('Frame has zero size');
+    }
+
+    const imageSource = img.currentSrc || img.src;
+    const baseImage = await loadImage(imageSource);
+    const naturalWidth = baseImage.naturalWidth || baseImage.width;
+    const naturalHeight = baseImage.naturalHeight || baseImage.height;
+
+    if (!naturalWidth || !naturalHeight) {
+        throw new Error('Unable to determine image dimensions');
+    }
+
+    const baseScale = Math.max(frameWidth / naturalWidth, frameHeight / naturalHeight);
+    const userScale = (typeof settings.scale === 'number' ? settings.scale : 100) / 100;
+    const totalScale = baseScale * userScale;
+
+    const displayWidth = naturalWidth * totalScale;
+    const displayHeight = naturalHeight * totalScale;
+
+    const offsetXPercent = (typeof settings.x === 'number' ? settings.x : 100) - 100;
+    const offsetYPercent = (typeof settings.y === 'number' ? settings.y : 100) - 100;
+
+    const translateX = frameWidth * (offsetXPercent / 100);
+    const translateY = frameHeight * (offsetYPercent / 100);
+
+    // V4 FIX: Use top-left origin to match CSS transform-origin (not center)
+    const drawX = translateX;
+    const drawY = translateY;
+
+    const canvas = document.createElement('canvas');
+    canvas.width = frameWidth;
+    canvas.height = frameHeight;
+
+    const ctx = canvas.getContext('2d', { willReadFrequently: true });
+    if (!ctx) {
+        throw new Error('Failed to acquire canvas context');
+    }
+
+    ctx.clearRect(0, 0, frameWidth, frameHeight);
+    ctx.drawImage(baseImage, drawX, drawY, displayWidth, displayHeight);
+
+    return canvas.toDataURL('image/png');
+}
+
+// Create flattened image map (Dana&Peta 방식)
+async function createFlattenedImageMap() {
+    const flattenedMap = {};
+    const cacheKeyMap = new Map();
+
+    for (const frame of document.querySelectorAll('.image-frame')) {
+        const id = frame.getAttribute('data-id');
+        if (!id) continue;
+        const img = frame.querySelector('.editable-image');
+        if (!img) continue;
+
+        const settings = cropSettings.images[id] || { x: 100, y: 100, scale: 100 };
+        const frameWidth = Math.round(frame.offsetWidth);
+        const frameHeight = Math.round(frame.offsetHeight);
+        const cacheKey = `${img.currentSrc || img.src}|${settings.x}|${settings.y}|${settings.scale}|${frameWidth}|${frameHeight}`;
+
+        try {
+            if (cacheKey && cacheKeyMap.has(cacheKey)) {
+                flattenedMap[id] = cacheKeyMap.get(cacheKey);
+                continue;
+            }
+
+            const flattenedData = await generateFlattenedImageData(frame, img, settings);
+            flattenedMap[id] = flattenedData;
+            if (cacheKey) {
+                cacheKeyMap.set(cacheKey, flattenedData);
+            }
+        } catch (error) {
+            console.warn('Flatten image failed', id, error);
+        }
+    }
+
+    return flattenedMap;
+}
+
+// V4.6: 타일 JPG 내보내기 설정
+const TILE_SERVER_URL = 'http://localhost:5001/save-jpg-tile';
+const TILE_PIXEL_BUDGET_PER_GB = 4 * 1024 * 1024;  // 기기 메모리 1GB당 캔버스 픽셀 (RGBA 16MB)
+const TILE_MAX_CANVAS_HEIGHT = 16384;              // 브라우저 공통 캔버스 높이 한계
+const TILE_MIN_HEIGHT = 500;                       // 재시도 시 최소 타일 높이 (CSS px)
+
+// 기기 메모리에 맞춘 타일 높이 (CSS px)
+function computeTileHeight(widthCss, scale) {
+    const deviceGB = Math.min(Math.max(navigator.deviceMemory || 4, 1), 8);
+    const canvasHeight = Math.min(
+        (deviceGB * TILE_PIXEL_BUDGET_PER_GB) / (widthCss * scale),
+        TILE_MAX_CANVAS_HEIGHT
+    );
+    return Math.max(TILE_MIN_HEIGHT, Math.floor(canvasHeight / scale));
+}
+
+function createTileSessionId() {
+    return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+}
+
+function canvasToJpegBlob(canvas, quality) {
+    return new Promise((resolve, reject) => {
+        canvas.toBlob((blob) => {
+            if (blob && blob.size > 0) {
+                resolve(blob);
+            } else {
+                reject(new Error('Blob 변환 실패'));
+            }
+        }, 'image/jpeg', quality);
+    });
+}
+
+function releaseCanvas(canvas) {
+    // 캔버스 메모리 즉시 반환 (GC 대기 없이)
+    if (canvas) {
+        canvas.width = 0;
+        canvas.height = 0;
+    }
+}
+
+function downloadBlob(blob, filename) {
+    const blobUrl = URL.createObjectURL(blob);
+    const downloadLink = document.createElement('a');
+    downloadLink.href = blobUrl;
+    downloadLink.download = filename;
+    document.body.appendChild(downloadLink);
+    downloadLink.click();
+    document.body.removeChild(downloadLink);
+    setTimeout(() => URL.revokeObjectURL(blobUrl), 100);
+}
+
+// 타일 하나 업로드 (서버가 순서대로 이어 붙임)
+async function uploadTile(blob, params) {
+    const query = new URLSearchParams(params);
+    const response = await fetch(`${TILE_SERVER_URL}?${query}`, {
+        method: 'POST',
+        headers: {'Content-Type': 'image/jpeg'},
+        body: blob
+    });
+    const result = await response.json().catch(() => ({}));
+    if (!response.ok || !result.success) {
+        throw new Error(result.error || `HTTP ${response.status}`);
+    }
+    return result;
+}
+
+function readSliceHeight() {
+    const input = document.getElementById('jpg-slice-height');
+    const value = input ? parseInt(input.value, 10) : NaN;
+    return Number.isFinite(value) && value > 0 ? value : null;
+}
+
+// V4.6: Export JPG with adaptive tiling (server-side stitching)
+async function exportAsJPG() {
+    try {
+        // 지연 갤러리 이미지 포함 전체 복원 (캡처 전에 디코딩 완료)
+        await hydrateImages(document);
+        applyCurrentCrop();
+
+        // V4: 모든 .selected 클래스 제거
+        const selectedFrames = [];
+        document.querySelectorAll('.image-frame.selected').forEach(frame => {
+            selectedFrames.push(frame);
+            frame.classList.remove('selected');
+        });
+
+        // Create flattened images
+        const flattenedImageMap = await createFlattenedImageMap();
+        const replacedImageStates = [];
+
+        // Replace images with flattened versions
+        document.querySelectorAll('.image-frame').forEach(frame => {
+            const id = frame.getAttribute('data-id');
+            const img = frame.querySelector('.editable-image');
+            if (!img) return;
+
+            const flattenedSrc = id ? flattenedImageMap[id] : null;
+
+            if (flattenedSrc) {
+                replacedImageStates.push({
+                    img,
+                    src: img.src,
+                    transform: img.style.transform,
+                    origin: img.style.transformOrigin,
+                    objectFit: img.style.objectFit
+                });
+                img.src = flattenedSrc;
+                img.style.transform = 'none';
+                img.style.transformOrigin = 'center center';
+                img.style.objectFit = 'cover';
+            }
+        });
+
+        // Wait for images to load
+        await Promise.all(replacedImageStates.map(state => {
+            if (state.img.decode) {
+                return state.img.decode().catch(() => undefined);
+            }
+            return Promise.resolve();
+        }));
+
+        const controlPanel = document.querySelector('.control-panel');
+        const container = document.querySelector('.container');
+
+        // Save original styles
+        const originalTransform = container.style.transform;
+        const originalHeight = container.style.height;
+
+        // Hide control panel
+        controlPanel.style.display = 'none';
+
+        // Reset container for capture
+        container.style.transform = 'none';
+        container.style.height = 'auto';
+
+        // Wait for layout
+        await new Promise(resolve => setTimeout(resolve, 150));
+
+        // V4.6: 적응형 타일링 (기기 메모리 기준 타일 높이, 서버에서 한 장으로 스티칭)
+        const htmlSizeEstimate = document.documentElement.innerHTML.length / (1024 * 1024);  // MB
+        const totalHeight = container.scrollHeight;
+        const totalWidth = container.scrollWidth;
+        const canvasScale = 1.5;  // High resolution scale
+        const contentWidth = 1095;  // Good left margin setting
+        const marginX = Math.floor((totalWidth - contentWidth) / 2);  // 264px symmetric margins
+        const rightCropAmount = 39;  // Remove 39px from right (58px in final JPG at 1.5x scale)
+        const sliceHeight = readSliceHeight();
+        const sessionId = createTileSessionId();
+        let tileHeight = computeTileHeight(contentWidth, canvasScale);
+
+        console.log(`📊 HTML 크기: ${htmlSizeEstimate.toFixed(1)} MB`);
+        console.log(`📐 페이지 크기: ${totalWidth}×${totalHeight}px`);
+        console.log(`🔍 Scale: ${canvasScale}x, 타일 높이: ${tileHeight}px (deviceMemory: ${navigator.deviceMemory || '알 수 없음'})`);
+
+        let usedClientDownload = false;
+        let serverResult = null;
+        let tileIndex = 0;
+        let startY = 0;
+
+        while (startY < totalHeight) {
+            const chunkHeight = Math.min(tileHeight, totalHeight - startY);
+            console.log(`\n[Tile ${tileIndex + 1}] 캡처 시작: Y=${startY}~${startY + chunkHeight}px (높이: ${chunkHeight}px)`);
+
+            let originalCanvas = null;
+            try {
+                originalCanvas = await html2canvas(container, {
+                    scale: canvasScale,
+                    useCORS: true,
+                    backgroundColor: '#ffffff',
+                    logging: false,
+                    allowTaint: true,
+                    windowWidth: totalWidth,
+                    windowHeight: chunkHeight,
+                    width: contentWidth,
+                    height: chunkHeight,
+                    x: marginX,
+                    y: startY,
+                    scrollY: -startY,
+                    scrollX: -marginX
+                });
+                if (!originalCanvas || originalCanvas.width === 0 || originalCanvas.height === 0) {
+                    throw new Error(`Tile ${tileIndex + 1} Canvas 생성 실패`);
+                }
+            } catch (captureError) {
+                releaseCanvas(originalCanvas);
+                // 캔버스 한계 초과 → 타일 높이를 반으로 줄여 같은 위치부터 재시도
+                if (tileHeight > TILE_MIN_HEIGHT) {
+                    tileHeight = Math.max(TILE_MIN_HEIGHT, Math.floor(tileHeight / 2));
+                    console.warn(`⚠️ ${captureError.message} → 타일 높이 ${tileHeight}px로 재시도`);
+                    continue;
+                }
+                throw captureError;
+            }
+
+            // Post-processing: Crop right side only (asymmetric adjustment)
+            const croppedCanvas = document.createElement('canvas');
+            croppedCanvas.width = originalCanvas.width - rightCropAmount;
+            croppedCanvas.height = originalCanvas.height;
+            croppedCanvas.getContext('2d').drawImage(originalCanvas, 0, 0);
+            releaseCanvas(originalCanvas);
+
+            const blob = await canvasToJpegBlob(croppedCanvas, 0.95);
+            releaseCanvas(croppedCanvas);
+            console.log(`📦 Tile ${tileIndex + 1} JPG 변환 완료: ${(blob.size / 1024 / 1024).toFixed(2)} MB`);
+
+            const isLast = startY + chunkHeight >= totalHeight;
+
+            if (!usedClientDownload) {
+                try {
+                    const result = await uploadTile(blob, {
+                        productCode,
+                        session: sessionId,
+                        index: tileIndex,
+                        final: isLast ? 1 : 0,
+                        ...(sliceHeight ? {slice: Math.round(sliceHeight)} : {})
+                    });
+                    if (isLast) {
+                        serverResult = result;
+                    }
+                } catch (serverError) {
+                    // 첫 타일부터 서버에 닿지 않을 때만 다운로드로 전환 (중간 실패는 내보내기 실패)
+                    if (tileIndex > 0) {
+                        throw new Error(`타일 업로드 실패 (${tileIndex + 1}번): ${serverError.message}`);
+                    }
+                    console.warn('⚠️ 서버 저장 실패, 클라이언트 다운로드로 전환:', serverError.message);
+                    usedClientDownload = true;
+                }
+            }
+
+            if (usedClientDownload) {
+                downloadBlob(blob, `${productCode}_${String(tileIndex + 1).padStart(2, '0')}.jpg`);
+            }
+
+            startY += chunkHeight;
+            tileIndex++;
+        }
+
+        // Restore images
+        replacedImageStates.forEach(state => {
+            state.img.src = state.src;
+            state.img.style.transform = state.transform;
+            state.img.style.transformOrigin = state.origin;
+            if (state.objectFit) {
+                state.img.style.objectFit = state.objectFit;
+            } else {
+                state.img.style.removeProperty('object-fit');
+            }
+        });
+
+        // Restore container
+        container.style.transform = originalTransform;
+        container.style.height = originalHeight;
+        controlPanel.style.display = 'block';
+
+        // Restore .selected classes
+        selectedFrames.forEach(frame => {
+            frame.classList.add('selected');
+        });
+
+        // Show completion message
+        let message;
+        if (usedClientDownload) {
+            message = `✅ JPG 다운로드 완료!\n\n총 ${tileIndex}개 타일이 브라우저 다운로드로 저장되었습니다:\n${productCode}_01.jpg ~ ${productCode}_${String(tileIndex).padStart(2, '0')}.jpg\n\n💡 서버가 실행 중이지 않아 클라이언트 다운로드 방식을 사용했습니다.`;
+        } else {
+            message = `✅ JPG 저장 완료!\n\n${serverResult.filename} (${serverResult.width}×${serverResult.height}px, 타일 ${serverResult.tiles}개)`;
+            if (serverResult.files.length > 1) {
+                message += `\n\n📄 JPG 최대 높이를 넘어 ${serverResult.files.length}개 파일로 나눠 저장했습니다:\n${serverResult.files.join('\n')}`;
+            }
+            if (serverResult.slices.length) {
+                message += `\n\n✂️ 조각 ${serverResult.slices.length}개 추가 저장 (${sliceHeight}px)`;
+            }
+        }
+
+        alert(message);
+    } catch (e) {
+        alert('❌ JPG 저장 실패: ' + e.message);
+        console.error(e);
+
+        // Restore control panel
+        document.querySelector('.control-panel').style.display = 'block';
+        const container = document.querySelector('.container');
+        container.style.transform = `scale(${pageZoom / 100})`;
+    }
+}
+
+// Initialize on page load
+window.addEventListener('DOMContentLoaded', init);
@@ -8,6 +8,8 @@ ColorExtractor - 이미지로부터 지배 색상 추출 (K-means 기반)
 
 from typing import Optional, TYPE_CHECKING
 from pathlib import Path
+import base64
+import io
 import tempfile
 from PIL import Image
 import numpy as np
@@ -25,6 +27,9 @@ class ColorExtractor:
     KMEANS_CLUSTERS = 3  # K-means 클러스터 개수
     KMEANS_ITERATIONS = 10  # 최대 반복 횟수
 
+    # 에디터 스포이드용 샘플링 그리드
+    SAMPLING_GRID_CELLS = 64  # 긴 변 기준 셀 개수
+
     def __init__(self, sheets_loader: Optional["SheetsLoader"] = None) -> None:
         """
         초기화
@@ -170,3 +175,40 @@ class ColorExtractor:
         )
 
         return hex_color
+
+    def build_sampling_grid(self, image_bytes: bytes, cells: int = SAMPLING_GRID_CELLS) -> Optional[dict]:
+        """
+        에디터 스포이드용 다운샘플 RGB 그리드 생성
+
+        각 셀은 해당 영역 픽셀의 평균 색상 (BOX 리샘플링)이므로,
+        에디터는 클릭 위치의 셀을 배열에서 바로 읽습니다.
+
+        Args:
+            image_bytes: 이미지 파일 바이트 (JPEG/PNG 등)
+            cells: 긴 변 기준 셀 개수
+
+        Returns:
+            {"w": 열 수, "h": 행 수, "rgb": 행 우선 RGB 바이트의 base64} 또는 None (디코딩 불가)
+        """
+        try:
+            img = Image.open(io.BytesIO(image_bytes))
+            width, height = img.size
+            scale = cells / max(width, height)
+            grid_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+
+            # JPEG는 DCT 단계에서 축소 디코딩 (대형 제품 샷 디코딩 비용 절감)
+            img.draft("RGB", (grid_size[0] * 4, grid_size[1] * 4))
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+
+            grid = img.resize(grid_size, Image.BOX)
+            pixels = np.asarray(grid, dtype=np.uint8)
+        except Exception as e:
+            print(f"⚠️  샘플링 그리드 생성 실패: {e}")
+            return None
+
+        return {
+            "w": grid_size[0],
+            "h": grid_size[1],
+            "rgb": base64.b64encode(pixels.tobytes()).decode("ascii"),
+        }
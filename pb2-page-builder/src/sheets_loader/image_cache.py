@@ -0,0 +1,77 @@
+"""
+Drive 이미지 메모리 캐시 (상주 데몬용)
+
+Drive 파일 ID → 원본 바이트를 LRU로 보관합니다. 색상 추출과 Base64 변환이
+같은 이미지를 두 번 내려받거나, 같은 제품을 다시 생성할 때 다운로드를 생략합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class ImageCache:
+    """바이트 예산 + TTL 기반 LRU 이미지 캐시 (스레드 안전)"""
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, ttl_seconds: float = 600) -> None:
+        """
+        Args:
+            max_bytes: 최대 보관 크기 (bytes)
+            ttl_seconds: 항목 유효 시간 (초, Drive에서 이미지를 교체한 경우 대비)
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_id: str) -> Optional[bytes]:
+        """캐시 조회 (만료 항목은 제거 후 None)"""
+        with self._lock:
+            item = self._items.get(file_id)
+            if item is None:
+                self.misses += 1
+                return None
+            data, stored_at = item
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                self._remove(file_id)
+                self.misses += 1
+                return None
+            self._items.move_to_end(file_id)
+            self.hits += 1
+            return data
+
+    def put(self, file_id: str, data: bytes) -> None:
+        """캐시 저장 (예산 초과 시 가장 오래 사용하지 않은 항목부터 제거)"""
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if file_id in self._items:
+                self._remove(file_id)
+            self._items[file_id] = (data, time.monotonic())
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._items)))
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """항목 수/크기/적중 통계"""
+        with self._lock:
+            return {
+                "items": len(self._items),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _remove(self, file_id: str) -> None:
+        data, _ = self._items.pop(file_id)
+        self._bytes -= len(data)
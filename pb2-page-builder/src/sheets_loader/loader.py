@@ -5,19 +5,38 @@ Google Sheets 데이터 로더
 """
 
 from pathlib import Path
-from typing import List, Optional, Any
-import re
-import tempfile
+from typing import Dict, List, Optional, Any
+import copy
+import io
 import os
 
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseDownload
 
+from src.sheets_loader.image_cache import ImageCache
+from src.sheets_loader.utils import extract_drive_file_id
+from src.utils.rate_limiter import ApiRateLimiter, shared_limiter
+
+
+def _build_service(api: str, version: str, credentials: Any) -> Any:
+    """
+    API 서비스 객체 생성 (googleapiclient 2.x는 패키지 내장 discovery 문서 사용, 네트워크 조회 없음)
+
+    Args:
+        api: API 이름 (예: "sheets")
+        version: API 버전 (예: "v4")
+        credentials: 공유 인증 정보 (토큰 갱신 결과를 모든 서비스가 재사용)
+    """
+    from googleapiclient.discovery import build
+
+    return build(api, version, credentials=credentials, cache_discovery=False)
+
 
 class SheetsLoader:
-    """Google Sheets API를 사용한 데이터 로더"""
+    """Google Sheets API를 사용한 데이터 로더
+
+    Sheets/Drive 서비스는 첫 사용 시 생성됩니다 (Drive를 쓰지 않는 실행은 생성 비용 없음).
+    """
 
     SCOPES = [
         "https://www.googleapis.com/auth/spreadsheets.readonly",
@@ -40,11 +59,41 @@ class SheetsLoader:
                 f"Service Account 파일을 찾을 수 없습니다: {service_account_file}"
             )
 
-        credentials = service_account.Credentials.from_service_account_file(
+        # 두 서비스가 같은 Credentials를 공유 → 액세스 토큰 갱신 1회로 재사용
+        self.credentials = service_account.Credentials.from_service_account_file(
             str(service_account_file), scopes=self.SCOPES
         )
-        self.service = build("sheets", "v4", credentials=credentials)
-        self.drive_service = build("drive", "v3", credentials=credentials)
+        self._service: Optional[Any] = None
+        self._drive_service: Optional[Any] = None
+        # 상주 데몬에서만 설정 (download_image가 Drive 파일 ID 기준으로 재사용)
+        self.image_cache: Optional[ImageCache] = None
+        # 모든 API 호출이 거치는 제한기 (프로세스 내 로더/워커 공유, 토큰 버킷은 프로세스 간 공유)
+        self.limiter: ApiRateLimiter = shared_limiter()
+
+    @property
+    def service(self) -> Any:
+        """Sheets v4 서비스 (첫 사용 시 생성)"""
+        if self._service is None:
+            self._service = _build_service("sheets", "v4", self.credentials)
+        return self._service
+
+    @property
+    def drive_service(self) -> Any:
+        """Drive v3 서비스 (첫 사용 시 생성)"""
+        if self._drive_service is None:
+            self._drive_service = _build_service("drive", "v3", self.credentials)
+        return self._drive_service
+
+    def for_worker(self) -> "SheetsLoader":
+        """
+        작업 스레드용 로더 (googleapiclient 서비스는 스레드 간 공유 불가)
+
+        인증 정보(토큰), 이미지 캐시, 호출 제한기는 공유하고, Sheets/Drive 서비스만 따로 생성합니다.
+        """
+        worker = copy.copy(self)
+        worker._service = None
+        worker._drive_service = None
+        return worker
 
     def load_row(self, sheet_id: str, row_number: int) -> List[str]:
         """
@@ -61,11 +110,11 @@ class SheetsLoader:
             HttpError: API 오류 발생 시
         """
         range_name = f"{self.TAB_NAME}!A{row_number}:KN{row_number}"
-        result = (
+        result = self.limiter.execute(
+            "sheets",
             self.service.spreadsheets()
             .values()
-            .get(spreadsheetId=sheet_id, range=range_name)
-            .execute()
+            .get(spreadsheetId=sheet_id, range=range_name),
         )
         values = result.get("values", [])
         return values[0] if values else []
@@ -88,14 +137,58 @@ class SheetsLoader:
             HttpError: API 오류 발생 시
         """
         range_name = f"{self.TAB_NAME}!A{start_row}:KN{end_row}"
-        result = (
+        result = self.limiter.execute(
+            "sheets",
+            self.service.spreadsheets()
+            .values()
+            .get(spreadsheetId=sheet_id, range=range_name),
+        )
+        return result.get("values", [])
+
+    def load_all_rows(self, sheet_id: str, start_row: int = 2) -> List[List[str]]:
+        """
+        start_row부터 시트 끝까지 모든 행을 한 번의 호출로 로드
+
+        Args:
+            sheet_id: Google Sheets ID
+            start_row: 시작 행 번호 (1-based, 기본: 헤더 다음 행)
+
+        Returns:
+            행별 셀 값 리스트 (rows[0]이 start_row)
+
+        Raises:
+            HttpError: API 오류 발생 시
+        """
+        range_name = f"{self.TAB_NAME}!A{start_row}:KN"
+        result = self.limiter.execute(
+            "sheets",
             self.service.spreadsheets()
             .values()
-            .get(spreadsheetId=sheet_id, range=range_name)
-            .execute()
+            .get(spreadsheetId=sheet_id, range=range_name),
         )
         return result.get("values", [])
 
+    def get_sheet_version(self, sheet_id: str) -> Dict[str, str]:
+        """
+        스프레드시트 파일 버전 조회 (Drive 메타데이터, 셀 데이터 미포함)
+
+        watch 모드의 변경 감지용입니다. 시트가 수정될 때마다 version이 증가합니다.
+
+        Args:
+            sheet_id: Google Sheets ID
+
+        Returns:
+            {"version": str, "modifiedTime": str}
+
+        Raises:
+            HttpError: API 오류 발생 시
+        """
+        return self.limiter.execute(
+            "drive",
+            self.drive_service.files()
+            .get(fileId=sheet_id, fields="version,modifiedTime", supportsAllDrives=True),
+        )
+
     def get_all_product_codes(self, sheet_id: str) -> List[str]:
         """
         시트 A열에서 모든 제품 코드 추출 (헤더 제외)
@@ -110,11 +203,11 @@ class SheetsLoader:
             HttpError: API 오류 발생 시
         """
         range_name = f"{self.TAB_NAME}!A2:A1000"  # A2부터 시작 (헤더 제외)
-        result = (
+        result = self.limiter.execute(
+            "sheets",
             self.service.spreadsheets()
             .values()
-            .get(spreadsheetId=sheet_id, range=range_name)
-            .execute()
+            .get(spreadsheetId=sheet_id, range=range_name),
         )
 
         values = result.get("values", [])
@@ -122,6 +215,59 @@ class SheetsLoader:
         codes = [row[0].strip() for row in values if row and row[0].strip()]
         return codes
 
+    def get_product_rows(self, sheet_id: str) -> List[int]:
+        """
+        A열에 제품 코드가 있는 모든 행 번호 (한 번의 호출)
+
+        Args:
+            sheet_id: Google Sheets ID
+
+        Returns:
+            행 번호 리스트 (2부터 시작, 헤더 제외)
+
+        Raises:
+            HttpError: API 오류 발생 시
+        """
+        range_name = f"{self.TAB_NAME}!A2:A"
+        result = self.limiter.execute(
+            "sheets",
+            self.service.spreadsheets()
+            .values()
+            .get(spreadsheetId=sheet_id, range=range_name),
+        )
+        return [
+            offset + 2
+            for offset, row in enumerate(result.get("values", []))
+            if row and str(row[0]).strip()
+        ]
+
+    def find_product_row(self, sheet_id: str, product_code: str) -> Optional[int]:
+        """
+        A열에서 제품 코드의 행 번호 찾기 (한 번의 호출)
+
+        Args:
+            sheet_id: Google Sheets ID
+            product_code: 제품 코드 (앞뒤 공백 무시)
+
+        Returns:
+            행 번호 (1-based) 또는 None
+
+        Raises:
+            HttpError: API 오류 발생 시
+        """
+        range_name = f"{self.TAB_NAME}!A2:A"
+        result = self.limiter.execute(
+            "sheets",
+            self.service.spreadsheets()
+            .values()
+            .get(spreadsheetId=sheet_id, range=range_name),
+        )
+        target = product_code.strip()
+        for offset, row in enumerate(result.get("values", [])):
+            if row and str(row[0]).strip() == target:
+                return offset + 2
+        return None
+
     def extract_hyperlinks(
         self, sheet_id: str, row_number: int
     ) -> List[Optional[str]]:
@@ -140,14 +286,14 @@ class SheetsLoader:
         """
         # includeGridData=True로 셀 메타데이터 포함
         range_name = f"{self.TAB_NAME}!A{row_number}:KN{row_number}"
-        result = (
+        result = self.limiter.execute(
+            "sheets",
             self.service.spreadsheets()
             .get(
                 spreadsheetId=sheet_id,
                 ranges=[range_name],
                 includeGridData=True,
-            )
-            .execute()
+            ),
         )
 
         # 첫 번째 시트의 첫 번째 데이터 행 추출
@@ -173,18 +319,11 @@ class SheetsLoader:
         Returns:
             파일 ID 또는 None
         """
-        patterns = [
-            r"drive\.google\.com/file/d/([a-zA-Z0-9_-]+)",
-            r"drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)",
-            r"id=([a-zA-Z0-9_-]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, drive_url)
-            if match:
-                return match.group(1)
+        return extract_drive_file_id(drive_url)
 
-        return None
+    def drive_file_id(self, drive_url: str) -> Optional[str]:
+        """Drive URL의 파일 ID (같은 파일을 가리키는 URL 중복 제거 키)"""
+        return self._extract_drive_file_id(drive_url)
 
     def download_image(
         self, drive_url: str, output_path: Path
@@ -199,6 +338,19 @@ class SheetsLoader:
         Returns:
             성공 여부
 
+        Raises:
+            Exception: 다운로드 실패 시
+        """
+        output_path.write_bytes(self.read_image(drive_url))
+        return True
+
+    def read_image(self, drive_url: str) -> bytes:
+        """
+        Google Drive 이미지 바이트 (download_image와 같은 캐시/제한기, 임시 파일 없음)
+
+        Args:
+            drive_url: Google Drive URL
+
         Raises:
             Exception: 다운로드 실패 시
         """
@@ -206,17 +358,26 @@ class SheetsLoader:
         if not file_id:
             raise ValueError(f"유효하지 않은 Drive URL: {drive_url}")
 
+        if self.image_cache is not None:
+            cached = self.image_cache.get(file_id)
+            if cached is not None:
+                return cached
+
         try:
             # Drive API로 파일 다운로드
             request = self.drive_service.files().get_media(fileId=file_id)
 
-            with open(output_path, "wb") as f:
-                downloader = MediaIoBaseDownload(f, request)
-                done = False
-                while not done:
-                    status, done = downloader.next_chunk()
+            buffer = io.BytesIO()
+            downloader = MediaIoBaseDownload(buffer, request)
+            done = False
+            while not done:
+                status, done = self.limiter.call("drive", downloader.next_chunk)
+            data = buffer.getvalue()
 
-            return True
+            if self.image_cache is not None:
+                self.image_cache.put(file_id, data)
+
+            return data
 
         except Exception as e:
             raise Exception(f"이미지 다운로드 실패 ({drive_url}): {e}")
@@ -240,14 +401,14 @@ class SheetsLoader:
         """
         # includeGridData=True로 셀 메타데이터 포함
         range_name = f"{self.TAB_NAME}!A{row_number}:KN{row_number}"
-        result = (
+        result = self.limiter.execute(
+            "sheets",
             self.service.spreadsheets()
             .get(
                 spreadsheetId=sheet_id,
                 ranges=[range_name],
                 includeGridData=True,
-            )
-            .execute()
+            ),
         )
 
         # 첫 번째 시트의 첫 번째 데이터 행 추출
@@ -0,0 +1,126 @@
+"""행 스냅샷 (watch 모드)
+
+직전 실행 시점의 시트 버전과 제품별 행 해시를 저장하고,
+새로 읽은 행과 비교해 변경된 제품만 골라냅니다.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+def hash_row(row: List[str]) -> str:
+    """행 값 해시 (뒤쪽 빈 셀은 API가 생략하므로 제거 후 계산)"""
+    values = list(row)
+    while values and not str(values[-1]).strip():
+        values.pop()
+    payload = json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RowChange(NamedTuple):
+    """변경된 제품 행"""
+
+    code: str
+    row_number: int
+    row: List[str]
+    row_hash: str
+
+
+class RowDiff(NamedTuple):
+    """스냅샷 대비 변경 내역"""
+
+    changed: List[RowChange]
+    unchanged: List[RowChange]
+    removed: List[str]
+
+
+class RowSnapshot:
+    """시트 버전 + 제품 코드별 행 해시 스냅샷
+
+    저장 위치: .cache/watch/{sheet_id}.json
+    """
+
+    CACHE_DIR = Path(".cache/watch")
+
+    def __init__(self, sheet_id: str) -> None:
+        """RowSnapshot 초기화 (저장된 스냅샷이 있으면 로드)
+
+        Args:
+            sheet_id: Google Sheets ID
+        """
+        self.sheet_id = sheet_id
+        self.path = self.CACHE_DIR / f"{sheet_id}.json"
+        self.version: Optional[str] = None
+        self.date_folder: Optional[str] = None
+        # 제품 코드 → {"row": 행 번호, "hash": 행 해시}
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        self.version = data.get("version")
+        self.date_folder = data.get("date_folder")
+        self.rows = data.get("rows", {})
+
+    def save(self) -> None:
+        """스냅샷 저장 (임시 파일 + 원자적 교체)"""
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": self.version, "date_folder": self.date_folder, "rows": self.rows},
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
+
+    def diff(self, rows: List[List[str]], first_row: int = 2) -> RowDiff:
+        """새로 읽은 행과 스냅샷 비교
+
+        행 위치가 아니라 제품 코드(A열) 기준으로 비교하므로,
+        행이 삽입/삭제되어 위치만 바뀐 제품은 변경으로 보지 않습니다.
+
+        Args:
+            rows: 시트 행 목록 (first_row부터 순서대로)
+            first_row: rows[0]의 행 번호 (1-based)
+
+        Returns:
+            RowDiff: 변경/미변경 제품, 시트에서 사라진 제품 코드
+        """
+        changed: List[RowChange] = []
+        unchanged: List[RowChange] = []
+        seen = set()
+
+        for offset, row in enumerate(rows):
+            code = str(row[0]).strip() if row else ""
+            if not code or code in seen:
+                continue
+            seen.add(code)
+
+            entry = RowChange(code, first_row + offset, row, hash_row(row))
+            previous = self.rows.get(code)
+            if previous is not None and previous.get("hash") == entry.row_hash:
+                unchanged.append(entry)
+            else:
+                changed.append(entry)
+
+        removed = [code for code in self.rows if code not in seen]
+        return RowDiff(changed, unchanged, removed)
+
+    def record(self, change: RowChange) -> None:
+        """생성에 성공한 제품 행 기록"""
+        self.rows[change.code] = {"row": change.row_number, "hash": change.row_hash}
+
+    def forget(self, code: str) -> None:
+        """제품 기록 삭제 (시트에서 사라졌거나 다음 변경 시 재생성 필요)"""
+        self.rows.pop(code, None)
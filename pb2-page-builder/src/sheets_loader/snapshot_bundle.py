@@ -0,0 +1,343 @@
+"""스냅샷 번들 - 시트 행 + 참조 이미지를 로컬에 보관해 네트워크 없이 생성
+
+scripts/snapshot.py가 선택한 행의 값/하이퍼링크/텍스트 서식과 행이 참조하는
+모든 Drive 이미지를 번들 하나에 저장하고, SnapshotLoader가 SheetsLoader 대신
+같은 메서드로 그 번들을 제공합니다 (재생성, 템플릿 실험, 벤치마크를 로컬 디스크 속도로 재현).
+
+번들 구조 ({bundle}/):
+  snapshot.db                # SQLite: meta, rows(행 번호/코드/값/하이퍼링크/서식), images(파일 ID → 해시)
+  blobs/{sha[:2]}/{sha256}   # 이미지 원본 바이트 (내용 주소, 같은 이미지는 한 번만 저장)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from src.sheets_loader.utils import drive_urls, extract_drive_file_id
+
+SNAPSHOT_FORMAT = "pb2-snapshot/1"
+DB_NAME = "snapshot.db"
+BLOBS_DIR_NAME = "blobs"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    row_number INTEGER PRIMARY KEY,
+    code TEXT NOT NULL,
+    cells TEXT NOT NULL,
+    hyperlinks TEXT,
+    formatting TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_rows_code ON rows (code);
+CREATE TABLE IF NOT EXISTS images (
+    file_id TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+"""
+
+
+class SnapshotError(Exception):
+    """번들 형식 오류 / 번들에 없는 데이터"""
+    pass
+
+
+class SnapshotSummary(NamedTuple):
+    """캡처 결과"""
+    path: Path
+    rows: int
+    images: int
+    image_bytes: int
+    missing_codes: List[str]
+    failed_images: List[str]
+
+
+class SnapshotBundle:
+    """스냅샷 번들 읽기/쓰기"""
+
+    def __init__(self, path: Path, create: bool = False) -> None:
+        """
+        Args:
+            path: 번들 폴더
+            create: True면 새로 만듦 (없으면 생성), False면 기존 번들만 열기
+
+        Raises:
+            SnapshotError: 번들이 없거나 형식이 다를 경우
+        """
+        self.path = Path(path)
+        db_path = self.path / DB_NAME
+        if not create and not db_path.exists():
+            raise SnapshotError(f"스냅샷 번들을 찾을 수 없습니다: {self.path}")
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.executescript(SCHEMA)
+
+        fmt = self.meta().get("format")
+        if create and fmt is None:
+            self.set_meta(format=SNAPSHOT_FORMAT)
+        elif fmt != SNAPSHOT_FORMAT:
+            raise SnapshotError(f"지원하지 않는 스냅샷 형식: {fmt!r} ({self.path})")
+
+    def __enter__(self) -> "SnapshotBundle":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # --- 메타데이터 ---
+
+    def meta(self) -> Dict[str, str]:
+        return dict(self.conn.execute("SELECT key, value FROM meta"))
+
+    def set_meta(self, **values: Any) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, str(value)) for key, value in values.items()],
+            )
+
+    # --- 행 ---
+
+    def put_row(
+        self,
+        row_number: int,
+        cells: List[str],
+        hyperlinks: Optional[List[Optional[str]]] = None,
+        formatting: Optional[List[Optional[List[dict]]]] = None,
+    ) -> None:
+        code = str(cells[0]).strip() if cells else ""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO rows (row_number, code, cells, hyperlinks, formatting) VALUES (?, ?, ?, ?, ?)",
+                (
+                    row_number,
+                    code,
+                    json.dumps(cells, ensure_ascii=False),
+                    json.dumps(hyperlinks, ensure_ascii=False) if hyperlinks is not None else None,
+                    json.dumps(formatting, ensure_ascii=False) if formatting is not None else None,
+                ),
+            )
+
+    def _row_field(self, row_number: int, field: str) -> Optional[Any]:
+        found = self.conn.execute(f"SELECT {field} FROM rows WHERE row_number = ?", (row_number,)).fetchone()
+        if found is None or found[0] is None:
+            return None
+        return json.loads(found[0])
+
+    def row_cells(self, row_number: int) -> List[str]:
+        """행 값 (번들에 없는 행은 빈 리스트 - 시트의 빈 행과 같음)"""
+        return self._row_field(row_number, "cells") or []
+
+    def row_hyperlinks(self, row_number: int) -> List[Optional[str]]:
+        return self._row_field(row_number, "hyperlinks") or []
+
+    def row_formatting(self, row_number: int) -> List[Optional[List[dict]]]:
+        return self._row_field(row_number, "formatting") or []
+
+    def row_numbers(self) -> List[int]:
+        return [r for (r,) in self.conn.execute("SELECT row_number FROM rows ORDER BY row_number")]
+
+    def find_row(self, product_code: str) -> Optional[int]:
+        found = self.conn.execute(
+            "SELECT row_number FROM rows WHERE code = ? ORDER BY row_number LIMIT 1", (product_code.strip(),)
+        ).fetchone()
+        return found[0] if found else None
+
+    def product_rows(self) -> List[int]:
+        """제품 코드가 있는 행 번호"""
+        return [r for (r,) in self.conn.execute("SELECT row_number FROM rows WHERE code != '' ORDER BY row_number")]
+
+    def codes(self) -> List[str]:
+        return [c for (c,) in self.conn.execute("SELECT code FROM rows WHERE code != '' ORDER BY row_number")]
+
+    # --- 이미지 ---
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.path / BLOBS_DIR_NAME / sha256[:2] / sha256
+
+    def has_image(self, file_id: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM images WHERE file_id = ?", (file_id,)).fetchone() is not None
+
+    def put_image(self, file_id: str, data: bytes) -> str:
+        """이미지 저장 (같은 내용은 blob 하나 공유)"""
+        sha256 = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(sha256)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(f".{sha256}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, blob_path)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO images (file_id, sha256, size) VALUES (?, ?, ?)",
+                (file_id, sha256, len(data)),
+            )
+        return sha256
+
+    def image_bytes(self, file_id: str) -> bytes:
+        """
+        Raises:
+            SnapshotError: 번들에 없는 이미지
+        """
+        found = self.conn.execute("SELECT sha256 FROM images WHERE file_id = ?", (file_id,)).fetchone()
+        if found is None:
+            raise SnapshotError(f"스냅샷에 없는 이미지: {file_id}")
+        return self._blob_path(found[0]).read_bytes()
+
+    def image_stats(self) -> Dict[str, int]:
+        count, total = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM images").fetchone()
+        return {"images": count, "bytes": total}
+
+
+class SnapshotLoader:
+    """SheetsLoader 대체 - 스냅샷 번들에서 행/하이퍼링크/서식/이미지 제공 (네트워크 없음)
+
+    sheet_id 인자는 호환용이며 무시합니다 (번들은 시트 하나의 스냅샷).
+    """
+
+    def __init__(self, bundle_path: Path) -> None:
+        """
+        Args:
+            bundle_path: scripts/snapshot.py가 만든 번들 폴더
+
+        Raises:
+            SnapshotError: 번들이 없거나 형식이 다를 경우
+        """
+        self.bundle = SnapshotBundle(bundle_path)
+        self.meta = self.bundle.meta()
+        self.TAB_NAME = self.meta.get("tab", "")
+        self.image_cache = None  # SheetsLoader와 같은 속성 (번들이 곧 캐시)
+
+    def for_worker(self) -> "SnapshotLoader":
+        """작업 스레드용 로더 (SQLite 연결은 스레드 간 공유 불가)"""
+        return SnapshotLoader(self.bundle.path)
+
+    def load_row(self, sheet_id: str, row_number: int) -> List[str]:
+        return self.bundle.row_cells(row_number)
+
+    def load_rows(self, sheet_id: str, start_row: int, end_row: int) -> List[List[str]]:
+        rows = [self.bundle.row_cells(r) for r in range(start_row, end_row + 1)]
+        while rows and not rows[-1]:
+            rows.pop()  # API처럼 뒤쪽 빈 행 생략
+        return rows
+
+    def load_all_rows(self, sheet_id: str, start_row: int = 2) -> List[List[str]]:
+        numbers = self.bundle.row_numbers()
+        if not numbers or numbers[-1] < start_row:
+            return []
+        return self.load_rows(sheet_id, start_row, numbers[-1])
+
+    def get_sheet_version(self, sheet_id: str) -> Dict[str, str]:
+        """스냅샷은 변하지 않으므로 캡처 시각을 버전으로 사용"""
+        captured_at = self.meta.get("captured_at", "")
+        return {"version": f"snapshot:{captured_at}", "modifiedTime": captured_at}
+
+    def get_all_product_codes(self, sheet_id: str) -> List[str]:
+        return self.bundle.codes()
+
+    def get_product_rows(self, sheet_id: str) -> List[int]:
+        return self.bundle.product_rows()
+
+    def find_product_row(self, sheet_id: str, product_code: str) -> Optional[int]:
+        return self.bundle.find_row(product_code)
+
+    def extract_hyperlinks(self, sheet_id: str, row_number: int) -> List[Optional[str]]:
+        return self.bundle.row_hyperlinks(row_number)
+
+    def extract_text_formatting(self, sheet_id: str, row_number: int) -> List[Optional[List[dict]]]:
+        return self.bundle.row_formatting(row_number)
+
+    def drive_file_id(self, drive_url: str) -> Optional[str]:
+        return extract_drive_file_id(drive_url)
+
+    def download_image(self, drive_url: str, output_path: Path) -> bool:
+        """
+        번들의 이미지를 output_path에 기록 (SheetsLoader.download_image와 같은 계약)
+
+        Raises:
+            Exception: 번들에 없는 이미지
+        """
+        file_id = extract_drive_file_id(drive_url)
+        if not file_id:
+            raise ValueError(f"유효하지 않은 Drive URL: {drive_url}")
+        try:
+            output_path.write_bytes(self.bundle.image_bytes(file_id))
+        except SnapshotError as e:
+            raise Exception(f"이미지 다운로드 실패 ({drive_url}): {e}")
+        return True
+
+
+def capture_snapshot(
+    loader: Any,
+    sheet_id: str,
+    bundle_path: Path,
+    codes: Optional[List[str]] = None,
+    log: Callable[[str], None] = print,
+) -> SnapshotSummary:
+    """
+    시트에서 행 + 참조 이미지를 번들로 캡처
+
+    Args:
+        loader: SheetsLoader
+        sheet_id: Google Sheets ID
+        bundle_path: 번들 폴더 (이미 있으면 행/이미지를 추가·갱신)
+        codes: 캡처할 제품 코드 (None이면 코드가 있는 모든 행)
+        log: 진행 로그 함수
+    """
+    rows = loader.load_all_rows(sheet_id)
+    wanted = {c.strip() for c in codes} if codes else None
+
+    targets = []
+    for offset, cells in enumerate(rows):
+        code = str(cells[0]).strip() if cells else ""
+        if code and (wanted is None or code in wanted):
+            targets.append((offset + 2, code, cells))
+    found = {code for _, code, _ in targets}
+    missing = sorted(wanted - found) if wanted else []
+
+    failed: List[str] = []
+    with SnapshotBundle(bundle_path, create=True) as bundle:
+        bundle.set_meta(
+            sheet_id=sheet_id,
+            tab=loader.TAB_NAME,
+            captured_at=datetime.now().isoformat(timespec="seconds"),
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir) / "image"
+            for idx, (row_number, code, cells) in enumerate(targets, 1):
+                hyperlinks = loader.extract_hyperlinks(sheet_id, row_number)
+                formatting = loader.extract_text_formatting(sheet_id, row_number)
+                bundle.put_row(row_number, cells, hyperlinks, formatting)
+
+                urls = drive_urls(list(cells) + list(hyperlinks))
+                new_images = 0
+                for url in urls:
+                    file_id = loader.drive_file_id(url)
+                    if not file_id or bundle.has_image(file_id):
+                        continue
+                    try:
+                        loader.download_image(url, tmp_path)
+                        bundle.put_image(file_id, tmp_path.read_bytes())
+                        new_images += 1
+                    except Exception as e:
+                        failed.append(url)
+                        log(f"  ⚠️  {code}: {e}")
+
+                log(f"[{idx}/{len(targets)}] {code} (행 {row_number}): 이미지 {len(urls)}개 참조, {new_images}개 새로 저장")
+
+        stats = bundle.image_stats()
+
+    return SnapshotSummary(Path(bundle_path), len(targets), stats["images"], stats["bytes"], missing, failed)
@@ -4,7 +4,18 @@
 유틸리티 함수
 """
 
-from typing import Optional
+import re
+from typing import Any, Iterable, List, Optional
+
+# Google Drive URL에서 파일 ID를 찾는 패턴 (앞에서부터 우선)
+DRIVE_FILE_ID_PATTERNS = [
+    r"drive\.google\.com/file/d/([a-zA-Z0-9_-]+)",
+    r"drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)",
+    r"id=([a-zA-Z0-9_-]+)",
+]
+
+# 이미지로 쓰이는 셀 (Drive 링크)
+DRIVE_URL_PATTERN = re.compile(r"(drive|docs)\.google\.com/")
 
 
 def is_empty_value(value: Optional[str]) -> bool:
@@ -48,3 +59,36 @@ def is_empty_value(value: Optional[str]) -> bool:
         return True
 
     return False
+
+
+def extract_drive_file_id(drive_url: str) -> Optional[str]:
+    """
+    Google Drive URL에서 파일 ID 추출
+
+    Args:
+        drive_url: Google Drive URL
+
+    Returns:
+        파일 ID 또는 None
+    """
+    for pattern in DRIVE_FILE_ID_PATTERNS:
+        match = re.search(pattern, drive_url)
+        if match:
+            return match.group(1)
+
+    return None
+
+
+def drive_urls(values: Iterable[Any]) -> List[str]:
+    """
+    값 목록에서 Drive 링크만 추출 (순서 유지, 중복 제거)
+
+    Args:
+        values: 행 값/하이퍼링크 (문자열이 아닌 값은 무시)
+    """
+    urls: List[str] = []
+    for value in values:
+        url = value.strip() if isinstance(value, str) else ""
+        if DRIVE_URL_PATTERN.search(url) and url not in urls:
+            urls.append(url)
+    return urls
@@ -0,0 +1,175 @@
+"""
+배치 파이프라인 - 단계별 워커 스레드 + 크기 제한 큐로 네트워크/CPU 작업 겹치기
+
+제품을 하나씩 "행 조회 → 이미지 다운로드 → 변환 → 렌더링 → 저장" 순으로 처리하면
+다운로드 중에는 CPU가, 렌더링 중에는 네트워크가 놉니다. 단계마다 워커를 두고
+단계 사이를 크기 제한 큐로 연결하면 N+1번 제품의 다운로드가 N번 제품의 렌더링과 겹쳐
+전체 시간이 단계 합계 대신 가장 느린 단계에 가까워집니다.
+
+  items → [stage 0: N workers] → Queue(maxsize) → [stage 1] → ... → 결과 (완료 순서)
+
+- 백프레셔: 다음 단계 큐가 가득 차면 앞 단계 워커가 대기 (메모리에 올라가는 제품 수 제한)
+- 실패한 항목은 남은 단계를 건너뛰고 결과로 전달 (다른 항목은 계속 진행)
+- setup: 워커 스레드마다 한 번 호출해 스레드 전용 컨텍스트 생성 (예: API 클라이언트)
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+DEFAULT_QUEUE_SIZE = 2
+
+_STOP = object()  # 워커 종료 신호
+
+
+class Stage(NamedTuple):
+    """파이프라인 단계"""
+    name: str
+    func: Callable[[Any, Any], Any]           # (워커 컨텍스트, 이전 단계 값) → 다음 단계 값
+    workers: int = 1
+    setup: Optional[Callable[[], Any]] = None  # 워커별 컨텍스트 생성 (없으면 None 전달)
+
+
+class PipelineResult(NamedTuple):
+    """항목 하나의 처리 결과"""
+    index: int                        # 입력 순서
+    item: Any                         # 입력 항목
+    value: Any                        # 마지막 단계 결과 (실패 시 None)
+    error: Optional[BaseException]
+    stage: Optional[str]              # 실패한 단계 이름
+
+
+class _Envelope:
+    """단계 사이를 이동하는 항목"""
+    __slots__ = ("index", "item", "value", "error", "stage")
+
+    def __init__(self, index: int, item: Any) -> None:
+        self.index = index
+        self.item = item
+        self.value = item
+        self.error: Optional[BaseException] = None
+        self.stage: Optional[str] = None
+
+
+class BatchPipeline:
+    """단계별 스레드 풀 + 크기 제한 큐 파이프라인"""
+
+    def __init__(self, stages: List[Stage], queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        """
+        Args:
+            stages: 처리 단계 (순서대로)
+            queue_size: 단계 사이 큐 크기 (단계별로 대기할 수 있는 최대 항목 수)
+
+        Raises:
+            ValueError: 단계가 없거나 워커 수/큐 크기가 1 미만인 경우
+        """
+        if not stages:
+            raise ValueError("파이프라인 단계가 없습니다")
+        for stage in stages:
+            if stage.workers < 1:
+                raise ValueError(f"'{stage.name}' 단계 워커 수는 1 이상이어야 합니다")
+        if queue_size < 1:
+            raise ValueError("큐 크기는 1 이상이어야 합니다")
+
+        self.stages = stages
+        self.queue_size = queue_size
+        self._busy: Dict[str, float] = {stage.name: 0.0 for stage in stages}
+        self._processed: Dict[str, int] = {stage.name: 0 for stage in stages}
+        self._stats_lock = threading.Lock()
+        self.elapsed = 0.0
+
+    def run(self, items: Iterable[Any]) -> Iterator[PipelineResult]:
+        """
+        항목을 파이프라인으로 처리 (결과는 완료 순서대로)
+
+        모든 결과를 소비해야 워커 스레드가 종료됩니다.
+        """
+        started = time.perf_counter()
+        inputs = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results: "queue.Queue" = queue.Queue()
+        outputs = inputs[1:] + [results]
+
+        remaining = [stage.workers for stage in self.stages]
+        remaining_lock = threading.Lock()
+
+        def worker(position: int) -> None:
+            stage = self.stages[position]
+            context, setup_error = None, None
+            if stage.setup is not None:
+                try:
+                    context = stage.setup()
+                except Exception as e:
+                    setup_error = e
+
+            while True:
+                envelope = inputs[position].get()
+                if envelope is _STOP:
+                    break
+                if envelope.error is None:
+                    if setup_error is not None:
+                        envelope.error, envelope.stage = setup_error, stage.name
+                    else:
+                        began = time.perf_counter()
+                        try:
+                            envelope.value = stage.func(context, envelope.value)
+                        except Exception as e:
+                            envelope.error, envelope.stage, envelope.value = e, stage.name, None
+                        with self._stats_lock:
+                            self._busy[stage.name] += time.perf_counter() - began
+                            self._processed[stage.name] += 1
+                outputs[position].put(envelope)
+
+            # 마지막으로 끝난 워커가 다음 단계 워커 수만큼 종료 신호 전달
+            with remaining_lock:
+                remaining[position] -= 1
+                last = remaining[position] == 0
+            if last:
+                next_workers = self.stages[position + 1].workers if position + 1 < len(self.stages) else 1
+                for _ in range(next_workers):
+                    outputs[position].put(_STOP)
+
+        def feed() -> None:
+            for index, item in enumerate(items):
+                inputs[0].put(_Envelope(index, item))
+            for _ in range(self.stages[0].workers):
+                inputs[0].put(_STOP)
+
+        threads = [threading.Thread(target=feed, name="pipeline-feed", daemon=True)]
+        for position, stage in enumerate(self.stages):
+            threads.extend(
+                threading.Thread(target=worker, args=(position,), name=f"pipeline-{stage.name}-{n}", daemon=True)
+                for n in range(stage.workers)
+            )
+        for thread in threads:
+            thread.start()
+
+        while True:
+            envelope = results.get()
+            if envelope is _STOP:
+                break
+            yield PipelineResult(envelope.index, envelope.item, envelope.value, envelope.error, envelope.stage)
+
+        for thread in threads:
+            thread.join()
+        self.elapsed = time.perf_counter() - started
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        단계별 통계
+
+        Returns:
+            [{"name", "workers", "items", "busy", "span"}] - busy는 워커 합계 처리 시간,
+            span은 busy / workers (단계가 파이프라인을 붙잡는 시간의 추정치)
+        """
+        with self._stats_lock:
+            return [
+                {
+                    "name": stage.name,
+                    "workers": stage.workers,
+                    "items": self._processed[stage.name],
+                    "busy": self._busy[stage.name],
+                    "span": self._busy[stage.name] / stage.workers,
+                }
+                for stage in self.stages
+            ]
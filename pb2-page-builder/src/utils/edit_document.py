@@ -0,0 +1,244 @@
+"""
+편집 문서 - 에디터 변경분(크롭/텍스트/컬러)만 저장하고 필요할 때 원본 페이지에 적용
+
+에디터의 "편집 저장"은 전체 HTML(base64 이미지 포함) 대신 변경분만 보냅니다:
+  {
+    "format": "pb2-edits/1",
+    "productCode": "VD25FPT003",
+    "cropSettings": {...},             # localStorage cropSettings_{code} 그대로 (이미지 크롭/줌/간격/텍스트 박스)
+    "texts": {"t12": "<b>...</b>"},    # data-edit-id → 변경된 innerHTML
+    "colors": {"Black": "#1a1a1a"}     # 컬러명 → 스포이드로 고른 칩 색상
+  }
+
+서버는 원본 에디터블 파일 경로/해시를 붙여 버전별 JSON으로 보관합니다:
+  {store_dir}/{product_code}/v0001.json, v0002.json ...
+
+materialize_html()은 원본 페이지에 텍스트/컬러를 적용하고 편집 문서를
+window.PB2_EDITS로 넣어, 에디터 런타임이 로드 시 크롭 설정을 복원하게 합니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+EDIT_FORMAT = "pb2-edits/1"
+EDITS_DIR_NAME = "edits"  # output/ 아래 편집 문서 폴더
+
+PRODUCT_CODE_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+VERSION_FILE_PATTERN = re.compile(r"^v(\d{4,})\.json$")
+
+# 저장 시 서버가 채우는 필드 (내용 비교에서 제외)
+SERVER_FIELDS = ("savedAt",)
+
+
+class EditDocumentError(Exception):
+    """편집 문서 형식 오류 (클라이언트 요청 문제)"""
+    pass
+
+
+class EditVersion(NamedTuple):
+    """저장된 편집 문서 버전"""
+    version: int
+    path: Path
+    size: int
+    created: bool  # False면 직전 버전과 내용이 같아 새로 쓰지 않음
+
+
+def validate_product_code(product_code: Any) -> str:
+    """
+    제품 코드 검증 (편집 저장소 폴더명과 에디터블 파일 경로에 그대로 쓰이므로 경로 문자 거부)
+
+    Raises:
+        EditDocumentError: 형식 오류
+    """
+    if not isinstance(product_code, str) or not PRODUCT_CODE_PATTERN.match(product_code):
+        raise EditDocumentError(f"잘못된 제품 코드: {product_code!r}")
+    return product_code
+
+
+def validate_document(doc: Any, product_code: str) -> Dict[str, Any]:
+    """
+    편집 문서 검증 + 정규화 (알 수 없는 필드 제거)
+
+    Raises:
+        EditDocumentError: 형식 오류
+    """
+    if not isinstance(doc, dict):
+        raise EditDocumentError("편집 문서는 JSON 객체여야 합니다")
+    if doc.get("format") != EDIT_FORMAT:
+        raise EditDocumentError(f"지원하지 않는 편집 문서 형식: {doc.get('format')!r}")
+
+    crop_settings = doc.get("cropSettings") or {}
+    texts = doc.get("texts") or {}
+    colors = doc.get("colors") or {}
+
+    if not isinstance(crop_settings, dict):
+        raise EditDocumentError("cropSettings는 객체여야 합니다")
+    for name, mapping in (("texts", texts), ("colors", colors)):
+        if not isinstance(mapping, dict) or not all(
+            isinstance(k, str) and isinstance(v, str) for k, v in mapping.items()
+        ):
+            raise EditDocumentError(f"{name}는 문자열 → 문자열 객체여야 합니다")
+
+    return {
+        "format": EDIT_FORMAT,
+        "productCode": product_code,
+        "cropSettings": crop_settings,
+        "texts": texts,
+        "colors": colors,
+    }
+
+
+def source_hash(data: bytes) -> str:
+    """원본 페이지 식별용 해시 (sha256 앞 12자리)"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _content(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """서버 필드를 뺀 비교용 내용"""
+    return {k: v for k, v in doc.items() if k not in SERVER_FIELDS}
+
+
+class EditStore:
+    """제품별 편집 문서 버전 저장소"""
+
+    def __init__(self, store_dir: Path) -> None:
+        """
+        Args:
+            store_dir: 저장소 폴더 (output/edits)
+        """
+        self.store_dir = store_dir
+
+    def product_dir(self, product_code: str) -> Path:
+        return self.store_dir / validate_product_code(product_code)
+
+    def versions(self, product_code: str) -> List[int]:
+        """저장된 버전 번호 (오름차순)"""
+        directory = self.product_dir(product_code)
+        if not directory.exists():
+            return []
+        found = []
+        for path in directory.iterdir():
+            match = VERSION_FILE_PATTERN.match(path.name)
+            if match:
+                found.append(int(match.group(1)))
+        return sorted(found)
+
+    def load(self, product_code: str, version: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """편집 문서 읽기 (version 생략 시 최신, 없으면 None)"""
+        if version is None:
+            versions = self.versions(product_code)
+            if not versions:
+                return None
+            version = versions[-1]
+        path = self.product_dir(product_code) / f"v{version:04d}.json"
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, product_code: str, doc: Dict[str, Any]) -> EditVersion:
+        """
+        새 버전으로 저장 (직전 버전과 내용이 같으면 쓰지 않고 그 버전 반환)
+
+        Args:
+            product_code: 제품 코드
+            doc: validate_document() 결과 (+ source, sourceHash)
+        """
+        directory = self.product_dir(product_code)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        versions = self.versions(product_code)
+        if versions:
+            latest = versions[-1]
+            latest_path = directory / f"v{latest:04d}.json"
+            if _content(self.load(product_code, latest) or {}) == _content(doc):
+                return EditVersion(latest, latest_path, latest_path.stat().st_size, False)
+
+        version = (versions[-1] + 1) if versions else 1
+        path = directory / f"v{version:04d}.json"
+        stored = dict(doc, savedAt=datetime.now().isoformat(timespec="seconds"))
+        data = json.dumps(stored, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
+
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        return EditVersion(version, path, len(data), True)
+
+
+def diff_documents(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Dict[str, List[str]]]:
+    """
+    두 편집 문서의 차이 (섹션별 추가/삭제/변경 키)
+
+    Returns:
+        {"texts": {"added": [...], "removed": [...], "changed": [...]}, "colors": ..., "images": ..., "settings": ...}
+    """
+    def compare(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, List[str]]:
+        return {
+            "added": sorted(k for k in b if k not in a),
+            "removed": sorted(k for k in a if k not in b),
+            "changed": sorted(k for k in b if k in a and a[k] != b[k]),
+        }
+
+    old_crop = old.get("cropSettings") or {}
+    new_crop = new.get("cropSettings") or {}
+    return {
+        "texts": compare(old.get("texts") or {}, new.get("texts") or {}),
+        "colors": compare(old.get("colors") or {}, new.get("colors") or {}),
+        "images": compare(old_crop.get("images") or {}, new_crop.get("images") or {}),
+        "settings": compare(
+            {k: v for k, v in old_crop.items() if k != "images"},
+            {k: v for k, v in new_crop.items() if k != "images"},
+        ),
+    }
+
+
+def materialize_html(source_html: str, doc: Dict[str, Any]) -> str:
+    """
+    원본 에디터블 페이지 + 편집 문서 → 편집이 반영된 페이지
+
+    텍스트/컬러 칩은 HTML에 직접 적용하고, 크롭 설정(이미지 natural 크기가 필요)은
+    window.PB2_EDITS로 넣어 에디터 런타임이 로드 시 적용합니다.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(source_html, "html.parser")
+
+    texts = doc.get("texts") or {}
+    for element in soup.find_all(attrs={"data-edit-id": True}):
+        edited = texts.get(element["data-edit-id"])
+        if edited is not None:
+            element.clear()
+            for node in list(BeautifulSoup(edited, "html.parser").contents):
+                element.append(node)
+
+    colors = doc.get("colors") or {}
+    if colors:
+        for chip in soup.select(".color-chip-clickable"):
+            name_span = chip.parent.find("span") if chip.parent else None
+            color = colors.get(name_span.get_text(strip=True)) if name_span else None
+            if color:
+                chip["style"] = _set_style(chip.get("style", ""), {"background": color, "background-color": color})
+
+    # "</script>"가 값 안에서 태그를 닫지 않도록
+    edits_json = json.dumps(doc, ensure_ascii=False).replace("</", "<\\/")
+    edits_tag = soup.new_tag("script")
+    edits_tag.string = f"window.PB2_EDITS = {edits_json};"
+    (soup.head or soup).append(edits_tag)
+
+    return str(soup)
+
+
+def _set_style(style: str, updates: Dict[str, str]) -> str:
+    """인라인 style 문자열의 속성 값 교체/추가"""
+    declarations = []
+    for declaration in style.split(";"):
+        name = declaration.split(":", 1)[0].strip().lower()
+        if declaration.strip() and name not in updates:
+            declarations.append(declaration.strip())
+    declarations.extend(f"{name}: {value}" for name, value in updates.items())
+    return "; ".join(declarations) + ";"
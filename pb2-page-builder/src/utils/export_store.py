@@ -0,0 +1,178 @@
+"""
+익스포트 저장소 - 내용 해시 기반 중복 제거 + 경쟁 없는 파일명 생성
+
+에디터에서 같은 내용을 여러 번 익스포트하면 예전에는 name_1, name_2 ...를
+exists()로 하나씩 확인해 같은 바이트의 파일을 계속 새로 썼습니다.
+이제 익스포트 폴더마다 작은 인덱스(.exports.json)가 내용 해시 → 파일명을 기억합니다:
+
+  {export_dir}/.exports.json
+    {"version": 2,
+     "files": {"VD25FPT003|.jpg|<sha256>": "VD25FPT003.jpg", ...},   # 파일명 + 내용 해시 → 실제 파일명
+     "next": {"VD25FPT003|.jpg": 2, ...}}             # 파일명별 다음 suffix 번호
+
+- 같은 파일명 + 같은 내용: 기존 파일을 그대로 돌려줌 (디스크 사용/파일명 확인 없음)
+- 다른 파일명은 내용이 같아도 각자 파일 생성 (빈 조각/공통 푸터 조각, 다른 제품의 같은 조각이
+  한 파일로 합쳐지지 않도록 - 요청한 _sNN/_partN 이름은 항상 존재)
+- 새 내용: 임시 파일에 쓴 뒤 os.link로 최종 이름에 원자적으로 생성
+  (이미 있으면 FileExistsError → 다음 번호, 덮어쓰기/경쟁 없음)
+
+인덱스는 점(.) 파일이라 아카이브 멤버에 포함되지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+INDEX_NAME = ".exports.json"
+INDEX_VERSION = 2  # 1: 내용 해시만 키로 사용 (다른 제품/조각끼리 파일 공유)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_lock = threading.Lock()  # 인덱스 읽기-수정-쓰기 보호 (서버 스레드 간)
+
+
+class StoredExport(NamedTuple):
+    """저장 결과"""
+    path: Path
+    digest: str
+    created: bool  # False면 같은 내용의 기존 파일 재사용
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """파일 내용 해시 (청크 단위로 읽어 큰 JPG도 메모리 제한)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def store_bytes(directory: Path, base_name: str, extension: str, data: bytes) -> StoredExport:
+    """
+    익스포트 저장 (같은 내용이 이미 있으면 기존 파일 반환)
+
+    Args:
+        directory: 익스포트 폴더
+        base_name: 기본 파일명 (예: VD25FPT003_exported)
+        extension: 확장자 (.html, .jpg)
+        data: 파일 내용
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    digest = content_digest(data)
+
+    with _lock:
+        index = _read_index(directory)
+        key = _file_key(base_name, extension, digest)
+        existing = _lookup(directory, index, key)
+        if existing:
+            return StoredExport(existing, digest, False)
+
+        tmp_path = directory / f".{digest[:16]}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path.write_bytes(data)
+        try:
+            path = _link_new_name(directory, index, base_name, extension, tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        index["files"][key] = path.name
+        _write_index(directory, index)
+        return StoredExport(path, digest, True)
+
+
+def adopt_file(directory: Path, base_name: str, extension: str, source: Path) -> StoredExport:
+    """
+    이미 디스크에 쓴 파일(같은 폴더의 임시 파일)을 저장소에 등록
+
+    같은 내용이 있으면 source를 지우고 기존 파일을 반환합니다. source는 항상 정리됩니다.
+    """
+    digest = file_digest(source)
+
+    with _lock:
+        try:
+            index = _read_index(directory)
+            key = _file_key(base_name, extension, digest)
+            existing = _lookup(directory, index, key)
+            if existing:
+                return StoredExport(existing, digest, False)
+
+            path = _link_new_name(directory, index, base_name, extension, source)
+            index["files"][key] = path.name
+            _write_index(directory, index)
+            return StoredExport(path, digest, True)
+        finally:
+            source.unlink(missing_ok=True)
+
+
+def _file_key(base_name: str, extension: str, digest: str) -> str:
+    """인덱스 키 (기본 파일명 + 확장자 + 내용 해시)"""
+    return f"{base_name}|{extension}|{digest}"
+
+
+def _lookup(directory: Path, index: Dict, key: str) -> Optional[Path]:
+    """인덱스에 있는 같은 파일명 + 같은 내용 파일 (사용자가 지웠으면 항목 제거 후 None)"""
+    name = index["files"].get(key)
+    if not name:
+        return None
+    path = directory / name
+    if path.is_file():
+        return path
+    del index["files"][key]
+    return None
+
+
+def _link_new_name(directory: Path, index: Dict, base_name: str, extension: str, source: Path) -> Path:
+    """source를 새 파일명에 원자적으로 연결 (이름은 인덱스 번호로 선택)"""
+    key = f"{base_name}|{extension}"
+    counter = index["next"].get(key, 0)
+    while True:
+        name = f"{base_name}{extension}" if counter == 0 else f"{base_name}_{counter}{extension}"
+        path = directory / name
+        try:
+            _create_exclusive(source, path)
+        except FileExistsError:
+            # 인덱스 도입 전 파일 또는 다른 프로세스가 먼저 생성
+            counter += 1
+            continue
+        index["next"][key] = counter + 1
+        return path
+
+
+def _create_exclusive(source: Path, path: Path) -> None:
+    """path가 없을 때만 source 내용으로 생성 (하드 링크, 미지원 파일시스템은 배타적 복사)"""
+    try:
+        os.link(source, path)
+        return
+    except FileExistsError:
+        raise
+    except OSError:
+        pass
+
+    with open(source, "rb") as src, open(path, "xb") as dst:
+        for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b""):
+            dst.write(chunk)
+
+
+def _read_index(directory: Path) -> Dict:
+    try:
+        with open(directory / INDEX_NAME, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") == INDEX_VERSION:
+            index.setdefault("files", {})
+            index.setdefault("next", {})
+            return index
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"version": INDEX_VERSION, "files": {}, "next": {}}
+
+
+def _write_index(directory: Path, index: Dict) -> None:
+    """임시 파일 → 이름 변경"""
+    tmp_path = directory / f"{INDEX_NAME}.tmp"
+    tmp_path.write_text(json.dumps(index, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, directory / INDEX_NAME)
@@ -0,0 +1,304 @@
+"""
+Prometheus 텍스트 포맷 메트릭 레지스트리
+
+외부 의존성(prometheus_client) 없이 Counter / Gauge / Histogram 을 제공하고
+Flask 앱에 요청 수, 지연 시간, 처리 중 요청 수 계측과 /metrics 라우트를 붙입니다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 기본 히스토그램 버킷 (초 단위)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    """라벨 값 이스케이프 (\\, ", 줄바꿈)"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """{name="value",...} 형식 라벨 문자열"""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Prometheus 숫자 표기"""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """메트릭 공통 베이스"""
+
+    TYPE = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelKey:
+        """라벨 딕셔너리 → 정렬된 값 튜플 (labelnames 순서)"""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name}: 라벨 불일치 (필요: {self.labelnames}, 전달: {tuple(labels)})"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """# HELP / # TYPE 헤더 포함 텍스트"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """카운터 증가 (음수 불가)"""
+        if amount < 0:
+            raise ValueError(f"{self.name}: 카운터는 감소할 수 없습니다")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """증감 가능한 게이지 (콜백으로 스크레이프 시점 값 계산 가능)"""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """스크레이프 시점에 호출할 값 함수 등록 (라벨 없는 게이지 전용)"""
+        if self.labelnames:
+            raise ValueError(f"{self.name}: 라벨이 있는 게이지에는 함수를 등록할 수 없습니다")
+        self._function = function
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            try:
+                value = float(self._function())
+            except Exception:
+                return []
+            return [f"{self.name} {_format_value(value)}"]
+
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # key → (버킷별 카운트, 합계, 개수)
+        self._values: Dict[LabelKey, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for idx, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[idx] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """with 블록 실행 시간 관측"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(c), t, n)) for key, (c, t, n) in self._values.items())
+
+        lines = []
+        bucket_names = self.labelnames + ("le",)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(bucket_names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            base_labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{base_labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{base_labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 모음 + 텍스트 포맷 렌더링"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if any(m.name == metric.name for m in self._metrics):
+                raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """전체 메트릭을 Prometheus 텍스트 포맷으로 변환"""
+        with self._lock:
+            metrics = list(self._metrics)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+def instrument_flask_app(app, registry: MetricsRegistry, namespace: str) -> Dict[str, _Metric]:
+    """
+    Flask 앱에 요청 계측 훅과 /metrics 라우트 등록
+
+    Args:
+        app: Flask 앱
+        registry: 메트릭 레지스트리
+        namespace: 메트릭 이름 접두사 (예: "pb2")
+
+    Returns:
+        등록된 HTTP 메트릭 딕셔너리 (requests, latency, in_flight)
+    """
+    from flask import Response, g, request
+
+    requests_total = registry.counter(
+        f"{namespace}_http_requests_total",
+        "Total HTTP requests by route, method and status.",
+        ("route", "method", "status"),
+    )
+    latency = registry.histogram(
+        f"{namespace}_http_request_duration_seconds",
+        "HTTP request latency by route.",
+        ("route", "method"),
+    )
+    in_flight = registry.gauge(
+        f"{namespace}_http_requests_in_flight",
+        "HTTP requests currently being served.",
+    )
+
+    def _route() -> str:
+        # 매칭된 URL 규칙만 라벨로 사용 (제품 코드별 라벨 폭증 방지)
+        return request.url_rule.rule if request.url_rule is not None else "unmatched"
+
+    @app.before_request
+    def _metrics_before_request():
+        g._metrics_start = time.perf_counter()
+        g._metrics_recorded = False
+        in_flight.inc()
+
+    @app.after_request
+    def _metrics_after_request(response):
+        start = getattr(g, "_metrics_start", None)
+        if start is not None:
+            route = _route()
+            latency.observe(time.perf_counter() - start, route=route, method=request.method)
+            requests_total.inc(route=route, method=request.method, status=str(response.status_code))
+            g._metrics_recorded = True
+        return response
+
+    @app.teardown_request
+    def _metrics_teardown_request(exc):
+        start = getattr(g, "_metrics_start", None)
+        if start is None:
+            return
+        in_flight.dec()
+        # 처리되지 않은 예외로 after_request가 호출되지 않은 경우
+        if not getattr(g, "_metrics_recorded", False):
+            route = _route()
+            latency.observe(time.perf_counter() - start, route=route, method=request.method)
+            requests_total.inc(route=route, method=request.method, status="500")
+
+    @app.route("/metrics")
+    def metrics():
+        """Prometheus 스크레이프 엔드포인트"""
+        return Response(registry.render(), mimetype=None, content_type=MetricsRegistry.CONTENT_TYPE)
+
+    return {"requests": requests_total, "latency": latency, "in_flight": in_flight}
@@ -0,0 +1,317 @@
+"""
+Output 아카이브 - 오래된 날짜 폴더를 압축 아카이브로 보관 (제품 단위 랜덤 액세스)
+
+파일 구조 ({archive_dir}/{YYYYMMDD}.arc):
+  MAGIC
+  [블록 0][블록 1]...          # 제품 코드별로 묶어 독립 압축한 프레임
+  [인덱스 JSON]                # 블록 위치 + 멤버(상대 경로)별 블록/오프셋/크기/sha256
+  footer: 인덱스 오프셋, 길이 (<QQ) + MAGIC
+
+한 제품의 파일(에디터블/익스포트)은 같은 블록에 들어가므로 base64 이미지가
+중복돼도 함께 압축되고, 조회 시에는 해당 제품 블록 하나만 해제합니다.
+
+압축: zstandard 설치 시 zstd, 없으면 zlib (코덱은 인덱스에 기록되어 읽기 시 자동 선택)
+"""
+
+import hashlib
+import json
+import os
+import struct
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+ARCHIVE_DIR_NAME = "archive"  # output/ 아래 아카이브 폴더
+ARCHIVE_SUFFIX = ".arc"
+ARCHIVE_VERSION = 1
+ZSTD_LEVEL = 15  # base64 HTML 기준 압축률/속도 균형점
+ZLIB_LEVEL = 9
+
+MAGIC = b"OUTARC01"
+FOOTER = struct.Struct("<QQ")
+
+
+class ArchiveError(Exception):
+    """아카이브 형식/무결성 오류"""
+    pass
+
+
+class ArchiveResult(NamedTuple):
+    """아카이브 생성 결과"""
+    path: Path
+    member_count: int
+    original_bytes: int
+    archived_bytes: int
+
+
+def default_group_key(member: str) -> str:
+    """블록 그룹 키: 파일명의 제품 코드 부분 (예: editable/VD25FPT003_editable_v4.html → VD25FPT003)"""
+    return Path(member).name.split("_")[0].split(".")[0]
+
+
+def _load_zstd():
+    """zstandard 모듈 (미설치 시 None)"""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def available_codec() -> str:
+    """새 아카이브에 사용할 코덱"""
+    return "zstd" if _load_zstd() is not None else "zlib"
+
+
+def _compressor(codec: str) -> Callable[[bytes], bytes]:
+    if codec == "zstd":
+        zstandard = _load_zstd()
+        if zstandard is None:
+            raise ArchiveError("zstd 아카이브에는 zstandard가 필요합니다: pip install zstandard")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress
+    if codec == "zlib":
+        return lambda data: zlib.compress(data, ZLIB_LEVEL)
+    raise ArchiveError(f"알 수 없는 코덱: {codec}")
+
+
+def _decompressor(codec: str) -> Callable[[bytes], bytes]:
+    if codec == "zstd":
+        zstandard = _load_zstd()
+        if zstandard is None:
+            raise ArchiveError("zstd 아카이브를 읽으려면 zstandard가 필요합니다: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress
+    if codec == "zlib":
+        return zlib.decompress
+    raise ArchiveError(f"알 수 없는 코덱: {codec}")
+
+
+def archive_path_for(archive_dir: Path, folder_name: str) -> Path:
+    """날짜 폴더 이름 → 아카이브 파일 경로"""
+    return archive_dir / f"{folder_name}{ARCHIVE_SUFFIX}"
+
+
+class ArchiveReader:
+    """아카이브 읽기 (인덱스만 로드, 멤버는 요청 시 해당 블록만 해제)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: .arc 파일 경로
+
+        Raises:
+            ArchiveError: 형식이 올바르지 않은 경우
+        """
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self.index = self._read_index()
+        except Exception:
+            self._file.close()
+            raise
+        self._decompress = _decompressor(self.index["codec"])
+        # 최근 해제한 블록 (같은 제품 멤버를 연속 조회할 때 재사용)
+        self._block_cache: "OrderedDict[int, bytes]" = OrderedDict()
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _read_index(self) -> Dict:
+        tail_size = FOOTER.size + len(MAGIC)
+        self._file.seek(0, os.SEEK_END)
+        file_size = self._file.tell()
+        if file_size < len(MAGIC) + tail_size:
+            raise ArchiveError(f"아카이브가 너무 작습니다: {self.path}")
+
+        self._file.seek(0)
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise ArchiveError(f"아카이브 형식이 아닙니다: {self.path}")
+
+        self._file.seek(file_size - tail_size)
+        tail = self._file.read(tail_size)
+        if tail[FOOTER.size:] != MAGIC:
+            raise ArchiveError(f"아카이브 끝이 손상되었습니다: {self.path}")
+
+        index_offset, index_length = FOOTER.unpack(tail[:FOOTER.size])
+        self._file.seek(index_offset)
+        index = json.loads(self._file.read(index_length).decode('utf-8'))
+        if index.get("version") != ARCHIVE_VERSION:
+            raise ArchiveError(f"지원하지 않는 아카이브 버전: {index.get('version')}")
+        return index
+
+    def members(self) -> List[str]:
+        """멤버 목록 (날짜 폴더 기준 상대 경로)"""
+        return sorted(self.index["members"])
+
+    def _block(self, block_id: int) -> bytes:
+        cached = self._block_cache.get(block_id)
+        if cached is not None:
+            self._block_cache.move_to_end(block_id)
+            return cached
+
+        block = self.index["blocks"][block_id]
+        self._file.seek(block["offset"])
+        data = self._decompress(self._file.read(block["length"]))
+
+        self._block_cache[block_id] = data
+        if len(self._block_cache) > 2:
+            self._block_cache.popitem(last=False)
+        return data
+
+    def read(self, member: str, verify: bool = True) -> bytes:
+        """
+        멤버 하나 읽기
+
+        Args:
+            member: 멤버 경로 (예: "editable/VD25FPT003_editable_v4.html")
+            verify: sha256 확인 여부
+
+        Returns:
+            원본 바이트
+
+        Raises:
+            KeyError: 멤버가 없는 경우
+            ArchiveError: 무결성 검사 실패
+        """
+        entry = self.index["members"][member]
+        block = self._block(entry["block"])
+        data = block[entry["offset"]:entry["offset"] + entry["size"]]
+        if verify and hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            raise ArchiveError(f"무결성 검사 실패: {self.path.name}:{member}")
+        return data
+
+    def find_product(self, product_code: str, preferred_prefixes: Iterable[str]) -> Optional[str]:
+        """
+        제품 코드의 대표 멤버 찾기
+
+        Args:
+            product_code: 제품 코드
+            preferred_prefixes: 우선순위 순 폴더 접두어 (예: ("editable/", "export/"))
+
+        Returns:
+            멤버 경로 (없으면 None)
+        """
+        candidates = [
+            member for member in self.members()
+            if default_group_key(member) == product_code and member.endswith(('.html', '.htm'))
+        ]
+        for prefix in preferred_prefixes:
+            for member in candidates:
+                if member.startswith(prefix):
+                    return member
+        return candidates[0] if candidates else None
+
+
+def _collect_members(folder: Path) -> Dict[str, Path]:
+    members = {}
+    for root, _, files in os.walk(folder):
+        for name in files:
+            if name.startswith('.'):
+                continue
+            path = Path(root) / name
+            members[path.relative_to(folder).as_posix()] = path
+    return members
+
+
+def archive_folder(
+    folder: Path,
+    archive_dir: Path,
+    group_key: Callable[[str], str] = default_group_key,
+) -> ArchiveResult:
+    """
+    날짜 폴더를 아카이브로 압축 (원본 폴더는 삭제하지 않음)
+
+    같은 날짜 아카이브가 이미 있으면 기존 멤버를 유지하고 폴더 내용으로 덮어씁니다.
+    저장 후 모든 멤버를 다시 읽어 sha256을 확인합니다.
+
+    Args:
+        folder: 날짜 폴더 (예: output/20250101)
+        archive_dir: 아카이브 폴더 (예: output/archive)
+        group_key: 멤버 → 블록 그룹 키 (기본: 제품 코드)
+
+    Returns:
+        ArchiveResult
+    """
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    archive_path = archive_path_for(archive_dir, folder.name)
+    tmp_path = archive_path.with_name(f".{archive_path.name}.tmp")
+
+    members: Dict[str, Callable[[], bytes]] = {}
+    mtimes: Dict[str, float] = {}
+
+    previous = ArchiveReader(archive_path) if archive_path.exists() else None
+    try:
+        if previous is not None:
+            for member in previous.members():
+                members[member] = (lambda m=member: previous.read(m))
+                mtimes[member] = previous.index["members"][member]["mtime"]
+
+        for member, path in _collect_members(folder).items():
+            members[member] = path.read_bytes
+            mtimes[member] = path.stat().st_mtime
+
+        groups: Dict[str, List[str]] = {}
+        for member in sorted(members):
+            groups.setdefault(group_key(member), []).append(member)
+
+        codec = available_codec()
+        compress = _compressor(codec)
+        index = {
+            "version": ARCHIVE_VERSION,
+            "codec": codec,
+            "folder": folder.name,
+            "created": datetime.now().isoformat(),
+            "blocks": [],
+            "members": {},
+        }
+        original_bytes = 0
+
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            for group in sorted(groups):
+                raw = bytearray()
+                for member in groups[group]:
+                    data = members[member]()
+                    index["members"][member] = {
+                        "block": len(index["blocks"]),
+                        "offset": len(raw),
+                        "size": len(data),
+                        "mtime": mtimes[member],
+                        "sha256": hashlib.sha256(data).hexdigest(),
+                    }
+                    raw += data
+                compressed = compress(bytes(raw))
+                index["blocks"].append({"offset": f.tell(), "length": len(compressed), "size": len(raw)})
+                f.write(compressed)
+                original_bytes += len(raw)
+
+            index_bytes = json.dumps(index, ensure_ascii=False).encode('utf-8')
+            index_offset = f.tell()
+            f.write(index_bytes)
+            f.write(FOOTER.pack(index_offset, len(index_bytes)))
+            f.write(MAGIC)
+    finally:
+        if previous is not None:
+            previous.close()
+
+    # 원본 삭제 전 전체 검증
+    with ArchiveReader(tmp_path) as reader:
+        for member in reader.members():
+            reader.read(member, verify=True)
+
+    os.replace(tmp_path, archive_path)
+    return ArchiveResult(archive_path, len(index["members"]), original_bytes, archive_path.stat().st_size)
+
+
+def list_archives(archive_dir: Path) -> List[Path]:
+    """아카이브 파일 목록 (이름순)"""
+    if not archive_dir.exists():
+        return []
+    return sorted(archive_dir.glob(f"*{ARCHIVE_SUFFIX}"))
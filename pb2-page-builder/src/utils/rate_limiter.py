@@ -0,0 +1,315 @@
+"""
+Google API 호출 제한 - 프로세스 간 공유 토큰 버킷 + AIMD 동시성 + 429/5xx 재시도
+
+파이프라인 배치처럼 여러 스레드/프로세스가 동시에 호출하면 Sheets 분당 읽기 할당량과
+Drive 제한에 걸립니다. 모든 execute()/다운로드 청크를 ApiRateLimiter.call()로 감싸면:
+
+- 토큰 버킷: API별 분당 요청 수를 지키도록 대기. 상태를 잠금 파일에 두어 같은 폴더에서
+  실행 중인 모든 프로세스(배치, watch, 데몬)가 같은 할당량을 나눠 씀
+- AIMD 동시성: 성공할 때마다 동시 요청 한도를 조금씩 늘리고(+1/한도), 429/5xx를 받으면 절반으로 감소
+- 재시도: 429/5xx/연결 오류는 Retry-After 또는 지수 백오프(지터 포함) 후 다시 호출.
+  429를 받으면 공유 버킷을 비워 다른 프로세스도 함께 속도를 낮춤
+- 통계: 할당량/동시성/백오프 대기 시간, 제한 응답 수, 재시도 수
+
+상태 파일:
+  .cache/ratelimit/{api}.json   {"tokens": 12.5, "updated": 1729400000.0}
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 내 제한만 적용
+    fcntl = None
+
+STATE_DIR = Path(".cache/ratelimit")
+
+# API별 분당 요청 수 (Sheets 읽기: 사용자당 60/분, Drive: 사용자당 12,000/분의 10%)
+DEFAULT_PER_MINUTE = {
+    "sheets": float(os.getenv("PB2_SHEETS_PER_MINUTE", "60")),
+    "drive": float(os.getenv("PB2_DRIVE_PER_MINUTE", "1200")),
+}
+BURST_SECONDS = 10  # 버킷 크기 = 10초 분량 요청
+
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 6
+BACKOFF_BASE = 1.0  # 첫 재시도 대기 (초, 시도마다 2배)
+BACKOFF_MAX = 60.0
+
+CONCURRENCY_INITIAL = 4
+CONCURRENCY_MIN = 1
+CONCURRENCY_MAX = 16
+DECREASE_COOLDOWN = 1.0  # 동시에 도착한 429 여러 개로 한도가 여러 번 줄지 않도록 (초)
+
+
+def error_status(error: BaseException) -> Optional[int]:
+    """HttpError의 HTTP 상태 코드 (googleapiclient 임포트 없이)"""
+    resp = getattr(error, "resp", None)
+    status = getattr(resp, "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """재시도할 오류 (할당량 초과/일시적 서버 오류/연결 오류)"""
+    status = error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """응답의 Retry-After 헤더 (초)"""
+    resp = getattr(error, "resp", None)
+    try:
+        value = resp.get("retry-after") if resp is not None else None
+        return max(0.0, float(value)) if value is not None else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """잠금 파일로 여러 프로세스가 공유하는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, name: str, per_minute: float, state_dir: Optional[Path] = STATE_DIR) -> None:
+        """
+        Args:
+            name: 버킷 이름 (API 이름)
+            per_minute: 분당 허용 요청 수
+            state_dir: 상태 파일 폴더 (None이면 프로세스 내에서만 공유)
+        """
+        self.name = name
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * BURST_SECONDS)
+        self.path = state_dir / f"{name}.json" if state_dir is not None and fcntl is not None else None
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = time.time()
+
+    def _update(self, change: Callable[[float], tuple]) -> Any:
+        """
+        보충된 토큰 수에 change 적용 (change(tokens) → (새 토큰 수, 결과))
+
+        상태 파일이 있으면 파일 잠금 안에서 읽기-수정-쓰기를 수행합니다.
+        """
+        with self._lock:
+            now = time.time()
+            if self.path is None:
+                tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._tokens, result = change(tokens)
+                self._updated = now
+                return result
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a+", encoding="utf-8") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read())
+                        tokens, updated = float(state["tokens"]), float(state["updated"])
+                    except (ValueError, KeyError, TypeError):
+                        tokens, updated = self.capacity, now
+                    tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+                    tokens, result = change(tokens)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps({"tokens": tokens, "updated": now}))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+            return result
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        토큰을 얻을 때까지 대기
+
+        Returns:
+            대기한 시간 (초)
+        """
+        cost = min(cost, self.capacity)
+
+        def take(tokens: float) -> tuple:
+            if tokens >= cost:
+                return tokens - cost, 0.0
+            return tokens, (cost - tokens) / self.rate
+
+        waited = 0.0
+        while True:
+            wait = self._update(take)
+            if wait <= 0:
+                return waited
+            # 다른 프로세스가 먼저 가져갈 수 있으므로 짧게 나눠 다시 확인
+            wait = min(wait, 1.0)
+            time.sleep(wait)
+            waited += wait
+
+    def drain(self) -> None:
+        """남은 토큰 소진 (429 수신 시 모든 프로세스의 버스트 중단)"""
+        self._update(lambda tokens: (min(tokens, 0.0), None))
+
+
+class AdaptiveConcurrency:
+    """AIMD 동시 요청 한도 (성공 시 +1/한도, 제한 응답 시 절반)"""
+
+    def __init__(
+        self,
+        initial: int = CONCURRENCY_INITIAL,
+        minimum: int = CONCURRENCY_MIN,
+        maximum: int = CONCURRENCY_MAX,
+    ) -> None:
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._last_decrease = 0.0
+
+    def acquire(self) -> float:
+        """
+        슬롯을 얻을 때까지 대기
+
+        Returns:
+            대기한 시간 (초)
+        """
+        started = time.perf_counter()
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+        return time.perf_counter() - started
+
+    def release(self, throttled: bool = False) -> None:
+        """슬롯 반환 + 한도 조정"""
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                now = time.monotonic()
+                if now - self._last_decrease >= DECREASE_COOLDOWN:
+                    self.limit = max(float(self.minimum), self.limit / 2)
+                    self._last_decrease = now
+            else:
+                self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+
+class ApiRateLimiter:
+    """API 호출 래퍼 (토큰 버킷 + AIMD 동시성 + 재시도 + 통계)"""
+
+    def __init__(
+        self,
+        per_minute: Optional[Dict[str, float]] = None,
+        state_dir: Optional[Path] = STATE_DIR,
+        max_retries: int = MAX_RETRIES,
+    ) -> None:
+        """
+        Args:
+            per_minute: API별 분당 요청 수 (기본 DEFAULT_PER_MINUTE)
+            state_dir: 토큰 버킷 상태 파일 폴더 (None이면 프로세스 내에서만 공유)
+            max_retries: 재시도 가능한 오류의 최대 재시도 횟수
+        """
+        self.buckets = {
+            name: TokenBucket(name, rate, state_dir)
+            for name, rate in (per_minute or DEFAULT_PER_MINUTE).items()
+        }
+        self.concurrency = AdaptiveConcurrency()
+        self.max_retries = max_retries
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "throttled": 0,
+            "retries": 0,
+            "failed": 0,
+            "quota_wait": 0.0,
+            "slot_wait": 0.0,
+            "backoff_wait": 0.0,
+        }
+
+    def _add(self, key: str, value: float = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += value
+
+    def call(self, api: str, func: Callable[..., Any], *args: Any, cost: float = 1.0, **kwargs: Any) -> Any:
+        """
+        제한을 지키며 func 호출 (재시도 가능한 오류는 백오프 후 재시도)
+
+        Args:
+            api: 버킷 이름 ("sheets", "drive")
+            func: 요청 1회를 보내는 함수 (예: request.execute, downloader.next_chunk)
+            cost: 소비할 토큰 수 (배치 요청은 하위 요청 수)
+
+        Raises:
+            Exception: 재시도 불가 오류 또는 재시도 횟수 초과 시 마지막 오류
+        """
+        bucket = self.buckets[api]
+        attempt = 0
+        while True:
+            self._add("quota_wait", bucket.acquire(cost))
+            self._add("slot_wait", self.concurrency.acquire())
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                retryable = is_retryable(e)
+                self.concurrency.release(throttled=retryable)
+                if not retryable or attempt >= self.max_retries:
+                    self._add("failed")
+                    raise
+
+                self._add("throttled")
+                if error_status(e) == 429:
+                    bucket.drain()
+                delay = retry_after(e)
+                if delay is None:
+                    # 지수 백오프 + 지터 (동시에 실패한 요청이 같은 시점에 몰리지 않도록)
+                    delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)) * random.uniform(0.5, 1.0)
+                self._add("retries")
+                self._add("backoff_wait", delay)
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            self.concurrency.release()
+            self._add("calls")
+            return result
+
+    def execute(self, api: str, request: Any, cost: float = 1.0) -> Any:
+        """googleapiclient 요청 실행 (라이브러리 자체 재시도 대신 이 제한기가 재시도)"""
+        return self.call(api, request.execute, cost=cost)
+
+    def stats(self) -> Dict[str, Any]:
+        """누적 통계 + 현재 동시 요청 한도"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["throttle_wait"] = stats["quota_wait"] + stats["slot_wait"] + stats["backoff_wait"]
+        stats["concurrency_limit"] = int(self.concurrency.limit)
+        return stats
+
+    def summary(self) -> str:
+        """한 줄 요약 (배치 종료 시 출력용, 대기 시간은 스레드별 합계)"""
+        s = self.stats()
+        return (
+            f"API 호출 {s['calls']}회, 제한 대기 합계 {s['throttle_wait']:.1f}초 "
+            f"(할당량 {s['quota_wait']:.1f}초, 동시성 {s['slot_wait']:.1f}초, 백오프 {s['backoff_wait']:.1f}초), "
+            f"429/5xx {s['throttled']}회, 실패 {s['failed']}회, 동시 요청 한도 {s['concurrency_limit']}"
+        )
+
+
+_shared: Optional[ApiRateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def shared_limiter() -> ApiRateLimiter:
+    """프로세스 전체에서 공유하는 제한기 (모든 로더/워커가 같은 동시성 한도와 통계 사용)"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ApiRateLimiter()
+        return _shared
@@ -0,0 +1,390 @@
+"""
+스토리지 회계 인덱스 - output 트리 크기/mtime 단일 패스 인덱스
+
+os.scandir 한 번의 워크로 디렉토리별 파일 크기/mtime을 수집하고
+매니페스트(.storage_manifest.json)에 저장합니다. 다음 스캔에서는
+디렉토리 mtime이 바뀌지 않은 폴더의 파일 목록을 그대로 재사용합니다.
+
+주의: 파일을 제자리에서 덮어쓰면 디렉토리 mtime이 바뀌지 않으므로
+정확한 값이 필요하면 rescan=True로 전체 재스캔합니다.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+MANIFEST_NAME = ".storage_manifest.json"
+MANIFEST_VERSION = 1
+DATED_FOLDER_FORMAT = "%Y%m%d"
+
+
+def _join(rel: str, name: str) -> str:
+    return f"{rel}/{name}" if rel else name
+
+
+def is_dated_folder(name: str) -> bool:
+    """날짜별 폴더 이름 여부 (YYYYMMDD, 실제 날짜인지 strptime으로 확인 - 서버/cleanup 공용)"""
+    if not (name.isdigit() and len(name) == 8):
+        return False
+    try:
+        datetime.strptime(name, DATED_FOLDER_FORMAT)
+        return True
+    except ValueError:
+        return False
+
+
+class EvictionUnit(NamedTuple):
+    """삭제 단위 (날짜 폴더 또는 루트 파일)"""
+    path: Path
+    size: int
+    last_mtime_ns: int
+
+
+class EvictionPlan(NamedTuple):
+    """쿼터 적용 계획"""
+    victims: List[EvictionUnit]
+    managed_bytes: int    # 쿼터 대상 크기 (날짜 폴더 + 지정 확장자 루트 파일, 보호 중인 것 포함)
+    excess_bytes: int     # 쿼터 초과분 (0 이하면 초과 없음)
+    evictable_bytes: int  # 지금 삭제할 수 있는 크기 (보호 대상 제외)
+
+    @property
+    def clearable(self) -> bool:
+        """삭제로 초과분을 해소할 수 있는지"""
+        return self.excess_bytes <= self.evictable_bytes
+
+
+class StorageIndex:
+    """디렉토리 트리 크기/파일 수/최근 수정 시각 인덱스"""
+
+    def __init__(self, root: Path, persist: bool = True):
+        """
+        Args:
+            root: 인덱싱할 루트 디렉토리
+            persist: 매니페스트 저장/재사용 여부
+        """
+        self.root = Path(root)
+        self.persist = persist
+        self.manifest_path = self.root / MANIFEST_NAME
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+
+        # rel 경로 → {"mtime_ns", "files": {name: [size, mtime_ns]}, "dirs": [name, ...]}
+        self._dirs: Dict[str, Dict] = {}
+        # rel 경로 → (하위 전체 크기, 파일 수, 최근 mtime_ns)
+        self._totals: Dict[str, Tuple[int, int, int]] = {}
+
+        if self.persist:
+            self._load_manifest()
+
+    def _load_manifest(self) -> None:
+        """매니페스트 로드 (버전/루트 불일치 시 무시)"""
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self._dirs = data.get("dirs", {})
+        except (OSError, json.JSONDecodeError):
+            self._dirs = {}
+
+    def save(self) -> None:
+        """매니페스트 저장 (임시 파일 + 원자적 교체)"""
+        if not self.persist or not self.root.exists():
+            return
+        tmp_path = self.manifest_path.with_name(f"{MANIFEST_NAME}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": MANIFEST_VERSION, "dirs": self._dirs}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def scan(self, rescan: bool = False) -> "StorageIndex":
+        """
+        트리 스캔 (변경 없는 디렉토리는 매니페스트 재사용)
+
+        Args:
+            rescan: True면 매니페스트를 무시하고 전체 재스캔
+
+        Returns:
+            self
+        """
+        previous = {} if rescan else self._dirs
+        dirs: Dict[str, Dict] = {}
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+
+        if not self.root.exists():
+            self._dirs = {}
+            self._aggregate()
+            return self
+
+        stack = [("", self.root.stat().st_mtime_ns)]
+        while stack:
+            rel, mtime_ns = stack.pop()
+            cached = previous.get(rel)
+
+            if cached is not None and cached["mtime_ns"] == mtime_ns:
+                # 디렉토리 항목 변경 없음 → 파일 목록 재사용, 하위 폴더만 확인
+                entry = cached
+                self.dirs_reused += 1
+                for name in entry["dirs"]:
+                    child_rel = _join(rel, name)
+                    try:
+                        child_mtime = os.stat(self.root / child_rel).st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+                    stack.append((child_rel, child_mtime))
+            else:
+                files: Dict[str, List[int]] = {}
+                subdirs: List[str] = []
+                try:
+                    with os.scandir(self.root / rel) as it:
+                        for item in it:
+                            if item.is_dir(follow_symlinks=False):
+                                subdirs.append(item.name)
+                                stack.append((_join(rel, item.name), item.stat(follow_symlinks=False).st_mtime_ns))
+                            elif item.is_file(follow_symlinks=False):
+                                if not rel and item.name.startswith(MANIFEST_NAME):
+                                    continue
+                                stat = item.stat(follow_symlinks=False)
+                                files[item.name] = [stat.st_size, stat.st_mtime_ns]
+                except FileNotFoundError:
+                    continue
+                entry = {"mtime_ns": mtime_ns, "files": files, "dirs": sorted(subdirs)}
+                self.dirs_scanned += 1
+
+            dirs[rel] = entry
+
+        self._dirs = dirs
+        self._aggregate()
+        return self
+
+    def _aggregate(self) -> None:
+        """하위 트리 합계 계산 (깊은 폴더부터 한 번씩)"""
+        totals: Dict[str, Tuple[int, int, int]] = {}
+        depth = lambda rel: rel.count("/") + 1 if rel else 0
+
+        for rel in sorted(self._dirs, key=depth, reverse=True):
+            entry = self._dirs[rel]
+            file_stats = entry["files"].values()
+            size = sum(stat[0] for stat in file_stats)
+            count = len(entry["files"])
+            latest = max((stat[1] for stat in file_stats), default=0)
+
+            for name in entry["dirs"]:
+                child = totals.get(_join(rel, name))
+                if child is not None and child[1]:
+                    size += child[0]
+                    count += child[1]
+                    latest = max(latest, child[2])
+
+            # 파일이 하나도 없는 트리는 디렉토리 자체 mtime 기준
+            totals[rel] = (size, count, latest if count else entry["mtime_ns"])
+
+        self._totals = totals
+
+    def _rel(self, path: Path) -> str:
+        """루트 기준 상대 경로 (루트 자신은 "")"""
+        rel = Path(os.path.realpath(path)).relative_to(os.path.realpath(self.root)).as_posix()
+        return "" if rel == "." else rel
+
+    def size(self, path: Path) -> int:
+        """폴더(하위 포함) 또는 파일 크기 (bytes)"""
+        rel = self._rel(path)
+        if rel in self._totals:
+            return self._totals[rel][0]
+        stat = self._file_stat(rel)
+        return stat[0] if stat else 0
+
+    def file_count(self, path: Path) -> int:
+        """폴더 하위 파일 수"""
+        total = self._totals.get(self._rel(path))
+        return total[1] if total else 0
+
+    def last_mtime_ns(self, path: Path) -> int:
+        """폴더 하위 가장 최근 수정 시각 (LRU 기준)"""
+        rel = self._rel(path)
+        if rel in self._totals:
+            return self._totals[rel][2]
+        stat = self._file_stat(rel)
+        return stat[1] if stat else 0
+
+    def total_size(self) -> int:
+        """루트 전체 크기"""
+        return self._totals.get("", (0, 0, 0))[0]
+
+    def _file_stat(self, rel: str) -> Optional[List[int]]:
+        parent, _, name = rel.rpartition("/")
+        entry = self._dirs.get(parent)
+        return entry["files"].get(name) if entry else None
+
+    def root_files(self) -> List[Tuple[str, int, int]]:
+        """루트 직속 파일 목록 [(이름, 크기, mtime_ns)]"""
+        entry = self._dirs.get("")
+        if not entry:
+            return []
+        return [(name, stat[0], stat[1]) for name, stat in entry["files"].items()]
+
+    def root_dirs(self) -> List[str]:
+        """루트 직속 폴더 이름 목록"""
+        entry = self._dirs.get("")
+        return list(entry["dirs"]) if entry else []
+
+
+def select_lru_victims(units: Iterable[EvictionUnit], total_bytes: int, quota_bytes: int) -> List[EvictionUnit]:
+    """
+    쿼터 초과분을 해소할 삭제 대상 선택 (최근 사용이 가장 오래된 것부터, 정렬 1회)
+
+    Args:
+        units: 삭제 가능한 단위 목록
+        total_bytes: 현재 전체 크기
+        quota_bytes: 목표 최대 크기
+
+    Returns:
+        삭제 대상 목록 (LRU 순)
+    """
+    victims = []
+    excess = total_bytes - quota_bytes
+    if excess <= 0:
+        return victims
+
+    for unit in sorted(units, key=lambda u: u.last_mtime_ns):
+        if excess <= 0:
+            break
+        victims.append(unit)
+        excess -= unit.size
+    return victims
+
+
+def eviction_units(
+    index: StorageIndex,
+    is_dated_folder: Callable[[str], bool],
+    root_file_suffixes: Tuple[str, ...] = (),
+    exclude_names: Iterable[str] = (),
+) -> List[EvictionUnit]:
+    """
+    인덱스에서 삭제 가능한 단위 추출 (날짜 폴더 + 지정 확장자의 루트 파일)
+
+    Args:
+        index: 스캔된 StorageIndex
+        is_dated_folder: 날짜 폴더 이름 판별 함수
+        root_file_suffixes: 루트에서 삭제 가능한 파일 확장자 (예: (".html",))
+        exclude_names: 제외할 이름 (예: 오늘 날짜 폴더)
+    """
+    excluded = set(exclude_names)
+    units = []
+
+    for name in index.root_dirs():
+        if name in excluded or not is_dated_folder(name):
+            continue
+        path = index.root / name
+        units.append(EvictionUnit(path, index.size(path), index.last_mtime_ns(path)))
+
+    if not root_file_suffixes:
+        return units
+
+    for name, size, mtime_ns in index.root_files():
+        if name in excluded or not name.endswith(root_file_suffixes):
+            continue
+        units.append(EvictionUnit(index.root / name, size, mtime_ns))
+
+    return units
+
+
+def plan_eviction(
+    index: StorageIndex,
+    is_dated_folder: Callable[[str], bool],
+    quota_bytes: int,
+    root_file_suffixes: Tuple[str, ...] = (),
+    exclude_names: Iterable[str] = (),
+) -> EvictionPlan:
+    """
+    쿼터 초과분을 해소할 삭제 계획
+
+    쿼터는 삭제 단위(날짜 폴더 + 루트 파일)의 합계에만 적용합니다. archive/, static/,
+    edits/, .tiles, assets처럼 삭제할 수 없는 트리를 포함하면 그 크기만으로 쿼터를 넘는
+    순간 모든 날짜 폴더가 삭제되기 때문입니다. 보호 대상(오늘/작업 중 폴더)은 크기에는
+    포함하되 삭제하지 않으며, 남은 단위를 모두 지워도 초과분이 남으면 아무것도 삭제하지
+    않습니다 (clearable=False).
+
+    Args:
+        index: 스캔된 StorageIndex
+        is_dated_folder: 날짜 폴더 이름 판별 함수
+        quota_bytes: 최대 허용 크기
+        root_file_suffixes: 루트에서 삭제 가능한 파일 확장자
+        exclude_names: 보호할 이름 (예: 오늘 날짜 폴더)
+    """
+    managed = eviction_units(index, is_dated_folder, root_file_suffixes)
+    excluded = set(exclude_names)
+    units = [unit for unit in managed if unit.path.name not in excluded]
+
+    managed_bytes = sum(unit.size for unit in managed)
+    evictable_bytes = sum(unit.size for unit in units)
+    excess = managed_bytes - quota_bytes
+    victims = select_lru_victims(units, managed_bytes, quota_bytes) if 0 < excess <= evictable_bytes else []
+    return EvictionPlan(victims, managed_bytes, excess, evictable_bytes)
+
+
+def delete_unit(unit: EvictionUnit) -> None:
+    """삭제 단위 제거 (폴더는 트리 전체)"""
+    if unit.path.is_dir():
+        shutil.rmtree(unit.path)
+    elif unit.path.exists():
+        unit.path.unlink()
+
+
+def start_retention_thread(
+    output_dir: Path,
+    quota_bytes: int,
+    interval_seconds: float,
+    is_dated_folder: Callable[[str], bool],
+    protected_names: Callable[[], Iterable[str]],
+    root_file_suffixes: Tuple[str, ...] = (),
+    log: Callable[[str], None] = print,
+) -> threading.Thread:
+    """
+    쿼터 기반 주기적 보존 정책 스레드 시작 (데몬)
+
+    Args:
+        output_dir: output 루트
+        quota_bytes: 날짜 폴더 + 루트 파일의 최대 허용 크기 (archive/ 등 고정 트리 제외)
+        interval_seconds: 실행 주기 (초)
+        is_dated_folder: 날짜 폴더 이름 판별 함수
+        protected_names: 항상 보존할 이름 목록을 돌려주는 함수 (오늘/작업 중 폴더)
+        root_file_suffixes: 루트에서 삭제 가능한 파일 확장자
+        log: 로그 함수
+
+    Returns:
+        시작된 스레드
+    """
+    def run() -> None:
+        index = StorageIndex(output_dir)
+        while True:
+            try:
+                index.scan()
+                plan = plan_eviction(
+                    index, is_dated_folder, quota_bytes, root_file_suffixes, exclude_names=protected_names()
+                )
+                if not plan.clearable:
+                    log(f"⚠️  보존 정책: 날짜 폴더 {plan.managed_bytes / 1024 / 1024:.1f} MB가 쿼터를 "
+                        f"{plan.excess_bytes / 1024 / 1024:.1f} MB 초과하지만 삭제 가능한 폴더는 "
+                        f"{plan.evictable_bytes / 1024 / 1024:.1f} MB뿐이라 건너뜁니다 (오늘/작업 중 폴더는 보호)")
+                victims = plan.victims
+                for unit in victims:
+                    delete_unit(unit)
+                    log(f"🗑️  보존 정책: {unit.path.name} 삭제 ({unit.size / 1024 / 1024:.1f} MB, "
+                        f"마지막 사용 {datetime.fromtimestamp(unit.last_mtime_ns / 1e9):%Y-%m-%d %H:%M})")
+                if victims:
+                    index.scan()
+                index.save()
+            except Exception as e:
+                log(f"⚠️  보존 정책 실행 실패: {e}")
+            time.sleep(interval_seconds)
+
+    thread = threading.Thread(target=run, name="output-retention", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,214 @@
+"""
+타일 JPG 스티칭 - 에디터가 순서대로 올리는 페이지 타일을 JPG 하나로 합치기
+
+에디터는 기기 메모리에 맞춘 높이로 페이지를 잘라 캡처하고 (/save-jpg-tile),
+서버는 타일을 받는 즉시 디코딩해 RGBX 행을 스풀 파일 끝에 이어 씁니다.
+마지막 타일 후 스풀 파일을 mmap으로 열고, 출력 JPG마다 해당 행 구간을
+복사 없이 이미지로 매핑해 인코딩하므로 양쪽 모두 메모리 사용량이
+타일 하나 크기로 제한됩니다 (페이지 전체가 메모리에 올라가지 않음).
+
+스풀 구조 ({spool_dir}/):
+  {session}.rgbx   # 폭 × 누적 높이 × 4 바이트 (행 우선 RGBX, X는 미사용)
+
+JPG 최대 높이(65500px)를 넘으면 _part1, _part2 ...로 나눠 저장하고,
+slice_height를 주면 마켓 업로드용 조각(_s01, _s02 ...)을 추가로 저장합니다.
+"""
+
+import io
+import mmap
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+JPEG_MAX_DIMENSION = 65500  # libjpeg 한계 (65535) 이하
+DEFAULT_QUALITY = 92
+SESSION_MAX_AGE = 3600  # 완료되지 않은 세션 스풀 보관 시간 (초)
+
+# 4바이트 픽셀: Pillow는 RGB(3바이트) 버퍼는 복사하고 RGBX 버퍼만 그대로 매핑
+SPOOL_MODE = "RGBX"
+SPOOL_BYTES_PER_PIXEL = 4
+
+SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class TileStitchError(Exception):
+    """타일 순서/형식 오류 (클라이언트 요청 문제)"""
+    pass
+
+
+class TileSession(NamedTuple):
+    """진행 중인 스티칭 세션"""
+    spool_path: Path
+    width: int
+    height: int
+    next_index: int
+    updated_at: float
+
+
+class StitchResult(NamedTuple):
+    """스티칭 결과"""
+    width: int
+    height: int
+    tiles: int
+    files: List[Path]     # 최종 JPG (높이 초과 시 여러 개)
+    slices: List[Path]    # 요청한 조각 JPG
+
+
+class TileStitcher:
+    """세션별 타일 스풀 + 최종 JPG 인코딩 (스레드 안전)"""
+
+    def __init__(self, spool_dir: Path, max_age_seconds: float = SESSION_MAX_AGE) -> None:
+        """
+        Args:
+            spool_dir: 스풀 파일 폴더
+            max_age_seconds: 마지막 타일 이후 이 시간이 지난 세션은 정리
+        """
+        self.spool_dir = spool_dir
+        self.max_age_seconds = max_age_seconds
+        self._sessions: Dict[str, TileSession] = {}
+        self._lock = threading.Lock()
+
+    def add_tile(self, session_id: str, index: int, data: bytes) -> TileSession:
+        """
+        타일 하나 추가 (index는 0부터 순서대로)
+
+        폭이 첫 타일과 다르면 (반올림 차이) 첫 타일 폭에 맞춰 자르거나 흰색으로 채웁니다.
+
+        Raises:
+            TileStitchError: 세션 ID/순서/이미지 형식 오류
+        """
+        from PIL import Image
+
+        if not SESSION_ID_PATTERN.match(session_id or ""):
+            raise TileStitchError(f"잘못된 세션 ID: {session_id!r}")
+
+        try:
+            tile = Image.open(io.BytesIO(data))
+            tile.load()
+        except Exception as e:
+            raise TileStitchError(f"타일 이미지를 읽을 수 없습니다: {e}")
+        if tile.mode != SPOOL_MODE:
+            tile = tile.convert(SPOOL_MODE)
+        if tile.width == 0 or tile.height == 0:
+            raise TileStitchError("빈 타일입니다 (Canvas 생성 실패)")
+
+        with self._lock:
+            self._purge_stale()
+            session = self._sessions.get(session_id)
+
+            if index == 0:
+                if session:
+                    session.spool_path.unlink(missing_ok=True)
+                self.spool_dir.mkdir(parents=True, exist_ok=True)
+                session = TileSession(self.spool_dir / f"{session_id}.rgbx", tile.width, 0, 0, time.time())
+                session.spool_path.write_bytes(b"")
+            elif session is None:
+                raise TileStitchError(f"알 수 없는 세션입니다: {session_id} (첫 타일부터 다시 보내주세요)")
+
+            if index != session.next_index:
+                raise TileStitchError(f"타일 순서 오류: {session.next_index}번을 기다리는 중인데 {index}번이 왔습니다")
+
+            if tile.width != session.width:
+                canvas = Image.new(SPOOL_MODE, (session.width, tile.height), (255, 255, 255, 255))
+                canvas.paste(tile.crop((0, 0, min(tile.width, session.width), tile.height)), (0, 0))
+                tile = canvas
+
+            with open(session.spool_path, "ab") as f:
+                f.write(tile.tobytes())
+
+            session = session._replace(
+                height=session.height + tile.height,
+                next_index=index + 1,
+                updated_at=time.time(),
+            )
+            self._sessions[session_id] = session
+            return session
+
+    def finish(
+        self,
+        session_id: str,
+        output_path: Path,
+        quality: int = DEFAULT_QUALITY,
+        slice_height: Optional[int] = None,
+    ) -> StitchResult:
+        """
+        스풀을 JPG로 인코딩하고 세션 정리
+
+        Args:
+            session_id: 세션 ID
+            output_path: 최종 JPG 경로 (높이 초과 시 {stem}_part{n}.jpg)
+            quality: JPG 품질
+            slice_height: 지정 시 이 높이(px)마다 {stem}_s{nn}.jpg 조각 추가 저장
+
+        Raises:
+            TileStitchError: 알 수 없는 세션 / 타일 없음
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None or session.height == 0:
+            raise TileStitchError(f"스티칭할 타일이 없습니다: {session_id}")
+
+        files: List[Path] = []
+        slices: List[Path] = []
+        try:
+            with open(session.spool_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as spool:
+                    parts = _row_ranges(session.height, JPEG_MAX_DIMENSION)
+                    for part_no, (top, bottom) in enumerate(parts, 1):
+                        path = output_path if len(parts) == 1 else output_path.with_name(
+                            f"{output_path.stem}_part{part_no}{output_path.suffix}"
+                        )
+                        _save_jpeg(spool, session.width, (top, bottom), path, quality)
+                        files.append(path)
+
+                    if slice_height:
+                        for slice_no, (top, bottom) in enumerate(_row_ranges(session.height, slice_height), 1):
+                            path = output_path.with_name(f"{output_path.stem}_s{slice_no:02d}{output_path.suffix}")
+                            _save_jpeg(spool, session.width, (top, bottom), path, quality)
+                            slices.append(path)
+        finally:
+            session.spool_path.unlink(missing_ok=True)
+
+        return StitchResult(session.width, session.height, session.next_index, files, slices)
+
+    def abort(self, session_id: str) -> None:
+        """세션 취소 (스풀 삭제)"""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session:
+            session.spool_path.unlink(missing_ok=True)
+
+    def _purge_stale(self) -> None:
+        """오래된 미완료 세션 정리 (lock 보유 상태에서 호출)"""
+        cutoff = time.time() - self.max_age_seconds
+        for session_id, session in list(self._sessions.items()):
+            if session.updated_at < cutoff:
+                session.spool_path.unlink(missing_ok=True)
+                del self._sessions[session_id]
+
+
+def _row_ranges(height: int, step: int) -> List[tuple]:
+    """[0, height)를 step 높이 구간으로 나누기"""
+    step = max(1, int(step))
+    return [(top, min(top + step, height)) for top in range(0, height, step)]
+
+
+def _save_jpeg(spool: mmap.mmap, width: int, rows: tuple, path: Path, quality: int) -> None:
+    """스풀의 행 구간을 복사 없이 매핑해 JPG로 저장 (임시 파일 → 이름 변경)"""
+    from PIL import Image
+
+    top, bottom = rows
+    stride = width * SPOOL_BYTES_PER_PIXEL
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with memoryview(spool)[top * stride:bottom * stride] as buffer:
+        region = Image.frombuffer(SPOOL_MODE, (width, bottom - top), buffer, "raw", SPOOL_MODE, 0, 1)
+        try:
+            # 매핑 이미지는 readonly라 일부 Pillow 버전이 save() 전에 전체를 복사함 (인코더는 읽기만 함)
+            region.readonly = 0
+            region.save(tmp_path, format="JPEG", quality=quality)
+        finally:
+            # mmap을 닫기 전에 버퍼 참조 해제
+            del region
+    tmp_path.replace(path)
@@ -0,0 +1,73 @@
+"""
+TileStitcher: finish()가 페이지 전체를 메모리에 올리지 않고 mmap 스풀에서 인코딩하는지 확인
+
+실행 (pb2-page-builder/): python -m pytest tests
+"""
+
+import io
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가 (src 임포트용)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+Image = pytest.importorskip("PIL.Image")
+
+from src.utils.tile_stitcher import SPOOL_BYTES_PER_PIXEL, TileStitcher  # noqa: E402
+
+STATUS_PATH = Path("/proc/self/status")
+
+
+def rss_anon_bytes() -> int:
+    """익명 상주 메모리 (힙; mmap 스풀은 파일 매핑으로 집계됨)"""
+    for line in STATUS_PATH.read_text().splitlines():
+        if line.startswith("RssAnon:"):
+            return int(line.split()[1]) * 1024
+    raise RuntimeError("RssAnon missing from /proc/self/status")
+
+
+def png_tile(width: int, height: int, color: tuple) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.skipif(not STATUS_PATH.exists(), reason="/proc/self/status 필요 (Linux)")
+def test_finish_peak_memory_stays_below_page_size(tmp_path):
+    width, tile_height, tiles = 2000, 1000, 14
+    stitcher = TileStitcher(tmp_path / "spool")
+    for index in range(tiles):
+        stitcher.add_tile("page", index, png_tile(width, tile_height, (index * 15, 120, 200)))
+    spool_bytes = width * tile_height * tiles * SPOOL_BYTES_PER_PIXEL  # ~112 MB
+
+    baseline = rss_anon_bytes()
+    peak = baseline
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, rss_anon_bytes())
+            done.wait(0.002)
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    try:
+        result = stitcher.finish("page", tmp_path / "page.jpg", slice_height=5000)
+    finally:
+        done.set()
+        sampler.join()
+
+    # 페이지를 복사하면 (RGB frombuffer 또는 crop) 최소 spool_bytes * 3/4 증가
+    assert peak - baseline < spool_bytes // 4
+
+    assert (result.width, result.height, result.tiles) == (width, tile_height * tiles, tiles)
+    with Image.open(result.files[0]) as page:
+        assert page.size == (width, tile_height * tiles)
+        assert page.mode == "RGB"
+        assert page.getpixel((10, 10))[2] == pytest.approx(200, abs=8)
+    assert [Image.open(path).height for path in result.slices] == [5000, 5000, 4000]
+    assert not any((tmp_path / "spool").iterdir())